@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Benchmark CLI cold start: importing bpsai_pair.cli in fresh interpreters.
+
+Reports the median against startup.STARTUP_BUDGET_MS and lists any heavy
+modules (trello, requests, orchestration, ...) the import pulled in. Exits
+non-zero when the budget is exceeded.
+
+Usage:
+    python benchmarks/bench_cli_startup.py [--runs 10] [--budget-ms 150]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bpsai_pair import startup  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=startup.STARTUP_BUDGET_MS)
+    args = parser.parse_args()
+
+    result = startup.measure_startup(runs=args.runs, budget_ms=args.budget_ms)
+    runs = sorted(result.runs_ms)
+    print(f"import bpsai_pair.cli ({args.runs} runs, {len(result.modules)} modules)")
+    print(f"  min    {runs[0]:8.1f} ms")
+    print(f"  median {result.median_ms:8.1f} ms   budget {result.budget_ms:.0f} ms")
+    print(f"  max    {runs[-1]:8.1f} ms")
+    heavy = result.heavy_imports()
+    if heavy:
+        print(f"  heavy modules imported: {', '.join(heavy)}")
+    return 0 if result.within_budget and not heavy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
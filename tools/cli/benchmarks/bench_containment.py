@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Benchmark ContainmentManager checks: compiled path tries vs the previous
+linear scan over every protected entry.
+
+Builds a synthetic project with ~1k protected entries (blocked and read-only
+files and directories, existing and not, plus "**" patterns) and times
+check_read_allowed + check_write_allowed over a mix of protected and
+writable paths. The previous algorithm is reproduced below; both must agree
+on every path.
+
+Usage:
+    python benchmarks/bench_containment.py [--entries 1000] [--checks 5000]
+"""
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bpsai_pair.core.config import ContainmentConfig  # noqa: E402
+from bpsai_pair.security.containment import (  # noqa: E402
+    ContainmentManager,
+    ContainmentViolationError,
+)
+
+
+class LegacyContainmentManager(ContainmentManager):
+    """ContainmentManager with the previous per-check linear scan."""
+
+    def __init__(self, config, project_root):
+        super().__init__(config, project_root)
+        self._tiers = self._lookup_tiers
+
+    def _lookup_tiers(self, resolved):
+        return (
+            self._legacy_in_set(resolved, self._blocked_dirs, self._blocked_paths,
+                                self.config.blocked_directories),
+            self._legacy_in_set(resolved, self._readonly_dirs, self._readonly_paths,
+                                self.config.readonly_directories),
+        )
+
+    def _legacy_in_set(self, resolved, dirs, files, patterns):
+        if resolved in files:
+            return True
+        for locked_file in files:
+            if not locked_file.exists():
+                try:
+                    rel_locked = (
+                        locked_file.relative_to(self.project_root)
+                        if locked_file.is_relative_to(self.project_root)
+                        else locked_file
+                    )
+                    if resolved.relative_to(self.project_root) == rel_locked:
+                        return True
+                except ValueError:
+                    pass
+        for locked_dir in dirs:
+            if resolved == locked_dir:
+                return True
+            try:
+                resolved.relative_to(locked_dir)
+                return True
+            except ValueError:
+                pass
+        for locked_dir in dirs:
+            if not locked_dir.exists():
+                try:
+                    rel_locked = locked_dir.relative_to(self.project_root).parts
+                    rel_path = resolved.relative_to(self.project_root).parts
+                    if rel_path[:len(rel_locked)] == rel_locked:
+                        return True
+                except ValueError:
+                    pass
+        for dir_pattern in patterns:
+            if "**" in dir_pattern:
+                try:
+                    rel_path = resolved.relative_to(self.project_root)
+                    if self._matches_glob_pattern(str(rel_path), dir_pattern.rstrip("/")):
+                        return True
+                except ValueError:
+                    pass
+        return False
+
+
+def build_project(root: Path, entries: int, seed: int = 11) -> ContainmentConfig:
+    """Create files/dirs under root and a config protecting ~entries of them."""
+    rng = random.Random(seed)
+    blocked_files, readonly_files, blocked_dirs, readonly_dirs = [], [], [], []
+    for i in range(entries):
+        kind = rng.random()
+        depth = rng.randint(0, 3)
+        parent = "/".join(f"d{rng.randint(0, 9)}" for _ in range(depth))
+        prefix = f"{parent}/" if parent else ""
+        exists = rng.random() < 0.5
+        if kind < 0.35:
+            path = f"{prefix}secret{i}.env"
+            blocked_files.append(path)
+        elif kind < 0.75:
+            path = f"{prefix}doc{i}.md"
+            readonly_files.append(path)
+        elif kind < 0.85:
+            path = f"{prefix}vault{i}"
+            blocked_dirs.append(path + "/")
+        else:
+            path = f"{prefix}skills{i}"
+            readonly_dirs.append(path + "/")
+        if exists:
+            target = root / path
+            if path in blocked_files or path in readonly_files:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text("x")
+            else:
+                target.mkdir(parents=True, exist_ok=True)
+    readonly_dirs += ["generated/**/", "vendor/pinned/**/"]
+    blocked_dirs += ["**/credentials/*"]
+    return ContainmentConfig(
+        enabled=True,
+        blocked_files=blocked_files,
+        readonly_files=readonly_files,
+        blocked_directories=blocked_dirs,
+        readonly_directories=readonly_dirs,
+    )
+
+
+def sample_paths(config: ContainmentConfig, count: int, seed: int = 5) -> list[Path]:
+    """Paths to check: ~30% protected, the rest ordinary sources."""
+    rng = random.Random(seed)
+    protected = (config.blocked_files + config.readonly_files
+                 + [d + "inner/file.txt" for d in config.blocked_directories + config.readonly_directories
+                    if "*" not in d]
+                 + ["generated/a/b.py", "x/credentials/key"])
+    paths = []
+    for i in range(count):
+        if rng.random() < 0.3:
+            paths.append(Path(rng.choice(protected)))
+        else:
+            paths.append(Path(f"src/pkg{rng.randint(0, 50)}/module{i % 200}.py"))
+    return paths
+
+
+def time_checks(manager: ContainmentManager, paths: list[Path]) -> tuple[float, list[tuple[bool, bool]]]:
+    """Microseconds per read+write check pair, and the outcomes."""
+    outcomes = []
+    start = time.perf_counter()
+    for path in paths:
+        try:
+            manager.check_read_allowed(path)
+            readable = True
+        except ContainmentViolationError:
+            readable = False
+        try:
+            manager.check_write_allowed(path)
+            writable = True
+        except ContainmentViolationError:
+            writable = False
+        outcomes.append((readable, writable))
+    elapsed = time.perf_counter() - start
+    return elapsed / len(paths) * 1e6, outcomes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--checks", type=int, default=5000)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="containment-bench-"))
+    try:
+        config = build_project(root, args.entries)
+        paths = sample_paths(config, args.checks)
+
+        legacy = LegacyContainmentManager(config, root)
+        legacy.activate()
+        manager = ContainmentManager(config, root)
+        manager.activate()
+
+        legacy_us, expected = time_checks(legacy, paths[:max(1, args.checks // 10)])
+        cold_us, cold = time_checks(manager, paths)
+        warm_us, warm = time_checks(manager, paths)
+
+        print(f"{args.entries} protected entries, {len(paths)} paths "
+              f"({sum(not w for _, w in warm)} protected)")
+        print(f"  previous linear scan  {legacy_us:10.1f} us/check pair")
+        print(f"  trie (cold LRU)       {cold_us:10.1f} us/check pair   x{legacy_us / cold_us:.0f}")
+        print(f"  trie (warm LRU)       {warm_us:10.1f} us/check pair   x{legacy_us / warm_us:.0f}")
+
+        if cold != warm or cold[:len(expected)] != expected:
+            print("  decisions differ from the previous implementation")
+            return 1
+        print("  decisions match")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
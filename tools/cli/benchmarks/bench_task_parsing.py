@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark bulk task parsing throughput.
+
+Generates synthetic .task.md files and reports files/sec for sequential,
+thread-pool and process-pool parsing, plus a cold and warm task index
+refresh.
+
+Usage:
+    python benchmarks/bench_task_parsing.py [--sizes 100 1000 10000] [--jobs 0]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bpsai_pair.planning.bulk import (  # noqa: E402
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    has_libyaml,
+    parse_files,
+    resolve_jobs,
+)
+from bpsai_pair.planning.parser import load_task_file  # noqa: E402
+from bpsai_pair.planning.task_index import TaskIndex  # noqa: E402
+
+TASK_TEMPLATE = """---
+id: T{n}
+title: Synthetic task {n}
+plan: plan-2025-01-bench-{plan}
+type: feature
+priority: P{priority}
+complexity: {complexity}
+status: {status}
+sprint: sprint-{sprint}
+tags:
+- bench
+- synthetic
+depends_on:
+- T{dep}
+---
+
+# Objective
+
+Synthetic task body {n}.
+
+# Implementation Plan
+
+{steps}
+
+# Acceptance Criteria
+
+- [ ] Works
+"""
+
+STATUSES = ["pending", "in_progress", "done", "blocked"]
+
+
+def make_tasks(tasks_dir: Path, count: int) -> list[Path]:
+    """Write count synthetic task files."""
+    tasks_dir.mkdir(parents=True, exist_ok=True)
+    steps = "\n".join(f"- Step {i}: do something reasonably descriptive" for i in range(20))
+    paths = []
+    for n in range(count):
+        path = tasks_dir / f"T{n:05d}.task.md"
+        path.write_text(
+            TASK_TEMPLATE.format(
+                n=n,
+                plan=n % 5,
+                priority=n % 3,
+                complexity=(n * 7) % 100,
+                status=STATUSES[n % len(STATUSES)],
+                sprint=n % 10,
+                dep=max(n - 1, 0),
+                steps=steps,
+            ),
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def report(label: str, count: int, seconds: float) -> None:
+    print(f"  {label:<28} {seconds:8.3f}s  {count / seconds:10.0f} files/sec")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--jobs", type=int, default=0, help="Workers (0 = one per CPU)")
+    args = parser.parse_args()
+
+    jobs = resolve_jobs(args.jobs)
+    print(f"libyaml: {has_libyaml()}  workers: {jobs}")
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            paircoder_dir = Path(tmp) / ".paircoder"
+            paths = make_tasks(paircoder_dir / "tasks", size)
+            print(f"\n{size} tasks")
+
+            report("sequential", size, timed(lambda: [load_task_file(p) for p in paths]))
+            report("sequential (lazy)", size,
+                   timed(lambda: [load_task_file(p, lazy=True) for p in paths]))
+            report(f"threads x{jobs}", size,
+                   timed(lambda: parse_files(load_task_file, paths, jobs=jobs, executor=EXECUTOR_THREAD)))
+            report(f"processes x{jobs}", size,
+                   timed(lambda: parse_files(load_task_file, paths, jobs=jobs, executor=EXECUTOR_PROCESS)))
+
+            report("index refresh (cold)", size,
+                   timed(lambda: TaskIndex(paircoder_dir / "tasks").refresh(jobs=jobs)))
+            report("index refresh (warm)", size,
+                   timed(lambda: TaskIndex(paircoder_dir / "tasks").refresh(jobs=jobs)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
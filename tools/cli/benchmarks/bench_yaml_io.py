@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark YAML I/O: pure-Python yaml.safe_load/yaml.dump vs core.yamlio.
+
+Runs on real .plan.yaml and config.yaml files. By default it uses the
+project's .paircoder/config.yaml and every .paircoder/plans/*.plan.yaml;
+when no plan files exist a representative synthetic plan is generated.
+
+Usage:
+    python benchmarks/bench_yaml_io.py [FILE ...] [--iterations 200]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bpsai_pair.core import yamlio  # noqa: E402
+
+
+def default_files() -> list[Path]:
+    """Locate the project's config and plan files."""
+    root = Path(__file__).resolve().parents[3]
+    files = []
+    config = root / ".paircoder" / "config.yaml"
+    if config.exists():
+        files.append(config)
+    files.extend(sorted((root / ".paircoder" / "plans").glob("*.plan.yaml")))
+    return files
+
+
+def synthetic_plan(directory: Path) -> Path:
+    """Write a plan shaped like a large real plan."""
+    tasks = [
+        {"id": f"T{s}.{n}", "title": f"Task {s}.{n}", "type": "feature",
+         "priority": f"P{n % 3}", "complexity": (n * 13) % 100, "sprint": f"sprint-{s}"}
+        for s in range(10) for n in range(15)
+    ]
+    plan = {
+        "id": "plan-2025-01-synthetic",
+        "title": "Synthetic plan",
+        "type": "feature",
+        "status": "in_progress",
+        "goals": [f"Goal {n}" for n in range(10)],
+        "sprints": [
+            {"id": f"sprint-{s}", "title": f"Sprint {s}", "goal": "Ship it",
+             "tasks": [t["id"] for t in tasks if t["sprint"] == f"sprint-{s}"]}
+            for s in range(10)
+        ],
+        "tasks": tasks,
+    }
+    path = directory / "plan-2025-01-synthetic.plan.yaml"
+    path.write_text(yaml.dump(plan, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def bench(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def run(path: Path, iterations: int) -> None:
+    text = path.read_text(encoding="utf-8")
+    data = yaml.safe_load(text)
+
+    def old_load():
+        with open(path, encoding="utf-8") as f:
+            yaml.safe_load(f)
+
+    results = [
+        ("load  yaml.safe_load", bench(old_load, iterations)),
+        ("load  yamlio.load_file", bench(lambda: yamlio.load_file(path), iterations)),
+        ("load  yamlio.load_file(cache)", bench(lambda: yamlio.load_file(path, cache=True), iterations)),
+        ("dump  yaml.dump", bench(lambda: yaml.dump(data, sort_keys=False), iterations)),
+        ("dump  yamlio.dump", bench(lambda: yamlio.dump(data, sort_keys=False), iterations)),
+    ]
+    print(f"\n{path.name} ({len(text):,} bytes)")
+    baseline = {"load": results[0][1], "dump": results[3][1]}
+    for label, ms in results:
+        speedup = baseline[label.split()[0]] / ms
+        print(f"  {label:<32} {ms:8.3f} ms   x{speedup:5.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"libyaml: {yamlio.HAS_LIBYAML}")
+    with tempfile.TemporaryDirectory() as tmp:
+        files = args.files or default_files()
+        if not any(f.name.endswith(".plan.yaml") for f in files):
+            files.append(synthetic_plan(Path(tmp)))
+        for path in files:
+            run(path, args.iterations)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
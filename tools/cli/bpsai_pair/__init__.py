@@ -1,25 +1,49 @@
 """bpsai_pair package"""
-try:
+import importlib
+
+# Public modules, imported on first attribute access so that running one
+# CLI command does not import every feature package (and its dependencies).
+_LAZY_MODULES = {
+    # Core
+    "cli": ".cli",
+    "config": ".core.config",  # Moved to core/ in T24.2
+    "utils": ".core.utils",  # Merged utils/pyutils/jsonio to core/ in T24.7
+    # Features
+    "planning": ".planning",
+    "tasks": ".tasks",
+    "trello": ".trello",
+    "github": ".github",
+    "metrics": ".metrics",
+    "orchestration": ".orchestration",
+    "mcp": ".mcp",
+    "context": ".context",
+    "presets": ".core.presets",  # Moved to core/ in T24.6
+}
+
+
+def _package_version() -> str:
+    # importlib.metadata is slow to import; only --version and friends need it
     from importlib.metadata import version, PackageNotFoundError
-    __version__ = version("bpsai-pair")
-except PackageNotFoundError:
-    __version__ = "dev"
-
-# Core modules
-from . import cli
-from .core import config  # Moved to core/ in T24.2
-from .core import utils  # Merged utils/pyutils/jsonio to core/ in T24.7
-
-# Feature modules (public API)
-from . import planning
-from . import tasks
-from . import trello
-from . import github
-from . import metrics
-from . import orchestration
-from . import mcp
-from . import context
-from .core import presets  # Moved to core/ in T24.6
+    try:
+        return version("bpsai-pair")
+    except PackageNotFoundError:
+        return "dev"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        globals()[name] = _package_version()
+        return globals()[name]
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | {"__version__"})
+
 
 __all__ = [
     "__version__",
@@ -1,4 +1,4 @@
-from .cli import app
+from .daemon.client import main
 
 if __name__ == "__main__":
-    app()
+    main()
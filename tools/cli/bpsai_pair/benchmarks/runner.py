@@ -12,7 +12,7 @@ from typing import List, Optional, Dict, Any, Callable
 import logging
 import subprocess
 
-import yaml
+from ..core import yamlio
 
 logger = logging.getLogger(__name__)
 
@@ -81,8 +81,7 @@ class BenchmarkSuite:
     @classmethod
     def from_yaml(cls, path: Path) -> "BenchmarkSuite":
         """Load benchmark suite from YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = yamlio.load_file(path)
 
         benchmarks = {}
         for bench_id, bench_data in data.get("benchmarks", {}).items():
@@ -135,7 +134,7 @@ class BenchmarkRunner:
             "agents": agents,
             "iterations": iterations,
         }
-        (run_dir / "config.yaml").write_text(yaml.dump(config_data), encoding="utf-8")
+        (run_dir / "config.yaml").write_text(yamlio.dump(config_data), encoding="utf-8")
 
         for bench_id in benchmark_ids:
             if bench_id not in self.suite.benchmarks:
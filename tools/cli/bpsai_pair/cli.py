@@ -5,6 +5,10 @@ This module is the entry point for the CLI and handles only:
 - Sub-app registration
 - Version callback
 
+Sub-apps and command modules are registered by name in LAZY_COMMANDS and
+imported only when invoked, so a command pays only for its own imports.
+`bpsai-pair --profile-imports <command>` shows what those are.
+
 All command implementations are in the `commands/` package:
 - commands/core.py: init, feature, pack, context-sync, status, validate, ci
 - commands/preset.py: preset list, show, preview
@@ -14,6 +18,8 @@ All command implementations are in the `commands/` package:
 - commands/timer.py: timer start, stop, status, show, summary
 - commands/benchmark.py: benchmark run, results, compare, list
 - commands/cache.py: cache stats, clear, invalidate
+- commands/history.py: history compact, status
+- commands/daemon.py: daemon start, stop, status
 - commands/mcp.py: mcp serve, tools, test
 - commands/security.py: security scan-secrets, pre-commit, install-hook, scan-deps
 - commands/session.py: session check, status; compaction snapshot, check, recover, cleanup
@@ -23,129 +29,144 @@ Architecture refactored in Sprint 22 (EPIC-003 Phase 1).
 
 from __future__ import annotations
 
-from typing import Optional
+import importlib
+import logging
+import sys
+from typing import Dict, List, Optional, Tuple
 
 import typer
-from rich.console import Console
-from .commands.audit import app as audit_app
-from .commands.state import app as state_app
-
-try:
-    from . import __version__
-    from .planning.commands import (
-        plan_app, task_app, intent_app, standup_app
-    )
-    from .sprint import sprint_app
-    from .release import release_app, template_app
-    from .skills.cli_commands import skill_app, subagent_app, gaps_app
-    from .trello.commands import app as trello_app
-    from .trello.task_commands import app as trello_task_app
-    from .github.commands import app as github_app
-    from .migrate import migrate_app
-    from .commands import (
-        preset_app, config_app, orchestrate_app, metrics_app,
-        timer_app, benchmark_app, cache_app, mcp_app,
-        security_app, scan_secrets, scan_deps, register_core_commands,
-        session_app, compaction_app, containment_app, upgrade_app, budget_app,
-        contained_auto, claude666
-    )
-except ImportError:
-    # For development/testing when running as script
-    from pathlib import Path
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from bpsai_pair import __version__
-    from bpsai_pair.planning.commands import (
-        plan_app, task_app, intent_app, standup_app
-    )
-    from bpsai_pair.sprint import sprint_app
-    from bpsai_pair.release import release_app, template_app
-    from bpsai_pair.skills.cli_commands import skill_app, subagent_app, gaps_app
-    from bpsai_pair.trello.commands import app as trello_app
-    from bpsai_pair.trello.task_commands import app as trello_task_app
-    from bpsai_pair.github.commands import app as github_app
-    from bpsai_pair.migrate import migrate_app
-    from bpsai_pair.commands import (
-        preset_app, config_app, orchestrate_app, metrics_app,
-        timer_app, benchmark_app, cache_app, mcp_app,
-        security_app, scan_secrets, scan_deps, register_core_commands,
-        session_app, compaction_app, containment_app, upgrade_app, budget_app,
-        contained_auto, claude666
-    )
-
-# Initialize Rich console for version display
-console = Console()
+from typer.core import TyperGroup
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Lazy Command Registry
+# =============================================================================
+
+# Command name -> (module, attribute, kind). "app" entries are Typer sub-apps,
+# "command" entries are plain command functions. Nothing here is imported until
+# the command is invoked (or listed by --help), so `bpsai-pair status` does not
+# pay for trello, github, tiktoken or the orchestration stack.
+# Order is the order shown in --help.
+LAZY_COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    # Planning system sub-apps
+    "plan": ("bpsai_pair.planning.commands", "plan_app", "app"),
+    "task": ("bpsai_pair.planning.commands", "task_app", "app"),
+    "intent": ("bpsai_pair.planning.commands", "intent_app", "app"),
+    "standup": ("bpsai_pair.planning.commands", "standup_app", "app"),
+    "sprint": ("bpsai_pair.sprint", "sprint_app", "app"),
+    "release": ("bpsai_pair.release", "release_app", "app"),
+    "template": ("bpsai_pair.release", "template_app", "app"),
+    "migrate": ("bpsai_pair.migrate", "migrate_app", "app"),
+    "skill": ("bpsai_pair.skills.cli_commands", "skill_app", "app"),
+    "subagent": ("bpsai_pair.skills.cli_commands", "subagent_app", "app"),
+    "gaps": ("bpsai_pair.skills.cli_commands", "gaps_app", "app"),
+    "audit": ("bpsai_pair.commands.audit", "app", "app"),
+    # Extracted command sub-apps
+    "orchestrate": ("bpsai_pair.commands.orchestrate", "app", "app"),
+    "metrics": ("bpsai_pair.commands.metrics", "app", "app"),
+    "preset": ("bpsai_pair.commands.preset", "app", "app"),
+    "config": ("bpsai_pair.commands.config", "app", "app"),
+    "timer": ("bpsai_pair.commands.timer", "app", "app"),
+    "benchmark": ("bpsai_pair.commands.benchmark", "app", "app"),
+    "cache": ("bpsai_pair.commands.cache", "app", "app"),
+    "history": ("bpsai_pair.commands.history", "app", "app"),
+    "mcp": ("bpsai_pair.commands.mcp", "app", "app"),
+    "security": ("bpsai_pair.commands.security", "app", "app"),
+    "session": ("bpsai_pair.commands.session", "session_app", "app"),
+    "compaction": ("bpsai_pair.commands.session", "compaction_app", "app"),
+    "containment": ("bpsai_pair.commands.session", "containment_app", "app"),
+    "upgrade": ("bpsai_pair.commands.upgrade", "upgrade_app", "app"),
+    "budget": ("bpsai_pair.commands.budget", "app", "app"),
+    "state": ("bpsai_pair.commands.state", "app", "app"),
+    "daemon": ("bpsai_pair.commands.daemon", "app", "app"),
+    # Integration sub-apps
+    "trello": ("bpsai_pair.trello.commands", "app", "app"),
+    "ttask": ("bpsai_pair.trello.task_commands", "app", "app"),
+    "github": ("bpsai_pair.github.commands", "app", "app"),
+    # Core commands (commands/core.py)
+    "init": ("bpsai_pair.commands.core", "init_command", "command"),
+    "feature": ("bpsai_pair.commands.core", "feature_command", "command"),
+    "pack": ("bpsai_pair.commands.core", "pack_command", "command"),
+    "context-sync": ("bpsai_pair.commands.core", "context_sync_command", "command"),
+    "sync": ("bpsai_pair.commands.core", "context_sync_command", "command"),
+    "status": ("bpsai_pair.commands.core", "status_command", "command"),
+    "validate": ("bpsai_pair.commands.core", "validate_command", "command"),
+    "ci": ("bpsai_pair.commands.core", "ci_command", "command"),
+    "history-log": ("bpsai_pair.commands.core", "history_log_command", "command"),
+    # Contained autonomy as a top-level command
+    "contained-auto": ("bpsai_pair.commands.session", "contained_auto", "command"),
+    "claude666": ("bpsai_pair.commands.session", "claude666", "command"),
+}
+
+# Registered but not listed in --help
+HIDDEN_COMMANDS = {"sync", "history-log", "claude666"}
+
+# Integrations whose optional dependencies may not be installed
+OPTIONAL_COMMANDS = {"trello", "ttask", "github"}
+
+# Re-runs the command under `python -X importtime` (see startup.py)
+PROFILE_FLAG = "--profile-imports"
+
+
+def load_command(name: str):
+    """
+    Import a lazily registered command and build its Click command.
+
+    Args:
+        name: Command name from LAZY_COMMANDS
+
+    Returns:
+        The Click command or group
+
+    Raises:
+        ImportError: If the command's module (or a dependency) cannot be imported
+    """
+    module_name, attr, kind = LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attr)
+    if kind == "app":
+        command = typer.main.get_group(target)
+    else:
+        single = typer.Typer()
+        single.command(name, hidden=name in HIDDEN_COMMANDS)(target)
+        command = typer.main.get_command(single)
+    command.name = name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports command modules on first use."""
+
+    def list_commands(self, ctx) -> List[str]:
+        eager = super().list_commands(ctx)
+        return [name for name in LAZY_COMMANDS if name not in eager] + eager
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_COMMANDS:
+            return command
+        try:
+            command = load_command(cmd_name)
+        except ImportError as e:
+            if cmd_name not in OPTIONAL_COMMANDS:
+                raise
+            logger.debug(f"'{cmd_name}' commands unavailable: {e}")
+            return None
+        self.add_command(command, cmd_name)
+        return command
+
 
 # =============================================================================
 # Main App Creation
 # =============================================================================
 
 app = typer.Typer(
+    cls=LazyGroup,
     add_completion=False,
     help="bpsai-pair: AI pair-coding workflow CLI",
     context_settings={"help_option_names": ["-h", "--help"]}
 )
 
-# =============================================================================
-# Sub-App Registration
-# =============================================================================
-
-# Planning system sub-apps
-app.add_typer(plan_app, name="plan")
-app.add_typer(task_app, name="task")
-app.add_typer(intent_app, name="intent")
-app.add_typer(standup_app, name="standup")
-app.add_typer(sprint_app, name="sprint")
-app.add_typer(release_app, name="release")
-app.add_typer(template_app, name="template")
-app.add_typer(migrate_app, name="migrate")
-app.add_typer(skill_app, name="skill")
-app.add_typer(subagent_app, name="subagent")
-app.add_typer(gaps_app, name="gaps")
-app.add_typer(audit_app, name="audit")
-
-# Extracted command sub-apps
-app.add_typer(orchestrate_app, name="orchestrate")
-app.add_typer(metrics_app, name="metrics")
-app.add_typer(preset_app, name="preset")
-app.add_typer(config_app, name="config")
-app.add_typer(timer_app, name="timer")
-app.add_typer(benchmark_app, name="benchmark")
-app.add_typer(cache_app, name="cache")
-app.add_typer(mcp_app, name="mcp")
-app.add_typer(security_app, name="security")
-app.add_typer(session_app, name="session")
-app.add_typer(compaction_app, name="compaction")
-app.add_typer(containment_app, name="containment")
-app.add_typer(upgrade_app, name="upgrade")
-app.add_typer(budget_app, name="budget")
-app.add_typer(state_app, name="state")
-
-# Integration sub-apps (optional - may not be installed)
-try:
-    app.add_typer(trello_app, name="trello")
-    app.add_typer(trello_task_app, name="ttask")
-except NameError:
-    pass  # Trello module not available
-
-try:
-    app.add_typer(github_app, name="github")
-except NameError:
-    pass  # GitHub module not available
-
-# =============================================================================
-# Core Commands Registration
-# =============================================================================
-
-# Register core commands (init, feature, pack, context-sync, status, validate, ci)
-register_core_commands(app)
-
-# Register contained-auto as a top-level command
-app.command("contained-auto")(contained_auto)
-
-# Register claude666 alias (undocumented easter egg)
-app.command("claude666", hidden=True)(claude666)
-
 # =============================================================================
 # Shortcut Commands
 # =============================================================================
@@ -157,9 +178,14 @@ def scan_secrets_shortcut(
     diff_ref: Optional[str] = typer.Option(None, "--diff", "-d", help="Scan diff since git reference"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    jobs: int = typer.Option(0, "--jobs", "-j", help="Worker processes for directory scans (0 = one per CPU)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan files recorded as clean by earlier scans"),
 ):
     """Scan for secrets and credentials (shortcut for 'security scan-secrets')."""
-    scan_secrets(path=path, staged=staged, diff_ref=diff_ref, verbose=verbose, json_out=json_out)
+    from .commands.security import scan_secrets
+
+    scan_secrets(path=path, staged=staged, diff_ref=diff_ref, verbose=verbose, json_out=json_out,
+                 jobs=jobs, no_cache=no_cache)
 
 
 @app.command("scan-deps")
@@ -169,9 +195,12 @@ def scan_deps_shortcut(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Disable caching"),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Audits to run at once"),
 ):
     """Scan dependencies for vulnerabilities (shortcut for 'security scan-deps')."""
-    scan_deps(path=path, fail_on=fail_on, verbose=verbose, json_out=json_out, no_cache=no_cache)
+    from .commands.security import scan_deps
+
+    scan_deps(path=path, fail_on=fail_on, verbose=verbose, json_out=json_out, no_cache=no_cache, jobs=jobs)
 
 # =============================================================================
 # App Callback (Version)
@@ -180,7 +209,11 @@ def scan_deps_shortcut(
 def version_callback(value: bool):
     """Show version and exit."""
     if value:
-        console.print(f"[bold blue]bpsai-pair[/bold blue] version {__version__}")
+        from rich.console import Console
+
+        from . import __version__
+
+        Console().print(f"[bold blue]bpsai-pair[/bold blue] version {__version__}")
         raise typer.Exit()
 
 
@@ -192,9 +225,15 @@ def main(
         "-v",
         callback=version_callback,
         help="Show version and exit"
-    )
+    ),
+    profile_imports: bool = typer.Option(
+        False,
+        PROFILE_FLAG,
+        help="Report module import times for this command (on stderr)"
+    ),
 ):
     """bpsai-pair: AI pair-coding workflow CLI"""
+    # --profile-imports is handled by run(), before anything is imported
     pass
 
 # =============================================================================
@@ -203,6 +242,12 @@ def main(
 
 def run():
     """Entry point for the CLI."""
+    argv = sys.argv[1:]
+    if PROFILE_FLAG in argv:
+        from .startup import profile_command
+
+        argv.remove(PROFILE_FLAG)
+        raise SystemExit(profile_command(argv))
     app()
 
 
@@ -11,6 +11,8 @@ Sprint 22 extractions:
 - timer: Time tracking integration
 - benchmark: AI agent benchmarking framework
 - cache: Context caching commands
+- history: History log compaction and archival
+- daemon: Per-project command daemon for hooks
 - mcp: MCP server commands
 - flow: Flow management commands
 - security: Security scanning commands
@@ -18,22 +20,48 @@ Sprint 22 extractions:
 - session: Session and compaction management
 """
 
-from .preset import app as preset_app
-from .config import app as config_app
-from .orchestrate import app as orchestrate_app
-from .metrics import app as metrics_app
-from .timer import app as timer_app
-from .benchmark import app as benchmark_app
-from .cache import app as cache_app
-from .mcp import app as mcp_app
-from .security import app as security_app
-from .security import scan_secrets, scan_deps  # For shortcut commands
-from .core import register_core_commands
-from .session import session_app, compaction_app, containment_app, contained_auto, claude666
-from .upgrade import upgrade_app
-from .budget import app as budget_app
-from .audit import app as audit_app
-from .state import app as state_app
+import importlib
+
+# Exported names and the modules that define them. Modules are imported on
+# first access, so importing one command module does not import them all.
+_EXPORTS = {
+    "preset_app": (".preset", "app"),
+    "config_app": (".config", "app"),
+    "orchestrate_app": (".orchestrate", "app"),
+    "metrics_app": (".metrics", "app"),
+    "timer_app": (".timer", "app"),
+    "benchmark_app": (".benchmark", "app"),
+    "cache_app": (".cache", "app"),
+    "history_app": (".history", "app"),
+    "daemon_app": (".daemon", "app"),
+    "mcp_app": (".mcp", "app"),
+    "security_app": (".security", "app"),
+    "scan_secrets": (".security", "scan_secrets"),  # For shortcut commands
+    "scan_deps": (".security", "scan_deps"),
+    "session_app": (".session", "session_app"),
+    "compaction_app": (".session", "compaction_app"),
+    "containment_app": (".session", "containment_app"),
+    "contained_auto": (".session", "contained_auto"),
+    "claude666": (".session", "claude666"),
+    "upgrade_app": (".upgrade", "upgrade_app"),
+    "budget_app": (".budget", "app"),
+    "audit_app": (".audit", "app"),
+    "state_app": (".state", "app"),
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module_name, attr = _EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "preset_app",
@@ -43,11 +71,12 @@ __all__ = [
     "timer_app",
     "benchmark_app",
     "cache_app",
+    "history_app",
+    "daemon_app",
     "mcp_app",
     "security_app",
     "scan_secrets",
     "scan_deps",
-    "register_core_commands",
     "session_app",
     "compaction_app",
     "containment_app",
@@ -29,22 +29,24 @@ def print_json(data: dict) -> None:
 try:
     from ..core import ops
     from ..tokens import (
-        count_file_tokens,
+        count_files_tokens,
         estimate_task_tokens,
         estimate_from_task_file,
         get_budget_status,
         MODEL_LIMITS,
         THRESHOLDS,
+        TokenCountCache,
     )
 except ImportError:
     from bpsai_pair.core import ops
     from bpsai_pair.tokens import (
-        count_file_tokens,
+        count_files_tokens,
         estimate_task_tokens,
         estimate_from_task_file,
         get_budget_status,
         MODEL_LIMITS,
         THRESHOLDS,
+        TokenCountCache,
     )
 
 
@@ -130,7 +132,9 @@ def budget_estimate(
             console.print(f"[red]Error: Task {task_id} not found[/red]")
             raise typer.Exit(2)
 
-        estimate = estimate_from_task_file(task_path)
+        estimate = estimate_from_task_file(
+            task_path, cache=TokenCountCache.for_paircoder_dir(root / ".paircoder")
+        )
         if not estimate:
             console.print(f"[red]Error: Could not parse task file {task_path}[/red]")
             raise typer.Exit(2)
@@ -191,12 +195,15 @@ def budget_estimate(
     elif files:
         # Estimate from specific files
         file_paths = [Path(f) for f in files]
-        total_tokens = sum(count_file_tokens(root / f) for f in file_paths)
+        cache = TokenCountCache.for_paircoder_dir(root / ".paircoder")
+        counts = count_files_tokens([root / f for f in file_paths], cache=cache)
+        file_tokens = {f: counts[root / f] for f in file_paths}
+        total_tokens = sum(file_tokens[f] for f in file_paths)
         status = get_budget_status(total_tokens, model)
 
         if json_out:
             file_breakdown = {
-                str(f): count_file_tokens(root / f) for f in file_paths
+                str(f): file_tokens[f] for f in file_paths
             }
             print_json({
                 "files": file_breakdown,
@@ -214,7 +221,7 @@ def budget_estimate(
             table.add_column("Tokens", justify="right")
 
             for f in file_paths:
-                tokens = count_file_tokens(root / f)
+                tokens = file_tokens[f]
                 table.add_row(str(f), _format_tokens(tokens))
 
             table.add_row("─" * 30, "─" * 10, style="dim")
@@ -284,7 +291,9 @@ def budget_check(
             console.print(f"[red]Error: Task {task_id} not found[/red]")
         raise typer.Exit(2)
 
-    estimate = estimate_from_task_file(task_path)
+    estimate = estimate_from_task_file(
+        task_path, cache=TokenCountCache.for_paircoder_dir(root / ".paircoder")
+    )
     if not estimate:
         if json_out:
             print_json({"error": f"Could not parse task {task_id}", "exit_code": 2})
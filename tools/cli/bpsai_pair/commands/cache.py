@@ -26,9 +26,11 @@ def print_json(data: dict) -> None:
 # Try relative imports first, fall back to absolute
 try:
     from ..core import ops
+    from ..core.config import load_raw_config
     from ..context import ContextCache
 except ImportError:
     from bpsai_pair.core import ops
+    from bpsai_pair.core.config import load_raw_config
     from bpsai_pair.context import ContextCache
 
 
@@ -45,6 +47,24 @@ def repo_root() -> Path:
     return p
 
 
+def open_cache(root: Path) -> ContextCache:
+    """Open the project context cache, applying limits from config.yaml.
+
+    Reads the optional ``cache`` section: ``ttl_hours``, ``max_entries``
+    and ``max_mb``.
+    """
+    config, _ = load_raw_config(root)
+    settings = (config or {}).get("cache") or {}
+    kwargs = {}
+    if "ttl_hours" in settings:
+        kwargs["ttl_hours"] = int(settings["ttl_hours"])
+    if "max_entries" in settings:
+        kwargs["max_entries"] = int(settings["max_entries"])
+    if "max_mb" in settings:
+        kwargs["max_bytes"] = int(float(settings["max_mb"]) * 1024 * 1024)
+    return ContextCache(root / ".paircoder" / "cache", **kwargs)
+
+
 # Cache sub-app
 app = typer.Typer(
     help="Context caching for efficient context management",
@@ -58,7 +78,7 @@ def cache_stats(
 ):
     """Show cache statistics."""
     root = repo_root()
-    cache = ContextCache(root / ".paircoder" / "cache")
+    cache = open_cache(root)
     stats = cache.stats()
 
     if json_out:
@@ -67,6 +87,13 @@ def cache_stats(
         console.print("[bold]Cache Statistics[/bold]")
         console.print(f"  Entries: {stats['entries']}")
         console.print(f"  Total size: {stats['total_bytes']:,} bytes")
+        console.print(
+            f"  Limits: {stats['max_entries']} entries, {stats['max_bytes']:,} bytes"
+        )
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = f" ({stats['hits'] / lookups:.0%} hit rate)" if lookups else ""
+        console.print(f"  Hits: {stats['hits']}  Misses: {stats['misses']}{hit_rate}")
+        console.print(f"  Evictions: {stats['evictions']}")
         if stats['oldest']:
             console.print(f"  Oldest: {stats['oldest']}")
         if stats['newest']:
@@ -83,7 +110,7 @@ def cache_clear(
         raise typer.Exit(1)
 
     root = repo_root()
-    cache = ContextCache(root / ".paircoder" / "cache")
+    cache = open_cache(root)
     count = cache.clear()
     console.print(f"[green]Cleared {count} cache entries[/green]")
 
@@ -94,7 +121,7 @@ def cache_invalidate(
 ):
     """Invalidate cache for a specific file."""
     root = repo_root()
-    cache = ContextCache(root / ".paircoder" / "cache")
+    cache = open_cache(root)
     full_path = root / file_path
 
     if cache.invalidate(full_path):
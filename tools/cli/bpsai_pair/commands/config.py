@@ -13,9 +13,9 @@ from rich.console import Console
 
 # Try relative imports first, fall back to absolute
 try:
-    from ..core import ops
+    from ..core import ops, yamlio
 except ImportError:
-    from bpsai_pair.core import ops
+    from bpsai_pair.core import ops, yamlio
 
 # Initialize Rich console
 console = Console()
@@ -180,8 +180,6 @@ def config_show(
         # Show specific section
         bpsai-pair config show hooks
     """
-    import yaml
-
     # Import here to avoid circular imports
     try:
         from ..core.config import load_raw_config
@@ -210,4 +208,4 @@ def config_show(
     else:
         output = raw_config
 
-    console.print(yaml.dump(output, default_flow_style=False, sort_keys=False))
+    console.print(yamlio.dump(output, sort_keys=False))
@@ -30,11 +30,11 @@ from rich.table import Table
 
 # Try relative imports first, fall back to absolute
 try:
-    from ..core import ops
+    from ..core import ops, yamlio
     from ..core.config import Config
     from ..core.presets import get_preset, get_preset_names, list_presets
 except ImportError:
-    from bpsai_pair.core import ops
+    from bpsai_pair.core import ops, yamlio
     from bpsai_pair.core.config import Config
     from bpsai_pair.core.presets import get_preset, get_preset_names, list_presets
 
@@ -158,8 +158,6 @@ def init_command(
 
     Use --interactive for guided setup, or no flags for minimal scaffolding.
     """
-    import yaml
-
     # Import here to avoid circular imports
     try:
         from .. import init_bundled_cli
@@ -191,8 +189,7 @@ def init_command(
 
         # Write config file
         config_file = paircoder_dir / "config.yaml"
-        with open(config_file, 'w', encoding="utf-8") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yamlio.dump_file(config_dict, config_file, sort_keys=False)
 
         console.print(f"[green]![/green] Applied preset: {preset}")
         console.print(f"  Project: {p_name}")
@@ -225,8 +222,7 @@ def init_command(
                 paircoder_dir = root / ".paircoder"
                 paircoder_dir.mkdir(exist_ok=True)
                 config_file = paircoder_dir / "config.yaml"
-                with open(config_file, 'w', encoding="utf-8") as f:
-                    yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+                yamlio.dump_file(config_dict, config_file, sort_keys=False)
                 console.print(f"[green]![/green] Applied preset: {preset_choice}")
             else:
                 console.print(f"[yellow]! Unknown preset, using defaults[/yellow]")
@@ -938,8 +934,9 @@ def history_log_command(
         timestamp = datetime.now().isoformat(timespec="seconds")
         entry = f"{timestamp} {path_to_log}\n"
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(entry)
+        from ..metrics.writer import append_locked
+
+        append_locked(log_file, entry.encode("utf-8"))
 
         if not quiet:
             console.print(f"[green]![/green] Logged: {path_to_log}")
@@ -948,21 +945,3 @@ def history_log_command(
             return  # Silent exit for hooks
         console.print(f"[red]Error logging file change: {e}[/red]")
         raise typer.Exit(1)
-
-
-def register_core_commands(app: typer.Typer) -> None:
-    """Register all core commands on the main app.
-
-    Args:
-        app: The main Typer application
-    """
-    app.command("init")(init_command)
-    app.command("feature")(feature_command)
-    app.command("pack")(pack_command)
-    app.command("context-sync")(context_sync_command)
-    # Alias for context-sync
-    app.command("sync", hidden=True)(context_sync_command)
-    app.command("status")(status_command)
-    app.command("validate")(validate_command)
-    app.command("ci")(ci_command)
-    app.command("history-log", hidden=True)(history_log_command)
@@ -0,0 +1,141 @@
+"""Daemon commands: start, stop and status of the per-project command daemon."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+
+import typer
+from rich.console import Console
+
+# Initialize Rich console
+console = Console()
+
+
+def print_json(data: dict) -> None:
+    """Print JSON to stdout without Rich formatting."""
+    sys.stdout.write(json.dumps(data, indent=2))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+# Try relative imports first, fall back to absolute
+try:
+    from ..daemon import client
+    from ..daemon.server import DEFAULT_IDLE_TIMEOUT, DaemonError, DaemonServer
+    from .cache import repo_root
+except ImportError:
+    from bpsai_pair.daemon import client
+    from bpsai_pair.daemon.server import DEFAULT_IDLE_TIMEOUT, DaemonError, DaemonServer
+    from bpsai_pair.commands.cache import repo_root
+
+
+# Daemon sub-app
+app = typer.Typer(
+    help="Keep a warm command daemon for hook invocations",
+    context_settings={"help_option_names": ["-h", "--help"]}
+)
+
+# Seconds `daemon start` waits for a new daemon to answer
+START_TIMEOUT = 15.0
+
+
+def _require_support() -> None:
+    if not client.SUPPORTED:
+        console.print("[red]The command daemon needs Unix domain sockets (not available on this platform)[/red]")
+        raise typer.Exit(1)
+
+
+@app.command("start")
+def daemon_start(
+    idle_minutes: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT / 60, "--idle-minutes", help="Exit after this many idle minutes"
+    ),
+    foreground: bool = typer.Option(False, "--foreground", help="Run in this process (Ctrl+C to stop)"),
+):
+    """Start a daemon that serves hook commands for this project.
+
+    While it runs, `session check`, `session status`, `compaction check`,
+    `compaction snapshot save`, `task update` and `status` are executed by
+    the daemon. Without one they run in-process as usual; set
+    BPSAI_PAIR_NO_DAEMON=1 to bypass a running daemon.
+    """
+    _require_support()
+    root = repo_root()
+    if client.request(root, {"op": "ping"}, timeout=5) is not None:
+        console.print(f"[yellow]Daemon already running for {root}[/yellow]")
+        return
+
+    if foreground:
+        server = DaemonServer(root, idle_timeout=idle_minutes * 60)
+        try:
+            server.bind()
+        except DaemonError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+        server.warm()
+        console.print(f"[green]Serving {root}[/green] [dim]({server.socket_path})[/dim]")
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            server.close()
+        return
+
+    log_path = root / ".paircoder" / "cache" / "daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "bpsai_pair.daemon.server",
+             "--root", str(root), "--idle-timeout", str(idle_minutes * 60)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            cwd=root, start_new_session=True,
+        )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        reply = client.request(root, {"op": "ping"}, timeout=5)
+        if reply is not None:
+            console.print(f"[green]Daemon started[/green] (pid {reply['pid']})")
+            return
+        if process.poll() is not None:
+            break
+        time.sleep(0.05)
+    console.print(f"[red]Daemon did not start; see {log_path}[/red]")
+    raise typer.Exit(1)
+
+
+@app.command("stop")
+def daemon_stop():
+    """Stop this project's daemon."""
+    _require_support()
+    root = repo_root()
+    if client.request(root, {"op": "stop"}, timeout=5) is None:
+        console.print("[dim]No daemon running[/dim]")
+        return
+    console.print("[green]Daemon stopped[/green]")
+
+
+@app.command("status")
+def daemon_status(
+    json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Show whether a daemon is serving this project."""
+    _require_support()
+    root = repo_root()
+    reply = client.request(root, {"op": "ping"}, timeout=5)
+    if json_out:
+        data: dict = {"running": reply is not None}
+        if reply is not None:
+            data.update({k: v for k, v in reply.items() if k != "ok"})
+        print_json(data)
+        return
+
+    if reply is None:
+        console.print("[dim]No daemon running[/dim]")
+        return
+    console.print(f"[green]Daemon running[/green] (pid {reply['pid']})")
+    console.print(f"  Socket:   {reply['socket']}")
+    console.print(f"  Uptime:   {reply['uptime_seconds']:.0f}s")
+    console.print(f"  Requests: {reply['requests']}")
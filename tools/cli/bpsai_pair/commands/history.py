@@ -0,0 +1,120 @@
+"""History commands: compaction and archive status for .paircoder/history."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# Initialize Rich console
+console = Console()
+
+
+def print_json(data: dict) -> None:
+    """Print JSON to stdout without Rich formatting."""
+    sys.stdout.write(json.dumps(data, indent=2))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+# Try relative imports first, fall back to absolute
+try:
+    from ..core.config import load_raw_config
+    from ..core.history import CompactionPolicy, HistoryArchive
+    from .cache import repo_root
+except ImportError:
+    from bpsai_pair.core.config import load_raw_config
+    from bpsai_pair.core.history import CompactionPolicy, HistoryArchive
+    from bpsai_pair.commands.cache import repo_root
+
+
+# History sub-app
+app = typer.Typer(
+    help="Rotate and archive .paircoder/history logs",
+    context_settings={"help_option_names": ["-h", "--help"]}
+)
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@app.command("compact")
+def history_compact(
+    max_mb: Optional[float] = typer.Option(None, "--max-mb", help="Keep live logs under this size"),
+    max_age_days: Optional[int] = typer.Option(
+        None, "--max-age-days", help="Archive lines older than this many days"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be archived"),
+    json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Move cold history lines into gzip archive segments.
+
+    Limits default to the ``history`` section of config.yaml
+    (``max_mb``, ``max_age_days``).
+    """
+    root = repo_root()
+    config, _ = load_raw_config(root)
+    policy = CompactionPolicy.from_config(config)
+    if max_mb is not None:
+        policy.max_bytes = int(max_mb * 1024 * 1024)
+    if max_age_days is not None:
+        policy.max_age_days = max_age_days
+
+    archive = HistoryArchive(root / ".paircoder" / "history")
+    result = archive.compact(policy, dry_run=dry_run)
+
+    if json_out:
+        print_json({"dry_run": dry_run, **result.to_dict()})
+        return
+
+    if not result.segments:
+        console.print("[dim]Nothing to compact[/dim]")
+        return
+
+    verb = "Would archive" if dry_run else "Archived"
+    for segment in result.segments:
+        scope = "whole log" if segment.whole else f"{segment.lines} lines"
+        console.print(f"  {segment.log}: {scope} -> archive/{segment.file}")
+    console.print(
+        f"[green]{verb} {_format_bytes(result.bytes_archived)} "
+        f"({_format_bytes(result.bytes_compressed)} compressed)[/green]"
+    )
+
+
+@app.command("status")
+def history_status(
+    json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Show live log sizes and archived segments."""
+    root = repo_root()
+    archive = HistoryArchive(root / ".paircoder" / "history")
+    live = {path.name: path.stat().st_size for path in archive.live_logs()}
+    segments = archive.segments()
+
+    if json_out:
+        print_json({"live": live, "segments": [s.to_dict() for s in segments]})
+        return
+
+    table = Table(title="History Logs")
+    table.add_column("Log")
+    table.add_column("Live", justify="right")
+    table.add_column("Segments", justify="right")
+    table.add_column("Archived", justify="right")
+    for name in sorted(set(live) | {s.log for s in segments}):
+        archived = [s for s in segments if s.log == name]
+        table.add_row(
+            name,
+            _format_bytes(live[name]) if name in live else "-",
+            str(len(archived)),
+            _format_bytes(sum(s.bytes for s in archived)) if archived else "-",
+        )
+    console.print(table)
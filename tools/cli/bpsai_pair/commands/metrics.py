@@ -7,7 +7,9 @@ from __future__ import annotations
 
 import json
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
@@ -28,9 +30,11 @@ def print_json(data: dict) -> None:
 try:
     from ..core import ops
     from ..metrics import MetricsCollector, MetricsReporter, BudgetEnforcer, VelocityTracker
+    from ..metrics.analytics import MetricsDataset
 except ImportError:
     from bpsai_pair.core import ops
     from bpsai_pair.metrics import MetricsCollector, MetricsReporter, BudgetEnforcer, VelocityTracker
+    from bpsai_pair.metrics.analytics import MetricsDataset
 
 
 def repo_root() -> Path:
@@ -53,11 +57,16 @@ def _get_metrics_collector() -> MetricsCollector:
     return MetricsCollector(history_dir)
 
 
+def _get_dataset(history_dir: Path) -> MetricsDataset:
+    """History loaded once and shared by the reports in this invocation."""
+    return MetricsDataset.shared(history_dir)
+
+
 def _get_velocity_tracker() -> VelocityTracker:
     """Get a velocity tracker instance."""
     root = repo_root()
     history_dir = root / ".paircoder" / "history"
-    return VelocityTracker(history_dir)
+    return VelocityTracker(history_dir, dataset=_get_dataset(history_dir))
 
 
 def _get_burndown_generator():
@@ -68,7 +77,7 @@ def _get_burndown_generator():
         from bpsai_pair.metrics import BurndownGenerator
     root = repo_root()
     history_dir = root / ".paircoder" / "history"
-    return BurndownGenerator(history_dir)
+    return BurndownGenerator(history_dir, dataset=_get_dataset(history_dir))
 
 
 def _get_accuracy_analyzer():
@@ -79,7 +88,7 @@ def _get_accuracy_analyzer():
         from bpsai_pair.metrics.accuracy import AccuracyAnalyzer
     root = repo_root()
     history_dir = root / ".paircoder" / "history"
-    return AccuracyAnalyzer(history_dir)
+    return AccuracyAnalyzer(history_dir, dataset=_get_dataset(history_dir))
 
 
 def _get_token_tracker():
@@ -90,7 +99,7 @@ def _get_token_tracker():
         from bpsai_pair.metrics.estimation import TokenFeedbackTracker
     root = repo_root()
     history_dir = root / ".paircoder" / "history"
-    return TokenFeedbackTracker(history_dir)
+    return TokenFeedbackTracker(history_dir, dataset=_get_dataset(history_dir))
 
 
 # Metrics sub-app for token tracking and cost estimation
@@ -216,22 +225,72 @@ def metrics_budget(
             console.print(f"[yellow]⚠ {status.alert_message}[/yellow]")
 
 
+@app.command("rebuild")
+def metrics_rebuild(
+    json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Recompute the metrics store and spend counters from the raw logs."""
+    collector = _get_metrics_collector()
+
+    events = collector.rebuild_counters()
+
+    if json_out:
+        print_json({"events": events})
+    else:
+        console.print(f"[green]✓[/green] Rebuilt metrics counters from {events} events")
+
+
+def _parse_day(value: str, end: bool = False) -> datetime:
+    """YYYY-MM-DD as the start (or, for end dates, the last moment) of that day."""
+    try:
+        day = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        console.print(f"[red]Invalid date format: {value}. Use YYYY-MM-DD.[/red]")
+        raise typer.Exit(1)
+    return day + timedelta(days=1, microseconds=-1) if end else day
+
+
 @app.command("export")
 def metrics_export(
-    output: str = typer.Option("metrics.csv", "--output", "-o", help="Output file path"),
-    format_type: str = typer.Option("csv", "--format", "-f", help="Export format: csv"),
+    output: str = typer.Option("metrics.csv", "--output", "-o", help="Output file path ('-' for stdout, csv only)"),
+    format_type: str = typer.Option("csv", "--format", "-f", help="Export format: csv, npz"),
+    columns: Optional[str] = typer.Option(
+        None, "--columns", "-c", help="Comma-separated columns to export (default: all)"
+    ),
+    start_date: Optional[str] = typer.Option(None, "--start", help="First day (YYYY-MM-DD)"),
+    end_date: Optional[str] = typer.Option(None, "--end", help="Last day (YYYY-MM-DD)"),
 ):
-    """Export metrics to file."""
+    """Export metrics to file.
+
+    Rows are streamed from the metrics store. CSV is written as it streams,
+    in constant memory. npz writes one NumPy array per column (timestamps
+    as datetime64[us]) and buffers the columns until the end, about 8 bytes
+    per value.
+    """
     collector = _get_metrics_collector()
     reporter = MetricsReporter(collector)
+    selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    start_dt = _parse_day(start_date) if start_date else None
+    end_dt = _parse_day(end_date, end=True) if end_date else None
 
-    if format_type.lower() == "csv":
-        csv_content = reporter.export_csv()
-        Path(output).write_text(csv_content, encoding="utf-8")
-        console.print(f"[green]✓[/green] Exported metrics to {output}")
-    else:
-        console.print(f"[red]Unsupported format: {format_type}[/red]")
+    format_type = format_type.lower()
+    try:
+        reporter.export_columns(selected)
+        if format_type == "csv":
+            if output == "-":
+                reporter.write_csv(sys.stdout, start_dt, end_dt, selected)
+                return
+            with open(output, "w", encoding="utf-8", newline="") as f:
+                rows = reporter.write_csv(f, start_dt, end_dt, selected)
+        elif format_type == "npz":
+            rows = reporter.write_npz(Path(output), start_dt, end_dt, selected)
+        else:
+            console.print(f"[red]Unsupported format: {format_type}[/red]")
+            raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
         raise typer.Exit(1)
+    console.print(f"[green]✓[/green] Exported {rows} events to {output}")
 
 
 @app.command("velocity")
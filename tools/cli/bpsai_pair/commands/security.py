@@ -64,6 +64,19 @@ def _get_secret_scanner():
     return SecretScanner(allowlist), root
 
 
+def _get_secret_scan_cache(root: Path):
+    """The project's secret scan cache, or None outside a PairCoder project."""
+    try:
+        from ..security.secrets import SecretScanCache
+    except ImportError:
+        from bpsai_pair.security.secrets import SecretScanCache
+
+    paircoder_dir = root / ".paircoder"
+    if not paircoder_dir.is_dir():
+        return None
+    return SecretScanCache.for_paircoder_dir(paircoder_dir)
+
+
 @app.command("scan-secrets")
 def scan_secrets(
     path: Optional[str] = typer.Argument(None, help="File or directory to scan"),
@@ -71,10 +84,14 @@ def scan_secrets(
     diff_ref: Optional[str] = typer.Option(None, "--diff", "-d", help="Scan diff since git reference (e.g., HEAD~1)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    jobs: int = typer.Option(0, "--jobs", "-j", help="Worker processes for directory scans (0 = one per CPU)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan files recorded as clean by earlier scans"),
 ):
     """Scan for secrets and credentials in code.
 
-    By default, scans all files in the current directory.
+    By default, scans all files in the current directory. Directory scans
+    skip files that are unchanged since an earlier scan found them clean
+    (cached in .paircoder/cache/secret-scan.json).
 
     Examples:
 
@@ -92,16 +109,17 @@ def scan_secrets(
         from bpsai_pair.security import format_scan_results
 
     scanner, root = _get_secret_scanner()
+    cache = None if no_cache else _get_secret_scan_cache(root)
 
     matches = []
 
     if staged:
         # Scan staged changes
-        matches = scanner.scan_staged(root)
+        matches = scanner.scan_staged(root, stream=True)
         scan_target = "staged changes"
     elif diff_ref:
         # Scan since reference
-        matches = scanner.scan_commit_range(diff_ref, root)
+        matches = scanner.scan_commit_range(diff_ref, root, stream=True)
         scan_target = f"changes since {diff_ref}"
     elif path:
         # Scan specific path
@@ -110,14 +128,14 @@ def scan_secrets(
             matches = scanner.scan_file(target)
             scan_target = str(target)
         elif target.is_dir():
-            matches = scanner.scan_directory(target)
+            matches = scanner.scan_directory(target, jobs=jobs, cache=cache)
             scan_target = f"directory {target}"
         else:
             console.print(f"[red]Path not found: {path}[/red]")
             raise typer.Exit(1)
     else:
         # Scan entire project
-        matches = scanner.scan_directory(root)
+        matches = scanner.scan_directory(root, jobs=jobs, cache=cache)
         scan_target = "project"
 
     if json_out:
@@ -159,7 +177,7 @@ def pre_commit_hook(
         from bpsai_pair.security import format_scan_results
 
     scanner, root = _get_secret_scanner()
-    matches = scanner.scan_staged(root)
+    matches = scanner.scan_staged(root, stream=True)
 
     if json_out:
         print_json({
@@ -232,6 +250,7 @@ def scan_deps(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Disable caching of scan results"),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Audits (pip-audit, npm audit) to run at once"),
 ):
     """Scan dependencies for known vulnerabilities.
 
@@ -251,7 +270,7 @@ def scan_deps(
         from bpsai_pair.security import DependencyScanner, Severity, format_scan_report
 
     root = Path(path) if path else repo_root()
-    scanner = DependencyScanner()
+    scanner = DependencyScanner(max_workers=jobs)
 
     report = scanner.scan_all(root, use_cache=not no_cache)
 
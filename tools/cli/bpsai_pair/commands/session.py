@@ -586,9 +586,9 @@ def session_status(
             console.print("[bold]Token Budget:[/bold]")
 
             try:
-                from ..tokens import estimate_from_task_file, get_budget_status, MODEL_LIMITS
+                from ..tokens import estimate_from_task_file, get_budget_status, MODEL_LIMITS, TokenCountCache
             except ImportError:
-                from bpsai_pair.tokens import estimate_from_task_file, get_budget_status, MODEL_LIMITS
+                from bpsai_pair.tokens import estimate_from_task_file, get_budget_status, MODEL_LIMITS, TokenCountCache
 
             # Try to find current in-progress task
             current_task_id = _get_current_task_id(paircoder_dir)
@@ -603,7 +603,9 @@ def session_status(
                         break
 
                 if task_file:
-                    estimate = estimate_from_task_file(task_file)
+                    estimate = estimate_from_task_file(
+                        task_file, cache=TokenCountCache.for_paircoder_dir(paircoder_dir)
+                    )
                     if estimate:
                         status = get_budget_status(estimate.total)
                         bar = _get_progress_bar(estimate.budget_percent)
@@ -18,9 +18,9 @@ from rich.console import Console
 
 # Try relative imports first, fall back to absolute
 try:
-    from ..core import ops
+    from ..core import ops, yamlio
 except ImportError:
-    from bpsai_pair.core import ops
+    from bpsai_pair.core import ops, yamlio
 
 console = Console()
 
@@ -196,8 +196,7 @@ def plan_upgrade(project_root: Path, template: Path) -> UpgradePlan:
     config_path = project_root / ".paircoder" / "config.yaml"
     if config_path.exists():
         try:
-            import yaml
-            config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+            config = yamlio.load_file(config_path, cache=True) or {}
 
             required_sections = ["trello", "hooks", "estimation", "metrics"]
             for section in required_sections:
@@ -307,8 +306,7 @@ def execute_upgrade(
         config_path = project_root / ".paircoder" / "config.yaml"
         if config_path.exists():
             try:
-                import yaml
-                config_data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+                config_data = yamlio.load_file(config_path, cache=True) or {}
 
                 defaults = {
                     "trello": {
@@ -341,8 +339,7 @@ def execute_upgrade(
                         config_data[section] = defaults[section]
                         results["config_sections_added"] += 1
 
-                with open(config_path, "w", encoding="utf-8") as f:
-                    yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+                yamlio.dump_file(config_data, config_path, sort_keys=False)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not update config: {e}[/yellow]")
 
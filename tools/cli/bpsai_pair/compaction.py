@@ -15,7 +15,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 
-import yaml
+from .core.state_cache import StateSummary, parse_state, read_state
 
 logger = logging.getLogger(__name__)
 
@@ -157,64 +157,36 @@ class CompactionManager:
         return snapshot_path
 
     def _create_snapshot_from_state(self, timestamp: datetime, trigger: str) -> CompactionSnapshot:
-        """Create a snapshot by parsing state.md."""
+        """Create a snapshot from the parsed (cached) state.md."""
         snapshot = CompactionSnapshot(timestamp=timestamp, trigger=trigger)
 
-        state_path = self.context_dir / "state.md"
-        if not state_path.exists():
-            return snapshot
-
         try:
-            content = state_path.read_text(encoding="utf-8")
-            snapshot = self._parse_state_for_snapshot(content, timestamp, trigger)
-        except IOError as e:
+            summary = read_state(self.context_dir / "state.md")
+        except (IOError, ValueError) as e:
             logger.warning(f"Failed to read state.md: {e}")
+            return snapshot
 
+        if summary is not None:
+            snapshot = self._snapshot_from_summary(summary, timestamp, trigger)
         return snapshot
 
     def _parse_state_for_snapshot(self, content: str, timestamp: datetime, trigger: str) -> CompactionSnapshot:
         """Parse state.md content for snapshot."""
-        snapshot = CompactionSnapshot(timestamp=timestamp, trigger=trigger)
-        lines = content.split("\n")
-
-        current_section = None
-
-        for line in lines:
-            stripped = line.strip()
+        return self._snapshot_from_summary(parse_state(content), timestamp, trigger)
 
-            # Detect sections
-            if stripped.startswith("## "):
-                current_section = stripped[3:].lower()
-                continue
-
-            # Parse Active Plan section
-            if current_section == "active plan":
-                if stripped.startswith("**Plan:**"):
-                    snapshot.active_plan = stripped.replace("**Plan:**", "").strip()
-
-            # Parse task table
-            if current_section and "sprint" in current_section and "task" in current_section:
-                if "|" in stripped and "in_progress" in stripped.lower():
-                    parts = [p.strip() for p in stripped.split("|") if p.strip()]
-                    if len(parts) >= 2:
-                        snapshot.current_task_id = parts[0] if parts[0] != "ID" else None
-                        snapshot.current_task_title = parts[1] if len(parts) > 1 else None
-
-            # Parse Progress line
-            if stripped.startswith("**Progress:**"):
-                snapshot.progress = stripped.replace("**Progress:**", "").strip()
-
-            # Parse What Was Just Done
-            if current_section == "what was just done":
-                if stripped.startswith("- ") and not snapshot.last_done:
-                    snapshot.last_done = stripped[2:]
-
-            # Parse What's Next
-            if current_section == "what's next":
-                if (stripped.startswith("1. ") or stripped.startswith("- ")) and not snapshot.whats_next:
-                    snapshot.whats_next = stripped.lstrip("1.- ")
-
-        return snapshot
+    @staticmethod
+    def _snapshot_from_summary(summary: StateSummary, timestamp: datetime,
+                               trigger: str) -> CompactionSnapshot:
+        return CompactionSnapshot(
+            timestamp=timestamp,
+            trigger=trigger,
+            active_plan=summary.active_plan,
+            current_task_id=summary.current_task_id,
+            current_task_title=summary.current_task_title,
+            progress=summary.progress,
+            last_done=summary.last_done,
+            whats_next=summary.next_step,
+        )
 
     def _get_recent_files(self) -> List[str]:
         """Get list of recently changed files from changes.log."""
@@ -250,6 +222,8 @@ class CompactionManager:
 
     def _log_compaction(self, trigger: str, reason: Optional[str], snapshot_path: Path) -> None:
         """Log compaction event to history."""
+        from .metrics.writer import append_locked
+
         try:
             timestamp = datetime.now().isoformat()
             log_entry = f"{timestamp} compaction trigger={trigger}"
@@ -257,8 +231,7 @@ class CompactionManager:
                 log_entry += f" reason=\"{reason}\""
             log_entry += f" snapshot={snapshot_path.name}\n"
 
-            with open(self.compaction_log, "a", encoding="utf-8") as f:
-                f.write(log_entry)
+            append_locked(self.compaction_log, log_entry.encode("utf-8"))
         except IOError as e:
             logger.warning(f"Failed to log compaction: {e}")
 
@@ -1,11 +1,64 @@
-"""Context cache for static files."""
+"""Context cache for static files.
 
-import json
-from dataclasses import dataclass, asdict
+Entry metadata lives in a single SQLite database
+(.paircoder/cache/context-cache.db), so every mutation is an atomic
+transaction, concurrent CLI invocations serialize on the database lock
+instead of clobbering a shared index file, and eviction is a query rather
+than a full rewrite. Content is written to the shared content-addressed
+blob store (.paircoder/cache/blobs), so identical files are stored once.
+
+Writes made inside ``with cache.batch():`` are committed together; access
+times and hit/miss counters are buffered in memory and committed with the
+next write, on flush(), or when the cache object is discarded.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from hashlib import sha256
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..core.blobs import BLOBS_DIRNAME, BlobStore
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "context-cache.db"
+SCHEMA_VERSION = 3
+
+# Default LRU caps
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Buffered access-time updates are committed once this many accumulate
+BATCH_SIZE = 64
+
+# Seconds to wait for another process holding the write lock
+LOCK_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    cached_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+COUNTERS = ("hits", "misses", "evictions")
 
 
 @dataclass
@@ -18,36 +71,226 @@ class CacheEntry:
     content_hash: str
 
 
+@dataclass
+class _PendingWrites:
+    """Writes buffered in memory until the next commit."""
+    entries: Dict[str, Tuple] = field(default_factory=dict)
+    touches: Dict[str, float] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.entries or self.touches or self.counters)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        str(db_path), timeout=LOCK_TIMEOUT, isolation_level=None, check_same_thread=False
+    )
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.DatabaseError:
+        pass  # e.g. network filesystems; rollback journal still works
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _commit(
+    conn: sqlite3.Connection,
+    pending: _PendingWrites,
+    max_entries: int,
+    max_bytes: int,
+) -> int:
+    """Apply buffered writes and evict least recently used entries.
+
+    Returns:
+        Number of entries evicted
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if pending.entries:
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries "
+                "(key, path, mtime_ns, cached_at, last_access, size_bytes, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, *row) for key, row in pending.entries.items()],
+            )
+        if pending.touches:
+            conn.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+                [(ts, key) for key, ts in pending.touches.items()],
+            )
+        evicted = _evict(conn, max_entries, max_bytes) if pending.entries else 0
+        if evicted:
+            pending.count("evictions", evicted)
+        if pending.counters:
+            conn.executemany(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                list(pending.counters.items()),
+            )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    pending.entries.clear()
+    pending.touches.clear()
+    pending.counters.clear()
+    return evicted
+
+
+def _evict(conn: sqlite3.Connection, max_entries: int, max_bytes: int) -> int:
+    count, total = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+    ).fetchone()
+    if count <= max_entries and total <= max_bytes:
+        return 0
+
+    victims: List[str] = []
+    for key, size in conn.execute(
+        "SELECT key, size_bytes FROM entries ORDER BY last_access ASC"
+    ):
+        if count <= max_entries and total <= max_bytes:
+            break
+        victims.append(key)
+        count -= 1
+        total -= size
+    conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in victims])
+    return len(victims)
+
+
+def _finalize(conn: sqlite3.Connection, pending: _PendingWrites, max_entries: int, max_bytes: int) -> None:
+    """Commit leftovers when a cache object is garbage collected or at exit."""
+    try:
+        if pending:
+            _commit(conn, pending, max_entries, max_bytes)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to flush context cache: {e}")
+    finally:
+        conn.close()
+
+
 class ContextCache:
     """Cache for static context files.
 
-    Caches file content with mtime-based invalidation and TTL expiry.
+    Caches file content with mtime-based invalidation, TTL expiry and a
+    least-recently-used cap on entry count and total size.
     """
 
-    def __init__(self, cache_dir: Path, ttl_hours: int = 24):
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_hours: int = 24,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
-        self.index_file = cache_dir / "index.json"
-        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.db_path = cache_dir / DB_FILENAME
+        self.blobs = BlobStore(cache_dir / BLOBS_DIRNAME)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._pending = _PendingWrites()
+        self._conn = _connect(self.db_path)
+        self._init_db()
+        self._finalizer = weakref.finalize(
+            self, _finalize, self._conn, self._pending, max_entries, max_bytes
+        )
 
-    def _load_index(self) -> Dict[str, Dict[str, Any]]:
-        """Load cache index from disk."""
-        if self.index_file.exists():
-            try:
-                return json.loads(self.index_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                return {}
-        return {}
+    def _init_db(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+        self._conn.executescript(_SCHEMA)
+        if version != SCHEMA_VERSION:
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._remove_legacy_files()
 
-    def _save_index(self) -> None:
-        """Save cache index to disk."""
-        self.index_file.write_text(json.dumps(self._index, indent=2), encoding="utf-8")
+    def _remove_legacy_files(self) -> None:
+        """Delete the v1 index.json and its per-entry .txt files."""
+        import json
+
+        index_file = self.cache_dir / "index.json"
+        if not index_file.exists():
+            return
+        try:
+            keys = list(json.loads(index_file.read_text(encoding="utf-8")))
+        except (ValueError, OSError):
+            keys = []
+        for key in keys:
+            (self.cache_dir / f"{key}.txt").unlink(missing_ok=True)
+        index_file.unlink(missing_ok=True)
 
     def _cache_key(self, file_path: Path) -> str:
         """Generate cache key from file path."""
         return sha256(str(file_path.resolve()).encode()).hexdigest()[:16]
 
+    @staticmethod
+    def _mtime_ns(file_path: Path) -> int:
+        try:
+            return file_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _entry(path: str, mtime_ns: int, cached_at: float, size_bytes: int, content_hash: str) -> CacheEntry:
+        return CacheEntry(
+            path=path,
+            mtime=mtime_ns / 1e9,
+            cached_at=datetime.fromtimestamp(cached_at).isoformat(),
+            size_bytes=size_bytes,
+            content_hash=content_hash,
+        )
+
+    def _maybe_commit(self) -> None:
+        if self._batch_depth == 0 and (self._pending.entries or len(self._pending.touches) >= BATCH_SIZE):
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit buffered writes, access times and counters."""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                evicted = _commit(self._conn, self._pending, self.max_entries, self.max_bytes)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write context cache: {e}")
+                return
+        if evicted:
+            self.blobs.prune()
+
+    @contextmanager
+    def batch(self) -> Iterator["ContextCache"]:
+        """Group writes into a single transaction committed on exit."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def close(self) -> None:
+        """Flush and close the database connection."""
+        self._finalizer()
+
+    def _lookup(self, key: str) -> Optional[Tuple]:
+        pending = self._pending.entries.get(key)
+        if pending is not None:
+            return pending
+        return self._conn.execute(
+            "SELECT path, mtime_ns, cached_at, last_access, size_bytes, content_hash "
+            "FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+
     def get(self, file_path: Path) -> Optional[Tuple[str, CacheEntry]]:
         """Get cached content if valid.
 
@@ -55,39 +298,28 @@ class ContextCache:
             Tuple of (content, entry) or None if cache miss
         """
         key = self._cache_key(file_path)
+        with self._lock:
+            row = self._lookup(key)
 
-        if key not in self._index:
-            return None
-
-        entry_data = self._index[key]
+        # File and blob I/O happen outside the lock so concurrent loads overlap
+        now = time.time()
+        valid = (
+            row is not None
+            and self._mtime_ns(file_path) <= row[1]  # file unchanged
+            and now - row[2] <= self.ttl.total_seconds()  # not expired
+        )
+        data = self.blobs.get(row[5]) if valid else None
 
-        # Check file mtime
-        if file_path.exists():
-            current_mtime = file_path.stat().st_mtime
-            if current_mtime > entry_data["mtime"]:
-                return None  # File changed
+        with self._lock:
+            if data is None:
+                self._pending.count("misses")
+                return None
+            self._pending.count("hits")
+            self._pending.touches[key] = now
+            self._maybe_commit()
 
-        # Check TTL
-        try:
-            cached_at = datetime.fromisoformat(entry_data["cached_at"])
-            if datetime.now() - cached_at > self.ttl:
-                return None  # Expired
-        except (KeyError, ValueError):
-            return None
-
-        # Read cached content
-        cache_file = self.cache_dir / f"{key}.txt"
-        if not cache_file.exists():
-            return None
-
-        entry = CacheEntry(
-            path=entry_data["path"],
-            mtime=entry_data["mtime"],
-            cached_at=entry_data["cached_at"],
-            size_bytes=entry_data["size_bytes"],
-            content_hash=entry_data["content_hash"],
-        )
-        return cache_file.read_text(encoding="utf-8"), entry
+        path, mtime_ns, cached_at, _, size_bytes, content_hash = row
+        return data.decode("utf-8"), self._entry(path, mtime_ns, cached_at, size_bytes, content_hash)
 
     def set(self, file_path: Path, content: str) -> CacheEntry:
         """Cache content for file.
@@ -96,62 +328,61 @@ class ContextCache:
             Cache entry metadata
         """
         key = self._cache_key(file_path)
-
-        # Write content
-        cache_file = self.cache_dir / f"{key}.txt"
-        cache_file.write_text(content, encoding="utf-8")
-
-        # Create entry
-        entry = CacheEntry(
-            path=str(file_path),
-            mtime=file_path.stat().st_mtime if file_path.exists() else 0,
-            cached_at=datetime.now().isoformat(),
-            size_bytes=len(content.encode("utf-8")),
-            content_hash=sha256(content.encode()).hexdigest()[:16],
+        encoded = content.encode("utf-8")
+        now = time.time()
+        row = (
+            str(file_path),
+            self._mtime_ns(file_path),
+            now,
+            now,
+            len(encoded),
+            self.blobs.put(encoded),
         )
-
-        # Update index
-        self._index[key] = asdict(entry)
-        self._save_index()
-
-        return entry
+        with self._lock:
+            self._pending.entries[key] = row
+            self._pending.touches.pop(key, None)
+            self._maybe_commit()
+        return self._entry(row[0], row[1], row[2], row[4], row[5])
 
     def invalidate(self, file_path: Path) -> bool:
         """Invalidate cache for file."""
         key = self._cache_key(file_path)
-        if key in self._index:
-            del self._index[key]
-            cache_file = self.cache_dir / f"{key}.txt"
-            cache_file.unlink(missing_ok=True)
-            self._save_index()
-            return True
-        return False
+        with self._lock:
+            self.flush()
+            self._pending.touches.pop(key, None)
+            cursor = self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
 
     def clear(self) -> int:
-        """Clear entire cache. Returns count of cleared entries."""
-        count = len(self._index)
-        for key in list(self._index.keys()):
-            cache_file = self.cache_dir / f"{key}.txt"
-            cache_file.unlink(missing_ok=True)
-        self._index = {}
-        self._save_index()
-        return count
+        """Clear entire cache. Returns count of cleared entries.
 
-    def stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        if not self._index:
-            return {
-                "entries": 0,
-                "total_bytes": 0,
-                "oldest": None,
-                "newest": None,
-            }
+        Only blobs referenced by cache entries are deleted; the store is
+        shared with the context and handoff packers.
+        """
+        with self._lock:
+            self.flush()
+            self._pending.touches.clear()
+            digests = [row[0] for row in self._conn.execute("SELECT DISTINCT content_hash FROM entries")]
+            cursor = self._conn.execute("DELETE FROM entries")
+            for digest in digests:
+                self.blobs.delete(digest)
+        return cursor.rowcount
 
-        cached_times = [e.get("cached_at") for e in self._index.values() if e.get("cached_at")]
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics, including lifetime hit/miss/eviction counts."""
+        with self._lock:
+            self.flush()
+            count, total, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), MIN(cached_at), MAX(cached_at) FROM entries"
+            ).fetchone()
+            counters = dict(self._conn.execute("SELECT name, value FROM counters"))
 
         return {
-            "entries": len(self._index),
-            "total_bytes": sum(e.get("size_bytes", 0) for e in self._index.values()),
-            "oldest": min(cached_times) if cached_times else None,
-            "newest": max(cached_times) if cached_times else None,
+            "entries": count,
+            "total_bytes": total,
+            "oldest": datetime.fromtimestamp(oldest).isoformat() if oldest is not None else None,
+            "newest": datetime.fromtimestamp(newest).isoformat() if newest is not None else None,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            **{name: counters.get(name, 0) for name in COUNTERS},
         }
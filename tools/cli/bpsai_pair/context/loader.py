@@ -1,10 +1,16 @@
 """Context loader with caching support."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Tuple
 
 from .cache import ContextCache
 
+# Upper bound on prefetch threads; there are only a handful of context files
+MAX_PREFETCH_WORKERS = 8
+
 
 class ContextLoader:
     """Load context files with caching.
@@ -34,6 +40,9 @@ class ContextLoader:
         self.cache = cache or ContextCache(project_root / ".paircoder" / "cache")
         self.hits = 0
         self.misses = 0
+        # relative path -> {"latency_ms": float, "cache_hit": bool | None}
+        self.file_stats: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
 
     def load(self, relative_path: str) -> str:
         """Load file content, using cache if eligible.
@@ -47,6 +56,23 @@ class ContextLoader:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
+        start = time.perf_counter()
+        content, cache_hit = self._load(relative_path)
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        with self._stats_lock:
+            if cache_hit is True:
+                self.hits += 1
+            elif cache_hit is False:
+                self.misses += 1
+            self.file_stats[relative_path] = {
+                "latency_ms": round(latency_ms, 3),
+                "cache_hit": cache_hit,
+            }
+        return content
+
+    def _load(self, relative_path: str) -> Tuple[str, Optional[bool]]:
+        """Load a file; the flag is None for non-cacheable files."""
         file_path = self.project_root / relative_path
 
         if not file_path.exists():
@@ -54,44 +80,59 @@ class ContextLoader:
 
         # Check if cacheable
         if relative_path not in self.CACHEABLE:
-            return file_path.read_text(encoding="utf-8")
+            return file_path.read_text(encoding="utf-8"), None
 
         # Try cache
         cached = self.cache.get(file_path)
         if cached:
-            self.hits += 1
-            return cached[0]
+            return cached[0], True
 
         # Cache miss - load and cache
-        self.misses += 1
         content = file_path.read_text(encoding="utf-8")
         self.cache.set(file_path, content)
-        return content
+        return content, False
 
-    def load_all_context(self) -> Dict[str, str]:
+    def load_all_context(self, prefetch: bool = True, max_workers: Optional[int] = None) -> Dict[str, str]:
         """Load all standard context files.
 
+        Args:
+            prefetch: Load files concurrently on a thread pool; cache writes
+                from all files are committed in one batch either way
+            max_workers: Thread count (default: one per file, at most
+                MAX_PREFETCH_WORKERS)
+
         Returns:
             Dict mapping relative paths to content
         """
-        context = {}
-        for path in self.CACHEABLE:
-            full_path = self.project_root / path
-            if full_path.exists():
-                context[path] = self.load(path)
-        return context
+        paths = [p for p in self.CACHEABLE if (self.project_root / p).exists()]
+        with self.cache.batch():
+            if prefetch and len(paths) > 1:
+                workers = max_workers or min(len(paths), MAX_PREFETCH_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    contents = list(pool.map(self.load, paths))
+            else:
+                contents = [self.load(p) for p in paths]
+        return dict(zip(paths, contents))
 
     def get_stats(self) -> Dict:
-        """Get loader statistics."""
-        total = self.hits + self.misses
-        return {
-            "hits": self.hits,
-            "misses": self.misses,
-            "hit_rate": self.hits / total if total > 0 else 0,
-            "cache": self.cache.stats(),
-        }
+        """Get loader statistics, including per-file latency and cache hits
+        for the most recent load of each file."""
+        with self._stats_lock:
+            total = self.hits + self.misses
+            files = {path: dict(stat) for path, stat in self.file_stats.items()}
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total > 0 else 0,
+                "files": files,
+                "total_latency_ms": round(sum(f["latency_ms"] for f in files.values()), 3),
+            }
+        stats["cache"] = self.cache.stats()
+        return stats
 
     def reset_stats(self) -> None:
-        """Reset hit/miss counters."""
-        self.hits = 0
-        self.misses = 0
+        """Reset hit/miss counters and per-file stats."""
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+            self.file_stats = {}
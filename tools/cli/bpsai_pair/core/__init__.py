@@ -2,20 +2,27 @@
 
 This module consolidates shared utilities that were previously scattered
 at the package root level:
+- blobs: Content-addressed blob store shared by caches and packers
 - config: Configuration loading and management
 - constants: Application constants
+- history: Rotation and gzip archival of .paircoder/history logs
 - hooks: Hook system for task lifecycle events
 - ops: Git and file operations
 - presets: Preset system for common configurations
+- state_cache: Parsed state.md shared by status, session and compaction
 - utils: General utilities (merged from utils, pyutils, jsonio)
+- yamlio: YAML loading/dumping (libyaml when available, cached config reads)
 """
 
+from . import blobs
 from . import config
 from . import constants
+from . import history
 from . import hooks
 from . import ops
 from . import presets
 from . import utils
+from . import yamlio
 
 # Re-export commonly used classes for convenience
 from .config import (
@@ -62,12 +69,15 @@ from .ops import (
 
 __all__ = [
     # Modules
+    "blobs",
     "config",
     "constants",
+    "history",
     "hooks",
     "ops",
     "presets",
     "utils",
+    "yamlio",
     # Config classes and functions
     "Config",
     "ConfigValidationResult",
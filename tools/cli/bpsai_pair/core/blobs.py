@@ -0,0 +1,285 @@
+"""Content-addressed blob store.
+
+Blobs are keyed by the sha256 of their content and shared under
+.paircoder/cache/blobs, so identical content (the same state.md or
+AGENTS.md cached by ContextCache and packed into every handoff) is stored
+once. Each blob can also carry a pre-compressed tar member, letting
+write_targz() build .tgz archives without re-compressing unchanged files.
+
+Layout:
+    blobs/<ab>/<sha256>        raw content
+    blobs/<ab>/<sha256>.tgzm   gzip member of the content padded to tar blocks
+
+Usage:
+    from bpsai_pair.core.blobs import BlobStore, write_targz
+
+    store = BlobStore.for_project(root)
+    digest = store.put(b"...")
+    write_targz(output, [("AGENTS.md", root / "AGENTS.md")], store=store)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+import tarfile
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIRNAME = "blobs"
+MEMBER_SUFFIX = ".tgzm"
+
+# prune() trims the store back under this size
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_BLOCK = tarfile.BLOCKSIZE
+_RECORD = tarfile.RECORDSIZE
+_COMPRESSLEVEL = 9
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps members byte-identical across runs
+    return gzip.compress(data, compresslevel=_COMPRESSLEVEL, mtime=0)
+
+
+def _padding(size: int, unit: int) -> bytes:
+    remainder = size % unit
+    return b"\0" * (unit - remainder) if remainder else b""
+
+
+class BlobStore:
+    """sha256-keyed store of immutable content."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the store.
+
+        Args:
+            root: Blob directory (usually .paircoder/cache/blobs)
+            max_bytes: Size prune() trims the store back under by default
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> Optional["BlobStore"]:
+        """Store under a project's .paircoder/cache, or None if the project
+        has no .paircoder directory (nothing is created outside it)."""
+        paircoder_dir = Path(project_root) / ".paircoder"
+        if not paircoder_dir.is_dir():
+            return None
+        return cls(paircoder_dir / "cache" / BLOBS_DIRNAME)
+
+    def path_for(self, digest: str) -> Path:
+        """Location of a blob (which may not exist)."""
+        return self.root / digest[:2] / digest
+
+    def _write(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark a blob as recently used (prune() evicts by mtime)."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def has(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def put(self, data: bytes) -> str:
+        """
+        Store content if not already present.
+
+        Args:
+            data: Raw bytes
+
+        Returns:
+            sha256 hex digest of data
+        """
+        digest = _digest(data)
+        path = self.path_for(digest)
+        if path.exists():
+            self._touch(path)
+        else:
+            self._write(path, data)
+        return digest
+
+    def put_file(self, file_path: Path) -> str:
+        """Store a file's content; returns its digest."""
+        return self.put(Path(file_path).read_bytes())
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """Content for a digest, or None if missing or corrupt."""
+        path = self.path_for(digest)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if _digest(data) != digest:
+            logger.warning(f"Discarding corrupt blob {digest}")
+            self.delete(digest)
+            return None
+        return data
+
+    def delete(self, digest: str) -> None:
+        path = self.path_for(digest)
+        path.unlink(missing_ok=True)
+        path.with_name(path.name + MEMBER_SUFFIX).unlink(missing_ok=True)
+
+    def tar_member(self, digest: str) -> Optional[bytes]:
+        """
+        Gzip member holding a blob's content padded to tar blocks.
+
+        Built on first use and kept next to the blob, so repeat archives
+        reuse the compressed bytes.
+
+        Returns:
+            Compressed member, or None if the blob is missing
+        """
+        member_path = self.path_for(digest).with_name(digest + MEMBER_SUFFIX)
+        try:
+            member = member_path.read_bytes()
+            self._touch(member_path)
+            return member
+        except OSError:
+            pass
+        data = self.get(digest)
+        if data is None:
+            return None
+        member = _gzip(data + _padding(len(data), _BLOCK))
+        try:
+            self._write(member_path, member)
+        except OSError as e:
+            logger.warning(f"Failed to cache compressed blob {digest}: {e}")
+        return member
+
+    def _files(self) -> List[Tuple[float, int, Path]]:
+        files = []
+        if not self.root.exists():
+            return files
+        for path in self.root.glob("*/*"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def size(self) -> int:
+        """Total bytes on disk."""
+        return sum(size for _, size, _ in self._files())
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Delete least recently used blobs until the store fits max_bytes.
+
+        Args:
+            max_bytes: Size limit (defaults to the store's max_bytes)
+
+        Returns:
+            Number of files deleted
+        """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Delete every blob."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+ArchiveSource = Union[Path, bytes]
+
+
+def write_targz(
+    output: Path,
+    members: Iterable[Tuple[str, ArchiveSource]],
+    store: Optional[BlobStore] = None,
+) -> None:
+    """
+    Write a .tar.gz as a sequence of gzip members.
+
+    gzip readers (including tarfile's "r:gz") treat concatenated members as
+    one stream, so each file's data can be compressed independently and, for
+    content in the blob store, reused from a previous archive. Tar headers
+    are small and compressed fresh.
+
+    Args:
+        output: Archive path
+        members: (arcname, source) pairs; source is a file path or raw bytes.
+            File members keep their mtime and permission bits.
+        store: Blob store to write file content through (None compresses
+            everything fresh). It is pruned back under its size cap once the
+            archive is written.
+    """
+    offset = 0
+    tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as out:
+            for arcname, source in members:
+                info = tarfile.TarInfo(name=arcname)
+                if isinstance(source, bytes):
+                    data: Optional[bytes] = source
+                    info.mtime = int(time.time())
+                    info.mode = 0o644
+                else:
+                    st = source.stat()
+                    data = source.read_bytes()
+                    info.mtime = int(st.st_mtime)
+                    info.mode = st.st_mode & 0o7777
+                info.size = len(data)
+                header = info.tobuf(format=tarfile.DEFAULT_FORMAT)
+                out.write(_gzip(header))
+
+                member = None
+                if store is not None and not isinstance(source, bytes):
+                    try:
+                        member = store.tar_member(store.put(data))
+                    except OSError as e:
+                        logger.warning(f"Blob store unavailable ({e}), compressing directly")
+                if member is None:
+                    member = _gzip(data + _padding(len(data), _BLOCK))
+                out.write(member)
+                offset += len(header) + info.size + len(_padding(info.size, _BLOCK))
+
+            # End-of-archive marker, padded to a full record like tarfile does
+            trailer = b"\0" * (2 * _BLOCK)
+            out.write(_gzip(trailer + _padding(offset + len(trailer), _RECORD)))
+        os.replace(tmp_path, output)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if store is not None:
+        try:
+            store.prune()
+        except OSError as e:
+            logger.warning(f"Failed to prune blob store: {e}")
@@ -59,8 +59,9 @@ def log_bypass(
         "metadata": metadata or {},
     }
 
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    from ..metrics.writer import append_locked
+
+    append_locked(log_path, (json.dumps(entry) + "\n").encode("utf-8"))
 
     if not silent:
         console.print(f"[yellow]⚠️ BYPASS LOGGED:[/yellow] {command} on {target}")
@@ -82,34 +83,38 @@ def get_bypasses(
     Returns:
         List of bypass entries, newest first
     """
+    from .history import HistoryArchive
+
     log_path = get_bypass_log_path()
-    if not log_path.exists():
-        return []
 
     cutoff = None
     if since_days:
         cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
 
+    # Includes entries archived by `history compact` (only the segments
+    # that overlap the requested window are read)
+    archive = HistoryArchive(log_path.parent)
+    start = cutoff.replace(tzinfo=None) if cutoff else None
+
     bypasses = []
-    with open(log_path, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+    for line in archive.iter_lines(log_path, start=start):
+        if line.strip():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            # Filter by time
+            if cutoff:
+                entry_time = datetime.fromisoformat(entry["timestamp"].rstrip("Z")).replace(tzinfo=timezone.utc)
+                if entry_time < cutoff:
                     continue
 
-                # Filter by time
-                if cutoff:
-                    entry_time = datetime.fromisoformat(entry["timestamp"].rstrip("Z")).replace(tzinfo=timezone.utc)
-                    if entry_time < cutoff:
-                        continue
-
-                # Filter by type
-                if bypass_type and entry.get("bypass_type") != bypass_type:
-                    continue
+            # Filter by type
+            if bypass_type and entry.get("bypass_type") != bypass_type:
+                continue
 
-                bypasses.append(entry)
+            bypasses.append(entry)
 
     # Return newest first
     bypasses.reverse()
@@ -7,10 +7,11 @@ import os
 import re
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
-import yaml
 import json
 from dataclasses import dataclass, asdict, field
 
+from . import yamlio
+
 
 # Default network domains allowed in containment mode
 DEFAULT_CONTAINMENT_NETWORK_ALLOWLIST = [
@@ -267,8 +268,7 @@ def load_raw_config(root: Path) -> Tuple[Optional[Dict[str, Any]], Optional[Path
     if not config_file or not config_file.exists():
         return None, None
 
-    with open(config_file) as f:
-        data = yaml.safe_load(f) or {}
+    data = yamlio.load_file(config_file, cache=True) or {}
 
     return data, config_file
 
@@ -410,8 +410,7 @@ def save_raw_config(root: Path, config: Dict[str, Any]) -> Path:
         config_dir.mkdir(exist_ok=True)
         config_file = config_dir / "config.yaml"
 
-    with open(config_file, 'w', encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    yamlio.dump_file(config, config_file, sort_keys=False)
 
     return config_file
 
@@ -479,42 +478,41 @@ class Config:
 
         data = {}
         if config_file and config_file.exists():
-            with open(config_file) as f:
-                yaml_data = yaml.safe_load(f) or {}
-
-                # Handle both flat and nested structures
-                if "version" in yaml_data:
-                    # New nested structure
-                    if "project" in yaml_data:
-                        project = yaml_data["project"]
-                        data["project_name"] = project.get("name", "My Project")
-                        data["primary_goal"] = project.get("primary_goal", "Build awesome software")
-                        data["coverage_target"] = project.get("coverage_target", 80)
-
-                    if "workflow" in yaml_data:
-                        workflow = yaml_data["workflow"]
-                        data["default_branch_type"] = workflow.get("default_branch_type", "feature")
-                        data["main_branch"] = workflow.get("main_branch", "main")
-                        data["context_dir"] = workflow.get("context_dir", "context")
-
-                    if "pack" in yaml_data:
-                        pack = yaml_data["pack"]
-                        data["default_pack_name"] = pack.get("default_name", "agent_pack.tgz")
-                        data["pack_excludes"] = pack.get("excludes", [])
-
-                    if "ci" in yaml_data:
-                        ci = yaml_data["ci"]
-                        data["python_formatter"] = ci.get("python_formatter", "ruff")
-                        data["node_formatter"] = ci.get("node_formatter", "prettier")
-
-                    # Load containment config (contained autonomy mode)
-                    if "containment" in yaml_data:
-                        containment_data = yaml_data["containment"]
-                        if isinstance(containment_data, dict):
-                            data["containment"] = ContainmentConfig.from_dict(containment_data)
-                else:
-                    # Old flat structure (backwards compatibility)
-                    data = yaml_data
+            yaml_data = yamlio.load_file(config_file, cache=True) or {}
+
+            # Handle both flat and nested structures
+            if "version" in yaml_data:
+                # New nested structure
+                if "project" in yaml_data:
+                    project = yaml_data["project"]
+                    data["project_name"] = project.get("name", "My Project")
+                    data["primary_goal"] = project.get("primary_goal", "Build awesome software")
+                    data["coverage_target"] = project.get("coverage_target", 80)
+
+                if "workflow" in yaml_data:
+                    workflow = yaml_data["workflow"]
+                    data["default_branch_type"] = workflow.get("default_branch_type", "feature")
+                    data["main_branch"] = workflow.get("main_branch", "main")
+                    data["context_dir"] = workflow.get("context_dir", "context")
+
+                if "pack" in yaml_data:
+                    pack = yaml_data["pack"]
+                    data["default_pack_name"] = pack.get("default_name", "agent_pack.tgz")
+                    data["pack_excludes"] = pack.get("excludes", [])
+
+                if "ci" in yaml_data:
+                    ci = yaml_data["ci"]
+                    data["python_formatter"] = ci.get("python_formatter", "ruff")
+                    data["node_formatter"] = ci.get("node_formatter", "prettier")
+
+                # Load containment config (contained autonomy mode)
+                if "containment" in yaml_data:
+                    containment_data = yaml_data["containment"]
+                    if isinstance(containment_data, dict):
+                        data["containment"] = ContainmentConfig.from_dict(containment_data)
+            else:
+                # Old flat structure (backwards compatibility)
+                data = yaml_data
 
         # Override with environment variables
         env_mappings = {
@@ -579,8 +577,7 @@ class Config:
             "containment": self.containment.to_dict(),
         }
 
-        with open(config_file, 'w', encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yamlio.dump_file(data, config_file, sort_keys=False)
 
         return config_file
 
@@ -0,0 +1,521 @@
+"""History maintenance: rotation, compaction and gzip archival.
+
+Everything under .paircoder/history is an append-only log (metrics-*.jsonl,
+velocity/token/task completion logs, sessions.log, changes.log, bypass logs)
+that would otherwise grow forever. compact() moves cold lines out of the live
+logs into gzip segments under history/archive and records each segment in a
+manifest with its line count and time range:
+
+- monthly metrics logs for past months are archived whole (their query
+  sidecars keep working and can be rebuilt from the archive);
+- any other log has lines older than max_age_days moved out, plus more of its
+  oldest lines if it is still larger than max_bytes.
+
+Readers go through HistoryArchive.iter_lines() / open_log(), which yield the
+archived lines first and only decompress segments whose time range overlaps
+the requested one.
+
+Layout:
+    history/archive/manifest.json
+    history/archive/<log-stem>.<seq>.<suffix>.gz   segment of a log (part or whole)
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIRNAME = "archive"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30
+
+# maybe_compact() runs at most this often
+AUTO_COMPACT_INTERVAL = timedelta(days=1)
+_AUTO_STAMP = ".last-compact"
+
+# Append-only logs that may be compacted. Other files in history/ (gap
+# lists, per-session files) are rewritten in place and are left alone.
+LOG_GLOBS = (
+    "metrics-*.jsonl",
+    "*-completions.jsonl",
+    "token-comparisons.jsonl",
+    "bypass_log.jsonl",
+    "sessions.log",
+    "changes.log",
+    "compaction.log",
+)
+
+_MONTHLY_LOG = re.compile(r"^metrics-(\d{4})-(\d{2})\.jsonl$")
+
+# JSONL fields holding a record's timestamp, in order of preference
+_TIME_FIELDS = ("timestamp", "completed_at")
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    """Naive datetime from an ISO timestamp (offsets dropped), or None."""
+    if not isinstance(value, str) or not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1]
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def line_time(line: bytes) -> Optional[datetime]:
+    """Timestamp of a history line: a JSON record's timestamp field, or the
+    leading token of a text log line."""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    if stripped.startswith(b"{"):
+        try:
+            record = json.loads(stripped)
+        except ValueError:
+            return None
+        if not isinstance(record, dict):
+            return None
+        for name in _TIME_FIELDS:
+            dt = _parse_time(record.get(name))
+            if dt is not None:
+                return dt
+        return None
+    return _parse_time(stripped.split(None, 1)[0].decode("utf-8", "replace"))
+
+
+@dataclass
+class Segment:
+    """A gzip file in the archive holding lines moved out of a log."""
+
+    log: str
+    file: str
+    start: Optional[str]
+    end: Optional[str]
+    lines: int
+    bytes: int
+    whole: bool = False
+    created: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Segment":
+        return cls(
+            log=data["log"],
+            file=data["file"],
+            start=data.get("start"),
+            end=data.get("end"),
+            lines=data.get("lines", 0),
+            bytes=data.get("bytes", 0),
+            whole=data.get("whole", False),
+            created=data.get("created", ""),
+        )
+
+    def overlaps(self, start: Optional[datetime], end: Optional[datetime]) -> bool:
+        """Whether the segment can hold lines in [start, end].
+
+        Segments without any timestamped line always match.
+        """
+        seg_start, seg_end = _parse_time(self.start), _parse_time(self.end)
+        if seg_start is None or seg_end is None:
+            return True
+        if start is not None and seg_end < start:
+            return False
+        if end is not None and seg_start > end:
+            return False
+        return True
+
+
+@dataclass
+class CompactionPolicy:
+    """When to move lines out of the live logs."""
+
+    max_bytes: int = DEFAULT_MAX_BYTES
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS
+    auto: bool = False
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "CompactionPolicy":
+        """Read the optional ``history`` section of config.yaml
+        (``max_mb``, ``max_age_days``, ``auto_compact``)."""
+        settings = (config or {}).get("history") or {}
+        policy = cls()
+        if "max_mb" in settings:
+            policy.max_bytes = int(float(settings["max_mb"]) * 1024 * 1024)
+        if "max_age_days" in settings:
+            policy.max_age_days = int(settings["max_age_days"])
+        policy.auto = bool(settings.get("auto_compact", False))
+        return policy
+
+
+@dataclass
+class CompactionResult:
+    """What a compaction run archived."""
+
+    segments: List[Segment] = field(default_factory=list)
+    bytes_archived: int = 0
+    bytes_compressed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "segments": [s.to_dict() for s in self.segments],
+            "bytes_archived": self.bytes_archived,
+            "bytes_compressed": self.bytes_compressed,
+        }
+
+
+class HistoryArchive:
+    """Archived segments of the logs in a history directory."""
+
+    def __init__(self, history_dir: Path):
+        """
+        Initialize the archive.
+
+        Args:
+            history_dir: .paircoder/history directory
+        """
+        self.history_dir = Path(history_dir)
+        self.archive_dir = self.history_dir / ARCHIVE_DIRNAME
+        self.manifest_path = self.archive_dir / MANIFEST_FILENAME
+
+    # -- manifest ---------------------------------------------------------
+
+    def _load_manifest(self) -> List[Segment]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read history manifest: {e}")
+            return []
+        if data.get("version") != MANIFEST_VERSION:
+            logger.warning(f"Unsupported history manifest version: {data.get('version')}")
+            return []
+        return [Segment.from_dict(s) for s in data.get("segments", [])]
+
+    def _save_manifest(self, segments: List[Segment]) -> None:
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(f"{MANIFEST_FILENAME}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": MANIFEST_VERSION, "segments": [s.to_dict() for s in segments]},
+                    f,
+                    indent=2,
+                )
+            os.replace(tmp_path, self.manifest_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def segments(
+        self,
+        log_name: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Segment]:
+        """
+        Archived segments, oldest first.
+
+        Args:
+            log_name: Only segments of this log (file name, e.g. "sessions.log")
+            start: Only segments that may hold lines at or after this time
+            end: Only segments that may hold lines at or before this time
+
+        Returns:
+            Matching segments
+        """
+        return [
+            s for s in self._load_manifest()
+            if (log_name is None or s.log == log_name) and s.overlaps(start, end)
+        ]
+
+    def archived_logs(self) -> List[str]:
+        """Names of logs that were archived whole (and may no longer exist live)."""
+        return sorted({s.log for s in self._load_manifest() if s.whole})
+
+    # -- reading ----------------------------------------------------------
+
+    def read_segment(self, segment: Segment) -> bytes:
+        """Decompressed content of a segment."""
+        with gzip.open(self.archive_dir / segment.file, "rb") as f:
+            return f.read()
+
+    def iter_lines(
+        self,
+        log_path: Path,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[str]:
+        """
+        Lines of a log in order: archived segments overlapping [start, end],
+        then the live file.
+
+        Lines are not filtered by time; segments outside the range are just
+        never decompressed.
+
+        Args:
+            log_path: Live log path
+            start: Earliest time the caller is interested in
+            end: Latest time the caller is interested in
+
+        Yields:
+            Lines without trailing newlines
+        """
+        log_path = Path(log_path)
+        for segment in self.segments(log_path.name, start, end):
+            try:
+                data = self.read_segment(segment)
+            except (OSError, EOFError) as e:
+                logger.warning(f"Failed to read archived segment {segment.file}: {e}")
+                continue
+            yield from data.decode("utf-8", "replace").splitlines()
+        try:
+            with open(log_path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    yield line.rstrip("\n")
+        except FileNotFoundError:
+            return
+
+    def open_log(self, log_name: str) -> Optional[Tuple[int, BinaryIO]]:
+        """
+        Open a log for binary reading, including its whole-file archives
+        when the log has been archived.
+
+        A log recreated after being archived (a late write to a past month)
+        reads as its archives followed by the live file.
+
+        Returns:
+            (uncompressed size, file object), or None if neither exists
+        """
+        log_path = self.history_dir / log_name
+        archived = []
+        for segment in self.segments(log_name):
+            if segment.whole:
+                try:
+                    archived.append(self.read_segment(segment))
+                except (OSError, EOFError) as e:
+                    logger.warning(f"Failed to read archived segment {segment.file}: {e}")
+        try:
+            f = open(log_path, "rb")
+        except FileNotFoundError:
+            if not archived:
+                return None
+            data = b"".join(archived)
+            return len(data), io.BytesIO(data)
+        if not archived:
+            return os.fstat(f.fileno()).st_size, f
+        with f:
+            data = b"".join(archived) + f.read()
+        return len(data), io.BytesIO(data)
+
+    # -- compaction -------------------------------------------------------
+
+    def live_logs(self) -> List[Path]:
+        """Log files directly under the history directory."""
+        logs = set()
+        for pattern in LOG_GLOBS:
+            logs.update(p for p in self.history_dir.glob(pattern) if p.is_file())
+        return sorted(logs)
+
+    def compact(self, policy: Optional[CompactionPolicy] = None,
+                now: Optional[datetime] = None, dry_run: bool = False) -> CompactionResult:
+        """
+        Move cold lines out of the live logs into gzip segments.
+
+        Args:
+            policy: Size and age limits (defaults to CompactionPolicy())
+            now: Reference time for ages (defaults to now)
+            dry_run: Report what would be archived without changing anything
+
+        Returns:
+            CompactionResult describing the new segments
+        """
+        policy = policy or CompactionPolicy()
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=policy.max_age_days)
+        result = CompactionResult()
+        manifest = self._load_manifest()
+
+        for log_path in self.live_logs():
+            try:
+                planned = self._plan(log_path, policy, now, cutoff)
+            except OSError as e:
+                logger.warning(f"Failed to read {log_path.name} for compaction: {e}")
+                continue
+            if planned is None:
+                continue
+            data, whole = planned
+
+            seq = sum(1 for s in manifest if s.log == log_path.name) + 1
+            segment = self._segment_for(log_path, data, seq, whole, now)
+            compressed = gzip.compress(data, compresslevel=6, mtime=0)
+            result.segments.append(segment)
+            result.bytes_archived += len(data)
+            result.bytes_compressed += len(compressed)
+            if dry_run:
+                continue
+
+            try:
+                self._write_segment(segment, compressed)
+                manifest.append(segment)
+                self._save_manifest(manifest)
+                self._truncate(log_path, len(data), whole)
+            except OSError as e:
+                logger.warning(f"Failed to compact {log_path.name}: {e}")
+                manifest = [s for s in manifest if s is not segment]
+                result.segments.remove(segment)
+                self._discard_segment(segment, manifest)
+        return result
+
+    def _discard_segment(self, segment: Segment, manifest: List[Segment]) -> None:
+        """Undo a segment whose log could not be truncated: publish the
+        manifest without it, then delete its file. Otherwise readers would
+        see its lines twice, archived and still live."""
+        try:
+            self._save_manifest(manifest)
+            (self.archive_dir / segment.file).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to discard segment {segment.file}: {e}")
+
+    def _plan(self, log_path: Path, policy: CompactionPolicy, now: datetime,
+              cutoff: datetime) -> Optional[Tuple[bytes, bool]]:
+        """Bytes to archive from the head of a log and whether that is the
+        whole log, or None if it should be left alone."""
+        monthly = _MONTHLY_LOG.match(log_path.name)
+        if monthly:
+            # The current month's log is never split: its query sidecar
+            # tracks byte offsets. Past months are archived whole.
+            if (int(monthly.group(1)), int(monthly.group(2))) >= (now.year, now.month):
+                return None
+            data = log_path.read_bytes()
+            return (data, True) if data else None
+
+        data = log_path.read_bytes()
+        complete = data.rfind(b"\n") + 1
+        lines = data[:complete].splitlines(keepends=True)
+
+        # Leading lines older than the cutoff
+        head = 0
+        for line in lines:
+            dt = line_time(line)
+            if dt is not None and dt >= cutoff:
+                break
+            head += len(line)
+        if head and all(line_time(line) is None for line in lines):
+            head = 0  # no timestamps at all: rotate by size only
+
+        # Then enough of the oldest lines to bring the log under max_bytes
+        offset = 0
+        for line in lines:
+            if len(data) - max(head, offset) <= policy.max_bytes:
+                break
+            offset += len(line)
+        head = max(head, offset)
+
+        return (data[:head], False) if head else None
+
+    def _segment_for(self, log_path: Path, data: bytes, seq: int, whole: bool,
+                     now: datetime) -> Segment:
+        times = [dt for dt in (line_time(line) for line in data.splitlines()) if dt is not None]
+        # Whole logs are numbered too: a past month's log recreated by a
+        # late write is archived again next to the first segment
+        name = f"{log_path.stem}.{seq:04d}{log_path.suffix}.gz"
+        return Segment(
+            log=log_path.name,
+            file=name,
+            start=min(times).isoformat() if times else None,
+            end=max(times).isoformat() if times else None,
+            lines=data.count(b"\n"),
+            bytes=len(data),
+            whole=whole,
+            created=now.isoformat(),
+        )
+
+    def _write_segment(self, segment: Segment, compressed: bytes) -> None:
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / segment.file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _truncate(self, log_path: Path, archived: int, whole: bool) -> None:
+        """Drop the archived head of a log, keeping anything appended since.
+
+        Holds the lock every writer of these logs appends under
+        (metrics.writer.append_locked), so no record lands in the old file
+        after its tail has been copied.
+        """
+        from ..metrics.writer import exclusive_lock
+
+        with open(log_path, "rb") as f, exclusive_lock(f.fileno()):
+            f.seek(archived)
+            data = f.read()
+            if whole and not data:
+                log_path.unlink()
+                return
+            tmp_path = log_path.with_name(f"{log_path.name}.{os.getpid()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, log_path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+
+def maybe_compact(paircoder_dir: Path, now: Optional[datetime] = None) -> Optional[CompactionResult]:
+    """
+    Compact history if ``history.auto_compact`` is enabled in config.yaml
+    and the last automatic run was more than AUTO_COMPACT_INTERVAL ago.
+
+    Never raises; failures are logged.
+
+    Returns:
+        CompactionResult if compaction ran, else None
+    """
+    from .config import load_raw_config
+
+    try:
+        config, _ = load_raw_config(Path(paircoder_dir).parent)
+        policy = CompactionPolicy.from_config(config)
+        if not policy.auto:
+            return None
+
+        now = now or datetime.now()
+        archive = HistoryArchive(Path(paircoder_dir) / "history")
+        stamp = archive.archive_dir / _AUTO_STAMP
+        try:
+            last = datetime.fromtimestamp(stamp.stat().st_mtime)
+            if now - last < AUTO_COMPACT_INTERVAL:
+                return None
+        except OSError:
+            pass
+
+        result = archive.compact(policy, now=now)
+        archive.archive_dir.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        os.utime(stamp, (now.timestamp(), now.timestamp()))
+        return result
+    except Exception as e:
+        logger.warning(f"Automatic history compaction failed: {e}")
+        return None
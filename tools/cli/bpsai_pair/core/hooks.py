@@ -10,6 +10,7 @@ Automatically triggers actions when task state changes:
 """
 
 import logging
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -214,6 +215,13 @@ class HookRunner:
             logger.warning(f"Timer stop failed: {e}")
             return {"timer_stopped": False, "error": str(e)}
 
+    def _metrics_writer(self):
+        """Process-wide buffered writer for the history logs (see
+        metrics.writer), configured from ``metrics.writer`` in config.yaml."""
+        from ..metrics.writer import WriterPolicy, shared_writer
+
+        return shared_writer(WriterPolicy.from_config(self.config))
+
     def _record_metrics(self, ctx: HookContext) -> dict:
         """Record metrics from context.extra."""
         try:
@@ -222,7 +230,7 @@ class HookRunner:
             history_dir = self.paircoder_dir / "history"
             history_dir.mkdir(exist_ok=True)
 
-            collector = MetricsCollector(history_dir)
+            collector = MetricsCollector(history_dir, writer=self._metrics_writer())
 
             extra = ctx.extra or {}
             event = collector.record_invocation(
@@ -486,7 +494,7 @@ class HookRunner:
             history_dir = self.paircoder_dir / "history"
             history_dir.mkdir(exist_ok=True)
 
-            collector = MetricsCollector(history_dir)
+            collector = MetricsCollector(history_dir, writer=self._metrics_writer())
             data = collector.record_task_completion(
                 task_id=ctx.task_id,
                 estimated_hours=estimated_hours,
@@ -527,7 +535,7 @@ class HookRunner:
             history_dir = self.paircoder_dir / "history"
             history_dir.mkdir(exist_ok=True)
 
-            tracker = VelocityTracker(history_dir)
+            tracker = VelocityTracker(history_dir, writer=self._metrics_writer())
             record = tracker.record_completion(
                 task_id=ctx.task_id,
                 complexity=complexity,
@@ -584,7 +592,7 @@ class HookRunner:
             history_dir = self.paircoder_dir / "history"
             history_dir.mkdir(exist_ok=True)
 
-            tracker = TokenFeedbackTracker(history_dir)
+            tracker = TokenFeedbackTracker(history_dir, writer=self._metrics_writer())
             data = tracker.record_usage(
                 task_id=ctx.task_id,
                 estimated_tokens=estimated,
@@ -618,6 +626,7 @@ class HookRunner:
                 estimate_from_task_file,
                 get_budget_status,
                 THRESHOLDS,
+                TokenCountCache,
             )
 
             # Find task file
@@ -635,17 +644,24 @@ class HookRunner:
                     "reason": f"Task file not found for {ctx.task_id}",
                 }
 
-            estimate = estimate_from_task_file(task_file)
+            # Get threshold from config or use default
+            budget_config = self.config.get("token_budget", {})
+            warning_threshold = budget_config.get("warning_threshold", THRESHOLDS["warning"])
+
+            # Only over/under the threshold matters here, so stop counting
+            # (and reading large files) once the threshold is crossed
+            limit = get_budget_status(0).limit
+            estimate = estimate_from_task_file(
+                task_file,
+                cache=TokenCountCache.for_paircoder_dir(self.paircoder_dir),
+                max_tokens=math.ceil(limit * warning_threshold / 100),
+            )
             if not estimate:
                 return {
                     "budget_checked": False,
                     "reason": "Could not estimate tokens",
                 }
 
-            # Get threshold from config or use default
-            budget_config = self.config.get("token_budget", {})
-            warning_threshold = budget_config.get("warning_threshold", THRESHOLDS["warning"])
-
             status = get_budget_status(estimate.total)
             over_threshold = estimate.budget_percent >= warning_threshold
 
@@ -657,6 +673,7 @@ class HookRunner:
                 "threshold": warning_threshold,
                 "over_threshold": over_threshold,
                 "status": status.status,
+                "estimate_truncated": estimate.truncated,
             }
 
             if over_threshold:
@@ -674,7 +691,8 @@ class HookRunner:
                 elif is_interactive:
                     # Print warning and prompt
                     print("\n\u26a0\ufe0f  TOKEN BUDGET WARNING")
-                    print(f"Task {ctx.task_id} estimated at {estimate.total:,} tokens ({estimate.budget_percent}% of budget)")
+                    at_least = "at least " if estimate.truncated else ""
+                    print(f"Task {ctx.task_id} estimated at {at_least}{estimate.total:,} tokens ({estimate.budget_percent}% of budget)")
                     print(f"Threshold: {warning_threshold}%")
                     print("\nBreakdown:")
                     print(f"  Base context:  {estimate.base_context:,}")
@@ -717,12 +735,16 @@ class HookRunner:
 
 
 def load_config(paircoder_dir: Path) -> dict:
-    """Load configuration from config.yaml."""
-    import yaml
+    """Load configuration from config.yaml.
+
+    Repeat loads of an unchanged file are served from memory, which is what
+    keeps config warm in a long-lived daemon process.
+    """
+    from . import yamlio
 
     config_path = paircoder_dir / "config.yaml"
     if config_path.exists():
-        return yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        return yamlio.load_file(config_path, cache=True) or {}
     return {}
 
 
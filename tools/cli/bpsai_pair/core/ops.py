@@ -6,7 +6,6 @@ from __future__ import annotations
 
 import os
 import subprocess
-import tarfile
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -315,13 +314,22 @@ class ContextPacker:
         ignore_file = root / ".agentpackignore"
         patterns = ContextPacker.read_ignore_patterns(ignore_file)
 
-        # Create tarball
-        with tarfile.open(output, "w:gz") as tar:
-            for file_path in context_files:
-                # Check if file should be excluded
-                if not ContextPacker.should_exclude(file_path, patterns):
-                    arcname = file_path.relative_to(root)
-                    tar.add(file_path, arcname=str(arcname))
+        # Create tarball, writing file content through the shared blob
+        # store so unchanged files reuse their compressed form
+        from .blobs import BlobStore, write_targz
+
+        members = []
+        for file_path in context_files:
+            # Check if file should be excluded
+            if ContextPacker.should_exclude(file_path, patterns):
+                continue
+            if file_path.is_dir():
+                for child in sorted(file_path.rglob("*")):
+                    if child.is_file() and not ContextPacker.should_exclude(child, patterns):
+                        members.append((child.relative_to(root).as_posix(), child))
+            else:
+                members.append((file_path.relative_to(root).as_posix(), file_path))
+        write_targz(output, members, store=BlobStore.for_project(root))
 
         return context_files
 
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
-import yaml
+
+from . import yamlio
 
 
 @dataclass
@@ -220,7 +221,7 @@ class Preset:
             YAML string
         """
         config = self.to_config_dict(project_name, primary_goal)
-        return yaml.dump(config, default_flow_style=False, sort_keys=False)
+        return yamlio.dump(config, sort_keys=False)
 
 
 # Common pack excludes shared across presets
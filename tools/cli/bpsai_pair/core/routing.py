@@ -159,8 +159,8 @@ def load_config_with_routing(path=None):
       require_ac_verification: true
       require_budget_check: true
     """
-    import yaml
     from pathlib import Path
+    from . import yamlio
     from .ops import find_paircoder_dir
     
     if path is None:
@@ -176,8 +176,7 @@ def load_config_with_routing(path=None):
             "enforcement": EnforcementConfig(),
         }
     
-    with open(path, "r") as f:
-        data = yaml.safe_load(f) or {}
+    data = yamlio.load_file(path, cache=True) or {}
     
     # Parse routing section
     routing_data = data.get("routing", {})
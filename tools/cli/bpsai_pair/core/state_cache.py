@@ -0,0 +1,256 @@
+"""Parsed state.md shared by every reader.
+
+`status`, `session check` and the compaction hooks all need the same few
+facts from .paircoder/context/state.md (active plan, sprint, current task,
+what was done / what's next) and fire on nearly every agent turn.
+read_state() parses the file once into a StateSummary and caches it:
+
+- in memory, so a process parses state.md at most once per change;
+- in .paircoder/cache/state-summary.json, keyed by the file's mtime, size
+  and sha1, so later processes skip the parse entirely.
+
+A stat match alone is trusted only when the file had not been modified for
+a couple of seconds when it was cached; otherwise the content hash decides
+(mtime granularity can hide a same-size rewrite made right after a read).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "state-summary.json"
+CACHE_VERSION = 1
+
+# Stat-only cache hits need the file to have been this old when cached
+_RACY_NS = 2_000_000_000
+
+
+@dataclass
+class StateSummary:
+    """Everything the state.md readers extract, from a single parse."""
+
+    # Document-wide fields (planning.state.ProjectState)
+    last_updated: Optional[str] = None
+    plan_id: Optional[str] = None
+    sprint_id: Optional[str] = None
+    what_was_done: List[str] = field(default_factory=list)
+    whats_next: List[str] = field(default_factory=list)
+    blockers: List[str] = field(default_factory=list)
+
+    # Section scan (session context and compaction snapshots)
+    active_plan: Optional[str] = None
+    plan_status: Optional[str] = None
+    current_task_id: Optional[str] = None
+    current_task_title: Optional[str] = None
+    progress: Optional[str] = None
+    last_done: Optional[str] = None
+    next_step: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StateSummary":
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__
+                      if name in data})
+
+
+def _section(content: str, heading: str) -> Optional[str]:
+    match = re.search(heading + r"\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL)
+    return match.group(1).strip() if match else None
+
+
+def parse_state(content: str) -> StateSummary:
+    """
+    Parse state.md content.
+
+    This is a best-effort parser for the Markdown-formatted state file.
+
+    Args:
+        content: state.md text
+
+    Returns:
+        StateSummary
+    """
+    summary = StateSummary()
+
+    updated_match = re.search(r"Last updated:\s*(\d{4}-\d{2}-\d{2})", content)
+    if updated_match:
+        summary.last_updated = updated_match.group(1)
+
+    plan_match = re.search(r"\*\*Plan:\*\*\s*`([^`]+)`", content)
+    if plan_match:
+        summary.plan_id = plan_match.group(1)
+
+    sprint_match = re.search(r"\*\*Current Sprint:\*\*\s*(\S+)", content)
+    if sprint_match:
+        summary.sprint_id = sprint_match.group(1)
+
+    done = _section(content, r"## What Was Just Done")
+    if done is not None:
+        summary.what_was_done = [
+            line.lstrip("- ✅•").strip()
+            for line in done.split("\n")
+            if line.strip() and not line.startswith("#")
+        ]
+
+    upcoming = _section(content, r"## What'?s Next")
+    if upcoming is not None:
+        summary.whats_next = [
+            line.lstrip("- 0123456789.•").strip()
+            for line in upcoming.split("\n")
+            if line.strip() and not line.startswith("#")
+        ]
+
+    blockers = _section(content, r"## Blockers")
+    if blockers is not None and blockers.lower() not in ("none", "none.", "none currently", "none currently."):
+        summary.blockers = [
+            line.lstrip("- •").strip()
+            for line in blockers.split("\n")
+            if line.strip() and not line.startswith("#")
+        ]
+
+    _scan_sections(content, summary)
+    return summary
+
+
+def _scan_sections(content: str, summary: StateSummary) -> None:
+    """Line-by-line pass for the session/compaction fields."""
+    current_section = None
+
+    for line in content.split("\n"):
+        stripped = line.strip()
+
+        if stripped.startswith("## "):
+            current_section = stripped[3:].lower()
+            continue
+
+        if current_section == "active plan":
+            if stripped.startswith("**Plan:**"):
+                summary.active_plan = stripped.replace("**Plan:**", "").strip()
+            elif stripped.startswith("**Status:**"):
+                summary.plan_status = stripped.replace("**Status:**", "").strip()
+
+        # in_progress row of the sprint task table (the last one wins)
+        if current_section and "sprint" in current_section and "task" in current_section:
+            if "|" in stripped and "in_progress" in stripped.lower():
+                parts = [p.strip() for p in stripped.split("|") if p.strip()]
+                if len(parts) >= 2:
+                    summary.current_task_id = parts[0] if parts[0] != "ID" else None
+                    summary.current_task_title = parts[1]
+
+        if stripped.startswith("**Progress:**"):
+            summary.progress = stripped.replace("**Progress:**", "").strip()
+
+        if current_section == "what was just done":
+            if stripped.startswith("- ") and not summary.last_done:
+                summary.last_done = stripped[2:]
+
+        if current_section == "what's next":
+            if (stripped.startswith("1. ") or stripped.startswith("- ")) and not summary.next_step:
+                summary.next_step = stripped.lstrip("1.- ")
+
+
+@dataclass
+class _Entry:
+    key: Tuple[int, int]  # (mtime_ns, size) of state.md
+    sha1: str
+    checked_ns: int  # when the key was recorded
+    summary: StateSummary
+
+    def trusted(self, key: Tuple[int, int]) -> bool:
+        """Whether a matching stat is enough to skip reading the file."""
+        return self.key == key and self.checked_ns - key[0] > _RACY_NS
+
+
+# In-process entries by state.md path
+_memo: Dict[Path, _Entry] = {}
+
+
+def _cache_path(state_path: Path) -> Path:
+    # .paircoder/context/state.md -> .paircoder/cache/state-summary.json
+    return state_path.parent.parent / "cache" / CACHE_FILENAME
+
+
+def _load_cached(cache_path: Path) -> Optional[_Entry]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION:
+            return None
+        return _Entry(
+            key=(data["mtime_ns"], data["size"]),
+            sha1=data["sha1"],
+            checked_ns=data["checked_ns"],
+            summary=StateSummary.from_dict(data["state"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_cached(cache_path: Path, entry: _Entry) -> None:
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": CACHE_VERSION,
+                "mtime_ns": entry.key[0],
+                "size": entry.key[1],
+                "sha1": entry.sha1,
+                "checked_ns": entry.checked_ns,
+                "state": entry.summary.to_dict(),
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Failed to save state cache: {e}")
+
+
+def read_state(state_path: Path) -> Optional[StateSummary]:
+    """
+    Parsed state.md, from cache when the file is unchanged.
+
+    Args:
+        state_path: Path to .paircoder/context/state.md
+
+    Returns:
+        StateSummary, or None if state.md does not exist
+
+    Raises:
+        OSError: If state.md exists but cannot be read
+    """
+    state_path = Path(state_path)
+    try:
+        st = state_path.stat()
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+
+    entry = _memo.get(state_path)
+    if entry is not None and entry.trusted(key):
+        return entry.summary
+
+    cache_path = _cache_path(state_path)
+    cached = _load_cached(cache_path)
+    if cached is not None and cached.trusted(key):
+        _memo[state_path] = cached
+        return cached.summary
+
+    raw = state_path.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    known = next((e for e in (entry, cached) if e is not None and e.sha1 == digest), None)
+    summary = known.summary if known is not None else parse_state(raw.decode("utf-8"))
+    fresh = _Entry(key=key, sha1=digest, checked_ns=time.time_ns(), summary=summary)
+    if cached is None or cached.sha1 != digest or not cached.trusted(key):
+        _save_cached(cache_path, fresh)
+    _memo[state_path] = fresh
+    return summary
@@ -0,0 +1,173 @@
+"""Unified YAML I/O.
+
+All YAML loading and dumping goes through this module so that:
+- the libyaml C loader/dumper (CSafeLoader/CSafeDumper) is used when
+  PyYAML was built with it, falling back to the pure-Python classes;
+- only safe (plain data) tags are ever loaded or emitted;
+- repeated loads of the same config document within a process are served
+  from a cache keyed by (path, mtime, size). A file loaded within _RACY_NS
+  of its mtime is re-read until it is older, since a same-size rewrite
+  inside the timestamp granularity would keep the key.
+
+Usage:
+    from bpsai_pair.core import yamlio
+
+    data = yamlio.load_file(config_path, cache=True)
+    yamlio.dump_file(data, config_path, sort_keys=False)
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any, Dict, IO, Optional, Tuple, Union
+
+import yaml
+
+# Re-exported so callers can catch errors without importing yaml directly
+YAMLError = yaml.YAMLError
+
+HAS_LIBYAML: bool = bool(getattr(yaml, "__with_libyaml__", False)) and hasattr(yaml, "CSafeLoader")
+
+SafeLoader = yaml.CSafeLoader if HAS_LIBYAML else yaml.SafeLoader
+_BaseDumper = yaml.CSafeDumper if HAS_LIBYAML else yaml.SafeDumper
+
+
+class SafeDumper(_BaseDumper):
+    """Safe dumper that also writes enums and paths as plain scalars.
+
+    The unsafe yaml.dump used to emit python/object tags for these, which
+    safe loaders then refused to read back.
+    """
+
+
+def _represent_enum(dumper: yaml.BaseDumper, data: Enum) -> yaml.Node:
+    return dumper.represent_data(data.value)
+
+
+def _represent_path(dumper: yaml.BaseDumper, data: PurePath) -> yaml.Node:
+    return dumper.represent_str(str(data))
+
+
+SafeDumper.add_multi_representer(Enum, _represent_enum)
+SafeDumper.add_multi_representer(PurePath, _represent_path)
+
+# Defaults shared by every dump (PyYAML's own default_flow_style is None in
+# older releases, which produces inline lists)
+_DUMP_DEFAULTS: Dict[str, Any] = {"default_flow_style": False}
+
+_CacheKey = Tuple[str, int, int]
+# path -> (key, when the key was recorded (ns), document)
+_cache: Dict[str, Tuple[_CacheKey, int, Any]] = {}
+
+# Cache hits need the file to have been this old when it was loaded
+_RACY_NS = 2_000_000_000
+_cache_lock = threading.Lock()
+
+
+def load(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document from a string or open stream.
+
+    Args:
+        stream: YAML text or a readable stream
+
+    Returns:
+        Parsed Python object (None for an empty document)
+
+    Raises:
+        YAMLError: If the document is not valid YAML
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream: Optional[IO] = None, **kwargs: Any) -> Optional[str]:
+    """Serialize data to YAML.
+
+    Args:
+        data: Object to serialize (plain data, enums and paths)
+        stream: Optional writable stream; if omitted a string is returned
+        **kwargs: Passed through to yaml.dump (sort_keys, allow_unicode, ...)
+
+    Returns:
+        YAML string when no stream is given, otherwise None
+    """
+    options = {**_DUMP_DEFAULTS, **kwargs}
+    return yaml.dump(data, stream, Dumper=SafeDumper, **options)
+
+
+def _stat_key(path: Path) -> Optional[_CacheKey]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_file(path: Union[str, Path], cache: bool = False) -> Any:
+    """Load a YAML file.
+
+    Args:
+        path: File to read
+        cache: Serve repeat loads of an unchanged file from memory. A deep
+            copy is returned so callers may mutate the result freely.
+
+    Returns:
+        Parsed document (None for an empty file)
+
+    Raises:
+        OSError: If the file cannot be read
+        YAMLError: If the document is not valid YAML
+    """
+    path = Path(path)
+    if not cache:
+        with open(path, "r", encoding="utf-8") as f:
+            return load(f)
+
+    cache_id = str(path.resolve())
+    checked_ns = time.time_ns()  # before the file is read
+    key = _stat_key(path)
+    with _cache_lock:
+        cached = _cache.get(cache_id)
+    if key is not None and cached is not None and cached[0] == key and cached[1] - key[1] > _RACY_NS:
+        return copy.deepcopy(cached[2])
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = load(f)
+    if key is not None:
+        with _cache_lock:
+            _cache[cache_id] = (key, checked_ns, data)
+    return copy.deepcopy(data)
+
+
+def dump_file(data: Any, path: Union[str, Path], **kwargs: Any) -> Path:
+    """Write data to a YAML file (UTF-8) and drop any cached copy.
+
+    Args:
+        data: Object to serialize
+        path: Destination file
+        **kwargs: Passed through to dump
+
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as f:
+        dump(data, f, **kwargs)
+    invalidate(path)
+    return path
+
+
+def invalidate(path: Optional[Union[str, Path]] = None) -> None:
+    """Forget cached documents.
+
+    Args:
+        path: File to forget, or None to clear the whole cache
+    """
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(str(Path(path).resolve()), None)
@@ -0,0 +1,17 @@
+"""Optional per-project daemon for hook-driven commands.
+
+Claude Code hooks run `session check`, `compaction check` and `task update`
+many times per session, and each run pays Python startup, imports and the
+config.yaml parse. `bpsai-pair daemon start` launches a background process
+for the project that keeps the CLI imported, config and the task index
+loaded and caches warm, and runs those commands on behalf of a thin client.
+
+- client: the `bpsai-pair` entry point. Forwards served commands over a
+  Unix domain socket and falls back to running in-process when no daemon
+  is listening (or it is out of date).
+- server: DaemonServer, which runs forwarded commands one at a time and
+  exits after an idle timeout.
+
+Only commands listed in client.SERVED_COMMANDS are forwarded; everything
+else (and anything interactive) always runs in-process.
+"""
@@ -0,0 +1,245 @@
+"""Thin client: the `bpsai-pair` entry point.
+
+Kept to the standard library so that forwarding a command to a running
+daemon costs an interpreter start and a socket round trip, not the CLI's
+imports. Anything the daemon does not serve runs in-process via cli.run().
+"""
+
+import functools
+import hashlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Leading arguments of the commands a daemon runs. Hook commands only:
+# they are non-interactive and their output is small.
+SERVED_COMMANDS = (
+    ("session", "check"),
+    ("session", "status"),
+    ("compaction", "check"),
+    ("compaction", "snapshot", "save"),
+    ("task", "update"),
+    ("status",),
+)
+
+# Set to run every command in-process
+NO_DAEMON_ENV = "BPSAI_PAIR_NO_DAEMON"
+
+# Seconds to wait for a daemon to connect / finish a command
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 300.0
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Unix domain sockets (and per-user socket directories) are POSIX-only
+SUPPORTED = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def find_root(start: Optional[Path] = None) -> Optional[Path]:
+    """Project root as ops.find_project_root() finds it, or None."""
+    cwd = start or Path.cwd()
+    for parent in [cwd, *cwd.parents]:
+        if (parent / ".paircoder").exists() or (parent / ".git").exists():
+            return parent
+    return None
+
+
+def socket_path(root: Path) -> Path:
+    """
+    Socket a project's daemon listens on.
+
+    Sockets live in a per-user directory under $XDG_RUNTIME_DIR (or the temp
+    directory), named by a hash of the project root: socket paths are
+    limited to ~100 bytes, which deep project paths would exceed.
+
+    Args:
+        root: Project root
+
+    Returns:
+        Path of the Unix domain socket
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    digest = hashlib.sha1(str(Path(root).resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(base) / f"bpsai-pair-{os.getuid()}" / f"{digest}.sock"
+
+
+def _source_fingerprint(directory: Path) -> Tuple[int, int]:
+    """Newest mtime (ns) and count of the .py files under a directory."""
+    newest = count = 0
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    newest = max(newest, entry.stat().st_mtime_ns)
+                    count += 1
+    return newest, count
+
+
+def _installed_version(site_dir: Path) -> str:
+    """Version in the package's install metadata next to it, read without
+    importlib.metadata (slow to import), or "" if there is none."""
+    try:
+        with os.scandir(site_dir) as entries:
+            names = [entry.name for entry in entries if entry.name.startswith("bpsai_pair")]
+    except OSError:
+        return ""
+    for name in names:
+        # bpsai_pair-2.9.2.dist-info
+        if name.startswith("bpsai_pair-") and name.endswith(".dist-info"):
+            return name[len("bpsai_pair-"):-len(".dist-info")]
+    if "bpsai_pair.egg-info" in names:
+        # Development installs: the Version: header of PKG-INFO
+        try:
+            with open(site_dir / "bpsai_pair.egg-info" / "PKG-INFO", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("Version:"):
+                        return line.split(":", 1)[1].strip()
+        except OSError:
+            pass
+    return ""
+
+
+@functools.lru_cache(maxsize=None)
+def build_key() -> List[Any]:
+    """Identifies the installed code, so a daemon started before an upgrade
+    (or an edit of any module in a development install) is not used to run
+    the new version's commands. Computed once per process, and by the client
+    only once a daemon has accepted its connection."""
+    return [_installed_version(_PACKAGE_DIR.parent), *_source_fingerprint(_PACKAGE_DIR)]
+
+
+def is_served(argv: Sequence[str]) -> bool:
+    """Whether a command line is one the daemon runs."""
+    return any(tuple(argv[:len(prefix)]) == prefix for prefix in SERVED_COMMANDS)
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Read one newline-terminated JSON message (None if the peer closed)."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    data = b"".join(chunks)
+    return json.loads(data) if data.strip() else None
+
+
+def connect(root: Path) -> Optional[socket.socket]:
+    """Connect to a project's daemon (None if no daemon is listening)."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(socket_path(root)))
+    except OSError:
+        sock.close()
+        return None  # not running (or a stale socket)
+    return sock
+
+
+def exchange(sock: socket.socket, message: Dict[str, Any],
+             timeout: float = REQUEST_TIMEOUT) -> Dict[str, Any]:
+    """
+    Send one request on a connected socket and read the reply.
+
+    Raises:
+        OSError: If the daemon did not reply
+    """
+    sock.settimeout(timeout)
+    send_message(sock, message)
+    reply = recv_message(sock)
+    if reply is None:
+        raise ConnectionError("daemon closed the connection")
+    return reply
+
+
+def request(root: Path, message: Dict[str, Any],
+            timeout: float = REQUEST_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to a project's daemon.
+
+    Args:
+        root: Project root
+        message: Request ({"op": ...})
+        timeout: Seconds to wait for the reply
+
+    Returns:
+        The reply, or None if no daemon is listening
+
+    Raises:
+        OSError: If the daemon accepted the request but did not reply
+    """
+    sock = connect(root)
+    if sock is None:
+        return None
+    try:
+        return exchange(sock, message, timeout)
+    finally:
+        sock.close()
+
+
+def forward(argv: Sequence[str]) -> Optional[int]:
+    """
+    Run a command in the project's daemon, replaying its output here.
+
+    Args:
+        argv: Command line (without the program name)
+
+    Returns:
+        The command's exit code, or None if it has to run in-process
+    """
+    root = find_root()
+    if root is None:
+        return None
+    # Without a daemon (the default) nothing more than the connect is paid
+    sock = connect(root)
+    if sock is None:
+        return None
+    try:
+        reply = exchange(sock, {
+            "op": "run",
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "root": str(root),
+            "build": build_key(),
+        })
+    except (OSError, ValueError) as e:
+        # The command may have run: do not run it a second time
+        sys.stderr.write(f"bpsai-pair: daemon request failed: {e}\n")
+        return 1
+    finally:
+        sock.close()
+    if not reply.get("ok"):
+        return None  # a daemon that cannot run this request
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.stderr.flush()
+    return int(reply.get("exit_code", 0))
+
+
+def main() -> None:
+    """Entry point for the CLI."""
+    argv = sys.argv[1:]
+    if SUPPORTED and is_served(argv) and not os.environ.get(NO_DAEMON_ENV):
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from ..cli import run
+
+    run()
@@ -0,0 +1,263 @@
+"""Daemon process: runs forwarded CLI commands for one project.
+
+Commands run one at a time, in this process, against the Typer app: the
+working directory and environment are switched to the client's for the
+duration of a command and its stdout/stderr are captured and sent back.
+
+Warm state survives between commands: imported modules, config.yaml
+(yamlio's stat-keyed cache), the task index and the parsed state.md. All
+of these are revalidated against the files on every use, so edits made
+outside the daemon are picked up without a restart.
+
+Usage:
+    python -m bpsai_pair.daemon.server --root PATH [--idle-timeout SECONDS]
+"""
+
+import argparse
+import io
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .client import build_key, recv_message, request, send_message, socket_path
+
+logger = logging.getLogger(__name__)
+
+# Exit after this long without a request
+DEFAULT_IDLE_TIMEOUT = 30 * 60.0
+
+
+class DaemonError(Exception):
+    """Raised when a daemon cannot be started."""
+
+
+@contextmanager
+def _client_context(cwd: str, env: Dict[str, str]) -> Iterator[None]:
+    """Run with the client's working directory, environment and no stdin."""
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_stdin = sys.stdin
+    try:
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+        sys.stdin = io.StringIO("")
+        yield
+    finally:
+        sys.stdin = saved_stdin
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+class DaemonServer:
+    """Serves CLI commands for one project over a Unix domain socket."""
+
+    def __init__(self, root: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the server.
+
+        Args:
+            root: Project root
+            idle_timeout: Seconds without a request before exiting
+        """
+        self.root = Path(root).resolve()
+        self.idle_timeout = idle_timeout
+        self.socket_path = socket_path(self.root)
+        self.build = build_key()
+        self.started = time.time()
+        self.requests = 0
+        self._running = False
+        self._sock: Optional[socket.socket] = None
+
+    def bind(self) -> None:
+        """
+        Create the listening socket.
+
+        Raises:
+            DaemonError: If a daemon is already serving this project
+        """
+        directory = self.socket_path.parent
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if directory.stat().st_uid != os.getuid():
+            raise DaemonError(f"{directory} is owned by another user")
+        if self.socket_path.exists():
+            if request(self.root, {"op": "ping"}, timeout=5) is not None:
+                raise DaemonError(f"A daemon is already running for {self.root}")
+            self.socket_path.unlink()  # left behind by a daemon that died
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        sock.listen(16)
+        self._sock = sock
+
+    def warm(self) -> None:
+        """Import the served commands and load project state ahead of the
+        first request. Failures are logged: the request will report them."""
+        from .. import cli
+        from ..core.hooks import load_config
+        from ..core.state_cache import read_state
+        from ..planning.parser import TaskParser
+        from .client import SERVED_COMMANDS
+
+        paircoder_dir = self.root / ".paircoder"
+        try:
+            for name in {prefix[0] for prefix in SERVED_COMMANDS}:
+                cli.load_command(name)
+            load_config(paircoder_dir)
+            TaskParser(paircoder_dir / "tasks").index
+            read_state(paircoder_dir / "context" / "state.md")
+        except Exception as e:
+            logger.warning(f"Daemon warm-up failed: {e}")
+
+    def serve(self) -> None:
+        """Handle requests until stopped or idle for idle_timeout seconds."""
+        if self._sock is None:
+            self.bind()
+        self._sock.settimeout(self.idle_timeout)
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    break  # idle
+                with conn:
+                    self._serve_connection(conn)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening and remove the socket (if it is still ours)."""
+        self._running = False
+        if self._sock is None:
+            return
+        try:
+            if os.path.samestat(os.stat(self.socket_path), os.stat(self._sock.fileno())):
+                self.socket_path.unlink()
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        conn.settimeout(30)
+        try:
+            message = recv_message(conn)
+            if message is None:
+                return
+            send_message(conn, self.handle(message))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Daemon request failed: {e}")
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle one request.
+
+        Args:
+            message: {"op": "ping" | "stop" | "run", ...}
+
+        Returns:
+            Reply; "ok" is False when the client should run the command itself
+        """
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, **self.status()}
+        if op == "stop":
+            self._running = False
+            return {"ok": True}
+        if op != "run":
+            return {"ok": False, "error": f"unknown op: {op}"}
+
+        if message.get("build") != self.build:
+            # Code changed since this daemon started: let the client run it
+            # and retire, so the next `daemon start` loads the new code.
+            self._running = False
+            return {"ok": False, "error": "out of date"}
+        if Path(message.get("root", "")).resolve() != self.root:
+            return {"ok": False, "error": "wrong project"}
+
+        self.requests += 1
+        return self.run(message["argv"], message["cwd"], message.get("env") or {})
+
+    def run(self, argv: List[str], cwd: str, env: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Run one CLI command, capturing its output.
+
+        Args:
+            argv: Command line (without the program name)
+            cwd: Working directory to run in
+            env: Environment to run with
+
+        Returns:
+            {"ok": True, "exit_code", "stdout", "stderr"}
+        """
+        from ..cli import app
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        with _client_context(cwd, env), redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                app(args=argv, prog_name="bpsai-pair")
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+        return {
+            "ok": True,
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "root": str(self.root),
+            "socket": str(self.socket_path),
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "idle_timeout_seconds": self.idle_timeout,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a daemon in the foreground (`daemon start` launches this)."""
+    parser = argparse.ArgumentParser(description="bpsai-pair command daemon")
+    parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    server = DaemonServer(args.root, idle_timeout=args.idle_timeout)
+    try:
+        server.bind()
+    except (DaemonError, OSError) as e:
+        logger.error(str(e))
+        return 1
+
+    def _terminate(signum, frame):
+        server._running = False  # in case a running command swallows the exit
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _terminate)
+    server.warm()
+    print(f"Serving {server.root} on {server.socket_path}", file=sys.stderr, flush=True)
+    server.serve()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -194,30 +194,28 @@ async def test_tool(tool_name: str, input_data: dict) -> dict:
         plan = input_data.get("plan")
         sprint = input_data.get("sprint")
 
-        if plan:
-            tasks = task_parser.get_tasks_for_plan(plan)
-        else:
-            tasks = task_parser.parse_all()
-
+        status_filter = None
         if status != "all":
             try:
                 status_filter = TaskStatus(status)
-                tasks = [t for t in tasks if t.status == status_filter]
             except ValueError:
                 pass
 
-        if sprint:
-            tasks = [t for t in tasks if t.sprint == sprint]
+        entries = task_parser.list_summaries(
+            plan_id=plan or None,
+            status=status_filter,
+            sprint=sprint or None,
+        )
 
         return [
             {
-                "id": t.id,
-                "title": t.title,
-                "status": t.status.value,
-                "priority": t.priority,
-                "sprint": t.sprint,
+                "id": e.id,
+                "title": e.title,
+                "status": e.status,
+                "priority": e.priority,
+                "sprint": e.sprint,
             }
-            for t in tasks
+            for e in entries
         ]
 
     elif tool_name == "paircoder_task_next":
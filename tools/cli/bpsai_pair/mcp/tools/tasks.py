@@ -52,36 +52,33 @@ def register_task_tools(server: Any) -> None:
             paircoder_dir = find_paircoder_dir()
             task_parser = TaskParser(paircoder_dir / "tasks")
 
-            # Get tasks for plan if specified
-            if plan:
-                tasks = task_parser.get_tasks_for_plan(plan)
-            else:
-                tasks = task_parser.parse_all()
-
             # Filter by status
+            status_filter = None
             if status != "all":
                 try:
                     status_filter = TaskStatus(status)
-                    tasks = [t for t in tasks if t.status == status_filter]
                 except ValueError:
                     pass  # Invalid status, return all
 
-            # Filter by sprint
-            if sprint:
-                tasks = [t for t in tasks if t.sprint == sprint]
+            # Answered from the task index - task files are not opened
+            entries = task_parser.list_summaries(
+                plan_id=plan or None,
+                status=status_filter,
+                sprint=sprint or None,
+            )
 
             return [
                 {
-                    "id": t.id,
-                    "title": t.title,
-                    "status": t.status.value,
-                    "priority": t.priority,
-                    "complexity": t.complexity,
-                    "sprint": t.sprint,
-                    "plan": t.plan,
-                    "depends_on": t.depends_on,
+                    "id": e.id,
+                    "title": e.title,
+                    "status": e.status,
+                    "priority": e.priority,
+                    "complexity": e.complexity,
+                    "sprint": e.sprint,
+                    "plan": e.plan_id,
+                    "depends_on": e.depends_on,
                 }
-                for t in tasks
+                for e in entries
             ]
         except FileNotFoundError:
             return {"error": {"code": "NOT_FOUND", "message": "No .paircoder directory found"}}
@@ -113,8 +110,8 @@ def register_task_tools(server: Any) -> None:
                 "priority": task.priority,
                 "complexity": task.complexity,
                 "sprint": task.sprint,
-                "plan": task.plan,
-                "objective": task.objective,
+                "plan": task.plan_id,
+                "objective": task.description,
             }
         except FileNotFoundError:
             return {"error": {"code": "NOT_FOUND", "message": "No .paircoder directory found"}}
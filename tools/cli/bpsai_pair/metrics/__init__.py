@@ -3,6 +3,10 @@
 from .collector import MetricsCollector, MetricsEvent, TokenUsage
 from .budget import BudgetEnforcer, BudgetStatus, BudgetConfig
 from .reports import MetricsReporter, MetricsSummary
+from .store import MetricsStore
+from .timelog import TimeIndexedLog
+from .analytics import MetricsDataset
+from .writer import MetricsWriter, WriterPolicy
 from .estimation import (
     EstimationService,
     EstimationConfig,
@@ -32,6 +36,11 @@ __all__ = [
     "BudgetConfig",
     "MetricsReporter",
     "MetricsSummary",
+    "MetricsStore",
+    "TimeIndexedLog",
+    "MetricsDataset",
+    "MetricsWriter",
+    "WriterPolicy",
     "EstimationService",
     "EstimationConfig",
     "HoursEstimate",
@@ -1,14 +1,19 @@
 """Estimation accuracy analysis and reporting."""
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .analytics import MetricsDataset, RecordTable, group_stats
+from .timelog import TimeIndexedLog
+
 logger = logging.getLogger(__name__)
 
+# Columns read for accuracy reports, with defaults for missing fields
+_COLUMNS = {"variance_percent": 0.0, "task_type": "unknown", "complexity": 30}
+
 # Complexity band definitions (matching estimation.py)
 COMPLEXITY_BANDS = {
     "XS": (0, 15),
@@ -83,40 +88,48 @@ class ComplexityBandAccuracy:
 class AccuracyAnalyzer:
     """Analyzes estimation accuracy from historical task data."""
 
-    def __init__(self, history_dir: Path):
+    def __init__(self, history_dir: Path, dataset: Optional[MetricsDataset] = None):
         """Initialize accuracy analyzer.
 
         Args:
             history_dir: Directory containing task completion history
+            dataset: Loaded-history cache to share with other reports
         """
         self.history_dir = Path(history_dir)
         self._completions_path = self.history_dir / "task-completions.jsonl"
+        self._log = TimeIndexedLog(self._completions_path, "completed_at")
+        self._dataset = dataset or MetricsDataset(self.history_dir)
 
-    def load_completions(self) -> List[Dict[str, Any]]:
+    def _table(self) -> RecordTable:
+        """Completion columns, loaded once per log change."""
+        try:
+            return self._dataset.load(
+                "task-completions", self._log,
+                lambda records: RecordTable.from_records(records, _COLUMNS),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load completions: {e}")
+            return RecordTable.from_records([], _COLUMNS)
+
+    def load_completions(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
         """Load task completion records.
 
+        Args:
+            start_date: Only completions at or after this time
+            end_date: Only completions at or before this time
+
         Returns:
             List of completion records with estimated vs actual data
         """
-        completions = []
-
-        if not self._completions_path.exists():
-            return completions
-
         try:
-            with open(self._completions_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            completions.append(data)
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse completion line: {e}")
+            return list(self._log.read(start_date, end_date))
         except Exception as e:
             logger.warning(f"Failed to load completions: {e}")
-
-        return completions
+            return []
 
     def _get_complexity_band(self, complexity: int) -> str:
         """Map complexity score to band name.
@@ -179,9 +192,9 @@ class AccuracyAnalyzer:
         Returns:
             AccuracyStats with overall metrics
         """
-        completions = self.load_completions()
+        table = self._table()
 
-        if not completions:
+        if not len(table):
             return AccuracyStats(
                 total_tasks=0,
                 overall_accuracy=100.0,
@@ -190,24 +203,18 @@ class AccuracyAnalyzer:
                 avg_variance_percent=0.0,
             )
 
-        # Calculate average variance
-        variances = [c.get("variance_percent", 0.0) for c in completions]
-        avg_variance = sum(variances) / len(variances)
-
-        # Calculate accuracy from average absolute variance
-        abs_variances = [abs(v) for v in variances]
-        avg_abs_variance = sum(abs_variances) / len(abs_variances)
-        overall_accuracy = self._calculate_accuracy_from_variance(avg_abs_variance)
+        stats = group_stats(table.column("variance_percent"))["all"]
 
-        # Determine bias
-        bias_direction, bias_percent = self._determine_bias(avg_variance)
+        # Accuracy from average absolute variance, bias from signed average
+        overall_accuracy = self._calculate_accuracy_from_variance(stats.mean_abs)
+        bias_direction, bias_percent = self._determine_bias(stats.mean)
 
         return AccuracyStats(
-            total_tasks=len(completions),
+            total_tasks=stats.count,
             overall_accuracy=overall_accuracy,
             bias_direction=bias_direction,
             bias_percent=bias_percent,
-            avg_variance_percent=avg_variance,
+            avg_variance_percent=stats.mean,
         )
 
     def get_accuracy_by_task_type(self) -> List[TaskTypeAccuracy]:
@@ -216,34 +223,18 @@ class AccuracyAnalyzer:
         Returns:
             List of TaskTypeAccuracy for each task type
         """
-        completions = self.load_completions()
-
-        if not completions:
-            return []
-
-        # Group by task type
-        by_type: Dict[str, List[Dict[str, Any]]] = {}
-        for c in completions:
-            task_type = c.get("task_type", "unknown")
-            if task_type not in by_type:
-                by_type[task_type] = []
-            by_type[task_type].append(c)
+        table = self._table()
 
         result = []
-        for task_type, tasks in by_type.items():
-            variances = [t.get("variance_percent", 0.0) for t in tasks]
-            avg_variance = sum(variances) / len(variances)
-
-            abs_variances = [abs(v) for v in variances]
-            avg_abs_variance = sum(abs_variances) / len(abs_variances)
-            accuracy = self._calculate_accuracy_from_variance(avg_abs_variance)
-
-            bias_direction, bias_percent = self._determine_bias(avg_variance)
+        by_type = group_stats(table.column("variance_percent"), table.column("task_type"))
+        for task_type, stats in by_type.items():
+            accuracy = self._calculate_accuracy_from_variance(stats.mean_abs)
+            bias_direction, bias_percent = self._determine_bias(stats.mean)
 
             result.append(
                 TaskTypeAccuracy(
                     task_type=task_type,
-                    count=len(tasks),
+                    count=stats.count,
                     accuracy_percent=accuracy,
                     bias_direction=bias_direction,
                     bias_percent=bias_percent,
@@ -260,37 +251,26 @@ class AccuracyAnalyzer:
         Returns:
             List of ComplexityBandAccuracy for each band with data
         """
-        completions = self.load_completions()
+        table = self._table()
 
-        if not completions:
-            return []
-
-        # Group by complexity band
-        by_band: Dict[str, List[Dict[str, Any]]] = {}
-        for c in completions:
-            complexity = c.get("complexity", 30)  # Default to medium
-            band = self._get_complexity_band(complexity)
-            if band not in by_band:
-                by_band[band] = []
-            by_band[band].append(c)
+        # Missing complexity defaults to 30
+        bands = [self._get_complexity_band(c) for c in table.column("complexity")]
+        by_band = group_stats(table.column("variance_percent"), bands)
 
         result = []
         for band in ["XS", "S", "M", "L", "XL"]:
             if band not in by_band:
                 continue
 
-            tasks = by_band[band]
-            variances = [t.get("variance_percent", 0.0) for t in tasks]
-            abs_variances = [abs(v) for v in variances]
-            avg_abs_variance = sum(abs_variances) / len(abs_variances)
-            accuracy = self._calculate_accuracy_from_variance(avg_abs_variance)
+            stats = by_band[band]
+            accuracy = self._calculate_accuracy_from_variance(stats.mean_abs)
 
             low, high = COMPLEXITY_BANDS[band]
             result.append(
                 ComplexityBandAccuracy(
                     band=band,
                     complexity_range=f"{low}-{high}",
-                    count=len(tasks),
+                    count=stats.count,
                     accuracy_percent=accuracy,
                 )
             )
@@ -0,0 +1,206 @@
+"""Column-oriented analytics over completion and comparison histories.
+
+Velocity, burndown, accuracy and token reports all aggregate the same few
+append-only logs. MetricsDataset loads each log once into columns and keeps
+it until the log changes, so a report that asks a dozen questions (points
+per week, sprint averages, per-type bias...) parses the history once instead
+of once per question. A shared dataset per history directory lets several
+reports in one CLI invocation reuse the same load.
+
+Time-range sums use a sorted timestamp column with prefix sums, so any
+window is two binary searches; group-bys are a single pass over a column.
+
+Usage:
+    dataset = MetricsDataset.shared(history_dir)
+    series = dataset.load("velocity", log, CompletionSeries.from_records)
+    series.points_between(week_start, week_end)
+"""
+
+import bisect
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from .store import parse_timestamp, to_epoch
+from .timelog import TimeIndexedLog
+
+T = TypeVar("T")
+
+_WEEK_SECONDS = 7 * 24 * 3600.0
+_DAY_SECONDS = 24 * 3600.0
+
+
+@dataclass
+class GroupStats:
+    """Count, sum and sum of absolute values for one group."""
+
+    count: int = 0
+    total: float = 0.0
+    total_abs: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def mean_abs(self) -> float:
+        return self.total_abs / self.count if self.count else 0.0
+
+
+def group_stats(values: Sequence[float],
+                keys: Optional[Sequence[Hashable]] = None) -> Dict[Hashable, GroupStats]:
+    """
+    Aggregate a value column, optionally grouped by a key column.
+
+    Args:
+        values: Numeric column
+        keys: Group key per value (None puts everything under "all")
+
+    Returns:
+        GroupStats per key, in first-seen order
+    """
+    groups: Dict[Hashable, GroupStats] = {}
+    if keys is None:
+        keys = ["all"] * len(values)
+    for key, value in zip(keys, values):
+        stats = groups.get(key)
+        if stats is None:
+            stats = groups[key] = GroupStats()
+        stats.count += 1
+        stats.total += value
+        stats.total_abs += abs(value)
+    return groups
+
+
+class RecordTable:
+    """Records pivoted into named columns with per-column defaults."""
+
+    def __init__(self, columns: Dict[str, List[Any]]):
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]],
+                     defaults: Dict[str, Any]) -> "RecordTable":
+        """Build columns for the fields in defaults (missing fields get the default)."""
+        columns: Dict[str, List[Any]] = {name: [] for name in defaults}
+        for record in records:
+            for name, default in defaults.items():
+                columns[name].append(record.get(name, default))
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def column(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+
+class _Cumulative:
+    """Sorted timestamps with running point totals."""
+
+    def __init__(self, points: List[Tuple[float, int]]):
+        points.sort(key=lambda p: p[0])
+        self.times = [t for t, _ in points]
+        self.running = [0]
+        for _, value in points:
+            self.running.append(self.running[-1] + value)
+
+    def between(self, lo: float, hi: float, inclusive_end: bool = True) -> int:
+        i = bisect.bisect_left(self.times, lo)
+        j = (bisect.bisect_right if inclusive_end else bisect.bisect_left)(self.times, hi)
+        return self.running[j] - self.running[i] if j > i else 0
+
+
+class CompletionSeries:
+    """Velocity completions as time-sorted columns with prefix sums."""
+
+    def __init__(self, completions: List[Tuple[float, int, str]]):
+        """
+        Args:
+            completions: (epoch seconds, complexity, sprint) in log order
+        """
+        self._all = _Cumulative([(t, c) for t, c, _ in completions])
+        by_sprint: Dict[str, List[Tuple[float, int]]] = {}
+        self.sprint_totals: Dict[str, int] = {}
+        weeks = set()
+        for t, complexity, sprint in completions:
+            by_sprint.setdefault(sprint, []).append((t, complexity))
+            if sprint:
+                self.sprint_totals[sprint] = self.sprint_totals.get(sprint, 0) + complexity
+            weeks.add(_week_index(t))
+        self._by_sprint = {sprint: _Cumulative(points) for sprint, points in by_sprint.items()}
+        self.weeks_tracked = len(weeks)
+        self.count = len(completions)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "CompletionSeries":
+        """Build from raw velocity log records; undated records are skipped."""
+        completions = []
+        for record in records:
+            dt = parse_timestamp(record.get("completed_at"))
+            if dt is None:
+                continue
+            completions.append((to_epoch(dt), record.get("complexity", 0), record.get("sprint", "")))
+        return cls(completions)
+
+    def points_between(self, start: datetime, end: datetime) -> int:
+        """Points completed in [start, end]."""
+        return self._all.between(to_epoch(start.replace(tzinfo=None)), to_epoch(end.replace(tzinfo=None)))
+
+    def daily_points(self, sprint: str, start: datetime, days: int) -> List[int]:
+        """Points completed for a sprint on each of `days` days from start."""
+        series = self._by_sprint.get(sprint)
+        day_start = to_epoch(start.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None))
+        if series is None:
+            return [0] * max(days, 0)
+        return [
+            series.between(day_start + i * _DAY_SECONDS, day_start + (i + 1) * _DAY_SECONDS,
+                           inclusive_end=False)
+            for i in range(max(days, 0))
+        ]
+
+
+def _week_index(epoch: float) -> int:
+    # 1970-01-01 was a Thursday; shift so weeks start on Monday
+    return int((epoch + 3 * _DAY_SECONDS) // _WEEK_SECONDS)
+
+
+class MetricsDataset:
+    """Parsed history logs, reloaded only when a log changes."""
+
+    _shared: Dict[Path, "MetricsDataset"] = {}
+
+    def __init__(self, history_dir: Path):
+        self.history_dir = Path(history_dir)
+        self._cache: Dict[str, Tuple[Any, Any]] = {}
+
+    @classmethod
+    def shared(cls, history_dir: Path) -> "MetricsDataset":
+        """Process-wide dataset for a history directory."""
+        key = Path(history_dir).resolve()
+        dataset = cls._shared.get(key)
+        if dataset is None:
+            dataset = cls._shared[key] = cls(key)
+        return dataset
+
+    def load(self, name: str, log: TimeIndexedLog,
+             build: Callable[[Iterable[Dict[str, Any]]], T]) -> T:
+        """
+        Build (or reuse) a view of a log.
+
+        Args:
+            name: Cache key for this view
+            log: Source log
+            build: Turns the log's records into the view
+
+        Returns:
+            The view, rebuilt if the log changed since it was last built
+        """
+        version = log.version()
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = build(log.read())
+        self._cache[name] = (version, value)
+        return value
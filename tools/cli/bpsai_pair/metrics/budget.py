@@ -1,7 +1,7 @@
 """Budget tracking and enforcement for AI agent usage."""
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 import logging
@@ -46,7 +46,11 @@ class BudgetEnforcer:
         self.config = config or BudgetConfig()
 
     def check_budget(self) -> BudgetStatus:
-        """Check current spend against limits."""
+        """Check current spend against limits.
+
+        Reads the collector's running day/month counters, so the cost of a
+        check does not grow with the number of recorded events.
+        """
         now = datetime.now()
 
         # Calculate daily spend
@@ -56,9 +60,7 @@ class BudgetEnforcer:
         daily_percent = (daily_spent / self.config.daily_limit_usd) * 100 if self.config.daily_limit_usd > 0 else 0
 
         # Calculate monthly spend
-        start_of_month = datetime(now.year, now.month, 1)
-        monthly_events = self.collector.load_events(start_of_month, now)
-        monthly_spent = sum(e.cost_usd for e in monthly_events)
+        monthly_spent = self.collector.get_monthly_totals(now)["cost_usd"]
         monthly_remaining = max(0, self.config.monthly_limit_usd - monthly_spent)
         monthly_percent = (monthly_spent / self.config.monthly_limit_usd) * 100 if self.config.monthly_limit_usd > 0 else 0
 
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol
 
+from .analytics import MetricsDataset
 from .velocity import VelocityTracker
 
 logger = logging.getLogger(__name__)
@@ -91,14 +92,15 @@ class BurndownData:
 class BurndownGenerator:
     """Generates burndown chart data from velocity completions."""
 
-    def __init__(self, history_dir: Path):
+    def __init__(self, history_dir: Path, dataset: Optional[MetricsDataset] = None):
         """Initialize burndown generator.
 
         Args:
             history_dir: Directory containing velocity data
+            dataset: Loaded-history cache to share with other reports
         """
         self.history_dir = Path(history_dir)
-        self._velocity_tracker = VelocityTracker(history_dir)
+        self._velocity_tracker = VelocityTracker(history_dir, dataset=dataset)
 
     def generate(self, config: SprintConfig) -> BurndownData:
         """Generate burndown data for a sprint.
@@ -119,16 +121,13 @@ class BurndownGenerator:
         current_date = config.start_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = config.end_date.replace(hour=23, minute=59, second=59, microsecond=0)
 
-        while current_date <= end_date:
-            # Don't generate future data points
-            if current_date > today:
-                break
+        # Don't generate future data points
+        days = max(0, (min(end_date, today) - current_date).days + 1)
 
-            # Get completions for this day
-            daily_completed = self._get_completions_for_date(
-                config.sprint_id,
-                current_date,
-            )
+        # Every sprint day from one load of the log
+        daily_points = self._velocity_tracker.get_daily_points(config.sprint_id, current_date, days)
+
+        for daily_completed in daily_points:
             cumulative_completed += daily_completed
 
             # Calculate remaining points
@@ -182,36 +181,6 @@ class BurndownGenerator:
 
         return max(0.0, ideal_remaining)
 
-    def _get_completions_for_date(
-        self,
-        sprint_id: str,
-        date: datetime,
-    ) -> int:
-        """Get total points completed on a specific date.
-
-        Args:
-            sprint_id: Sprint ID to filter by
-            date: Date to get completions for
-
-        Returns:
-            Total points completed on that date
-        """
-        # Get start and end of day
-        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        completions = self._velocity_tracker.load_completions(
-            start_date=day_start,
-            end_date=day_end,
-        )
-
-        # Filter by sprint and sum complexity
-        return sum(
-            c.complexity
-            for c in completions
-            if c.sprint == sprint_id
-        )
-
     def create_config_from_tasks(
         self,
         sprint_id: str,
@@ -1,12 +1,15 @@
 """Metrics collection for token usage and costs."""
 
 import json
+import sqlite3
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 import logging
 
+from .writer import append_locked, flush_pending
+
 logger = logging.getLogger(__name__)
 
 
@@ -105,11 +108,31 @@ class PricingConfig:
 class MetricsCollector:
     """Collects and stores metrics for agent invocations."""
 
-    def __init__(self, history_dir: Path, pricing_config: Optional[PricingConfig] = None):
+    def __init__(self, history_dir: Path, pricing_config: Optional[PricingConfig] = None,
+                 writer=None):
+        """
+        Initialize the collector.
+
+        Args:
+            history_dir: Directory holding the metrics logs
+            pricing_config: Pricing used for cost calculation
+            writer: MetricsWriter to batch appends through (default: write
+                each event immediately)
+        """
         self.history_dir = history_dir
         self.history_dir.mkdir(parents=True, exist_ok=True)
         self.pricing = pricing_config or PricingConfig()
+        self.writer = writer
         self._current_log = self._get_current_log_path()
+        self._store = None
+
+    @property
+    def store(self):
+        """Columnar sidecar store used for queries (see metrics.store)."""
+        if self._store is None:
+            from .store import MetricsStore
+            self._store = MetricsStore(self.history_dir)
+        return self._store
 
     def _get_current_log_path(self) -> Path:
         """Get the current month's log file path."""
@@ -122,11 +145,21 @@ class MetricsCollector:
             # Ensure we're using current month's log
             self._current_log = self._get_current_log_path()
 
-            with open(self._current_log, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event.to_dict()) + "\n")
+            if self.writer is not None:
+                # Batched; the sidecar catches up when the batch is read
+                self.writer.append(self._current_log, [event.to_dict()])
+                return
+            append_locked(self._current_log, (json.dumps(event.to_dict()) + "\n").encode("utf-8"))
         except Exception as e:
             # Don't block on metrics failures
             logger.warning(f"Failed to record metrics: {e}")
+            return
+
+        try:
+            self.store.sync(self._current_log)
+        except (sqlite3.Error, OSError) as e:
+            # The sidecar catches up from the log on the next query
+            logger.warning(f"Failed to update metrics store: {e}")
 
     def calculate_cost(self, agent: str, model: str,
                        input_tokens: int, output_tokens: int) -> float:
@@ -198,9 +231,89 @@ class MetricsCollector:
     def load_events(self, start_date: Optional[datetime] = None,
                     end_date: Optional[datetime] = None) -> List[MetricsEvent]:
         """Load events from metrics log files."""
+        return self.query_events(start_date, end_date)
+
+    def query_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        task_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> List[MetricsEvent]:
+        """Load events matching time-range, task and session filters."""
+        try:
+            return self.store.events(start_date, end_date, task_id=task_id, session_id=session_id)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Metrics store unavailable, scanning logs: {e}")
+        events = self._scan_events(start_date, end_date)
+        return [
+            e for e in events
+            if (task_id is None or e.task_id == task_id)
+            and (session_id is None or e.session_id == session_id)
+        ]
+
+    def export_rows(
+        self,
+        columns: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Tuple]:
+        """Stream export columns of events in a time range.
+
+        See MetricsStore.rows; falls back to scanning the logs if the store
+        is unavailable before any row was produced.
+        """
+        from .store import export_row
+
+        produced = False
+        try:
+            for row in self.store.rows(columns, start_date, end_date):
+                produced = True
+                yield row
+            return
+        except (sqlite3.Error, OSError) as e:
+            if produced:
+                raise
+            logger.warning(f"Metrics store unavailable, scanning logs: {e}")
+        for event in self._scan_events(start_date, end_date):
+            yield export_row(event, columns)
+
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Optional[str] = None,
+        task_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Sum events (optionally grouped by a dimension) in the store.
+
+        See MetricsStore.aggregate for the result shape.
+        """
+        from .store import aggregate_events
+
+        try:
+            return self.store.aggregate(
+                start_date, end_date, group_by=group_by, task_id=task_id, session_id=session_id
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Metrics store unavailable, scanning logs: {e}")
+        events = self.query_events(start_date, end_date, task_id=task_id, session_id=session_id)
+        return aggregate_events(events, group_by)
+
+    def _scan_events(self, start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> List[MetricsEvent]:
+        """Load events by parsing the JSONL logs directly."""
+        from ..core.history import HistoryArchive
+        from .store import parse_timestamp
+
+        flush_pending()
         events = []
+        archive = HistoryArchive(self.history_dir)
+        log_files = set(self.history_dir.glob("metrics-*.jsonl"))
+        log_files.update(self.history_dir / name for name in archive.archived_logs())
 
-        for log_file in sorted(self.history_dir.glob("metrics-*.jsonl")):
+        for log_file in sorted(log_files):
             # Parse date from filename to filter
             try:
                 file_date_str = log_file.stem.replace("metrics-", "")
@@ -213,64 +326,100 @@ class MetricsCollector:
             except ValueError:
                 continue
 
-            with open(log_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            event = MetricsEvent.from_dict(data)
-
-                            # Filter by exact date if specified
-                            event_dt = datetime.fromisoformat(event.timestamp.replace("Z", "+00:00").replace("+00:00", ""))
+            for line in archive.iter_lines(log_file, start_date, end_date):
+                line = line.strip()
+                if line:
+                    try:
+                        data = json.loads(line)
+                        event = MetricsEvent.from_dict(data)
+
+                        # Filter by exact date if specified
+                        if start_date or end_date:
+                            event_dt = parse_timestamp(event.timestamp)
+                            if event_dt is None:
+                                continue
                             if start_date and event_dt < start_date:
                                 continue
                             if end_date and event_dt > end_date:
                                 continue
 
-                            events.append(event)
-                        except (json.JSONDecodeError, KeyError) as e:
-                            logger.warning(f"Failed to parse metrics line: {e}")
+                        events.append(event)
+                    except (json.JSONDecodeError, KeyError) as e:
+                        logger.warning(f"Failed to parse metrics line: {e}")
 
         return events
 
     def get_session_events(self, session_id: str) -> List[MetricsEvent]:
         """Get all events for a specific session."""
-        events = self.load_events()
-        return [e for e in events if e.session_id == session_id]
+        return self.query_events(session_id=session_id)
 
     def get_task_events(self, task_id: str) -> List[MetricsEvent]:
         """Get all events for a specific task."""
-        events = self.load_events()
-        return [e for e in events if e.task_id == task_id]
+        return self.query_events(task_id=task_id)
+
+    def rollup(self, date: Optional[datetime] = None, period: str = "day",
+               group_by: Optional[str] = None) -> Dict[str, Any]:
+        """Running counters for the day or month containing date.
+
+        See MetricsStore.rollup; falls back to summing the logs if the
+        store is unavailable.
+        """
+        date = date or datetime.now()
+        try:
+            return self.store.rollup(date, period=period, group_by=group_by)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Metrics store unavailable, scanning logs: {e}")
+
+        if period == "month":
+            start = datetime(date.year, date.month, 1)
+            next_month = datetime(date.year + date.month // 12, date.month % 12 + 1, 1)
+            end = next_month - timedelta(microseconds=1)
+        else:
+            start = datetime(date.year, date.month, date.day)
+            end = start + timedelta(days=1) - timedelta(microseconds=1)
+        return self.aggregate(start, end, group_by=group_by)
 
     def get_daily_totals(self, date: Optional[datetime] = None) -> Dict[str, Any]:
         """Get totals for a specific day."""
         date = date or datetime.now()
-        start = datetime(date.year, date.month, date.day)
-        end = datetime(date.year, date.month, date.day, 23, 59, 59)
+        totals = self.rollup(date, "day")
 
-        events = self.load_events(start, end)
+        return {
+            "date": date.strftime("%Y-%m-%d"),
+            "events": totals["events"],
+            "tokens": totals["tokens"],
+            "cost_usd": totals["cost_usd"],
+        }
 
-        total_input = sum(e.tokens.input for e in events)
-        total_output = sum(e.tokens.output for e in events)
-        total_cost = sum(e.cost_usd for e in events)
+    def get_monthly_totals(self, date: Optional[datetime] = None) -> Dict[str, Any]:
+        """Get totals for the month containing date."""
+        date = date or datetime.now()
+        totals = self.rollup(date, "month")
 
         return {
-            "date": date.strftime("%Y-%m-%d"),
-            "events": len(events),
-            "tokens": {
-                "input": total_input,
-                "output": total_output,
-                "total": total_input + total_output,
-            },
-            "cost_usd": round(total_cost, 4),
+            "month": date.strftime("%Y-%m"),
+            "events": totals["events"],
+            "tokens": totals["tokens"],
+            "cost_usd": totals["cost_usd"],
         }
 
+    def rebuild_counters(self) -> int:
+        """Recompute the store and its counters from the raw logs.
+
+        Returns:
+            Number of events ingested
+        """
+        return self.store.rebuild()
+
     def _get_task_completions_log_path(self) -> Path:
         """Get the task completions log file path."""
         return self.history_dir / "task-completions.jsonl"
 
+    def _task_completions_log(self):
+        """Shared reader/writer for the task completions log."""
+        from .timelog import TimeIndexedLog
+        return TimeIndexedLog(self._get_task_completions_log_path(), "completed_at", writer=self.writer)
+
     def record_task_completion(
         self,
         task_id: str,
@@ -315,9 +464,7 @@ class MetricsCollector:
         }
 
         try:
-            log_path = self._get_task_completions_log_path()
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(data) + "\n")
+            self._task_completions_log().append(data)
             logger.info(f"Recorded task completion for {task_id}")
         except Exception as e:
             logger.warning(f"Failed to record task completion: {e}")
@@ -335,27 +482,14 @@ class MetricsCollector:
         Returns:
             List of task completion records
         """
-        completions = []
-        log_path = self._get_task_completions_log_path()
-
-        if not log_path.exists():
-            return completions
-
         try:
-            with open(log_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            if task_id is None or data.get("task_id") == task_id:
-                                completions.append(data)
-                        except json.JSONDecodeError:
-                            continue
+            return [
+                data for data in self._task_completions_log().read()
+                if task_id is None or data.get("task_id") == task_id
+            ]
         except Exception as e:
             logger.warning(f"Failed to load task completions: {e}")
-
-        return completions
+            return []
 
     def get_estimation_accuracy(self) -> Dict[str, Any]:
         """Get overall estimation accuracy statistics.
@@ -0,0 +1,169 @@
+"""Columnar binary export of metrics in NumPy's .npz format.
+
+`metrics export --format npz` writes one .npy array per column into a zip
+archive, which `numpy.load(path)` (or pandas via numpy) reads back without
+parsing any JSON or CSV. The format is simple enough to write with the
+standard library, so NumPy is only needed by whoever reads the file.
+
+An array's length goes in its header, so rows are buffered column by column
+until close(): memory grows with the export. Numbers and timestamps take 8
+bytes per row. Timestamps become datetime64[us] (NaT when missing or
+unparseable). Strings are dictionary-encoded: a 4-byte code per row, plus
+each distinct value once. That suits agent, model and operation, which
+repeat on almost every row. Arrays are written out in chunks of about
+_CHUNK_BYTES, so close() needs no copy of a whole column.
+
+Usage:
+    with NpzWriter(path, [("timestamp", "datetime"), ("cost_usd", "float")]) as out:
+        for row in rows:
+            out.append(row)
+"""
+
+import struct
+import sys
+import zipfile
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Column kinds and the array typecode / .npy dtype used for them
+_NUMERIC = {
+    "int": ("q", "<i8"),
+    "float": ("d", "<f8"),
+    "bool": ("b", "|b1"),
+}
+
+# Bytes of array data per write to the archive
+_CHUNK_BYTES = 1 << 20
+
+# datetime64 "not a time"
+_NAT = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _npy_header(descr: str, count: int) -> bytes:
+    """.npy v1.0 header for a 1-d array."""
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (descr, count)
+    # magic + version + length take 10 bytes; pad so the data is 64-byte aligned
+    header += " " * (-(10 + len(header) + 1) % 64) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin-1")
+
+
+def _write_array(f, data: array) -> None:
+    """Write an array's items little-endian, _CHUNK_BYTES at a time."""
+    step = max(1, _CHUNK_BYTES // data.itemsize)
+    for i in range(0, len(data), step):
+        chunk = data[i:i + step]
+        if sys.byteorder == "big":
+            chunk.byteswap()
+        f.write(chunk.tobytes())
+
+
+def _microseconds(value: Any) -> int:
+    """Microseconds since the epoch of an ISO timestamp (UTC if it has an
+    offset, as written otherwise), or NaT."""
+    if not isinstance(value, str) or not value:
+        return _NAT
+    try:
+        dt = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return _NAT
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class _StringColumn:
+    def __init__(self):
+        self.codes = array("i")
+        self.values: Dict[str, int] = {}
+
+    def append(self, value: Any) -> None:
+        text = "" if value is None else str(value)
+        code = self.values.get(text)
+        if code is None:
+            code = self.values[text] = len(self.values)
+        self.codes.append(code)
+
+    def write(self, f) -> None:
+        width = max([len(text) for text in self.values] + [1])
+        encoded = [b""] * len(self.values)
+        for text, code in self.values.items():
+            encoded[code] = text.encode("utf-32-le").ljust(4 * width, b"\0")
+        f.write(_npy_header(f"<U{width}", len(self.codes)))
+        step = max(1, _CHUNK_BYTES // (4 * width))
+        for i in range(0, len(self.codes), step):
+            f.write(b"".join(encoded[code] for code in self.codes[i:i + step]))
+
+
+class _NumericColumn:
+    def __init__(self, kind: str):
+        typecode, self.descr = _NUMERIC[kind]
+        self.data = array(typecode)
+
+    def append(self, value: Any) -> None:
+        self.data.append(value or 0)
+
+    def write(self, f) -> None:
+        f.write(_npy_header(self.descr, len(self.data)))
+        _write_array(f, self.data)
+
+
+class _DatetimeColumn(_NumericColumn):
+    def __init__(self):
+        self.descr = "<M8[us]"
+        self.data = array("q")
+
+    def append(self, value: Any) -> None:
+        self.data.append(_microseconds(value))
+
+
+class NpzWriter:
+    """Writes rows as a compressed .npz archive, one array per column."""
+
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str]]):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Output .npz file
+            columns: (name, kind) pairs; kind is "str", "datetime", "int",
+                "float" or "bool"
+
+        Raises:
+            ValueError: If a column kind is unknown
+        """
+        self.path = Path(path)
+        self.names = [name for name, _ in columns]
+        self._columns: List[Any] = []
+        for name, kind in columns:
+            if kind == "str":
+                self._columns.append(_StringColumn())
+            elif kind == "datetime":
+                self._columns.append(_DatetimeColumn())
+            elif kind in _NUMERIC:
+                self._columns.append(_NumericColumn(kind))
+            else:
+                raise ValueError(f"Unknown column kind for {name}: {kind}")
+        self.rows = 0
+
+    def append(self, row: Sequence[Any]) -> None:
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self.rows += 1
+
+    def close(self) -> None:
+        with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, column in zip(self.names, self._columns):
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as f:
+                    column.write(f)
+
+    def __enter__(self) -> "NpzWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
@@ -4,10 +4,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from pathlib import Path
-import json
-import yaml
 import logging
 
+from .analytics import MetricsDataset, RecordTable, group_stats
+from .timelog import TimeIndexedLog
+
 if TYPE_CHECKING:
     from ..planning.models import Task
 
@@ -136,12 +137,13 @@ class EstimationService:
     @classmethod
     def from_config_file(cls, config_path: Path) -> "EstimationService":
         """Load estimation config from a YAML file."""
+        from ..core import yamlio
+
         if not config_path.exists():
             return cls()
 
         try:
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
+            data = yamlio.load_file(config_path, cache=True) or {}
 
             estimation_data = data.get("estimation", {})
             config = EstimationConfig.from_dict(estimation_data)
@@ -402,12 +404,13 @@ class TokenEstimator:
         Returns:
             TokenEstimator with loaded configuration
         """
+        from ..core import yamlio
+
         if not config_path.exists():
             return cls()
 
         try:
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
+            data = yamlio.load_file(config_path, cache=True) or {}
 
             token_data = data.get("token_estimates", {})
             config = TokenEstimationConfig.from_dict(token_data)
@@ -479,6 +482,9 @@ MIN_MULTIPLIER = 0.3  # Don't go below 30% of base
 MAX_MULTIPLIER = 3.0  # Don't go above 3x of base
 LEARNING_RATE = 0.1   # How quickly to adjust (10% per iteration)
 
+# Comparison columns read for accuracy stats, with defaults for missing fields
+_COMPARISON_COLUMNS = {"ratio": 1.0, "task_type": "unknown"}
+
 
 @dataclass
 class TokenComparison:
@@ -521,15 +527,31 @@ class TokenFeedbackTracker:
     4. Apply learning to improve future estimates
     """
 
-    def __init__(self, history_dir: Path):
+    def __init__(self, history_dir: Path, dataset: Optional[MetricsDataset] = None,
+                 writer=None):
         """Initialize token feedback tracker.
 
         Args:
             history_dir: Directory for storing token comparison data
+            dataset: Loaded-history cache to share with other reports
+            writer: MetricsWriter to batch appends through
         """
         self.history_dir = Path(history_dir)
         self.history_dir.mkdir(parents=True, exist_ok=True)
         self._comparisons_path = self.history_dir / "token-comparisons.jsonl"
+        self._log = TimeIndexedLog(self._comparisons_path, "completed_at", writer=writer)
+        self._dataset = dataset or MetricsDataset(self.history_dir)
+
+    def _table(self) -> RecordTable:
+        """Comparison columns, loaded once per log change."""
+        try:
+            return self._dataset.load(
+                "token-comparisons", self._log,
+                lambda records: RecordTable.from_records(records, _COMPARISON_COLUMNS),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load token comparisons: {e}")
+            return RecordTable.from_records([], _COMPARISON_COLUMNS)
 
     def record_usage(
         self,
@@ -565,38 +587,31 @@ class TokenFeedbackTracker:
         data = comparison.to_dict()
 
         try:
-            with open(self._comparisons_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(data) + "\n")
+            self._log.append(data)
         except Exception as e:
             logger.warning(f"Failed to record token comparison: {e}")
 
         return data
 
-    def load_comparisons(self) -> List[Dict[str, Any]]:
-        """Load all token comparisons.
+    def load_comparisons(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Load token comparisons.
+
+        Args:
+            start_date: Only comparisons completed at or after this time
+            end_date: Only comparisons completed at or before this time
 
         Returns:
             List of comparison dictionaries
         """
-        comparisons = []
-
-        if not self._comparisons_path.exists():
-            return comparisons
-
         try:
-            with open(self._comparisons_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            comparisons.append(data)
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse token comparison: {e}")
+            return list(self._log.read(start_date, end_date))
         except Exception as e:
             logger.warning(f"Failed to load token comparisons: {e}")
-
-        return comparisons
+            return []
 
     def get_accuracy_stats(self) -> Dict[str, Any]:
         """Get token accuracy statistics.
@@ -607,39 +622,26 @@ class TokenFeedbackTracker:
             - avg_ratio: Average actual/estimated ratio
             - by_task_type: Breakdown by task type
         """
-        comparisons = self.load_comparisons()
+        table = self._table()
 
-        if not comparisons:
+        if not len(table):
             return {
                 "total_tasks": 0,
                 "avg_ratio": 1.0,
                 "by_task_type": {},
             }
 
-        # Calculate overall average ratio
-        ratios = [c.get("ratio", 1.0) for c in comparisons]
-        avg_ratio = sum(ratios) / len(ratios)
-
-        # Group by task type
-        by_type: Dict[str, List[float]] = {}
-        for c in comparisons:
-            task_type = c.get("task_type", "unknown")
-            if task_type not in by_type:
-                by_type[task_type] = []
-            by_type[task_type].append(c.get("ratio", 1.0))
-
-        # Calculate stats per type
-        by_type_stats = {}
-        for task_type, type_ratios in by_type.items():
-            by_type_stats[task_type] = {
-                "count": len(type_ratios),
-                "avg_ratio": sum(type_ratios) / len(type_ratios),
-            }
+        ratios = table.column("ratio")
+        overall = group_stats(ratios)["all"]
+        by_type = group_stats(ratios, table.column("task_type"))
 
         return {
-            "total_tasks": len(comparisons),
-            "avg_ratio": avg_ratio,
-            "by_task_type": by_type_stats,
+            "total_tasks": overall.count,
+            "avg_ratio": overall.mean,
+            "by_task_type": {
+                task_type: {"count": stats.count, "avg_ratio": stats.mean}
+                for task_type, stats in by_type.items()
+            },
         }
 
     def get_recommended_adjustments(self, min_samples: int = 2) -> Dict[str, float]:
@@ -1,14 +1,25 @@
 """Metrics reporting and analytics."""
 
 import csv
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from io import StringIO
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, TextIO, Tuple
 
-from .collector import MetricsCollector, MetricsEvent
+from .collector import MetricsCollector
+from .store import EXPORT_COLUMNS
+
+# Column kinds for the binary (npz) export
+_EXPORT_KINDS = {
+    "timestamp": "datetime",
+    "input_tokens": "int",
+    "output_tokens": "int",
+    "total_tokens": "int",
+    "cost_usd": "float",
+    "duration_ms": "int",
+    "success": "bool",
+}
 
 
 @dataclass
@@ -56,38 +67,6 @@ class MetricsReporter:
     def __init__(self, collector: MetricsCollector):
         self.collector = collector
 
-    def _aggregate_events(self, events: List[MetricsEvent]) -> Dict[str, Any]:
-        """Aggregate basic stats from events."""
-        total_input = sum(e.tokens.input for e in events)
-        total_output = sum(e.tokens.output for e in events)
-        total_cost = sum(e.cost_usd for e in events)
-        total_duration = sum(e.duration_ms for e in events)
-        successful = sum(1 for e in events if e.success)
-
-        return {
-            "events": len(events),
-            "successful": successful,
-            "failed": len(events) - successful,
-            "tokens": {
-                "input": total_input,
-                "output": total_output,
-                "total": total_input + total_output,
-            },
-            "cost_usd": round(total_cost, 4),
-            "duration_ms": total_duration,
-        }
-
-    def _group_by_field(self, events: List[MetricsEvent],
-                        field: str) -> Dict[str, Dict[str, Any]]:
-        """Group events by a field and aggregate."""
-        grouped: Dict[str, List[MetricsEvent]] = defaultdict(list)
-
-        for event in events:
-            key = getattr(event, field) or "unknown"
-            grouped[key].append(event)
-
-        return {k: self._aggregate_events(v) for k, v in grouped.items()}
-
     def get_summary(self, period: str = "daily",
                     date: Optional[datetime] = None) -> MetricsSummary:
         """Get metrics summary for a period."""
@@ -114,8 +93,7 @@ class MetricsReporter:
         else:
             raise ValueError(f"Unknown period: {period}")
 
-        events = self.collector.load_events(start, end)
-        agg = self._aggregate_events(events)
+        agg = self.collector.aggregate(start, end)
 
         return MetricsSummary(
             period=period_label,
@@ -129,67 +107,120 @@ class MetricsReporter:
             output_tokens=agg["tokens"]["output"],
             total_cost_usd=agg["cost_usd"],
             total_duration_ms=agg["duration_ms"],
-            by_agent=self._group_by_field(events, "agent"),
-            by_task=self._group_by_field(events, "task_id"),
-            by_model=self._group_by_field(events, "model"),
+            by_agent=self.collector.aggregate(start, end, group_by="agent"),
+            by_task=self.collector.aggregate(start, end, group_by="task_id"),
+            by_model=self.collector.aggregate(start, end, group_by="model"),
         )
 
     def get_breakdown(self, by: str = "agent",
                       start_date: Optional[datetime] = None,
                       end_date: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
-        """Get metrics breakdown by a specific dimension."""
-        events = self.collector.load_events(start_date, end_date)
-        return self._group_by_field(events, by)
+        """Get metrics breakdown by a specific dimension.
+
+        Args:
+            by: agent, model, operation, task or session
+        """
+        return self.collector.aggregate(start_date, end_date, group_by=by)
 
     def get_task_metrics(self, task_id: str) -> Dict[str, Any]:
         """Get metrics for a specific task."""
-        events = self.collector.get_task_events(task_id)
-        metrics = self._aggregate_events(events)
+        metrics = self.collector.aggregate(task_id=task_id)
         metrics["task_id"] = task_id
-        metrics["by_agent"] = self._group_by_field(events, "agent")
+        metrics["by_agent"] = self.collector.aggregate(task_id=task_id, group_by="agent")
         return metrics
 
     def get_session_metrics(self, session_id: str) -> Dict[str, Any]:
         """Get metrics for a specific session."""
-        events = self.collector.get_session_events(session_id)
-        metrics = self._aggregate_events(events)
+        metrics = self.collector.aggregate(session_id=session_id)
         metrics["session_id"] = session_id
         return metrics
 
     def export_csv(self, start_date: Optional[datetime] = None,
                    end_date: Optional[datetime] = None) -> str:
         """Export metrics to CSV format."""
-        events = self.collector.load_events(start_date, end_date)
-
         output = StringIO()
+        self.write_csv(output, start_date, end_date)
+        return output.getvalue()
+
+    @staticmethod
+    def export_columns(columns: Optional[List[str]] = None) -> List[str]:
+        """
+        Validate an export column selection.
+
+        Returns:
+            The columns, or all exportable columns if none were given
+
+        Raises:
+            ValueError: If a column is not exportable
+        """
+        columns = list(columns or EXPORT_COLUMNS)
+        unknown = [name for name in columns if name not in EXPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown metrics column(s): {', '.join(unknown)}")
+        return columns
+
+    def _export_rows(self, columns: Optional[List[str]], start_date: Optional[datetime],
+                     end_date: Optional[datetime]) -> Tuple[List[str], Iterable[Tuple]]:
+        columns = self.export_columns(columns)
+        return columns, self.collector.export_rows(columns, start_date, end_date)
+
+    def write_csv(self, output: TextIO, start_date: Optional[datetime] = None,
+                  end_date: Optional[datetime] = None,
+                  columns: Optional[List[str]] = None) -> int:
+        """
+        Stream events as CSV, one row at a time.
+
+        Args:
+            output: Text stream to write to
+            start_date: Earliest timestamp (inclusive)
+            end_date: Latest timestamp (inclusive)
+            columns: Columns to export (default: all, see EXPORT_COLUMNS)
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If a column is not exportable
+        """
+        columns, rows = self._export_rows(columns, start_date, end_date)
+        success = columns.index("success") if "success" in columns else None
+
         writer = csv.writer(output)
+        writer.writerow(columns)
+        count = 0
+        for row in rows:
+            row = ["" if value is None else value for value in row]
+            if success is not None:
+                row[success] = bool(row[success])
+            writer.writerow(row)
+            count += 1
+        return count
 
-        # Header
-        writer.writerow([
-            "timestamp", "session_id", "task_id", "agent", "model",
-            "operation", "input_tokens", "output_tokens", "total_tokens",
-            "cost_usd", "duration_ms", "success", "error"
-        ])
-
-        # Data
-        for event in events:
-            writer.writerow([
-                event.timestamp,
-                event.session_id or "",
-                event.task_id or "",
-                event.agent,
-                event.model,
-                event.operation,
-                event.tokens.input,
-                event.tokens.output,
-                event.tokens.total,
-                event.cost_usd,
-                event.duration_ms,
-                event.success,
-                event.error or "",
-            ])
+    def write_npz(self, path: Path, start_date: Optional[datetime] = None,
+                  end_date: Optional[datetime] = None,
+                  columns: Optional[List[str]] = None) -> int:
+        """
+        Export events as a columnar .npz archive (see metrics.columnar).
 
-        return output.getvalue()
+        Args:
+            path: Output file
+            start_date: Earliest timestamp (inclusive)
+            end_date: Latest timestamp (inclusive)
+            columns: Columns to export (default: all, see EXPORT_COLUMNS)
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If a column is not exportable
+        """
+        from .columnar import NpzWriter
+
+        columns, rows = self._export_rows(columns, start_date, end_date)
+        with NpzWriter(path, [(name, _EXPORT_KINDS.get(name, "str")) for name in columns]) as out:
+            for row in rows:
+                out.append(row)
+        return out.rows
 
     def format_summary_report(self, summary: MetricsSummary) -> str:
         """Format summary as human-readable report."""
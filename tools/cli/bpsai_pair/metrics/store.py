@@ -0,0 +1,620 @@
+"""Columnar rollup store for metrics events.
+
+Each monthly log (metrics-YYYY-MM.jsonl) gets a SQLite sidecar
+(metrics-YYYY-MM.db) holding one typed column per event field, indexed by
+timestamp, task and session. The JSONL log stays the source of truth: a
+sidecar remembers how many bytes of its log it has ingested and only reads
+the new tail on each sync, so MetricsCollector.record() keeps it current
+for the price of one line. A log that shrank or was rewritten is
+re-ingested from scratch.
+
+Range, task and session queries and sum/group-by aggregations then run as
+SQL over the sidecars instead of json.loads over every line.
+
+Ingest also maintains running per-day and per-month counters (overall and
+per agent/model) in the same transaction as the rows, so budget checks read
+a single counter row instead of summing the month. rebuild() recomputes
+everything from the raw logs.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .collector import MetricsEvent, TokenUsage
+from .writer import flush_pending
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 2
+LOG_GLOB = "metrics-*.jsonl"
+
+# Bytes of the log head fingerprinted to detect a rewritten file
+_HEAD_BYTES = 4096
+
+_EPOCH = datetime(1970, 1, 1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    ts REAL,
+    timestamp TEXT NOT NULL,
+    session_id TEXT,
+    task_id TEXT,
+    agent TEXT NOT NULL,
+    model TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    success INTEGER NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS events_task ON events (task_id);
+CREATE INDEX IF NOT EXISTS events_session ON events (session_id);
+CREATE TABLE IF NOT EXISTS rollups (
+    period TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    successful INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    PRIMARY KEY (period, dimension, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_EVENT_COLUMNS = (
+    "timestamp, session_id, task_id, agent, model, operation, "
+    "input_tokens, output_tokens, cost_usd, duration_ms, success, error"
+)
+
+# Dimensions accepted by aggregate(group_by=...); "task"/"session" are
+# accepted as aliases because that is how the CLI spells them
+GROUP_COLUMNS = {
+    "agent": "agent",
+    "model": "model",
+    "operation": "operation",
+    "task_id": "task_id",
+    "task": "task_id",
+    "session_id": "session_id",
+    "session": "session_id",
+}
+
+# Exportable columns and the SQL producing each, in export order
+EXPORT_COLUMNS = {
+    "timestamp": "timestamp",
+    "session_id": "session_id",
+    "task_id": "task_id",
+    "agent": "agent",
+    "model": "model",
+    "operation": "operation",
+    "input_tokens": "input_tokens",
+    "output_tokens": "output_tokens",
+    "total_tokens": "input_tokens + output_tokens",
+    "cost_usd": "cost_usd",
+    "duration_ms": "duration_ms",
+    "success": "success",
+    "error": "error",
+}
+
+# Dimensions with running counters, besides the overall total
+ROLLUP_DIMENSIONS = ("agent", "model")
+
+# Rollup periods and the strftime format of their keys
+ROLLUP_PERIODS = {"day": "%Y-%m-%d", "month": "%Y-%m"}
+
+_TOTAL = "total"
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an event timestamp as a naive datetime (None if invalid).
+
+    Offsets are dropped rather than converted, matching how events have
+    always been compared against naive local query bounds.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1]
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def to_epoch(dt: datetime) -> float:
+    """Seconds since 1970-01-01 for a naive datetime (no timezone math)."""
+    return (dt - _EPOCH).total_seconds()
+
+
+def month_of(log_path: Path) -> Optional[datetime]:
+    """First day of the month a metrics log covers, from its filename."""
+    try:
+        return datetime.strptime(log_path.name[len("metrics-"):len("metrics-YYYY-MM")], "%Y-%m")
+    except ValueError:
+        return None
+
+
+def empty_totals() -> Dict[str, Any]:
+    """Aggregate for no events, in MetricsReporter's shape."""
+    return _totals_dict(0, 0, 0, 0, 0.0, 0)
+
+
+def _totals_dict(events: int, successful: int, input_tokens: int, output_tokens: int,
+                 cost: float, duration: int) -> Dict[str, Any]:
+    return {
+        "events": events,
+        "successful": successful,
+        "failed": events - successful,
+        "tokens": {
+            "input": input_tokens,
+            "output": output_tokens,
+            "total": input_tokens + output_tokens,
+        },
+        "cost_usd": round(cost, 4),
+        "duration_ms": duration,
+    }
+
+
+def aggregate_events(events: List[MetricsEvent], group_by: Optional[str] = None) -> Dict[str, Any]:
+    """Pure-Python equivalent of MetricsStore.aggregate for loaded events."""
+    if group_by is not None and group_by not in GROUP_COLUMNS:
+        raise ValueError(f"Unknown metrics dimension: {group_by}")
+
+    merged: Dict[str, List[float]] = {}
+    for event in events:
+        key = "all" if group_by is None else (getattr(event, GROUP_COLUMNS[group_by]) or "unknown")
+        acc = merged.setdefault(key, [0, 0, 0, 0, 0.0, 0])
+        acc[0] += 1
+        acc[1] += 1 if event.success else 0
+        acc[2] += event.tokens.input
+        acc[3] += event.tokens.output
+        acc[4] += event.cost_usd
+        acc[5] += event.duration_ms
+
+    if group_by is None:
+        totals = merged.get("all")
+        return _totals_dict(*totals) if totals else empty_totals()
+    return {key: _totals_dict(*values) for key, values in merged.items()}
+
+
+def _row_from_record(data: Dict[str, Any]) -> Tuple:
+    event = MetricsEvent.from_dict(data)
+    dt = parse_timestamp(event.timestamp)
+    return (
+        to_epoch(dt) if dt is not None else None,
+        event.timestamp,
+        event.session_id,
+        event.task_id,
+        event.agent,
+        event.model,
+        event.operation,
+        int(event.tokens.input or 0),
+        int(event.tokens.output or 0),
+        float(event.cost_usd or 0.0),
+        int(event.duration_ms or 0),
+        1 if event.success else 0,
+        event.error,
+    )
+
+
+def _event_from_row(row: Tuple) -> MetricsEvent:
+    (timestamp, session_id, task_id, agent, model, operation,
+     input_tokens, output_tokens, cost_usd, duration_ms, success, error) = row
+    return MetricsEvent(
+        timestamp=timestamp,
+        session_id=session_id,
+        task_id=task_id,
+        agent=agent,
+        model=model,
+        operation=operation,
+        tokens=TokenUsage(input=input_tokens, output=output_tokens),
+        cost_usd=cost_usd,
+        duration_ms=duration_ms,
+        success=bool(success),
+        error=error,
+    )
+
+
+def export_row(event: MetricsEvent, columns: List[str]) -> Tuple:
+    """An event's values for export columns, as MetricsStore.rows() returns them."""
+    values = {
+        "timestamp": event.timestamp,
+        "session_id": event.session_id,
+        "task_id": event.task_id,
+        "agent": event.agent,
+        "model": event.model,
+        "operation": event.operation,
+        "input_tokens": event.tokens.input,
+        "output_tokens": event.tokens.output,
+        "total_tokens": event.tokens.total,
+        "cost_usd": event.cost_usd,
+        "duration_ms": event.duration_ms,
+        "success": 1 if event.success else 0,
+        "error": event.error,
+    }
+    return tuple(values[name] for name in columns)
+
+
+class MonthStore:
+    """SQLite sidecar for a single monthly metrics log."""
+
+    def __init__(self, log_path: Path):
+        self.log_path = Path(log_path)
+        self.db_path = self.log_path.with_suffix(".db")
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0, isolation_level=None)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _meta(self, conn: sqlite3.Connection) -> Dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+
+    def _head_hash(self, f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(min(length, _HEAD_BYTES))).hexdigest()
+
+    def sync(self, conn: sqlite3.Connection) -> int:
+        """
+        Ingest log lines appended since the last sync.
+
+        Returns:
+            Number of events ingested
+        """
+        from ..core.history import HistoryArchive
+
+        flush_pending(self.log_path)
+        # Months archived by `history compact` are read from their gzip
+        opened = HistoryArchive(self.log_path.parent).open_log(self.log_path.name)
+        if opened is None:
+            return 0
+        size, log_file = opened
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            meta = self._meta(conn)
+            offset = int(meta.get("offset", 0))
+            if meta.get("version") != str(STORE_VERSION):
+                offset = -1
+            with log_file as f:
+                if offset > size or (offset > 0 and self._head_hash(f, offset) != meta.get("head")):
+                    offset = -1  # truncated or rewritten
+                if offset < 0:
+                    self._reset(conn)
+                    offset = 0
+                if offset == size:
+                    conn.execute("COMMIT")
+                    return 0
+                f.seek(offset)
+                tail = f.read(size - offset)
+                # Leave a partially written last line for the next sync
+                end = tail.rfind(b"\n") + 1
+                rows = list(self._parse(tail[:end]))
+                new_offset = offset + end
+                head = self._head_hash(f, new_offset)
+            self._insert(conn, rows)
+            self._roll_up(conn, rows)
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("version", str(STORE_VERSION)), ("offset", str(new_offset)), ("head", head)],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def _reset(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM events")
+        conn.execute("DELETE FROM rollups")
+        conn.execute("DELETE FROM meta")
+
+    def _insert(self, conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+        conn.executemany(
+            f"INSERT INTO events (ts, {_EVENT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _roll_up(self, conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+        """Add rows to the day/month counters (caller holds the transaction)."""
+        deltas: Dict[Tuple[str, str, str], List[float]] = {}
+        for row in rows:
+            dt = parse_timestamp(row[1])
+            if dt is None:
+                continue  # never matched by a date range query either
+            values = (1, row[11], row[7], row[8], row[9], row[10])
+            for fmt in ROLLUP_PERIODS.values():
+                period = dt.strftime(fmt)
+                keys = (
+                    (period, _TOTAL, ""),
+                    (period, "agent", row[4] or "unknown"),
+                    (period, "model", row[5] or "unknown"),
+                )
+                for key in keys:
+                    acc = deltas.setdefault(key, [0, 0, 0, 0, 0.0, 0])
+                    for i, value in enumerate(values):
+                        acc[i] += value
+        conn.executemany(
+            """
+            INSERT INTO rollups (period, dimension, key, events, successful,
+                                 input_tokens, output_tokens, cost_usd, duration_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (period, dimension, key) DO UPDATE SET
+                events = events + excluded.events,
+                successful = successful + excluded.successful,
+                input_tokens = input_tokens + excluded.input_tokens,
+                output_tokens = output_tokens + excluded.output_tokens,
+                cost_usd = cost_usd + excluded.cost_usd,
+                duration_ms = duration_ms + excluded.duration_ms
+            """,
+            [key + tuple(acc) for key, acc in deltas.items()],
+        )
+
+    def rollup(self, conn: sqlite3.Connection, period: str,
+               dimension: str = _TOTAL) -> Dict[str, Tuple]:
+        """Counter rows for a period key, keyed by dimension value."""
+        return {
+            key: tuple(values)
+            for key, *values in conn.execute(
+                "SELECT key, events, successful, input_tokens, output_tokens, cost_usd, duration_ms "
+                "FROM rollups WHERE period = ? AND dimension = ?",
+                (period, dimension),
+            )
+        }
+
+    def _parse(self, data: bytes) -> Iterator[Tuple]:
+        for line in data.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("not an object")
+                yield _row_from_record(record)
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"Failed to parse metrics line: {e}")
+
+
+class MetricsStore:
+    """Queries over all monthly sidecars in a history directory."""
+
+    def __init__(self, history_dir: Path):
+        self.history_dir = Path(history_dir)
+
+    def logs(self, start: Optional[datetime] = None,
+             end: Optional[datetime] = None) -> List[Path]:
+        """Monthly logs overlapping [start, end], oldest first."""
+        from ..core.history import HistoryArchive
+
+        flush_pending()  # a buffered month may not have been created yet
+        paths = set(self.history_dir.glob(LOG_GLOB))
+        paths.update(self.history_dir / name for name in HistoryArchive(self.history_dir).archived_logs())
+        logs = []
+        for log_path in sorted(paths):
+            month = month_of(log_path)
+            if month is None:
+                continue
+            if start and month < datetime(start.year, start.month, 1):
+                continue
+            if end and month > datetime(end.year, end.month, 1):
+                continue
+            logs.append(log_path)
+        return logs
+
+    def sync(self, log_path: Path) -> int:
+        """Bring one month's sidecar up to date; returns events ingested."""
+        store = MonthStore(log_path)
+        conn = store.connect()
+        try:
+            return store.sync(conn)
+        finally:
+            conn.close()
+
+    def _months(self, start: Optional[datetime], end: Optional[datetime]) -> Iterator[sqlite3.Connection]:
+        """Synced connections for each month in range (closed after use)."""
+        for log_path in self.logs(start, end):
+            store = MonthStore(log_path)
+            conn = store.connect()
+            try:
+                store.sync(conn)
+                yield conn
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _where(start: Optional[datetime], end: Optional[datetime],
+               task_id: Optional[str], session_id: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(to_epoch(start.replace(tzinfo=None)))
+        if end is not None:
+            clauses.append("ts <= ?")
+            params.append(to_epoch(end.replace(tzinfo=None)))
+        if task_id is not None:
+            clauses.append("task_id = ?")
+            params.append(task_id)
+        if session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def events(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> List[MetricsEvent]:
+        """
+        Events matching the filters, in log order.
+
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            task_id: Only events for this task
+            session_id: Only events for this session
+
+        Returns:
+            Matching events
+        """
+        where, params = self._where(start, end, task_id, session_id)
+        events: List[MetricsEvent] = []
+        for conn in self._months(start, end):
+            for row in conn.execute(f"SELECT {_EVENT_COLUMNS} FROM events{where} ORDER BY rowid", params):
+                events.append(_event_from_row(row))
+        return events
+
+    def rows(
+        self,
+        columns: List[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[Tuple]:
+        """
+        Stream selected columns of events in a time range, month by month.
+
+        Only the requested columns are read, months outside the range are
+        never opened and the range is applied by the timestamp index, so
+        memory stays flat however much history is exported.
+
+        Args:
+            columns: Names from EXPORT_COLUMNS
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+
+        Yields:
+            Value tuples in column order (success as 0/1)
+
+        Raises:
+            ValueError: If a column is not exportable
+        """
+        unknown = [name for name in columns if name not in EXPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown metrics column(s): {', '.join(unknown)}")
+        select = ", ".join(EXPORT_COLUMNS[name] for name in columns)
+        where, params = self._where(start, end, None, None)
+        for conn in self._months(start, end):
+            yield from conn.execute(f"SELECT {select} FROM events{where} ORDER BY rowid", params)
+
+    def aggregate(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        group_by: Optional[str] = None,
+        task_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sum events in SQL, optionally grouped by a dimension.
+
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            group_by: agent, model, operation, task(_id) or session(_id);
+                missing values are grouped under "unknown"
+            task_id: Only events for this task
+            session_id: Only events for this session
+
+        Returns:
+            Totals dict (events, successful, failed, tokens, cost_usd,
+            duration_ms), or a dict of them keyed by group value
+
+        Raises:
+            ValueError: If group_by is not a known dimension
+        """
+        if group_by is not None and group_by not in GROUP_COLUMNS:
+            raise ValueError(f"Unknown metrics dimension: {group_by}")
+
+        where, params = self._where(start, end, task_id, session_id)
+        sums = (
+            "COUNT(*), COALESCE(SUM(success), 0), COALESCE(SUM(input_tokens), 0), "
+            "COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost_usd), 0.0), "
+            "COALESCE(SUM(duration_ms), 0)"
+        )
+        if group_by is None:
+            sql = f"SELECT 'all', {sums} FROM events{where}"
+        else:
+            column = GROUP_COLUMNS[group_by]
+            key = f"COALESCE(NULLIF({column}, ''), 'unknown')"
+            sql = f"SELECT {key}, {sums} FROM events{where} GROUP BY {key}"
+
+        merged: Dict[str, List[float]] = {}
+        for conn in self._months(start, end):
+            for key, *values in conn.execute(sql, params):
+                acc = merged.setdefault(key, [0, 0, 0, 0, 0.0, 0])
+                for i, value in enumerate(values):
+                    acc[i] += value
+
+        if group_by is None:
+            totals = merged.get("all")
+            return _totals_dict(*totals) if totals else empty_totals()
+        return {key: _totals_dict(*values) for key, values in merged.items()}
+
+    def rollup(self, date: datetime, period: str = "day",
+               group_by: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Read the running counters for the day or month containing date.
+
+        Only the month's sidecar is touched (after syncing any new log
+        lines), so the cost does not grow with the number of events.
+
+        Args:
+            date: Any moment in the period
+            period: "day" or "month"
+            group_by: None for overall totals, or "agent"/"model"
+
+        Returns:
+            Totals dict, or a dict of them keyed by agent/model
+
+        Raises:
+            ValueError: If period or group_by is not supported
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"Unknown rollup period: {period}")
+        if group_by is not None and group_by not in ROLLUP_DIMENSIONS:
+            raise ValueError(f"No rollup for metrics dimension: {group_by}")
+
+        rows: Dict[str, Tuple] = {}
+        log_path = self.history_dir / f"metrics-{date.strftime('%Y-%m')}.jsonl"
+        flush_pending(log_path)
+        if log_path.exists() or log_path.with_suffix(".db").exists():
+            store = MonthStore(log_path)
+            conn = store.connect()
+            try:
+                store.sync(conn)
+                rows = store.rollup(conn, date.strftime(ROLLUP_PERIODS[period]), group_by or _TOTAL)
+            finally:
+                conn.close()
+
+        if group_by is None:
+            totals = rows.get("")
+            return _totals_dict(*totals) if totals else empty_totals()
+        return {key: _totals_dict(*values) for key, values in rows.items()}
+
+    def rebuild(self) -> int:
+        """
+        Discard every sidecar and re-ingest all logs, recomputing the
+        running counters.
+
+        Returns:
+            Number of events ingested
+        """
+        for db_path in self.history_dir.glob("metrics-*.db"):
+            db_path.unlink(missing_ok=True)
+        return sum(self.sync(log_path) for log_path in self.logs())
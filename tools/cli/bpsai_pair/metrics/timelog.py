@@ -0,0 +1,302 @@
+"""Append-only JSONL logs with a sparse time index.
+
+The velocity, task-completion and token-comparison histories are
+append-only JSONL files that are mostly queried by date range. TimeIndexedLog
+keeps a small sidecar (<log>.idx.json) that splits the log into blocks of
+lines and records each block's byte offset and min/max timestamp, so a range
+query only reads the blocks that can contain matching records.
+
+The index is updated lazily: a read first indexes any complete lines
+appended since the last read, and a log that shrank or was rewritten is
+re-indexed from scratch. Records do not have to be in timestamp order.
+Lines archived by `bpsai-pair history compact` are read back transparently.
+
+Usage:
+    log = TimeIndexedLog(history_dir / "velocity-completions.jsonl", "completed_at")
+    log.append({"task_id": "T1", "completed_at": "2025-01-05T10:00:00"})
+    records = list(log.read(start=datetime(2025, 1, 1)))
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .store import parse_timestamp, to_epoch
+from .writer import append_locked, flush_pending
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Lines per index block; smaller blocks mean finer seeks but a bigger index
+DEFAULT_BLOCK_LINES = 256
+
+# Bytes of the log head fingerprinted to detect a rewritten file
+_HEAD_BYTES = 4096
+
+# Block: [byte offset, line count, min epoch, max epoch]; the epochs are
+# None while the block has no line with a parseable timestamp
+Block = List[Any]
+
+
+class TimeIndexedLog:
+    """Append-only JSONL log with range reads over a sparse time index."""
+
+    def __init__(self, path: Path, time_field: str,
+                 block_lines: int = DEFAULT_BLOCK_LINES, writer=None):
+        """
+        Initialize the log.
+
+        Args:
+            path: JSONL file (created on first append)
+            time_field: Record field holding an ISO timestamp
+            block_lines: Lines per index block
+            writer: MetricsWriter to batch appends through (default:
+                append immediately)
+        """
+        self.path = Path(path)
+        self.time_field = time_field
+        self.block_lines = block_lines
+        self.writer = writer
+        self.index_path = self.path.with_name(self.path.stem + ".idx.json")
+        self._index: Optional[Dict[str, Any]] = None
+
+    def version(self) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) of the log, or None if it does not exist.
+
+        Changes whenever the log is appended to or rewritten, so callers can
+        cache anything derived from the records against it.
+        """
+        flush_pending(self.path)
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record (raises OSError on failure)."""
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records with a single locked write, or queue them on the
+        writer (raises OSError on failure)."""
+        if self.writer is not None:
+            self.writer.append(self.path, records)
+            return
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        if data:
+            append_locked(self.path, data.encode("utf-8"))
+
+    def read(self, start: Optional[datetime] = None,
+             end: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Records in log order, optionally limited to a time range.
+
+        Records without a parseable timestamp are only returned when no
+        range is given. Malformed lines are skipped with a warning.
+
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+
+        Yields:
+            Record dicts
+        """
+        for record, _ in self._scan(start, end):
+            yield record
+
+    def buckets(self, start: datetime, period: timedelta,
+                count: int) -> List[List[Dict[str, Any]]]:
+        """
+        Records grouped into consecutive time buckets in one pass.
+
+        Bucket i holds records in [start + i*period, start + (i+1)*period).
+
+        Args:
+            start: Start of the first bucket
+            period: Bucket width
+            count: Number of buckets
+
+        Returns:
+            One list of records per bucket
+        """
+        buckets: List[List[Dict[str, Any]]] = [[] for _ in range(max(count, 0))]
+        if not buckets:
+            return buckets
+        start = start.replace(tzinfo=None)
+        for record, dt in self._scan(start, start + period * count):
+            i = int((dt - start) // period)
+            if 0 <= i < count:
+                buckets[i].append(record)
+        return buckets
+
+    def _scan(self, start: Optional[datetime],
+              end: Optional[datetime]) -> Iterator[Tuple[Dict[str, Any], Optional[datetime]]]:
+        from ..core.history import HistoryArchive
+
+        flush_pending(self.path)
+        ranged = start is not None or end is not None
+        lo = to_epoch(start.replace(tzinfo=None)) if start is not None else None
+        hi = to_epoch(end.replace(tzinfo=None)) if end is not None else None
+
+        # Lines moved out by `history compact` come first; only segments
+        # overlapping the range are decompressed
+        archive = HistoryArchive(self.path.parent)
+        for segment in archive.segments(self.path.name, start, end):
+            try:
+                data = archive.read_segment(segment)
+            except (OSError, EOFError) as e:
+                logger.warning(f"Failed to read archived segment {segment.file}: {e}")
+                continue
+            yield from self._filter(data, ranged, lo, hi)
+
+        try:
+            with open(self.path, "rb") as f:
+                index = self._sync_index(f)
+                for offset, stop in self._ranges(index, lo, hi):
+                    f.seek(offset)
+                    yield from self._filter(f.read(stop - offset), ranged, lo, hi)
+        except FileNotFoundError:
+            return
+
+    def _filter(self, data: bytes, ranged: bool, lo: Optional[float],
+                hi: Optional[float]) -> Iterator[Tuple[Dict[str, Any], Optional[datetime]]]:
+        for line in data.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("not an object")
+            except ValueError as e:
+                logger.warning(f"Failed to parse {self.path.name} line: {e}")
+                continue
+            dt = parse_timestamp(record.get(self.time_field))
+            if ranged:
+                if dt is None:
+                    continue
+                if lo is not None and to_epoch(dt) < lo:
+                    continue
+                if hi is not None and to_epoch(dt) > hi:
+                    continue
+            yield record, dt
+
+    def _ranges(self, index: Dict[str, Any], lo: Optional[float],
+                hi: Optional[float]) -> List[Tuple[int, int]]:
+        """Merged byte ranges of the blocks that can hold matching records."""
+        blocks: List[Block] = index["blocks"]
+        size = index["size"]
+        if lo is None and hi is None:
+            return [(0, size)] if size else []
+
+        first = 0
+        if lo is not None:
+            # Running max of block maxima is sorted, so bisect for the first
+            # block that has seen a timestamp >= lo
+            running, prefix_max = float("-inf"), []
+            for block in blocks:
+                if block[3] is not None:
+                    running = max(running, block[3])
+                prefix_max.append(running)
+            first = bisect.bisect_left(prefix_max, lo)
+
+        ranges: List[Tuple[int, int]] = []
+        for i in range(first, len(blocks)):
+            offset, _, bmin, bmax = blocks[i]
+            if bmin is None:
+                continue
+            if (lo is not None and bmax < lo) or (hi is not None and bmin > hi):
+                continue
+            stop = blocks[i + 1][0] if i + 1 < len(blocks) else size
+            if ranges and ranges[-1][1] == offset:
+                ranges[-1] = (ranges[-1][0], stop)
+            else:
+                ranges.append((offset, stop))
+        return ranges
+
+    @staticmethod
+    def _head_hash(f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(min(length, _HEAD_BYTES))).hexdigest()
+
+    def _load_index(self) -> Optional[Dict[str, Any]]:
+        if self._index is not None:
+            return self._index
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            return None
+        if index.get("block_lines") != self.block_lines:
+            return None
+        return index
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to save index for {self.path.name}: {e}")
+
+    def _sync_index(self, f) -> Dict[str, Any]:
+        """Index complete lines appended since the last sync."""
+        size = os.fstat(f.fileno()).st_size
+        index = self._load_index()
+        if index is not None:
+            indexed = index["size"]
+            if indexed > size or (indexed and self._head_hash(f, indexed) != index["head"]):
+                index = None  # truncated or rewritten
+        if index is None:
+            index = {"version": INDEX_VERSION, "block_lines": self.block_lines,
+                     "size": 0, "head": "", "blocks": []}
+
+        if index["size"] < size:
+            f.seek(index["size"])
+            tail = f.read(size - index["size"])
+            # A partially written last line is indexed on a later sync
+            complete = tail.rfind(b"\n") + 1
+            if complete:
+                self._extend(index, tail[:complete])
+                index["head"] = self._head_hash(f, index["size"])
+                self._save_index(index)
+
+        self._index = index
+        return index
+
+    def _extend(self, index: Dict[str, Any], data: bytes) -> None:
+        blocks: List[Block] = index["blocks"]
+        offset = index["size"]
+        for line in data.splitlines(keepends=True):
+            if not blocks or blocks[-1][1] >= self.block_lines:
+                blocks.append([offset, 0, None, None])
+            block = blocks[-1]
+            block[1] += 1
+            offset += len(line)
+
+            ts = self._line_epoch(line)
+            if ts is not None:
+                block[2] = ts if block[2] is None else min(block[2], ts)
+                block[3] = ts if block[3] is None else max(block[3], ts)
+        index["size"] = offset
+
+    def _line_epoch(self, line: bytes) -> Optional[float]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(record, dict):
+            return None
+        dt = parse_timestamp(record.get(self.time_field))
+        return to_epoch(dt) if dt is not None else None
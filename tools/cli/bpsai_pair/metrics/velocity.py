@@ -1,11 +1,13 @@
 """Velocity tracking for project planning."""
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from .analytics import CompletionSeries, MetricsDataset
+from .timelog import TimeIndexedLog
 
 logger = logging.getLogger(__name__)
 
@@ -68,15 +70,29 @@ class VelocityStats:
 class VelocityTracker:
     """Tracks velocity metrics for project planning."""
 
-    def __init__(self, history_dir: Path):
+    def __init__(self, history_dir: Path, dataset: Optional[MetricsDataset] = None,
+                 writer=None):
         """Initialize velocity tracker.
 
         Args:
             history_dir: Directory to store velocity data
+            dataset: Loaded-history cache to share with other reports
+                (defaults to a private one)
+            writer: MetricsWriter to batch appends through
         """
         self.history_dir = Path(history_dir)
         self.history_dir.mkdir(parents=True, exist_ok=True)
         self._velocity_log_path = self.history_dir / "velocity-completions.jsonl"
+        self._log = TimeIndexedLog(self._velocity_log_path, "completed_at", writer=writer)
+        self._dataset = dataset or MetricsDataset(self.history_dir)
+
+    def _series(self) -> CompletionSeries:
+        """All completions as a time-sorted series, loaded once per log change."""
+        try:
+            return self._dataset.load("velocity", self._log, CompletionSeries.from_records)
+        except Exception as e:
+            logger.warning(f"Failed to load velocity completions: {e}")
+            return CompletionSeries([])
 
     def record_completion(
         self,
@@ -105,8 +121,7 @@ class VelocityTracker:
         )
 
         try:
-            with open(self._velocity_log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record.to_dict()) + "\n")
+            self._log.append(record.to_dict())
         except Exception as e:
             logger.warning(f"Failed to record velocity completion: {e}")
 
@@ -126,32 +141,33 @@ class VelocityTracker:
         Returns:
             List of completion records
         """
-        completions = []
-
-        if not self._velocity_log_path.exists():
-            return completions
-
         try:
-            with open(self._velocity_log_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            record = TaskCompletionRecord.from_dict(data)
-
-                            # Apply date filters
-                            if start_date and record.completed_at < start_date:
-                                continue
-                            if end_date and record.completed_at > end_date:
-                                continue
-
-                            completions.append(record)
-                        except (json.JSONDecodeError, KeyError) as e:
-                            logger.warning(f"Failed to parse velocity line: {e}")
+            return self._parse_records(self._log.read(start_date, end_date))
         except Exception as e:
             logger.warning(f"Failed to load velocity completions: {e}")
+            return []
+
+    def get_daily_points(self, sprint: str, start_date: datetime, days: int) -> List[int]:
+        """Get complexity points completed for a sprint on consecutive days.
+
+        Args:
+            sprint: Sprint ID
+            start_date: First day (time of day is ignored)
+            days: Number of days
+
+        Returns:
+            Points per day
+        """
+        return self._series().daily_points(sprint, start_date, days)
 
+    @staticmethod
+    def _parse_records(records: Iterable[Dict[str, Any]]) -> List[TaskCompletionRecord]:
+        completions = []
+        for data in records:
+            try:
+                completions.append(TaskCompletionRecord.from_dict(data))
+            except (ValueError, TypeError, KeyError) as e:
+                logger.warning(f"Failed to parse velocity line: {e}")
         return completions
 
     def _get_week_start(self, date: datetime) -> datetime:
@@ -177,8 +193,7 @@ class VelocityTracker:
         week_start = self._get_week_start(date)
         week_end = week_start + timedelta(days=7)
 
-        completions = self.load_completions(start_date=week_start, end_date=week_end)
-        return sum(c.complexity for c in completions)
+        return self._series().points_between(week_start, week_end)
 
     def get_points_for_sprint(self, sprint: str) -> int:
         """Get complexity points completed in a specific sprint.
@@ -189,8 +204,7 @@ class VelocityTracker:
         Returns:
             Total complexity points for that sprint
         """
-        completions = self.load_completions()
-        return sum(c.complexity for c in completions if c.sprint == sprint)
+        return self._series().sprint_totals.get(sprint, 0)
 
     def get_weekly_velocity_average(self, weeks: int = 4) -> float:
         """Calculate rolling average weekly velocity.
@@ -223,12 +237,7 @@ class VelocityTracker:
         Returns:
             Average points per sprint
         """
-        completions = self.load_completions()
-        sprint_totals: Dict[str, int] = {}
-
-        for c in completions:
-            if c.sprint:
-                sprint_totals[c.sprint] = sprint_totals.get(c.sprint, 0) + c.complexity
+        sprint_totals = self._series().sprint_totals
 
         if not sprint_totals:
             return 0.0
@@ -259,24 +268,15 @@ class VelocityTracker:
         Returns:
             VelocityStats with all metrics
         """
-        completions = self.load_completions()
-
-        # Count unique weeks and sprints
-        weeks_set = set()
-        sprints_set = set()
-        for c in completions:
-            week_start = self._get_week_start(c.completed_at)
-            weeks_set.add(week_start.isoformat())
-            if c.sprint:
-                sprints_set.add(c.sprint)
+        series = self._series()
 
         return VelocityStats(
             points_this_week=self.get_points_this_week(),
             points_this_sprint=self.get_points_for_sprint(current_sprint) if current_sprint else 0,
             avg_weekly_velocity=self.get_weekly_velocity_average(weeks_for_average),
             avg_sprint_velocity=self.get_sprint_velocity_average(sprints_for_average),
-            weeks_tracked=len(weeks_set),
-            sprints_tracked=len(sprints_set),
+            weeks_tracked=series.weeks_tracked,
+            sprints_tracked=len(series.sprint_totals),
         )
 
     def get_weekly_breakdown(self, weeks: int = 4) -> List[Dict[str, Any]]:
@@ -309,11 +309,4 @@ class VelocityTracker:
         Returns:
             Dict mapping sprint ID to total points
         """
-        completions = self.load_completions()
-        sprint_totals: Dict[str, int] = {}
-
-        for c in completions:
-            if c.sprint:
-                sprint_totals[c.sprint] = sprint_totals.get(c.sprint, 0) + c.complexity
-
-        return sprint_totals
+        return dict(self._series().sprint_totals)
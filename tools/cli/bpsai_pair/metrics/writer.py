@@ -0,0 +1,283 @@
+"""Buffered, lock-protected appends to the history logs.
+
+Every metrics, velocity, token and task-completion record used to cost an
+open/write/close of its log. During autonomous runs the task hooks write
+several of these per task, so MetricsWriter keeps records in memory and
+appends them in batches: when enough records or bytes are pending, when the
+oldest pending record is max_delay seconds old, or when the process exits.
+
+Appends take an exclusive advisory lock (flock) on the log, so parallel
+agents writing the same file never interleave partial batches, and a writer
+that raced with `history compact` replacing the file re-opens it instead of
+appending to the orphaned copy.
+
+Fsync policy:
+    none      leave durability to the OS
+    on-flush  fsync once after each batch (default)
+    always    write and fsync every append immediately (no buffering)
+
+Readers in this package call flush_pending() before reading a log, so
+records buffered by this process are always visible to its own queries.
+
+Usage:
+    writer = shared_writer(WriterPolicy.from_config(config))
+    collector = MetricsCollector(history_dir, writer=writer)
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are unlocked
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FSYNC_NONE = "none"
+FSYNC_ON_FLUSH = "on-flush"
+FSYNC_ALWAYS = "always"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_ON_FLUSH, FSYNC_ALWAYS)
+
+DEFAULT_MAX_RECORDS = 64
+DEFAULT_MAX_BYTES = 256 * 1024
+DEFAULT_MAX_DELAY = 2.0
+
+# Times to re-open a log that is replaced while we wait for its lock
+_REOPEN_ATTEMPTS = 5
+
+
+@contextmanager
+def exclusive_lock(fd: int) -> Iterator[None]:
+    """Hold an exclusive advisory lock on an open file descriptor."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def append_locked(path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Append bytes to a file under an exclusive advisory lock.
+
+    Args:
+        path: File to append to (created if missing)
+        data: Complete lines to append
+        fsync: fsync the file before releasing the lock
+
+    Raises:
+        OSError: If the write fails
+    """
+    for _ in range(_REOPEN_ATTEMPTS):
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            with exclusive_lock(fd):
+                try:
+                    current = os.stat(path)
+                except FileNotFoundError:
+                    current = None
+                if current is None or not os.path.samestat(current, os.fstat(fd)):
+                    continue  # replaced while we waited for the lock
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                if fsync:
+                    os.fsync(fd)
+                return
+        finally:
+            os.close(fd)
+    raise OSError(f"{path} was replaced during every append attempt")
+
+
+@dataclass
+class WriterPolicy:
+    """When buffered records are written out and how durably."""
+
+    buffered: bool = True
+    max_records: int = DEFAULT_MAX_RECORDS
+    max_bytes: int = DEFAULT_MAX_BYTES
+    max_delay: float = DEFAULT_MAX_DELAY
+    fsync: str = FSYNC_ON_FLUSH
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "WriterPolicy":
+        """Read the optional ``metrics.writer`` section of config.yaml
+        (``buffered``, ``max_records``, ``max_delay_seconds``, ``fsync``)."""
+        settings = ((config or {}).get("metrics") or {}).get("writer") or {}
+        policy = cls()
+        if "buffered" in settings:
+            policy.buffered = bool(settings["buffered"])
+        if "max_records" in settings:
+            policy.max_records = max(1, int(settings["max_records"]))
+        if "max_delay_seconds" in settings:
+            policy.max_delay = float(settings["max_delay_seconds"])
+        fsync = settings.get("fsync", FSYNC_ON_FLUSH)
+        if fsync in FSYNC_POLICIES:
+            policy.fsync = fsync
+        else:
+            logger.warning(f"Unknown metrics.writer.fsync '{fsync}', using '{FSYNC_ON_FLUSH}'")
+        return policy
+
+
+class MetricsWriter:
+    """Batches JSONL appends per log file."""
+
+    def __init__(self, policy: Optional[WriterPolicy] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            policy: Flush triggers and fsync policy (defaults to WriterPolicy())
+        """
+        self.policy = policy or WriterPolicy()
+        self._pending: Dict[Path, List[bytes]] = {}
+        self._records = 0
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        _live.add(self)
+
+    def append(self, path: Path, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Queue records for a log, writing them out if a flush trigger is hit.
+
+        Raises:
+            OSError: When writing through (unbuffered or fsync "always") fails
+        """
+        records = list(records)
+        data = "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+        if not data:
+            return
+        path = _key(path)
+        if not self.policy.buffered or self.policy.fsync == FSYNC_ALWAYS:
+            append_locked(path, data, fsync=self.policy.fsync != FSYNC_NONE)
+            return
+
+        with self._lock:
+            self._pending.setdefault(path, []).append(data)
+            self._records += len(records)
+            self._bytes += len(data)
+            if self._records >= self.policy.max_records or self._bytes >= self.policy.max_bytes:
+                self._flush_locked(None)
+            else:
+                self._schedule_locked()
+
+    def pending(self, path: Optional[Path] = None) -> int:
+        """Bytes waiting to be written (for one log, or all)."""
+        with self._lock:
+            if path is not None:
+                return sum(len(chunk) for chunk in self._pending.get(_key(path), []))
+            return self._bytes
+
+    def flush(self, path: Optional[Path] = None) -> None:
+        """Write out pending records (for one log, or all).
+
+        Failures are logged and the records stay queued for the next flush.
+        """
+        with self._lock:
+            self._flush_locked(_key(path) if path is not None else None)
+
+    def close(self) -> None:
+        """Flush everything and stop the flush timer."""
+        self.flush()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _schedule_locked(self) -> None:
+        """Arm the flush timer unless it is already running."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.policy.max_delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._flush_locked(None)
+
+    def _flush_locked(self, only: Optional[Path]) -> None:
+        paths = [only] if only is not None else list(self._pending)
+        fsync = self.policy.fsync != FSYNC_NONE
+        for path in paths:
+            chunks = self._pending.get(path)
+            if not chunks:
+                continue
+            data = b"".join(chunks)
+            try:
+                append_locked(path, data, fsync=fsync)
+            except OSError as e:
+                logger.warning(f"Failed to write metrics to {path.name}: {e}")
+                continue
+            del self._pending[path]
+            self._records -= sum(chunk.count(b"\n") for chunk in chunks)
+            self._bytes -= len(data)
+
+        if not self._pending:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        else:
+            # Retry records whose write failed
+            self._schedule_locked()
+
+
+def _key(path: Path) -> Path:
+    # Writers and readers may spell the same log differently
+    return Path(os.path.abspath(path))
+
+
+_shared: Optional[MetricsWriter] = None
+_shared_lock = threading.Lock()
+
+# Writers still alive at exit are flushed by one hook; a weak set, so the
+# hook does not keep every writer ever created alive. A writer with
+# pending records is held by its armed timer until they are written.
+_live: "weakref.WeakSet[MetricsWriter]" = weakref.WeakSet()
+
+
+def _close_all() -> None:
+    for writer in list(_live):
+        writer.close()
+
+
+atexit.register(_close_all)
+
+
+def shared_writer(policy: Optional[WriterPolicy] = None) -> MetricsWriter:
+    """
+    Process-wide writer, so every recorder in a process shares one buffer.
+
+    Args:
+        policy: Policy to apply (pending records are flushed before a change)
+
+    Returns:
+        The shared MetricsWriter
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = MetricsWriter(policy)
+        elif policy is not None and policy != _shared.policy:
+            _shared.flush()
+            _shared.policy = policy
+        return _shared
+
+
+def flush_pending(path: Optional[Path] = None) -> None:
+    """Write out records this process has buffered for a log (or all logs)."""
+    if _shared is not None:
+        _shared.flush(path)
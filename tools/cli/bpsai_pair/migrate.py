@@ -9,9 +9,10 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import yaml
 from rich.console import Console
 
+from .core import yamlio
+
 console = Console()
 
 
@@ -63,7 +64,7 @@ def detect_version(project_root: Path) -> LegacyVersion:
     if has_paircoder_dir and has_config_yaml:
         # Check config version
         try:
-            config = yaml.safe_load((project_root / ".paircoder" / "config.yaml").read_text(encoding="utf-8"))
+            config = yamlio.load_file(project_root / ".paircoder" / "config.yaml", cache=True)
             version = str(config.get("version", "1.0"))
 
             # v2.4+ is current
@@ -165,7 +166,7 @@ def plan_migration(project_root: Path, preset: Optional[str] = None) -> Migratio
         config_path = paircoder_dir / "config.yaml"
         if config_path.exists():
             try:
-                config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+                config = yamlio.load_file(config_path, cache=True) or {}
             except Exception:
                 config = {}
 
@@ -250,14 +251,13 @@ def execute_migration(project_root: Path, plan: MigrationPlan) -> None:
         config_path = project_root / ".paircoder" / "config.yaml"
         if config_path.exists():
             try:
-                config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+                config = yamlio.load_file(config_path, cache=True) or {}
             except Exception:
                 config = {}
             config.update(plan.config_additions)
             config["version"] = plan.target_version
 
-            with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yamlio.dump_file(config, config_path, sort_keys=False)
 
     # Delete old files (only after everything else succeeds)
     for path in plan.files_to_delete:
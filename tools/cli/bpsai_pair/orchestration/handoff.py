@@ -22,7 +22,6 @@ import tempfile
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from io import BytesIO
 from pathlib import Path
 from typing import Any, Literal, Optional, Tuple, Union
 
@@ -337,30 +336,30 @@ class HandoffManager:
         files: list[Path],
         output_path: Path,
     ) -> None:
-        """Create the handoff tarball."""
-        with tarfile.open(output_path, "w:gz") as tar:
-            # Add HANDOFF.md
-            handoff_content = package.generate_handoff_md().encode("utf-8")
-            handoff_info = tarfile.TarInfo(name="HANDOFF.md")
-            handoff_info.size = len(handoff_content)
-            tar.addfile(handoff_info, BytesIO(handoff_content))
-
-            # Add metadata.json
-            metadata_content = json.dumps(package.to_metadata(), indent=2).encode("utf-8")
-            metadata_info = tarfile.TarInfo(name="metadata.json")
-            metadata_info.size = len(metadata_content)
-            tar.addfile(metadata_info, BytesIO(metadata_content))
-
-            # Add context files
-            for file_path in files:
-                if file_path.exists() and file_path.is_file():
-                    try:
-                        rel_path = file_path.relative_to(self.project_root)
-                        arcname = f"context/{rel_path}"
-                        tar.add(file_path, arcname=arcname)
-                    except ValueError:
-                        # File outside project root
-                        tar.add(file_path, arcname=f"context/{file_path.name}")
+        """Create the handoff tarball.
+
+        Context file content goes through the shared blob store, so files
+        unchanged since a previous pack reuse their compressed form.
+        """
+        from ..core.blobs import BlobStore, write_targz
+
+        members: list[tuple[str, Union[Path, bytes]]] = [
+            ("HANDOFF.md", package.generate_handoff_md().encode("utf-8")),
+            ("metadata.json", json.dumps(package.to_metadata(), indent=2).encode("utf-8")),
+        ]
+
+        # Add context files
+        for file_path in files:
+            if file_path.exists() and file_path.is_file():
+                try:
+                    rel_path = file_path.relative_to(self.project_root)
+                    arcname = f"context/{rel_path.as_posix()}"
+                except ValueError:
+                    # File outside project root
+                    arcname = f"context/{file_path.name}"
+                members.append((arcname, file_path))
+
+        write_targz(output_path, members, store=BlobStore.for_project(self.project_root))
 
 
 def _generate_handoff_id() -> str:
@@ -123,29 +123,37 @@ class HeadlessSession:
         """
         Check budget before expensive AI operation.
 
+        Reads the metrics store's running spend counters, so the check costs
+        the same however much history has been recorded.
+
         Returns:
             HeadlessResponse with error if over budget, None if OK to proceed.
         """
         try:
             from ..metrics.budget import BudgetEnforcer
             from ..metrics.collector import MetricsCollector
-            from ..tokens import estimate_prompt_tokens
             from ..core.ops import find_paircoder_dir
         except ImportError:
             # Budget modules not available, skip check
             BudgetEnforcer = None  # noqa: F841
             MetricsCollector = None  # noqa: F841
-            estimate_prompt_tokens = None  # noqa: F841
             find_paircoder_dir = None  # noqa: F841
             logger.debug("Budget enforcement not available, proceeding")
             return None
 
         try:
             history_dir = find_paircoder_dir() / "history"
+            if not history_dir.is_dir():
+                # Nothing recorded yet, so nothing spent
+                return None
             collector = MetricsCollector(history_dir)
             enforcer = BudgetEnforcer(collector)
-            estimated_tokens = estimate_prompt_tokens(prompt)
-            can_proceed, reason = enforcer.can_proceed(estimated_tokens)
+            # Rough prompt size (~4 chars/token); tokenizing here would cost
+            # more than the check itself
+            estimated_cost = enforcer.estimate_cost(
+                "claude-code", "default", len(prompt) // 4, 0
+            )
+            can_proceed, reason = enforcer.can_proceed(estimated_cost)
 
             if not can_proceed:
                 logger.warning(f"Budget exceeded: {reason}")
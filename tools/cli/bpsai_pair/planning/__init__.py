@@ -5,14 +5,25 @@ Provides plan and task management for the v2 planning system.
 Supports Goals → Tasks → Sprints workflow.
 """
 
-from .models import Plan, Task, Sprint, TaskStatus, PlanStatus, PlanType
-from .parser import PlanParser, TaskParser, parse_plan, parse_task, parse_frontmatter
+from .models import Plan, Task, LazyTask, Sprint, TaskStatus, PlanStatus, PlanType
+from .parser import (
+    PlanParser,
+    TaskParser,
+    parse_plan,
+    parse_task,
+    parse_frontmatter,
+    read_frontmatter,
+    read_task_body,
+)
 from .state import StateManager, ProjectState
+from .task_index import TaskIndex, TaskIndexEntry
+from .plan_index import PlanIndex, PlanIndexEntry
 
 __all__ = [
     # Models
     "Plan",
     "Task", 
+    "LazyTask",
     "Sprint",
     "TaskStatus",
     "PlanStatus",
@@ -23,6 +34,13 @@ __all__ = [
     "parse_plan",
     "parse_task",
     "parse_frontmatter",
+    "read_frontmatter",
+    "read_task_body",
+    # Index
+    "TaskIndex",
+    "TaskIndexEntry",
+    "PlanIndex",
+    "PlanIndexEntry",
     # State
     "StateManager",
     "ProjectState",
@@ -30,11 +30,11 @@ def get_next_pending_task(
     """
     task_parser = TaskParser(paircoder_dir / "tasks")
 
-    # Get all tasks
+    # Get all tasks (frontmatter only; bodies load if the caller reads them)
     if plan_id:
-        tasks = task_parser.get_tasks_for_plan(plan_id)
+        tasks = task_parser.get_tasks_for_plan(plan_id, lazy=True)
     else:
-        tasks = task_parser.parse_all()
+        tasks = task_parser.parse_all(lazy=True)
 
     # Filter to pending only
     pending = [t for t in tasks if t.status == TaskStatus.PENDING]
@@ -0,0 +1,92 @@
+"""
+Bulk Parsing
+
+Fans plan/task file parsing out over a worker pool.
+
+YAML parsing dominates cold runs over large task sets. When PyYAML is built
+with libyaml (CSafeLoader available) a thread pool is used; otherwise work
+is sent to a process pool so the pure-Python loader can use multiple cores.
+Results are always returned in input order.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from ..core import yamlio
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Below this many files per worker, pool start-up costs more than it saves
+MIN_FILES_PER_WORKER = 32
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+def has_libyaml() -> bool:
+    """Whether PyYAML was built with the libyaml C extension."""
+    return yamlio.HAS_LIBYAML
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normalize a --jobs value.
+
+    Args:
+        jobs: None or 1 for sequential, 0 (or negative) for one worker per CPU
+
+    Returns:
+        Number of workers (>= 1)
+    """
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def default_executor() -> str:
+    """Pick the pool type for the current YAML backend."""
+    return EXECUTOR_THREAD if has_libyaml() else EXECUTOR_PROCESS
+
+
+def parse_files(
+    parse_fn: Callable[[Path], T],
+    paths: Sequence[Path],
+    jobs: Optional[int] = 1,
+    executor: Optional[str] = None,
+) -> List[T]:
+    """
+    Apply parse_fn to every path, optionally in parallel.
+
+    Args:
+        parse_fn: Parser for a single file. Must be a module-level function
+            (or functools.partial of one) when a process pool is used.
+        paths: Files to parse
+        jobs: Worker count (see resolve_jobs)
+        executor: "thread" or "process" (default: chosen by YAML backend)
+
+    Returns:
+        Results in the same order as paths
+    """
+    paths = list(paths)
+    workers = min(resolve_jobs(jobs), len(paths) // MIN_FILES_PER_WORKER)
+    if workers <= 1:
+        return [parse_fn(p) for p in paths]
+
+    kind = executor or default_executor()
+    pool_cls = ThreadPoolExecutor if kind == EXECUTOR_THREAD else ProcessPoolExecutor
+    chunksize = max(1, len(paths) // (workers * 4))
+
+    try:
+        with pool_cls(max_workers=workers) as pool:
+            return list(pool.map(parse_fn, paths, chunksize=chunksize))
+    except (OSError, NotImplementedError) as e:
+        # Process pools are unavailable on some restricted platforms
+        logger.warning(f"Parallel parsing unavailable ({e}), parsing sequentially")
+        return [parse_fn(p) for p in paths]
@@ -24,6 +24,7 @@ from .models import Plan, Task, TaskStatus, PlanStatus, PlanType
 from .parser import PlanParser, TaskParser, parse_frontmatter
 from .state import StateManager
 from .token_estimator import PlanTokenEstimator, DEFAULT_THRESHOLD
+from ..core import yamlio
 
 # Import task lifecycle management
 try:
@@ -173,7 +174,7 @@ def plan_list(
 
     for plan in plans:
         # Count actual task files with matching plan_id
-        task_count = len(task_parser.get_tasks_for_plan(plan.id))
+        task_count = len(task_parser.list_summaries(plan_id=plan.id))
         table.add_row(
             plan.id,
             plan.title,
@@ -296,12 +297,16 @@ def plan_status(
     plan_id: str = typer.Argument("current", help="Plan ID or 'current' for active plan"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show individual task list"),
     json_out: bool = typer.Option(False, "--json", help="Output as JSON"),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j",
+        help="Parallel workers for parsing task files (0 = one per CPU)"
+    ),
 ):
     """Show plan status with sprint/task breakdown."""
     paircoder_dir = find_paircoder_dir()
     state_manager = get_state_manager()
     plan_parser = PlanParser(paircoder_dir / "plans")
-    task_parser = TaskParser(paircoder_dir / "tasks")
+    task_parser = TaskParser(paircoder_dir / "tasks", jobs=jobs)
 
     # If "current", get from state
     if plan_id == "current":
@@ -317,8 +322,8 @@ def plan_status(
         console.print(f"[red]Plan not found: {plan_id}[/red]")
         raise typer.Exit(1)
 
-    # Load tasks for this plan (filter by plan_id in frontmatter)
-    tasks = task_parser.get_tasks_for_plan(plan.id)
+    # Load task metadata for this plan from the task index
+    tasks = task_parser.get_tasks_for_plan(plan.id, metadata_only=True)
 
     # Calculate task counts
     task_counts = {"pending": 0, "in_progress": 0, "done": 0, "blocked": 0, "cancelled": 0}
@@ -457,6 +462,10 @@ def plan_sync_trello(
     apply_defaults: bool = typer.Option(False, "--apply-defaults", "-d", help="Apply project defaults from config to new cards"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without making changes"),
     json_out: bool = typer.Option(False, "--json", help="Output as JSON"),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j",
+        help="Parallel workers for parsing task files (0 = one per CPU)"
+    ),
 ):
     """Sync plan tasks to Trello board as cards.
 
@@ -469,7 +478,7 @@ def plan_sync_trello(
     """
     paircoder_dir = find_paircoder_dir()
     plan_parser = PlanParser(paircoder_dir / "plans")
-    task_parser = TaskParser(paircoder_dir / "tasks")
+    task_parser = TaskParser(paircoder_dir / "tasks", jobs=jobs)
 
     # Load plan
     plan = plan_parser.get_plan_by_id(plan_id)
@@ -484,12 +493,10 @@ def plan_sync_trello(
         raise typer.Exit(1)
 
     # Load config to get board_id if not provided
-    import yaml
     config_file = paircoder_dir / "config.yaml"
     full_config = {}
     if config_file.exists():
-        with open(config_file) as f:
-            full_config = yaml.safe_load(f) or {}
+        full_config = yamlio.load_file(config_file, cache=True) or {}
 
     # Use config board_id as default if --board not specified
     effective_board_id = board_id or full_config.get("trello", {}).get("board_id")
@@ -757,8 +764,8 @@ def plan_estimate(
         console.print(f"[red]Plan not found: {plan_id}[/red]")
         raise typer.Exit(1)
 
-    # Get tasks for this plan
-    tasks = task_parser.get_tasks_for_plan(plan_id)
+    # Get tasks for this plan (bodies are read by _populate_files_touched)
+    tasks = task_parser.get_tasks_for_plan(plan_id, lazy=True)
     if not tasks:
         console.print(f"[yellow]No tasks found for plan: {plan_id}[/yellow]")
         raise typer.Exit(0)
@@ -787,19 +794,25 @@ def _populate_files_touched(task: Task, tasks_dir: Path) -> None:
         tasks_dir: Directory containing task files
     """
     # Find task file
-    task_file = None
-    for ext in [".task.md", ".md"]:
-        candidate = tasks_dir / f"{task.id}{ext}"
-        if candidate.exists():
-            task_file = candidate
-            break
+    task_file = task.source_path
+    if task_file is None or not task_file.exists():
+        task_file = None
+        for ext in [".task.md", ".md"]:
+            candidate = tasks_dir / f"{task.id}{ext}"
+            if candidate.exists():
+                task_file = candidate
+                break
 
     if not task_file:
         task.files_touched = []
         return
 
     try:
-        content = task_file.read_text(encoding="utf-8")
+        # Reuse the (lazily loaded) body of the parsed task when available
+        if task.source_path == task_file:
+            content = task.body
+        else:
+            content = task_file.read_text(encoding="utf-8")
 
         # Find "Files to Modify" section
         files = []
@@ -888,10 +901,14 @@ def task_list(
         help="Filter: pending|in_progress|review|done|blocked"
     ),
     json_out: bool = typer.Option(False, "--json", help="Output as JSON"),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j",
+        help="Parallel workers for parsing task files (0 = one per CPU)"
+    ),
 ):
     """List tasks."""
     paircoder_dir = find_paircoder_dir()
-    task_parser = TaskParser(paircoder_dir / "tasks")
+    task_parser = TaskParser(paircoder_dir / "tasks", jobs=jobs)
     plan_parser = PlanParser(paircoder_dir / "plans")
 
     # Determine plan slug
@@ -901,7 +918,8 @@ def task_list(
         if plan:
             plan_slug = plan.slug
 
-    tasks = task_parser.parse_all(plan_slug)
+    # The table only needs index metadata; JSON output serializes full tasks
+    tasks = task_parser.parse_all(plan_slug, metadata_only=not json_out)
 
     if status:
         tasks = [t for t in tasks if t.status.value == status]
@@ -1101,12 +1119,10 @@ def task_update(
 ):
     # ENFORCEMENT: Block --local-only bypass when strict_ac_verification is enabled
     if status and status.lower() == "done" and local_only:
-        import yaml
         config_path = find_paircoder_dir() / "config.yaml"
         strict_ac = False
         if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
+            config = yamlio.load_file(config_path, cache=True) or {}
             strict_ac = config.get("enforcement", {}).get("strict_ac_verification", False)
 
         if strict_ac:
@@ -1123,12 +1139,10 @@ def task_update(
 
     # ENFORCEMENT: Block --no-hooks when completing tasks in strict mode
     if status and status.lower() == "done" and no_hooks:
-        import yaml
         config_path = find_paircoder_dir() / "config.yaml"
         strict_ac = False
         if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
+            config = yamlio.load_file(config_path, cache=True) or {}
             strict_ac = config.get("enforcement", {}).get("strict_ac_verification", False)
 
         if strict_ac:
@@ -1218,12 +1232,10 @@ def task_update(
 
     # ENFORCEMENT: Block --skip-state-check when strict_ac_verification is enabled
     if status == "done" and skip_state_check:
-            import yaml
             config_path = find_paircoder_dir() / "config.yaml"
             strict_ac = False
             if config_path.exists():
-                with open(config_path) as f:
-                    config = yaml.safe_load(f) or {}
+                config = yamlio.load_file(config_path, cache=True) or {}
                 strict_ac = config.get("enforcement", {}).get("strict_ac_verification", False)
 
             if strict_ac:
@@ -1291,9 +1303,7 @@ def _is_trello_enabled() -> bool:
         if not config_path.exists():
             return False
 
-        import yaml
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
+        config = yamlio.load_file(config_path, cache=True) or {}
 
         trello_config = config.get("trello", {})
         return trello_config.get("enabled", False) and trello_config.get("board_id")
@@ -1374,8 +1384,9 @@ def _log_bypass(command: str, task_id: str, reason: str = "forced") -> None:
             "reason": reason,
         }
 
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        from ..metrics.writer import append_locked
+
+        append_locked(log_path, (json.dumps(entry) + "\n").encode("utf-8"))
     except Exception:
         pass  # Best effort logging
 
@@ -2057,17 +2068,14 @@ def standup_post(
         console.print("[red]No config.yaml found[/red]")
         raise typer.Exit(1)
 
-    import yaml
-    config = yaml.safe_load(config_file.read_text(encoding="utf-8")) or {}
+    config = yamlio.load_file(config_file, cache=True) or {}
     board_id = config.get("trello", {}).get("board_id")
 
     if not board_id:
-        import yaml
         config_file = paircoder_dir / "config.yaml"
         if config_file.exists():
-            with open(config_file) as f:
-                full_config = yaml.safe_load(f) or {}
-                board_id = full_config.get("trello", {}).get("board_id")
+            full_config = yamlio.load_file(config_file, cache=True) or {}
+            board_id = full_config.get("trello", {}).get("board_id")
 
         if not board_id:
             console.print("[red]Board ID required. Use --board <board-id> or configure default board.[/red]")
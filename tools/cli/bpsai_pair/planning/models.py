@@ -217,6 +217,35 @@ class Task:
         )
 
 
+class LazyTask(Task):
+    """
+    Task whose Markdown body is read from source_path on first access.
+
+    Created by TaskParser in lazy mode, where only the YAML frontmatter is
+    read up front. Assigning ``body`` replaces the deferred value.
+    """
+
+    @property
+    def body(self) -> str:
+        """Markdown body, loaded from disk the first time it is read."""
+        if self.__dict__.get("_body") is None:
+            body = ""
+            if self.source_path is not None:
+                from .parser import read_task_body
+                body = read_task_body(self.source_path)
+            self.__dict__["_body"] = body
+        return self.__dict__["_body"]
+
+    @body.setter
+    def body(self, value: Optional[str]) -> None:
+        self.__dict__["_body"] = value
+
+    @property
+    def body_loaded(self) -> bool:
+        """Whether the body has been materialized."""
+        return self.__dict__.get("_body") is not None
+
+
 @dataclass
 class Sprint:
     """
@@ -6,12 +6,15 @@ Task files use YAML frontmatter + Markdown body format.
 """
 
 import re
+from functools import partial
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-import yaml
-
-from .models import Plan, Task
+from ..core import yamlio
+from .bulk import parse_files, resolve_jobs
+from .models import LazyTask, Plan, Task, TaskStatus
+from .plan_index import PlanIndex
+from .task_index import TaskIndex, TaskIndexEntry
 
 
 # Regex to match YAML frontmatter (content between --- delimiters)
@@ -37,26 +40,149 @@ def parse_frontmatter(content: str) -> Tuple[dict, str]:
         frontmatter_str = match.group(1)
         body = match.group(2).strip()
         try:
-            frontmatter = yaml.safe_load(frontmatter_str) or {}
-        except yaml.YAMLError:
+            frontmatter = yamlio.load(frontmatter_str) or {}
+        except yamlio.YAMLError:
             frontmatter = {}
         return frontmatter, body
     return {}, content
 
 
+def read_frontmatter(path: Path) -> dict:
+    """
+    Read only the YAML frontmatter of a file.
+
+    Streams lines up to the closing ``---`` delimiter so the Markdown body
+    is never read. Mirrors parse_frontmatter: returns {} when the file has
+    no (complete) frontmatter or the YAML is invalid.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Frontmatter dict (empty if none)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        if first.rstrip() != "---":
+            return {}
+
+        lines = []
+        for line in f:
+            if line.startswith("---") and not line[3:].strip():
+                break
+            lines.append(line)
+        else:
+            return {}
+
+    try:
+        return yamlio.load("".join(lines)) or {}
+    except yamlio.YAMLError:
+        return {}
+
+
+def read_task_body(path: Path) -> str:
+    """
+    Read the Markdown body (everything after the frontmatter) of a task file.
+
+    Args:
+        path: Task file path
+
+    Returns:
+        Body content, or "" if the file cannot be read
+    """
+    try:
+        content = Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return ""
+    match = FRONTMATTER_PATTERN.match(content)
+    if match:
+        return match.group(2).strip()
+    return content
+
+
+def load_plan_file(plan_path: Path) -> Optional[Plan]:
+    """
+    Parse a single plan file.
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        plan_path: Path to the plan file
+
+    Returns:
+        Plan object or None if parsing fails
+    """
+    try:
+        with open(plan_path, "r", encoding="utf-8") as f:
+            data = yamlio.load(f)
+        if not data:
+            return None
+        return Plan.from_dict(data, source_path=plan_path)
+    except (yamlio.YAMLError, OSError) as e:
+        print(f"Error parsing plan {plan_path}: {e}")
+        return None
+
+
+def load_task_file(task_path: Path, lazy: bool = False) -> Optional[Task]:
+    """
+    Parse a single task file.
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        task_path: Path to the task file
+        lazy: Read only the frontmatter; the body is loaded on first access
+
+    Returns:
+        Task object or None if parsing fails
+    """
+    if lazy:
+        try:
+            frontmatter = read_frontmatter(task_path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error parsing task {task_path}: {e}")
+            return None
+        if not frontmatter:
+            return None
+        return LazyTask.from_dict(frontmatter, body=None, source_path=task_path)
+
+    try:
+        with open(task_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        frontmatter, body = parse_frontmatter(content)
+        if not frontmatter:
+            return None
+
+        return Task.from_dict(frontmatter, body=body, source_path=task_path)
+    except OSError as e:
+        print(f"Error parsing task {task_path}: {e}")
+        return None
+
+
 class PlanParser:
     """
     Parser for plan files (.plan.yaml).
     """
 
-    def __init__(self, plans_dir: Path):
+    def __init__(
+        self,
+        plans_dir: Path,
+        jobs: Optional[int] = 1,
+        index_path: Optional[Path] = None,
+    ):
         """
         Initialize parser with plans directory.
 
         Args:
             plans_dir: Path to .paircoder/plans/
+            jobs: Parallel workers for bulk parsing (1 = sequential, 0 = per CPU)
+            index_path: Optional plan index location
+                (default: .paircoder/cache/plan-index.json)
         """
         self.plans_dir = Path(plans_dir)
+        self.jobs = jobs
+        self.index = PlanIndex(self.plans_dir, index_path)
 
     def list_plans(self) -> list[Path]:
         """List all plan files in the plans directory."""
@@ -74,51 +200,33 @@ class PlanParser:
         Returns:
             Plan object or None if parsing fails
         """
-        try:
-            with open(plan_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            if not data:
-                return None
-            return Plan.from_dict(data, source_path=plan_path)
-        except (yaml.YAMLError, OSError) as e:
-            print(f"Error parsing plan {plan_path}: {e}")
-            return None
+        return load_plan_file(plan_path)
 
     def parse_all(self) -> list[Plan]:
         """Parse all plans in the directory."""
-        plans = []
-        for plan_path in self.list_plans():
-            plan = self.parse(plan_path)
-            if plan:
-                plans.append(plan)
-        return plans
+        plan_paths = self.list_plans()
+        if resolve_jobs(self.jobs) > 1:
+            results = parse_files(load_plan_file, plan_paths, jobs=self.jobs)
+        else:
+            results = [self.parse(plan_path) for plan_path in plan_paths]
+        return [plan for plan in results if plan]
 
     def get_plan_by_id(self, plan_id: str) -> Optional[Plan]:
         """
-        Find and parse a plan by its ID.
+        Find and parse a plan by its ID, slug or partial slug.
 
         Args:
-            plan_id: Plan ID (e.g., "plan-2025-01-feature-name")
+            plan_id: Plan ID (e.g., "plan-2025-01-feature-name") or slug
 
         Returns:
             Plan object or None if not found
         """
-        # Try exact filename match first
-        exact_path = self.plans_dir / f"{plan_id}.plan.yaml"
-        if exact_path.exists():
-            return self.parse(exact_path)
-
-        # Search all plans for matching ID
-        for plan in self.parse_all():
-            if plan.id == plan_id:
-                return plan
-
-        # Try partial match (slug)
-        for plan_path in self.list_plans():
-            if plan_id in plan_path.stem:
-                return self.parse(plan_path)
-
-        return None
+        # Exact filename, then indexed ID/slug, then partial slug match;
+        # only the matching plan file is parsed
+        plan_path = self.index.resolve(plan_id)
+        if plan_path is None:
+            return None
+        return self.parse(plan_path)
 
     def save(self, plan: Plan, filename: Optional[str] = None) -> Path:
         """
@@ -139,7 +247,7 @@ class PlanParser:
         plan_path = self.plans_dir / filename
 
         with open(plan_path, "w", encoding="utf-8") as f:
-            yaml.dump(
+            yamlio.dump(
                 plan.to_dict(),
                 f,
                 default_flow_style=False,
@@ -176,14 +284,29 @@ class TaskParser:
     ```
     """
 
-    def __init__(self, tasks_dir: Path):
+    def __init__(
+        self,
+        tasks_dir: Path,
+        index_path: Optional[Path] = None,
+        jobs: Optional[int] = 1,
+    ):
         """
         Initialize parser with tasks directory.
 
         Args:
             tasks_dir: Path to .paircoder/tasks/
+            index_path: Optional task index location
+                (default: .paircoder/cache/task-index.json)
+            jobs: Parallel workers for bulk parsing (1 = sequential, 0 = per CPU)
         """
         self.tasks_dir = Path(tasks_dir)
+        self.jobs = jobs
+        self._index = TaskIndex(self.tasks_dir, index_path)
+
+    @property
+    def index(self) -> TaskIndex:
+        """Task metadata index, refreshed for any files changed on disk."""
+        return self._index.refresh(jobs=self.jobs)
 
     def list_tasks(self, plan_slug: Optional[str] = None) -> List[Path]:
         """List task files, optionally filtered by plan.
@@ -197,67 +320,81 @@ class TaskParser:
         if not self.tasks_dir.exists():
             return []
 
-        # Flat storage - all .task.md files directly in tasks/
-        all_tasks = list(self.tasks_dir.glob("*.task.md"))
-
-        # Also check subdirectories for backwards compatibility with old structure
-        for subdir in self.tasks_dir.iterdir():
-            if subdir.is_dir():
-                all_tasks.extend(subdir.glob("*.task.md"))
-
-        # Deduplicate and sort
-        all_tasks = sorted(set(all_tasks))
-
         if plan_slug:
-            # Filter by parsing each task's plan_id
-            filtered = []
-            for task_path in all_tasks:
-                task = self.parse(task_path)
-                if task and task.plan_id and plan_slug in task.plan_id:
-                    filtered.append(task_path)
-            return filtered
+            # Filter on indexed plan_id instead of parsing every task
+            index = self.index
+            return [index.path_for(entry) for entry in index.query(plan_slug=plan_slug)]
+
+        # Flat storage plus subdirectories for backwards compatibility
+        return self._index.scan_files()
+
+    def list_summaries(
+        self,
+        plan_slug: Optional[str] = None,
+        plan_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        sprint: Optional[str] = None,
+    ) -> List[TaskIndexEntry]:
+        """
+        List task metadata from the index without opening task files.
+
+        Args:
+            plan_slug: Filter to tasks whose plan ID contains this slug
+            plan_id: Filter to tasks whose plan ID matches exactly
+            status: Filter by status
+            sprint: Filter by sprint
 
-        return all_tasks
+        Returns:
+            List of TaskIndexEntry objects in path order
+        """
+        if not self.tasks_dir.exists():
+            return []
+        return self.index.query(plan_slug=plan_slug, plan_id=plan_id, status=status, sprint=sprint)
 
-    def parse(self, task_path: Path) -> Optional[Task]:
+    def parse(self, task_path: Path, lazy: bool = False) -> Optional[Task]:
         """
         Parse a single task file.
 
         Args:
             task_path: Path to the task file
+            lazy: Read only the frontmatter; the body is loaded on first access
 
         Returns:
             Task object or None if parsing fails
         """
-        try:
-            with open(task_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            frontmatter, body = parse_frontmatter(content)
-            if not frontmatter:
-                return None
-
-            return Task.from_dict(frontmatter, body=body, source_path=task_path)
-        except OSError as e:
-            print(f"Error parsing task {task_path}: {e}")
-            return None
-
-    def parse_all(self, plan_slug: Optional[str] = None) -> list[Task]:
+        return load_task_file(task_path, lazy=lazy)
+
+    def _parse_paths(self, task_paths: List[Path], lazy: bool = False) -> list[Task]:
+        """Parse task files in order, fanning out when jobs > 1."""
+        if resolve_jobs(self.jobs) > 1:
+            results = parse_files(partial(load_task_file, lazy=lazy), task_paths, jobs=self.jobs)
+        else:
+            results = [self.parse(task_path, lazy=lazy) for task_path in task_paths]
+        return [task for task in results if task]
+
+    def parse_all(
+        self,
+        plan_slug: Optional[str] = None,
+        metadata_only: bool = False,
+        lazy: bool = False,
+    ) -> list[Task]:
         """
         Parse all tasks, optionally filtered by plan.
 
         Args:
             plan_slug: If provided, only parse tasks for this plan
+            metadata_only: Build tasks from the index without reading files
+                (description, tags and files_touched are not populated;
+                the body is loaded on first access)
+            lazy: Read only frontmatter; bodies are loaded on first access
 
         Returns:
             List of Task objects
         """
-        tasks = []
-        for task_path in self.list_tasks(plan_slug):
-            task = self.parse(task_path)
-            if task:
-                tasks.append(task)
-        return tasks
+        if metadata_only:
+            return [e.to_task(self.tasks_dir) for e in self.list_summaries(plan_slug=plan_slug)]
+
+        return self._parse_paths(self.list_tasks(plan_slug), lazy=lazy)
 
     def get_task_by_id(self, task_id: str, plan_slug: Optional[str] = None) -> Optional[Task]:
         """
@@ -270,12 +407,20 @@ class TaskParser:
         Returns:
             Task object or None if not found
         """
-        for task in self.parse_all(plan_slug):
-            if task.id == task_id:
-                return task
-        return None
-
-    def get_tasks_for_plan(self, plan_id: str) -> list[Task]:
+        if not self.tasks_dir.exists():
+            return None
+        index = self.index
+        entry = index.find(task_id, plan_slug)
+        if entry is None:
+            return None
+        return self.parse(index.path_for(entry))
+
+    def get_tasks_for_plan(
+        self,
+        plan_id: str,
+        metadata_only: bool = False,
+        lazy: bool = False,
+    ) -> list[Task]:
         """
         Get all tasks belonging to a specific plan.
 
@@ -283,11 +428,17 @@ class TaskParser:
 
         Args:
             plan_id: Plan ID to filter by (e.g., "plan-2025-01-paircoder-v2.4-mcp")
+            metadata_only: Build tasks from the index without reading files
+            lazy: Read only frontmatter; bodies are loaded on first access
 
         Returns:
             List of Task objects belonging to this plan
         """
-        return [t for t in self.parse_all() if t.plan_id == plan_id]
+        if metadata_only:
+            return [e.to_task(self.tasks_dir) for e in self.list_summaries(plan_id=plan_id)]
+
+        task_paths = [self._index.path_for(entry) for entry in self.list_summaries(plan_id=plan_id)]
+        return self._parse_paths(task_paths, lazy=lazy)
 
     def save(self, task: Task, _plan_slug: Optional[str] = None) -> Path:
         """
@@ -311,7 +462,7 @@ class TaskParser:
 
         # Build content
         content = "---\n"
-        content += yaml.dump(
+        content += yamlio.dump(
             frontmatter,
             default_flow_style=False,
             allow_unicode=True,
@@ -359,7 +510,7 @@ class TaskParser:
 
         # Rewrite file
         new_content = "---\n"
-        new_content += yaml.dump(
+        new_content += yamlio.dump(
             frontmatter,
             default_flow_style=False,
             allow_unicode=True,
@@ -0,0 +1,265 @@
+"""
+Plan Index
+
+Persistent id -> file index for plan files (.plan.yaml).
+
+The index lives at .paircoder/cache/plan-index.json. It is revalidated
+against the plans directory's mtime, which changes whenever a plan file is
+added, removed or renamed; only then are plan files re-stat'ed, and only
+files whose (mtime, size) changed are parsed again. Lookups by ID or slug
+are dictionary reads and never parse unrelated plans.
+
+A stat recorded within _RACY_NS of the file's (or directory's) mtime is not
+trusted until it is older: a change within the timestamp granularity could
+keep the same mtime and size.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_FILENAME = "plan-index.json"
+
+# Stat-only index hits need the file to have been this old when indexed
+_RACY_NS = 2_000_000_000
+
+
+@dataclass
+class PlanIndexEntry:
+    """Indexed identity of a single plan file."""
+    filename: str
+    mtime: int  # st_mtime_ns
+    size: int
+    checked: int  # when the stat was recorded (ns)
+    id: str
+    slug: str
+
+    def trusted(self, mtime: int, size: int) -> bool:
+        """Whether a matching stat is enough to skip re-reading the file."""
+        return (self.mtime, self.size) == (mtime, size) and self.checked - mtime > _RACY_NS
+
+
+def plan_slug(plan_id: str) -> str:
+    """Slug for a plan ID (mirrors Plan.slug)."""
+    parts = plan_id.split("-")
+    if len(parts) > 3:
+        return "-".join(parts[3:])
+    return plan_id
+
+
+class PlanIndex:
+    """
+    Incremental on-disk index of plan IDs and slugs.
+
+    An edit that changes a plan's ``id`` in place does not touch the
+    directory mtime; a lookup that misses (or resolves to a file that
+    changed) therefore re-stats every plan file before giving up.
+    """
+
+    def __init__(self, plans_dir: Path, index_path: Optional[Path] = None):
+        """
+        Initialize the index.
+
+        Args:
+            plans_dir: Path to .paircoder/plans/
+            index_path: Index file location (default: .paircoder/cache/plan-index.json)
+        """
+        self.plans_dir = Path(plans_dir)
+        if index_path is None:
+            index_path = self.plans_dir.parent / "cache" / INDEX_FILENAME
+        self.index_path = Path(index_path)
+        self._dir_mtime: Optional[int] = None
+        self._dir_checked = 0
+        self._entries: Dict[str, PlanIndexEntry] = {}  # filename -> entry
+        self._by_id: Dict[str, str] = {}
+        self._by_slug: Dict[str, str] = {}
+        self._loaded = False
+
+    def _load(self) -> None:
+        """Load the persisted index, discarding it if unreadable or outdated."""
+        self._loaded = True
+        if not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load plan index: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        try:
+            self._entries = {
+                name: PlanIndexEntry(filename=name, **record)
+                for name, record in data.get("files", {}).items()
+            }
+            self._dir_mtime = data.get("dir_mtime")
+            self._dir_checked = data.get("dir_checked", 0)
+        except TypeError:
+            self._entries = {}
+            self._dir_mtime = None
+            self._dir_checked = 0
+        self._rebuild_maps()
+
+    def _save(self) -> None:
+        """Atomically write the index to disk."""
+        data = {
+            "version": INDEX_VERSION,
+            "dir_mtime": self._dir_mtime,
+            "dir_checked": self._dir_checked,
+            "files": {
+                name: {"mtime": e.mtime, "size": e.size, "checked": e.checked, "id": e.id, "slug": e.slug}
+                for name, e in self._entries.items()
+            },
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save plan index: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _rebuild_maps(self) -> None:
+        """Rebuild id/slug lookups; the first file in sorted order wins."""
+        self._entries = {name: self._entries[name] for name in sorted(self._entries)}
+        self._by_id = {}
+        self._by_slug = {}
+        for name, entry in self._entries.items():
+            if entry.id:
+                self._by_id.setdefault(entry.id, name)
+                self._by_slug.setdefault(entry.slug, name)
+
+    def _read_entry(self, path: Path, mtime: int, size: int, checked: int) -> PlanIndexEntry:
+        """Parse a plan file just far enough to learn its ID."""
+        from ..core import yamlio
+
+        plan_id = ""
+        try:
+            data = yamlio.load_file(path)
+            if isinstance(data, dict):
+                plan_id = str(data.get("id") or "")
+        except (yamlio.YAMLError, OSError) as e:
+            logger.warning(f"Failed to index plan {path}: {e}")
+        return PlanIndexEntry(
+            filename=path.name, mtime=mtime, size=size, checked=checked,
+            id=plan_id, slug=plan_slug(plan_id),
+        )
+
+    def _stat_dir(self) -> Optional[int]:
+        try:
+            return self.plans_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self, force: bool = False) -> "PlanIndex":
+        """
+        Bring the index up to date if the plans directory changed.
+
+        Args:
+            force: Re-stat every plan file even if the directory mtime is unchanged
+                (and old enough to trust)
+
+        Returns:
+            self, for chaining
+        """
+        if not self._loaded:
+            self._load()
+
+        checked_ns = time.time_ns()  # before anything is read
+        dir_mtime = self._stat_dir()
+        if dir_mtime is None:
+            self._entries, self._by_id, self._by_slug = {}, {}, {}
+            return self
+        dir_trusted = dir_mtime == self._dir_mtime and self._dir_checked - dir_mtime > _RACY_NS
+        if not force and dir_trusted:
+            return self
+
+        changed = not dir_trusted
+        entries = {}
+        for path in sorted(self.plans_dir.glob("*.plan.yaml")):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            current = self._entries.get(path.name)
+            if current and current.trusted(st.st_mtime_ns, st.st_size):
+                entries[path.name] = current
+            else:
+                entries[path.name] = self._read_entry(path, st.st_mtime_ns, st.st_size, checked_ns)
+                changed = True
+
+        if changed or entries.keys() != self._entries.keys():
+            self._entries = entries
+            self._dir_mtime = dir_mtime
+            self._dir_checked = checked_ns
+            self._rebuild_maps()
+            self._save()
+        return self
+
+    def _validated(self, filename: Optional[str]) -> Optional[Path]:
+        """Return the path for a filename if its indexed identity is still current."""
+        if filename is None:
+            return None
+        entry = self._entries[filename]
+        path = self.plans_dir / filename
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if not entry.trusted(st.st_mtime_ns, st.st_size):
+            return None
+        return path
+
+    def resolve(self, plan_id: str) -> Optional[Path]:
+        """
+        Resolve a plan ID, slug or partial slug to its file.
+
+        Precedence: exact filename, exact ID, exact slug, then the first
+        filename (sorted) containing plan_id.
+
+        Args:
+            plan_id: Plan ID, slug or partial slug
+
+        Returns:
+            Path to the plan file, or None if not found
+        """
+        exact_path = self.plans_dir / f"{plan_id}.plan.yaml"
+        if exact_path.exists():
+            return exact_path
+
+        self.refresh()
+        filename = self._lookup(plan_id)
+        if filename is not None:
+            path = self._validated(filename)
+            if path is not None:
+                return path
+
+        # Miss, or the resolved file was edited in place since it was
+        # indexed: re-stat all plan files (parsing only changed ones) and retry
+        self.refresh(force=True)
+        filename = self._lookup(plan_id)
+        if filename is not None:
+            return self.plans_dir / filename
+        return self._resolve_partial(plan_id)
+
+    def _lookup(self, plan_id: str) -> Optional[str]:
+        """Exact ID, then exact slug."""
+        return self._by_id.get(plan_id) or self._by_slug.get(plan_id)
+
+    def _resolve_partial(self, plan_id: str) -> Optional[Path]:
+        for name in self._entries:
+            if plan_id in name[: -len(".yaml")]:
+                return self.plans_dir / name
+        return None
+
+    def entries(self) -> List[PlanIndexEntry]:
+        """All indexed plans in filename order."""
+        return list(self._entries.values())
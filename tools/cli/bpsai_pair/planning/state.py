@@ -5,14 +5,15 @@ Manages project state including active plan, current tasks, and status tracking.
 Reads from and writes to .paircoder/context/state.md
 """
 
-import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from ..core.state_cache import StateSummary, parse_state, read_state
 from .models import Plan, Task, TaskStatus, PlanStatus
 from .parser import PlanParser, TaskParser
+from .task_index import TaskIndexEntry
 
 
 @dataclass
@@ -38,70 +39,24 @@ class ProjectState:
         This is a best-effort parser that extracts key information from
         the Markdown-formatted state file.
         """
-        state = cls(source_path=source_path)
-        
-        # Extract last updated
-        updated_match = re.search(r"Last updated:\s*(\d{4}-\d{2}-\d{2})", content)
-        if updated_match:
+        return cls.from_summary(parse_state(content), source_path=source_path)
+    
+    @classmethod
+    def from_summary(cls, summary: StateSummary, source_path: Optional[Path] = None) -> "ProjectState":
+        """Build from a parsed (possibly cached) state.md summary."""
+        state = cls(
+            active_plan_id=summary.plan_id,
+            active_sprint_id=summary.sprint_id,
+            what_was_done=list(summary.what_was_done),
+            whats_next=list(summary.whats_next),
+            blockers=list(summary.blockers),
+            source_path=source_path,
+        )
+        if summary.last_updated:
             try:
-                state.last_updated = datetime.strptime(updated_match.group(1), "%Y-%m-%d")
+                state.last_updated = datetime.strptime(summary.last_updated, "%Y-%m-%d")
             except ValueError:
                 pass
-        
-        # Extract active plan ID
-        plan_match = re.search(r"\*\*Plan:\*\*\s*`([^`]+)`", content)
-        if plan_match:
-            state.active_plan_id = plan_match.group(1)
-        
-        # Extract current sprint
-        sprint_match = re.search(r"\*\*Current Sprint:\*\*\s*(\S+)", content)
-        if sprint_match:
-            state.active_sprint_id = sprint_match.group(1)
-        
-        # Extract "What Was Just Done" section
-        done_match = re.search(
-            r"## What Was Just Done\s*\n(.*?)(?=\n## |\Z)",
-            content,
-            re.DOTALL
-        )
-        if done_match:
-            lines = done_match.group(1).strip().split("\n")
-            state.what_was_done = [
-                line.lstrip("- ✅•").strip()
-                for line in lines
-                if line.strip() and not line.startswith("#")
-            ]
-        
-        # Extract "What's Next" section
-        next_match = re.search(
-            r"## What'?s Next\s*\n(.*?)(?=\n## |\Z)",
-            content,
-            re.DOTALL
-        )
-        if next_match:
-            lines = next_match.group(1).strip().split("\n")
-            state.whats_next = [
-                line.lstrip("- 0123456789.•").strip()
-                for line in lines
-                if line.strip() and not line.startswith("#")
-            ]
-        
-        # Extract blockers
-        blockers_match = re.search(
-            r"## Blockers\s*\n(.*?)(?=\n## |\Z)",
-            content,
-            re.DOTALL
-        )
-        if blockers_match:
-            text = blockers_match.group(1).strip()
-            if text.lower() not in ("none", "none.", "none currently", "none currently."):
-                lines = text.split("\n")
-                state.blockers = [
-                    line.lstrip("- •").strip()
-                    for line in lines
-                    if line.strip() and not line.startswith("#")
-                ]
-        
         return state
 
 
@@ -144,10 +99,10 @@ class StateManager:
         return self._active_plan
     
     def load_state(self) -> ProjectState:
-        """Load state from state.md file."""
-        if self.state_path.exists():
-            content = self.state_path.read_text(encoding="utf-8")
-            return ProjectState.from_state_md(content, source_path=self.state_path)
+        """Load state from state.md file (parsed at most once per change)."""
+        summary = read_state(self.state_path)
+        if summary is not None:
+            return ProjectState.from_summary(summary, source_path=self.state_path)
         return ProjectState(source_path=self.state_path)
     
     def reload(self) -> None:
@@ -199,10 +154,9 @@ class StateManager:
                         "task_count": len(sprint.task_ids),
                     }
             
-            # Count tasks by status
-            tasks = self.task_parser.parse_all(plan.slug)
-            for task in tasks:
-                status_key = task.status.value
+            # Count tasks by status (index only, no task files opened)
+            for entry in self.task_parser.list_summaries(plan_slug=plan.slug):
+                status_key = entry.task_status.value
                 if status_key in summary["task_counts"]:
                     summary["task_counts"][status_key] += 1
         
@@ -222,10 +176,11 @@ class StateManager:
         if not plan:
             return []
         
-        tasks = self.task_parser.parse_all(plan.slug)
-        
-        if status:
-            tasks = [t for t in tasks if t.status == status]
+        tasks = []
+        for entry in self.task_parser.list_summaries(plan_slug=plan.slug, status=status):
+            task = self._load_indexed_task(entry)
+            if task:
+                tasks.append(task)
         
         return tasks
     
@@ -239,22 +194,27 @@ class StateManager:
         if not plan:
             return None
         
-        tasks = self.task_parser.parse_all(plan.slug)
+        # Select from the task index, then parse only the chosen task
+        entries = self.task_parser.list_summaries(plan_slug=plan.slug)
         
         # First check for in-progress tasks
-        in_progress = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
+        in_progress = [e for e in entries if e.task_status == TaskStatus.IN_PROGRESS]
         if in_progress:
-            return in_progress[0]
+            return self._load_indexed_task(in_progress[0])
         
         # Then get highest priority pending task
-        pending = [t for t in tasks if t.status == TaskStatus.PENDING]
+        pending = [e for e in entries if e.task_status == TaskStatus.PENDING]
         if pending:
             # Sort by priority (P0 > P1 > P2)
-            pending.sort(key=lambda t: t.priority)
-            return pending[0]
+            pending.sort(key=lambda e: e.priority)
+            return self._load_indexed_task(pending[0])
         
         return None
     
+    def _load_indexed_task(self, entry: TaskIndexEntry) -> Optional[Task]:
+        """Parse the task file behind an index entry."""
+        return self.task_parser.parse(self.task_parser.tasks_dir / entry.path)
+    
     def update_task_status(self, task_id: str, status: TaskStatus) -> bool:
         """
         Update a task's status.
@@ -0,0 +1,337 @@
+"""
+Task Index
+
+Persistent metadata index for task files (.task.md).
+
+The index lives at .paircoder/cache/task-index.json and stores the
+frontmatter fields needed for listing, filtering and status queries,
+keyed by file path together with the file's (mtime, size) and when it was
+indexed. Refreshing the index only re-parses files whose stat changed since
+the last run, so metadata-only queries never open unchanged task bodies.
+A file indexed within _RACY_NS of its mtime is re-parsed until it is older:
+an edit within the timestamp granularity could keep its size and mtime.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .models import LazyTask, Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_FILENAME = "task-index.json"
+
+# Stat-only index hits need the file to have been this old when indexed
+_RACY_NS = 2_000_000_000
+
+# Index contents already loaded by this process, by index path, keyed by the
+# index file's (mtime, size). A long-lived process (the command daemon)
+# re-reads the JSON only when another process rewrote it.
+_memo: Dict[Path, tuple] = {}
+
+
+def _file_key(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class TaskIndexEntry:
+    """Indexed metadata for a single task file."""
+    path: str  # Relative to tasks_dir
+    mtime: int  # st_mtime_ns
+    size: int
+    id: str
+    title: str
+    plan_id: str
+    sprint: Optional[str] = None
+    status: str = TaskStatus.PENDING.value
+    priority: str = "P1"
+    complexity: int = 50
+    depends_on: list[str] = field(default_factory=list)
+
+    @property
+    def task_status(self) -> TaskStatus:
+        """Status as a TaskStatus enum."""
+        try:
+            return TaskStatus(self.status)
+        except ValueError:
+            return TaskStatus.PENDING
+
+    def to_task(self, tasks_dir: Path) -> Task:
+        """Build a metadata-only Task whose body is loaded on first access."""
+        return LazyTask(
+            id=self.id,
+            title=self.title,
+            plan_id=self.plan_id,
+            priority=self.priority,
+            complexity=self.complexity,
+            status=self.task_status,
+            sprint=self.sprint,
+            depends_on=list(self.depends_on),
+            body=None,
+            source_path=tasks_dir / self.path,
+        )
+
+    @classmethod
+    def from_task(cls, task: Task, path: str, mtime: int, size: int) -> "TaskIndexEntry":
+        """Create an entry from a parsed Task."""
+        return cls(
+            path=path,
+            mtime=mtime,
+            size=size,
+            id=task.id,
+            title=task.title,
+            plan_id=task.plan_id or "",
+            sprint=task.sprint,
+            status=task.status.value,
+            priority=task.priority,
+            complexity=task.complexity,
+            depends_on=list(task.depends_on or []),
+        )
+
+
+class TaskIndex:
+    """
+    Incremental on-disk index of task metadata.
+
+    Files that cannot be parsed as tasks are remembered by stat as well
+    (with no entry) so they are not re-read on every refresh.
+    """
+
+    def __init__(self, tasks_dir: Path, index_path: Optional[Path] = None):
+        """
+        Initialize the index.
+
+        Args:
+            tasks_dir: Path to .paircoder/tasks/
+            index_path: Index file location (default: .paircoder/cache/task-index.json)
+        """
+        self.tasks_dir = Path(tasks_dir)
+        if index_path is None:
+            index_path = self.tasks_dir.parent / "cache" / INDEX_FILENAME
+        self.index_path = Path(index_path)
+        # path -> entry (None for files without valid frontmatter)
+        self._files: Dict[str, Optional[TaskIndexEntry]] = {}
+        self._stats: Dict[str, tuple[int, int]] = {}
+        # path -> when the file was indexed (ns)
+        self._checked: Dict[str, int] = {}
+        self._loaded = False
+
+    def _load(self) -> None:
+        """Load the persisted index, discarding it if unreadable or outdated."""
+        self._loaded = True
+        key = _file_key(self.index_path)
+        if key is None:
+            return
+        memo = _memo.get(self.index_path)
+        if memo is not None and memo[0] == key:
+            self._files, self._stats, self._checked = dict(memo[1]), dict(memo[2]), dict(memo[3])
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load task index: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+
+        for rel_path, record in data.get("files", {}).items():
+            try:
+                self._stats[rel_path] = (record["mtime"], record["size"])
+                self._checked[rel_path] = record["checked"]
+                task_data = record.get("task")
+                self._files[rel_path] = (
+                    TaskIndexEntry(path=rel_path, mtime=record["mtime"], size=record["size"], **task_data)
+                    if task_data else None
+                )
+            except (KeyError, TypeError):
+                self._stats.pop(rel_path, None)
+                self._checked.pop(rel_path, None)
+                self._files.pop(rel_path, None)
+        self._remember(key)
+
+    def _remember(self, key: Optional[tuple[int, int]]) -> None:
+        if key is not None:
+            _memo[self.index_path] = (key, dict(self._files), dict(self._stats), dict(self._checked))
+
+    def _save(self) -> None:
+        """Atomically write the index to disk."""
+        files = {}
+        for rel_path, (mtime, size) in self._stats.items():
+            entry = self._files.get(rel_path)
+            task_data = None
+            if entry is not None:
+                task_data = asdict(entry)
+                for key in ("path", "mtime", "size"):
+                    task_data.pop(key)
+            files[rel_path] = {
+                "mtime": mtime,
+                "size": size,
+                "checked": self._checked.get(rel_path, 0),
+                "task": task_data,
+            }
+
+        data = {"version": INDEX_VERSION, "files": files}
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, default=str), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+            self._remember(_file_key(self.index_path))
+        except OSError as e:
+            logger.warning(f"Failed to save task index: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def scan_files(self) -> List[Path]:
+        """List task files (flat layout plus legacy plan subdirectories)."""
+        if not self.tasks_dir.exists():
+            return []
+        all_tasks = list(self.tasks_dir.glob("*.task.md"))
+        for subdir in self.tasks_dir.iterdir():
+            if subdir.is_dir():
+                all_tasks.extend(subdir.glob("*.task.md"))
+        return sorted(set(all_tasks))
+
+    def _trusted(self, rel_path: str, stat_key: tuple[int, int]) -> bool:
+        """Whether a file's stat is enough to skip re-parsing it."""
+        return (self._stats.get(rel_path) == stat_key
+                and self._checked.get(rel_path, 0) - stat_key[0] > _RACY_NS)
+
+    def _apply(self, task_path: Path, rel_path: str, stat_key: tuple[int, int],
+               frontmatter: Optional[dict], checked_ns: int) -> None:
+        """Store the parsed frontmatter of a task file in the index."""
+        entry = None
+        if frontmatter:
+            task = Task.from_dict(frontmatter, source_path=task_path)
+            entry = TaskIndexEntry.from_task(task, rel_path, *stat_key)
+        self._files[rel_path] = entry
+        self._stats[rel_path] = stat_key
+        self._checked[rel_path] = checked_ns
+
+    def refresh(self, jobs: Optional[int] = 1) -> "TaskIndex":
+        """
+        Bring the index up to date with the tasks directory.
+
+        Only files whose (mtime, size) changed, or that were indexed too soon
+        after a write to trust their stat, are re-parsed; deleted files are
+        dropped. The index is persisted only when something changed.
+
+        Args:
+            jobs: Parallel workers for re-parsing changed files
+
+        Returns:
+            self, for chaining
+        """
+        from .bulk import parse_files
+
+        if not self._loaded:
+            self._load()
+
+        checked_ns = time.time_ns()  # before any file is read
+        stale = []
+        seen = set()
+        for task_path in self.scan_files():
+            rel_path = task_path.relative_to(self.tasks_dir).as_posix()
+            seen.add(rel_path)
+            try:
+                st = task_path.stat()
+            except OSError:
+                continue
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if not self._trusted(rel_path, stat_key):
+                stale.append((task_path, rel_path, stat_key))
+
+        changed = bool(stale)
+        results = parse_files(_read_frontmatter_safe, [item[0] for item in stale], jobs=jobs)
+        for (task_path, rel_path, stat_key), frontmatter in zip(stale, results):
+            if frontmatter == _UNREADABLE:
+                continue
+            self._apply(task_path, rel_path, stat_key, frontmatter, checked_ns)
+
+        for rel_path in list(self._stats):
+            if rel_path not in seen:
+                del self._stats[rel_path]
+                self._checked.pop(rel_path, None)
+                self._files.pop(rel_path, None)
+                changed = True
+
+        # Keep deterministic (sorted path) order for callers
+        if changed:
+            self._files = {k: self._files.get(k) for k in sorted(self._stats)}
+            self._stats = {k: self._stats[k] for k in sorted(self._stats)}
+            self._checked = {k: self._checked[k] for k in sorted(self._stats) if k in self._checked}
+            self._save()
+
+        return self
+
+    def entries(self) -> Iterator[TaskIndexEntry]:
+        """Iterate indexed task entries in path order."""
+        return (entry for entry in self._files.values() if entry is not None)
+
+    def query(
+        self,
+        plan_slug: Optional[str] = None,
+        plan_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        sprint: Optional[str] = None,
+    ) -> List[TaskIndexEntry]:
+        """
+        Filter indexed tasks by metadata.
+
+        Args:
+            plan_slug: Keep tasks whose plan ID contains this slug
+            plan_id: Keep tasks whose plan ID matches exactly
+            status: Keep tasks with this status
+            sprint: Keep tasks in this sprint
+
+        Returns:
+            Matching entries in path order
+        """
+        results = []
+        for entry in self.entries():
+            if plan_slug and not (entry.plan_id and plan_slug in entry.plan_id):
+                continue
+            if plan_id is not None and entry.plan_id != plan_id:
+                continue
+            if status is not None and entry.task_status != status:
+                continue
+            if sprint is not None and entry.sprint != sprint:
+                continue
+            results.append(entry)
+        return results
+
+    def find(self, task_id: str, plan_slug: Optional[str] = None) -> Optional[TaskIndexEntry]:
+        """Find the first entry for a task ID."""
+        for entry in self.query(plan_slug=plan_slug):
+            if entry.id == task_id:
+                return entry
+        return None
+
+    def path_for(self, entry: TaskIndexEntry) -> Path:
+        """Absolute path of an indexed task file."""
+        return self.tasks_dir / entry.path
+
+
+# Marker for files that could not be read (left out of the index, retried next refresh)
+_UNREADABLE = "__unreadable__"
+
+
+def _read_frontmatter_safe(task_path: Path):
+    """Read task frontmatter for indexing; picklable for worker processes."""
+    from . import parser
+
+    try:
+        return parser.read_frontmatter(task_path)
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Failed to index task {task_path}: {e}")
+        return _UNREADABLE
@@ -8,8 +8,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
+from ..core import yamlio
 from ..metrics.estimation import (
     TokenEstimator,
     TokenEstimationConfig,
@@ -141,8 +140,7 @@ class PlanTokenEstimator:
             return cls()
 
         try:
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
+            data = yamlio.load_file(config_path, cache=True) or {}
 
             token_data = data.get("token_estimates", {})
             config = TokenEstimationConfig.from_dict(token_data)
@@ -41,17 +41,16 @@ def get_state_manager() -> StateManager:
 
 def get_template_path(paircoder_dir: Path) -> Optional[Path]:
     """Get the cookie cutter template path from config or default."""
-    import yaml
+    from ..core import yamlio
 
     config_path = paircoder_dir / "config.yaml"
     template_path = None
 
     if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-            release_config = config.get("release", {})
-            cookie_cutter = release_config.get("cookie_cutter", {})
-            template_path = cookie_cutter.get("template_path")
+        config = yamlio.load_file(config_path, cache=True) or {}
+        release_config = config.get("release", {})
+        cookie_cutter = release_config.get("cookie_cutter", {})
+        template_path = cookie_cutter.get("template_path")
 
     if template_path:
         # Resolve relative to project root
@@ -331,11 +330,10 @@ def release_prep(
     }
 
     if config_path.exists():
-        import yaml
-        with open(config_path) as f:
-            full_config = yaml.safe_load(f) or {}
-            if "release" in full_config:
-                release_config.update(full_config["release"])
+        from ..core import yamlio
+        full_config = yamlio.load_file(config_path, cache=True) or {}
+        if "release" in full_config:
+            release_config.update(full_config["release"])
 
     console.print(f"\n[bold]Release Preparation Check[/bold]")
     if since:
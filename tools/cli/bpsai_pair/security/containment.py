@@ -10,17 +10,62 @@ agent sessions:
 Note: This is separate from the Docker sandbox system (security.sandbox).
 The Docker sandbox provides process isolation, while containment provides
 filesystem access control for autonomous agent sessions.
+
+Each tier is compiled into a path-prefix trie when the manager is built, so
+a check costs one resolve() of the path plus a walk over its components,
+and the tiers of recently checked (resolved) paths are kept in a small LRU.
 """
 from __future__ import annotations
 
 import fnmatch
-from pathlib import Path
-from typing import TYPE_CHECKING, Set, List
+import functools
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Set, List, Tuple
 
 if TYPE_CHECKING:
     from bpsai_pair.core.config import ContainmentConfig
 
 
+# Resolved paths whose tiers are remembered
+DECISION_CACHE_SIZE = 1024
+
+
+class _PathTrie:
+    """Absolute paths by component: whole subtrees (directories) and
+    exact paths (files)."""
+
+    __slots__ = ("_root",)
+
+    # Node: [children by component, covers subtree, exact match]
+    def __init__(self) -> None:
+        self._root: list = [{}, False, False]
+
+    def _node(self, path: PurePath) -> list:
+        node = self._root
+        for part in path.parts:
+            node = node[0].setdefault(part, [{}, False, False])
+        return node
+
+    def add_subtree(self, path: PurePath) -> None:
+        """Match path and everything below it."""
+        self._node(path)[1] = True
+
+    def add_exact(self, path: PurePath) -> None:
+        """Match path itself."""
+        self._node(path)[2] = True
+
+    def matches(self, parts: Tuple[str, ...]) -> bool:
+        """Whether a path (as its components) is covered, in O(len(parts))."""
+        node = self._root
+        for part in parts:
+            if node[1]:
+                return True
+            node = node[0].get(part)
+            if node is None:
+                return False
+        return node[1] or node[2]
+
+
 class ContainmentViolationError(Exception):
     """Raised when attempting to access protected resources.
 
@@ -70,6 +115,8 @@ class ContainmentManager:
         _blocked_paths: Set of resolved blocked file paths.
         _readonly_dirs: Set of resolved read-only directory paths.
         _readonly_paths: Set of resolved read-only file paths.
+        _blocked_trie: Compiled Tier 1 paths and "**" patterns.
+        _readonly_trie: Compiled Tier 2 paths and "**" patterns.
     """
 
     def __init__(self, config: "ContainmentConfig", project_root: Path) -> None:
@@ -91,7 +138,15 @@ class ContainmentManager:
         self._readonly_dirs: Set[Path] = set()
         self._readonly_paths: Set[Path] = set()
 
+        self._blocked_trie = _PathTrie()
+        self._readonly_trie = _PathTrie()
+        # "**" patterns the tries cannot express, matched as strings
+        self._blocked_globs: List[str] = []
+        self._readonly_globs: List[str] = []
+
         self._build_path_sets()
+        # Resolved path -> (blocked, readonly)
+        self._tiers = functools.lru_cache(maxsize=DECISION_CACHE_SIZE)(self._lookup_tiers)
 
     def _build_path_sets(self) -> None:
         """Build the sets of resolved paths for each tier.
@@ -117,6 +172,43 @@ class ContainmentManager:
             path = self.project_root / file_path
             self._readonly_paths.add(path.resolve() if path.exists() else path)
 
+        self._compile_tier(
+            self._blocked_trie, self._blocked_globs,
+            self._blocked_dirs, self._blocked_paths, self.config.blocked_directories,
+        )
+        self._compile_tier(
+            self._readonly_trie, self._readonly_globs,
+            self._readonly_dirs, self._readonly_paths, self.config.readonly_directories,
+        )
+
+    def _compile_tier(
+        self, trie: _PathTrie, globs: List[str], dirs: Set[Path], files: Set[Path], patterns: List[str]
+    ) -> None:
+        """Compile one tier's paths and "**" patterns into a trie.
+
+        Args:
+            trie: The tier's trie to fill.
+            globs: Receives "**" patterns that are not a plain prefix.
+            dirs: Directory paths of the tier (subtrees).
+            files: File paths of the tier (exact matches).
+            patterns: Directory patterns from config.
+        """
+        for locked_dir in dirs:
+            trie.add_subtree(locked_dir)
+        for locked_file in files:
+            trie.add_exact(locked_file)
+
+        # "prefix/**" covers prefix and everything below it
+        for dir_pattern in patterns:
+            if "**" not in dir_pattern:
+                continue
+            prefix = dir_pattern.rstrip("/").split("**")[0].rstrip("/")
+            if prefix and str(PurePath(prefix)) == prefix and ".." not in PurePath(prefix).parts \
+                    and not PurePath(prefix).is_absolute():
+                trie.add_subtree(self.project_root / prefix)
+            else:
+                globs.append(dir_pattern.rstrip("/"))
+
     def _process_dir_pattern(self, dir_pattern: str, target_set: Set[Path]) -> None:
         """Process a directory pattern and add resolved paths to target set.
 
@@ -171,76 +263,33 @@ class ContainmentManager:
         except (OSError, RuntimeError):
             return Path(path).absolute()
 
-    def _is_path_in_set(
-        self, resolved: Path, dirs: Set[Path], files: Set[Path], patterns: List[str]
-    ) -> bool:
-        """Check if a resolved path is in the given directory/file sets.
+    def _is_path_in_set(self, resolved: Path, trie: _PathTrie, globs: List[str]) -> bool:
+        """Check if a resolved path is covered by a tier.
 
         Args:
             resolved: The resolved absolute path to check.
-            dirs: Set of directory paths to check against.
-            files: Set of file paths to check against.
-            patterns: Original patterns from config for glob matching.
+            trie: The tier's compiled paths.
+            globs: The tier's "**" patterns not compiled into the trie.
 
         Returns:
-            True if path matches any entry in the sets.
+            True if path matches any entry of the tier.
         """
-        # Check if path is an exact file match
-        if resolved in files:
+        if trie.matches(resolved.parts):
             return True
 
-        # Check for non-existent files (relative match)
-        for locked_file in files:
-            if not locked_file.exists():
-                try:
-                    rel_locked = (
-                        locked_file.relative_to(self.project_root)
-                        if locked_file.is_relative_to(self.project_root)
-                        else locked_file
-                    )
-                    rel_path = resolved.relative_to(self.project_root)
-                    if rel_path == rel_locked:
-                        return True
-                except ValueError:
-                    pass
-
-        # Check if path is within a directory
-        for locked_dir in dirs:
-            if resolved == locked_dir:
-                return True
-            try:
-                resolved.relative_to(locked_dir)
-                return True
-            except ValueError:
-                pass
-
-        # Handle non-existent directories
-        for locked_dir in dirs:
-            if not locked_dir.exists():
-                try:
-                    rel_locked = locked_dir.relative_to(self.project_root)
-                    rel_path = resolved.relative_to(self.project_root)
-                    rel_locked_parts = rel_locked.parts
-                    rel_path_parts = rel_path.parts
-                    if len(rel_path_parts) >= len(rel_locked_parts):
-                        if rel_path_parts[: len(rel_locked_parts)] == rel_locked_parts:
-                            return True
-                except ValueError:
-                    pass
-
-        # Check for glob pattern matches
-        for dir_pattern in patterns:
-            if "**" in dir_pattern:
-                try:
-                    rel_path = resolved.relative_to(self.project_root)
-                    pattern = dir_pattern.rstrip("/")
-                    if self._matches_glob_pattern(str(rel_path), pattern):
-                        return True
-                except ValueError:
-                    pass
+        if globs and resolved.is_relative_to(self.project_root):
+            rel_path = str(resolved.relative_to(self.project_root))
+            return any(self._matches_glob_pattern(rel_path, pattern) for pattern in globs)
 
         return False
 
+    def _lookup_tiers(self, resolved: Path) -> Tuple[bool, bool]:
+        """(blocked, readonly) for a resolved path; cached by self._tiers."""
+        return (
+            self._is_path_in_set(resolved, self._blocked_trie, self._blocked_globs),
+            self._is_path_in_set(resolved, self._readonly_trie, self._readonly_globs),
+        )
+
     def _matches_glob_pattern(self, path_str: str, pattern: str) -> bool:
         """Check if a path matches a glob pattern.
 
@@ -269,13 +318,7 @@ class ContainmentManager:
         Returns:
             True if the path is blocked, False otherwise.
         """
-        resolved = self._resolve_path(path)
-        return self._is_path_in_set(
-            resolved,
-            self._blocked_dirs,
-            self._blocked_paths,
-            self.config.blocked_directories,
-        )
+        return self._tiers(self._resolve_path(path))[0]
 
     def is_path_readonly(self, path: Path) -> bool:
         """Check if a path is in the read-only tier (can read, cannot write).
@@ -289,13 +332,7 @@ class ContainmentManager:
         Returns:
             True if the path is read-only, False otherwise.
         """
-        resolved = self._resolve_path(path)
-        return self._is_path_in_set(
-            resolved,
-            self._readonly_dirs,
-            self._readonly_paths,
-            self.config.readonly_directories,
-        )
+        return self._tiers(self._resolve_path(path))[1]
 
     def is_path_write_protected(self, path: Path) -> bool:
         """Check if a path is write-protected (blocked OR read-only).
@@ -309,7 +346,7 @@ class ContainmentManager:
         Returns:
             True if the path cannot be written, False otherwise.
         """
-        return self.is_path_blocked(path) or self.is_path_readonly(path)
+        return any(self._tiers(self._resolve_path(path)))
 
     # Backward compatibility alias
     is_path_locked = is_path_write_protected
@@ -344,13 +381,14 @@ class ContainmentManager:
         if not self._active:
             return
 
-        if self.is_path_blocked(path):
+        blocked, readonly = self._tiers(self._resolve_path(path))
+        if blocked:
             raise ContainmentWriteError(
                 f"Cannot write to blocked path: {path}\n"
                 "This path contains sensitive data and is blocked in contained autonomy mode."
             )
 
-        if self.is_path_readonly(path):
+        if readonly:
             raise ContainmentWriteError(
                 f"Cannot write to read-only path: {path}\n"
                 "This path is protected in contained autonomy mode."
@@ -365,9 +403,10 @@ class ContainmentManager:
         Returns:
             One of: "blocked", "readonly", or "readwrite"
         """
-        if self.is_path_blocked(path):
+        blocked, readonly = self._tiers(self._resolve_path(path))
+        if blocked:
             return "blocked"
-        if self.is_path_readonly(path):
+        if readonly:
             return "readonly"
         return "readwrite"
 
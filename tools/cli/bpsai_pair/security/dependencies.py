@@ -4,10 +4,24 @@ This module provides:
 - DependencyScanner: Scans project dependencies for known CVEs
 - Vulnerability: Data class for detected vulnerabilities
 - ScanReport: Aggregated scan results with severity analysis
+
+scan_all runs the Python and npm audits of a project concurrently on a
+bounded thread pool (the work is waiting on subprocesses). Results are
+cached per dependency file and, for Python, per resolved (package,
+version): only the packages of a lock file (hash-pinned or pip-compile
+output) that are not cached yet are sent to pip-audit. Other requirements
+files are audited with dependency resolution as before, and their resolved
+packages fill the per-package cache. npm results are cached per
+package.json + package-lock.json. The audit commands are configurable, so
+tests can substitute local stubs.
 """
 
 import json
+import re
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -16,6 +30,18 @@ from typing import Optional
 import hashlib
 import os
 
+# Audits run at once by scan_all
+DEFAULT_AUDIT_WORKERS = 4
+
+# A fully pinned requirements line: name[extras]==version [--hash=...]
+_PINNED_REQUIREMENT = re.compile(
+    r'^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*==\s*([A-Za-z0-9.!+_-]+)'
+    r'((?:\s+--hash[=\s]\S+)*)$'
+)
+
+# Header comments of generated lock files (pip-compile, uv pip compile)
+_LOCK_FILE_MARKERS = ("autogenerated by pip-compile", "autogenerated by uv")
+
 
 class Severity(Enum):
     """Vulnerability severity levels."""
@@ -199,36 +225,67 @@ class DependencyScanner:
         self,
         cache_dir: Optional[Path] = None,
         cache_ttl: int = 3600,
+        max_workers: int = DEFAULT_AUDIT_WORKERS,
+        pip_audit_command: Optional[list[str]] = None,
+        npm_command: Optional[list[str]] = None,
+        assume_locked: bool = False,
     ):
         """Initialize dependency scanner.
 
         Args:
             cache_dir: Directory for caching scan results
             cache_ttl: Cache time-to-live in seconds
+            max_workers: Audits scan_all runs concurrently
+            pip_audit_command: Command running pip-audit (default ["pip-audit"])
+            npm_command: Command running npm (default ["npm"])
+            assume_locked: Treat every fully pinned requirements file as a
+                complete lock file (all transitive dependencies listed)
         """
         self.cache_dir = cache_dir or Path.home() / ".cache" / "paircoder" / "vuln-scans"
         self.cache_ttl = cache_ttl
+        self.max_workers = max(1, max_workers)
+        self.pip_audit_command = list(pip_audit_command or ["pip-audit"])
+        self.npm_command = list(npm_command or ["npm"])
+        self.assume_locked = assume_locked
+        # Tool availability, checked once per scanner
+        self._tool_errors: dict[str, Optional[str]] = {}
+        self._tool_lock = threading.Lock()
+
+    def _get_cache_key(self, file_path: Path, content: Optional[bytes] = None) -> str:
+        """Generate cache key for a dependency file.
 
-    def _get_cache_key(self, file_path: Path) -> str:
-        """Generate cache key for a dependency file."""
-        content = file_path.read_bytes()
+        Args:
+            file_path: Dependency file
+            content: The file's bytes, if already read
+        """
+        if content is None:
+            content = file_path.read_bytes()
         return hashlib.sha256(content).hexdigest()[:16]
 
-    def _get_cached_result(self, file_path: Path) -> Optional[list[Vulnerability]]:
+    def _get_cached_result(self, file_path: Path, cache_key: Optional[str] = None) -> Optional[list[Vulnerability]]:
         """Get cached scan result if still valid."""
         if not self.cache_dir.exists():
             return None
 
-        cache_key = self._get_cache_key(file_path)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_key = cache_key or self._get_cache_key(file_path)
+        return self._read_cache_file(self.cache_dir / f"{cache_key}.json")
+
+    def _save_to_cache(self, file_path: Path, vulnerabilities: list[Vulnerability],
+                       cache_key: Optional[str] = None):
+        """Save scan result to cache."""
+        cache_key = cache_key or self._get_cache_key(file_path)
+        self._write_cache_file(self.cache_dir / f"{cache_key}.json", vulnerabilities)
 
-        if not cache_file.exists():
+    def _read_cache_file(self, cache_file: Path) -> Optional[list[Vulnerability]]:
+        """Vulnerabilities stored in a cache file, or None if missing or expired."""
+        try:
+            cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
+        except OSError:
             return None
 
         # Check if cache is still valid
-        cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
         if cache_age > self.cache_ttl:
-            cache_file.unlink()
+            cache_file.unlink(missing_ok=True)
             return None
 
         try:
@@ -246,17 +303,69 @@ class DependencyScanner:
                 )
                 for v in data
             ]
-        except (json.JSONDecodeError, KeyError):
+        except (OSError, json.JSONDecodeError, KeyError):
             return None
 
-    def _save_to_cache(self, file_path: Path, vulnerabilities: list[Vulnerability]):
-        """Save scan result to cache."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_key = self._get_cache_key(file_path)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        with open(cache_file, "w", encoding="utf-8") as f:
+    def _write_cache_file(self, cache_file: Path, vulnerabilities: list[Vulnerability]) -> None:
+        """Atomically write a cache file (audits run on several threads)."""
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump([v.to_dict() for v in vulnerabilities], f)
+        os.replace(tmp_path, cache_file)
+
+    def _package_cache_file(self, ecosystem: str, name: str, version: str) -> Path:
+        digest = hashlib.sha256(f"{ecosystem}:{name}=={version}".encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / "packages" / f"{ecosystem}-{digest}.json"
+
+    def _cached_packages(
+        self, ecosystem: str, packages: list[tuple[str, str]]
+    ) -> tuple[list[Vulnerability], list[tuple[str, str]]]:
+        """
+        Look resolved packages up in the per-package cache.
+
+        Args:
+            ecosystem: Package index ("pypi")
+            packages: (normalized name, version) pairs
+
+        Returns:
+            (vulnerabilities of cached packages, packages not cached)
+        """
+        vulnerabilities: list[Vulnerability] = []
+        missing = []
+        for name, version in packages:
+            cached = self._read_cache_file(self._package_cache_file(ecosystem, name, version))
+            if cached is None:
+                missing.append((name, version))
+            else:
+                vulnerabilities.extend(cached)
+        return vulnerabilities, missing
+
+    def _save_packages(self, ecosystem: str, packages: list[tuple[str, str]],
+                       vulnerabilities: list[Vulnerability]) -> None:
+        """Cache audit results per package (packages without findings get [])."""
+        found: dict[tuple[str, str], list[Vulnerability]] = {}
+        for vuln in vulnerabilities:
+            found.setdefault((_normalize_name(vuln.package), vuln.version), []).append(vuln)
+        for name, version in packages:
+            self._write_cache_file(
+                self._package_cache_file(ecosystem, name, version), found.get((name, version), [])
+            )
+
+    def _tool_error(self, tool: str, command: list[str], message: str) -> Optional[str]:
+        """Error message if a tool is unavailable (checked once per scanner)."""
+        with self._tool_lock:
+            if tool not in self._tool_errors:
+                try:
+                    subprocess.run(
+                        [*command, "--version"],
+                        capture_output=True,
+                        check=True,
+                    )
+                    self._tool_errors[tool] = None
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    self._tool_errors[tool] = message
+            return self._tool_errors[tool]
 
     def scan_python(
         self,
@@ -265,6 +374,13 @@ class DependencyScanner:
     ) -> tuple[list[Vulnerability], list[str]]:
         """Scan Python dependencies using pip-audit.
 
+        A lock file (every requirement pinned, and hash-pinned or generated
+        by pip-compile, or any fully pinned file with assume_locked) is
+        audited per package: packages cached from earlier scans are not
+        audited again, and the rest are audited without dependency
+        resolution, since the lock lists them all. Other files are audited
+        with resolution, and the resolved packages are cached for later.
+
         Args:
             requirements: Path to requirements.txt or pyproject.toml
             use_cache: Whether to use cached results
@@ -272,36 +388,74 @@ class DependencyScanner:
         Returns:
             Tuple of (vulnerabilities, errors)
         """
-        vulnerabilities = []
-        errors = []
-
-        # Check cache
+        # Check cache (the file is read and hashed once)
+        cache_key = None
+        pins: list[tuple[str, str]] = []
         if use_cache:
-            cached = self._get_cached_result(requirements)
-            if cached is not None:
-                return cached, []
+            try:
+                content = requirements.read_bytes()
+            except OSError:
+                content = None
+            if content is not None:
+                cache_key = self._get_cache_key(requirements, content)
+                cached = self._get_cached_result(requirements, cache_key)
+                if cached is not None:
+                    return cached, []
+                if requirements.suffix != ".toml":
+                    pins = _locked_requirements(content.decode("utf-8", errors="replace"), self.assume_locked)
+
+        cached_vulns: list[Vulnerability] = []
+        if pins:
+            cached_vulns, pins = self._cached_packages("pypi", pins)
+            if not pins:
+                self._save_to_cache(requirements, cached_vulns, cache_key)
+                return cached_vulns, []
 
         # Check if pip-audit is available
-        try:
-            subprocess.run(
-                ["pip-audit", "--version"],
-                capture_output=True,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            errors.append("pip-audit not installed. Install with: pip install pip-audit")
-            return vulnerabilities, errors
+        error = self._tool_error(
+            "pip-audit", self.pip_audit_command, "pip-audit not installed. Install with: pip install pip-audit"
+        )
+        if error:
+            return [], [error]
 
         # Determine file type and build command
-        if requirements.suffix == ".toml":
+        options = ["--format", "json", "--progress-spinner", "off"]
+        if pins:
+            # Only the packages missing from the cache
+            with tempfile.TemporaryDirectory(prefix="paircoder-audit-") as tmp:
+                subset = Path(tmp) / "requirements.txt"
+                subset.write_text("".join(f"{name}=={version}\n" for name, version in pins), encoding="utf-8")
+                vulnerabilities, errors, _ = self._run_pip_audit(["-r", str(subset), "--no-deps", *options])
+            if not errors:
+                self._save_packages("pypi", pins, vulnerabilities)
+            vulnerabilities = cached_vulns + vulnerabilities
+        elif requirements.suffix == ".toml":
             # For pyproject.toml, we need to scan the current environment
-            cmd = ["pip-audit", "--format", "json", "--progress-spinner", "off"]
+            vulnerabilities, errors, _ = self._run_pip_audit(options)
         else:
-            cmd = ["pip-audit", "-r", str(requirements), "--format", "json", "--progress-spinner", "off"]
+            vulnerabilities, errors, audited = self._run_pip_audit(["-r", str(requirements), *options])
+            # Every resolved package was audited; lock files can reuse them
+            if use_cache and not errors:
+                self._save_packages("pypi", audited, vulnerabilities)
+
+        # Cache results
+        if use_cache and not errors:
+            self._save_to_cache(requirements, vulnerabilities, cache_key)
+
+        return vulnerabilities, errors
 
+    def _run_pip_audit(self, args: list[str]) -> tuple[list[Vulnerability], list[str], list[tuple[str, str]]]:
+        """Run pip-audit with args and parse its JSON report.
+
+        Returns:
+            Tuple of (vulnerabilities, errors, audited (normalized name, version) pairs)
+        """
+        vulnerabilities = []
+        errors = []
+        audited: list[tuple[str, str]] = []
         try:
             result = subprocess.run(
-                cmd,
+                [*self.pip_audit_command, *args],
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout
@@ -311,6 +465,12 @@ class DependencyScanner:
             if result.stdout:
                 data = json.loads(result.stdout)
                 vulnerabilities = self._parse_pip_audit(data)
+                deps = data.get("dependencies", []) if isinstance(data, dict) else data
+                audited = [
+                    (_normalize_name(dep["name"]), str(dep["version"]))
+                    for dep in deps
+                    if isinstance(dep, dict) and dep.get("name") and dep.get("version")
+                ]
 
             if result.stderr and "error" in result.stderr.lower():
                 errors.append(result.stderr.strip())
@@ -322,11 +482,7 @@ class DependencyScanner:
         except Exception as e:
             errors.append(f"pip-audit error: {str(e)}")
 
-        # Cache results
-        if use_cache and not errors:
-            self._save_to_cache(requirements, vulnerabilities)
-
-        return vulnerabilities, errors
+        return vulnerabilities, errors, audited
 
     def _parse_pip_audit(self, data: dict | list) -> list[Vulnerability]:
         """Parse pip-audit JSON output.
@@ -389,6 +545,10 @@ class DependencyScanner:
     ) -> tuple[list[Vulnerability], list[str]]:
         """Scan npm dependencies using npm audit.
 
+        Results are cached per package.json and package-lock.json content.
+        npm audit reports findings by package name and affected range, not
+        by installed version, so they are not cached per package.
+
         Args:
             package_json: Path to package.json
             use_cache: Whether to use cached results
@@ -399,22 +559,28 @@ class DependencyScanner:
         vulnerabilities = []
         errors = []
 
-        # Check cache
+        # Check cache; the key covers the lock file, which decides the tree
+        cache_key = None
         if use_cache:
-            cached = self._get_cached_result(package_json)
-            if cached is not None:
-                return cached, []
+            try:
+                content = package_json.read_bytes()
+            except OSError:
+                content = None
+            if content is not None:
+                lock_file = package_json.parent / "package-lock.json"
+                try:
+                    lock = lock_file.read_bytes()
+                except OSError:
+                    lock = b""
+                cache_key = self._get_cache_key(package_json, content + lock)
+                cached = self._get_cached_result(package_json, cache_key)
+                if cached is not None:
+                    return cached, []
 
         # Check if npm is available
-        try:
-            subprocess.run(
-                ["npm", "--version"],
-                capture_output=True,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            errors.append("npm not installed or not in PATH")
-            return vulnerabilities, errors
+        error = self._tool_error("npm", self.npm_command, "npm not installed or not in PATH")
+        if error:
+            return vulnerabilities, [error]
 
         # Check if node_modules exists
         node_modules = package_json.parent / "node_modules"
@@ -424,7 +590,7 @@ class DependencyScanner:
 
         try:
             result = subprocess.run(
-                ["npm", "audit", "--json"],
+                [*self.npm_command, "audit", "--json"],
                 cwd=package_json.parent,
                 capture_output=True,
                 text=True,
@@ -444,7 +610,7 @@ class DependencyScanner:
 
         # Cache results
         if use_cache and not errors:
-            self._save_to_cache(package_json, vulnerabilities)
+            self._save_to_cache(package_json, vulnerabilities, cache_key)
 
         return vulnerabilities, errors
 
@@ -493,12 +659,14 @@ class DependencyScanner:
         self,
         root_dir: Optional[Path] = None,
         use_cache: bool = True,
+        max_workers: Optional[int] = None,
     ) -> ScanReport:
         """Scan all detected dependency files.
 
         Args:
             root_dir: Root directory to search for dependency files
             use_cache: Whether to use cached results
+            max_workers: Audits to run at once (default: the scanner's max_workers)
 
         Returns:
             Aggregated scan report
@@ -508,23 +676,29 @@ class DependencyScanner:
         start_time = time.time()
         root_dir = root_dir or Path.cwd()
 
+        jobs = [(self.scan_python, self._count_python_packages, f) for f in self._find_python_deps(root_dir)]
+        jobs += [(self.scan_npm, self._count_npm_packages, f) for f in self._find_npm_deps(root_dir)]
+
+        def run(job):
+            scan, count, dep_file = job
+            vulns, errors = scan(dep_file, use_cache=use_cache)
+            return vulns, errors, count(dep_file)
+
+        workers = min(max_workers or self.max_workers, len(jobs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run, jobs))
+        else:
+            results = [run(job) for job in jobs]
+
         all_vulns: list[Vulnerability] = []
         all_errors: list[str] = []
         packages_scanned = 0
-
-        # Scan Python dependencies
-        for req_file in self._find_python_deps(root_dir):
-            vulns, errors = self.scan_python(req_file, use_cache=use_cache)
+        # Results stay in discovery order: Python files, then npm files
+        for vulns, errors, count in results:
             all_vulns.extend(vulns)
             all_errors.extend(errors)
-            packages_scanned += self._count_python_packages(req_file)
-
-        # Scan npm dependencies
-        for pkg_file in self._find_npm_deps(root_dir):
-            vulns, errors = self.scan_npm(pkg_file, use_cache=use_cache)
-            all_vulns.extend(vulns)
-            all_errors.extend(errors)
-            packages_scanned += self._count_npm_packages(pkg_file)
+            packages_scanned += count
 
         scan_duration = time.time() - start_time
 
@@ -588,6 +762,41 @@ class DependencyScanner:
             return 0
 
 
+def _normalize_name(name: str) -> str:
+    """Package name as compared across tools (PEP 503 normalization)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _locked_requirements(text: str, assume_locked: bool = False) -> list[tuple[str, str]]:
+    """
+    (normalized name, version) of every requirement of a lock file.
+
+    A requirements file counts as a lock file when every requirement is
+    pinned with == (options, includes, URLs and markers all count as not
+    pinned) and either each carries --hash, the file was generated by
+    pip-compile, or assume_locked is set.
+
+    Returns:
+        The pins, or [] if the file is not a lock file
+    """
+    generated = any(marker in text for marker in _LOCK_FILE_MARKERS)
+    pins = []
+    hashed = True
+    # Hash-pinned files continue requirements over lines ending in "\\"
+    for raw in text.replace("\\\n", " ").splitlines():
+        line = raw.split(" #", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _PINNED_REQUIREMENT.match(line)
+        if not match:
+            return []
+        hashed = hashed and bool(match.group(3))
+        pins.append((_normalize_name(match.group(1)), match.group(2)))
+    if not (hashed or generated or assume_locked):
+        return []
+    return pins
+
+
 def format_scan_report(report: ScanReport, verbose: bool = False) -> str:
     """Format scan report for display.
 
@@ -14,7 +14,7 @@ from typing import Literal, Optional
 
 from importlib.metadata import version as get_version
 
-import yaml
+from ..core import yamlio
 
 CONTAINMENT_IMAGE_REPO = "bpsai/paircoder-containment"
 
@@ -136,8 +136,7 @@ class SandboxConfig:
         Returns:
             SandboxConfig instance
         """
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = yamlio.load_file(path, cache=True)
 
         sandbox_data = data.get("sandbox", {})
 
@@ -4,17 +4,40 @@ This module provides:
 - SecretScanner: Scans files and diffs for leaked credentials
 - SecretMatch: Data class for detected secrets
 - AllowlistConfig: Configuration for false positive suppression
+
+Scanning is single-pass. A literal prefilter (PREFILTER_LITERALS) finds the
+few lines that could contain a secret at all, and the secret types they
+hint at; only those lines are searched, with one alternation regex (a named
+group per pattern) over the candidate types' SECRET_PATTERNS. IGNORE_PATTERNS
+are only checked on lines with a match. Allowlist globs are compiled into a
+single regex as well.
+
+Directory scans prune skipped directories without entering them, read large
+files through mmap, can fan files out over a process pool, and can skip
+files recorded as clean in a SecretScanCache
+(.paircoder/cache/secret-scan.json).
 """
 
+import fnmatch
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
 import re
 import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
 
 class SecretType(Enum):
     """Types of secrets that can be detected."""
@@ -136,11 +159,7 @@ class AllowlistConfig:
         Returns:
             True if the file should be skipped
         """
-        import fnmatch
-        for pattern in self.allowed_files:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        return False
+        return _glob_match(tuple(self.allowed_files), file_path)
 
     def is_allowed_pattern(self, match: str) -> bool:
         """Check if a matched value is in the allowlist.
@@ -151,11 +170,21 @@ class AllowlistConfig:
         Returns:
             True if the match is allowed
         """
-        import fnmatch
-        for pattern in self.allowed_patterns:
-            if fnmatch.fnmatch(match, pattern):
-                return True
-        return False
+        return _glob_match(tuple(self.allowed_patterns), match)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_globs(patterns: tuple[str, ...]) -> Optional[re.Pattern]:
+    """One regex matching any of the fnmatch patterns."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+def _glob_match(patterns: tuple[str, ...], name: str) -> bool:
+    """fnmatch.fnmatch against any of the patterns, with one regex match."""
+    regex = _compile_globs(patterns)
+    return regex is not None and regex.match(os.path.normcase(name)) is not None
 
 
 # Secret detection patterns with confidence scores
@@ -212,6 +241,33 @@ SECRET_PATTERNS: list[tuple[str, SecretType, float]] = [
     (r'(?i)token\s*[=:]\s*["\']([^"\']{20,})["\']', SecretType.GENERIC_TOKEN, 0.6),
 ]
 
+# Literal fragments, by secret type: every match of a SECRET_PATTERNS entry
+# contains one of its type's literals. A line is only checked against the
+# patterns whose literals it contains. Literals of types whose patterns are
+# case-insensitive ((?i)) are matched case-insensitively. Patterns of a type
+# missing here are checked on every line.
+PREFILTER_LITERALS: dict[SecretType, tuple[str, ...]] = {
+    SecretType.AWS_ACCESS_KEY: ("AKIA",),
+    SecretType.AWS_SECRET_KEY: ("aws_secret_access_key",),
+    SecretType.GITHUB_TOKEN: ("ghp_", "ghs_", "ghr_"),
+    SecretType.GITHUB_PAT: ("github_pat_",),
+    SecretType.GITHUB_OAUTH: ("gho_",),
+    SecretType.SLACK_TOKEN: ("xox",),
+    SecretType.SLACK_WEBHOOK: ("hooks.slack.com",),
+    SecretType.PRIVATE_KEY: ("-----BEGIN",),
+    SecretType.SSH_PRIVATE_KEY: ("-----BEGIN",),
+    SecretType.JWT_TOKEN: ("eyJ",),
+    SecretType.DATABASE_URL: ("postgresql://", "mysql://", "mongodb://", "redis://"),
+    SecretType.STRIPE_KEY: ("sk_live_", "sk_test_", "pk_live_"),
+    SecretType.SENDGRID_KEY: ("SG.",),
+    SecretType.TWILIO_KEY: ("SK",),
+    SecretType.GOOGLE_API_KEY: ("AIza",),
+    SecretType.GENERIC_API_KEY: ("api_key", "api-key", "apikey"),
+    SecretType.GENERIC_PASSWORD: ("password", "passwd"),
+    SecretType.GENERIC_SECRET: ("secret",),
+    SecretType.GENERIC_TOKEN: ("token",),
+}
+
 # Patterns to ignore (false positives)
 IGNORE_PATTERNS: list[str] = [
     r'os\.environ\.get\s*\(["\']',  # Reading from env vars
@@ -234,6 +290,364 @@ IGNORE_PATTERNS: list[str] = [
     r'\*{4,}',  # Redacted values
 ]
 
+# New-file start line in a diff hunk header (@@ -old,count +new,count @@)
+_HUNK_NEW_START = re.compile(r'\+(\d+)')
+
+# File extensions scanned by scan_directory by default
+DEFAULT_SCAN_EXTENSIONS: list[str] = [
+    '.py', '.js', '.ts', '.jsx', '.tsx',
+    '.json', '.yaml', '.yml', '.toml',
+    '.env', '.conf', '.config', '.cfg',
+    '.sh', '.bash', '.zsh',
+    '.rb', '.go', '.rs', '.java',
+    '.php', '.cs', '.cpp', '.c', '.h',
+]
+
+# Directories scan_directory never enters (nor any hidden directory)
+SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build', '.git'})
+
+# Files at least this large are read through mmap
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Below this many files per worker, pool start-up costs more than it saves
+MIN_FILES_PER_WORKER = 64
+
+SCAN_CACHE_VERSION = 2
+SCAN_CACHE_FILENAME = "secret-scan.json"
+# A stat match alone skips a file only if it was this old when recorded;
+# a write within the timestamp granularity could leave size and mtime as is
+_RACY_NS = 2_000_000_000
+# Oldest entries are dropped beyond this many cached files
+SCAN_CACHE_MAX_ENTRIES = 200000
+
+
+class _Prefilter:
+    """Finds lines containing PREFILTER_LITERALS, and which types they hint at.
+
+    Every literal is located with str.find, which runs at memory speed, so a
+    file without any literal is rejected without running a regex.
+    """
+
+    def __init__(self, literals: dict[SecretType, tuple[str, ...]], nocase: set[SecretType]):
+        self.cased = [(literal, t) for t, lits in literals.items() if t not in nocase for literal in lits]
+        self.uncased = [(literal.lower(), t) for t, lits in literals.items() if t in nocase for literal in lits]
+
+    def line_types(self, line: str) -> set[SecretType]:
+        """Secret types whose literals occur in a line."""
+        types = {t for literal, t in self.cased if literal in line}
+        if self.uncased:
+            lowered = line.lower()
+            types.update(t for literal, t in self.uncased if literal in lowered)
+        return types
+
+    def hits(self, text: str) -> Optional[list[tuple[int, SecretType]]]:
+        """
+        (offset, type) of literal hits in text, at most one per line and literal.
+
+        Returns:
+            Hits sorted by offset, or None if lowercasing changed the text's
+            length so offsets cannot be mapped back
+        """
+        hits = _find_all(text, self.cased)
+        if self.uncased:
+            lowered = text.lower()
+            if len(lowered) != len(text):
+                return None
+            hits.extend(_find_all(lowered, self.uncased))
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+
+def _find_all(text: str, literals: list[tuple[str, SecretType]]) -> list[tuple[int, SecretType]]:
+    # Once a literal is found on a line the rest of that line is irrelevant
+    # for it, so continue from the next line
+    hits = []
+    for literal, secret_type in literals:
+        pos = text.find(literal)
+        while pos != -1:
+            hits.append((pos, secret_type))
+            eol = text.find("\n", pos)
+            if eol == -1:
+                break
+            pos = text.find(literal, eol + 1)
+    return hits
+
+
+def _lines_at(text: str, hits: list[tuple[int, SecretType]]) -> Iterator[tuple[int, str, set[SecretType]]]:
+    """(line number, line, hinted types) for each line holding a hit."""
+    line_num = 1
+    counted = 0
+    start = end = -1
+    types: set[SecretType] = set()
+    for pos, secret_type in hits:
+        if start <= pos <= end:
+            types.add(secret_type)
+            continue
+        if types:
+            yield line_num, text[start:end], types
+        start = text.rfind("\n", 0, pos) + 1
+        end = text.find("\n", pos)
+        if end == -1:
+            end = len(text)
+        line_num += text.count("\n", counted, start)
+        counted = start
+        types = {secret_type}
+    if types:
+        yield line_num, text[start:end], types
+
+
+class _PatternSet:
+    """SECRET_PATTERNS combined into alternation regexes, one named group
+    per pattern, compiled on demand for each set of candidate types."""
+
+    def __init__(self, patterns: list[tuple[str, SecretType, float]], prefiltered: set[SecretType]):
+        self.patterns = patterns
+        # Patterns with no prefilter literal are always candidates
+        self.unfiltered = frozenset(t for _, t, _ in patterns if t not in prefiltered)
+        self._compiled: dict[frozenset, tuple[re.Pattern, dict]] = {}
+
+    def _regex(self, types: frozenset) -> tuple[re.Pattern, dict]:
+        compiled = self._compiled.get(types)
+        if compiled is not None:
+            return compiled
+        parts = []
+        # group name -> (secret type, confidence, group holding the value)
+        info: dict[str, tuple[SecretType, float, Optional[int]]] = {}
+        group = 1
+        for index, (pattern, secret_type, confidence) in enumerate(self.patterns):
+            if secret_type not in types:
+                continue
+            inner_groups = re.compile(pattern).groups
+            if pattern.startswith("(?i)"):
+                # Global flags are only allowed at the start; scope them
+                pattern = f"(?i:{pattern[4:]})"
+            name = f"p{index}"
+            parts.append(f"(?P<{name}>{pattern})")
+            info[name] = (secret_type, confidence, group + 1 if inner_groups else None)
+            group += 1 + inner_groups
+        compiled = self._compiled[types] = (re.compile("|".join(parts)), info)
+        return compiled
+
+    def finditer(self, line: str, types: set[SecretType]) -> Iterator[tuple[SecretType, float, str]]:
+        """
+        Yield (type, confidence, value) for each pattern match in a line.
+
+        Reports what searching each candidate pattern separately would
+        (matches of different patterns may overlap; matches of one pattern
+        may not), except that patterns matching the same span are reported
+        once.
+
+        Args:
+            line: Line to search
+            types: Candidate secret types (from the prefilter)
+        """
+        candidates = frozenset(types) | self.unfiltered
+        if not candidates:
+            return
+        regex, info = self._regex(candidates)
+        search = regex.search
+        next_start: dict[str, int] = {}
+        pos = 0
+        while pos <= len(line):
+            m = search(line, pos)
+            if m is None:
+                return
+            name = m.lastgroup
+            start, end = m.span()
+            if start >= next_start.get(name, 0):
+                next_start[name] = max(end, start + 1)
+                secret_type, confidence, value_group = info[name]
+                value = m.group(value_group) if value_group else None
+                yield secret_type, confidence, value if value is not None else m.group(name)
+            pos = start + 1
+
+
+def iter_scan_files(directory: Path, extensions: Optional[list[str]] = None) -> Iterator[Path]:
+    """
+    Files under directory that scan_directory scans, in sorted order.
+
+    Hidden entries and SKIP_DIRS are pruned without being entered, and
+    symlinked directories are not followed.
+
+    Args:
+        directory: Directory to walk
+        extensions: Lowercase suffixes to include (empty or None for all)
+    """
+    suffixes = set(extensions or ())
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if suffixes and os.path.splitext(name)[1].lower() not in suffixes:
+                continue
+            yield Path(entry.path)
+        # Depth-first, in name order
+        stack.extend(reversed(subdirs))
+
+
+def _read_source(path: Path, digest: bool = False) -> tuple[str, Optional[str], os.stat_result]:
+    """
+    Text of a file to scan, with newlines normalized as by Path.read_text.
+
+    Large files are decoded straight from a memory map instead of being read
+    into an intermediate buffer.
+
+    Args:
+        path: File to read
+        digest: Also return a content hash (of the raw bytes)
+
+    Returns:
+        (text, hash or None, stat of the opened file)
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if st.st_size >= MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                text = str(data, 'utf-8', 'ignore')
+                content_hash = hashlib.sha1(data).hexdigest() if digest else None
+        else:
+            data = f.read()
+            text = data.decode('utf-8', 'ignore')
+            content_hash = hashlib.sha1(data).hexdigest() if digest else None
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, content_hash, st
+
+
+class SecretScanCache:
+    """Files known to contain no secrets, for incremental directory scans.
+
+    Entries map a file's absolute path to its size, mtime, content hash and
+    the time it was checked. An unchanged file is skipped, provided it was
+    already older than _RACY_NS when checked; a file whose stat changed (or
+    was recorded too soon after a write) is re-read, and only rescanned if
+    its hash changed too. Files with findings are never
+    recorded, so the cache holds no secret values. The whole cache is
+    dropped when the scanner's patterns or allowlist change.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Cache file (usually .paircoder/cache/secret-scan.json)
+        """
+        self.path = Path(path)
+        self.fingerprint = ""
+        self._files: dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @classmethod
+    def for_paircoder_dir(cls, paircoder_dir: Path) -> "SecretScanCache":
+        """Cache stored under a project's .paircoder/cache directory."""
+        return cls(Path(paircoder_dir) / "cache" / SCAN_CACHE_FILENAME)
+
+    def bind(self, fingerprint: str) -> None:
+        """Load the cache for a scanner configuration, discarding entries
+        recorded under a different one."""
+        if not self._loaded:
+            self._load()
+        if fingerprint != self.fingerprint:
+            if self._files:
+                self._dirty = True
+            self._files = {}
+            self.fingerprint = fingerprint
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load secret scan cache: {e}")
+            return
+        if isinstance(data, dict) and data.get("version") == SCAN_CACHE_VERSION:
+            files = data.get("files", {})
+            if isinstance(files, dict):
+                self._files = files
+                self.fingerprint = data.get("fingerprint", "")
+
+    def lookup(self, key: str, st: os.stat_result) -> tuple[bool, Optional[str]]:
+        """
+        Check a file against the cache.
+
+        Returns:
+            (clean, cached hash): clean is True if size and mtime match a
+            clean entry recorded outside the racy window; otherwise the
+            entry's hash (or None) for comparison
+        """
+        entry = self._files.get(key)
+        if entry is None:
+            return False, None
+        size, mtime_ns, content_hash, checked_ns = entry
+        clean = (size == st.st_size and mtime_ns == st.st_mtime_ns
+                 and checked_ns - mtime_ns > _RACY_NS)
+        return clean, content_hash
+
+    def mark_clean(self, key: str, st: os.stat_result, content_hash: str,
+                   checked_ns: Optional[int] = None) -> None:
+        """Record a file as having no findings.
+
+        Args:
+            key: Absolute path of the file
+            st: Stat of the file when it was read
+            content_hash: Hash of the content that was read
+            checked_ns: Time (ns) at or before the read (defaults to now)
+        """
+        if checked_ns is None:
+            checked_ns = time.time_ns()
+        entry = [st.st_size, st.st_mtime_ns, content_hash, checked_ns]
+        if self._files.get(key) != entry:
+            self._files.pop(key, None)
+            self._files[key] = entry
+            self._dirty = True
+
+    def forget(self, key: str) -> None:
+        """Drop a file (it has findings)."""
+        if self._files.pop(key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache if anything changed."""
+        if not self._dirty:
+            return
+        if len(self._files) > SCAN_CACHE_MAX_ENTRIES:
+            self._files = dict(list(self._files.items())[-SCAN_CACHE_MAX_ENTRIES:])
+        data = {"version": SCAN_CACHE_VERSION, "fingerprint": self.fingerprint, "files": self._files}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save secret scan cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self._load()
+        return len(self._files)
+
 
 class SecretScanner:
     """Scans files and git diffs for leaked credentials.
@@ -259,6 +673,10 @@ class SecretScanner:
             re.compile(pattern, re.IGNORECASE)
             for pattern in IGNORE_PATTERNS
         ]
+        nocase = {t for pattern, t, _ in SECRET_PATTERNS if pattern.startswith("(?i)")}
+        self._prefilter = _Prefilter(PREFILTER_LITERALS, nocase)
+        self._pattern_set = _PatternSet(SECRET_PATTERNS, set(PREFILTER_LITERALS))
+        self._ignore = re.compile("|".join(f"(?:{p})" for p in IGNORE_PATTERNS), re.IGNORECASE)
 
     def _should_ignore_line(self, line: str) -> bool:
         """Check if a line should be ignored as a false positive.
@@ -269,10 +687,7 @@ class SecretScanner:
         Returns:
             True if the line should be ignored
         """
-        for pattern in self.ignore_patterns:
-            if pattern.search(line):
-                return True
-        return False
+        return self._ignore.search(line) is not None
 
     def _should_ignore_match(self, match: str) -> bool:
         """Check if a match should be ignored.
@@ -306,46 +721,113 @@ class SecretScanner:
         Returns:
             List of SecretMatch objects for detected secrets
         """
-        matches = []
-
         # Check if file should be skipped
         if self.allowlist.is_allowed_file(str(path)):
-            return matches
+            return []
 
-        # Skip binary files
+        # Skip unreadable files
         try:
-            content = path.read_text(encoding='utf-8', errors='ignore')
+            content, _, _ = _read_source(path)
         except Exception:
-            return matches
+            return []
 
-        lines = content.split('\n')
+        return self.scan_text(content, str(path))
 
-        for line_num, line in enumerate(lines, 1):
-            # Skip lines matching ignore patterns
-            if self._should_ignore_line(line):
-                continue
+    def scan_text(self, content: str, file_path: str) -> list[SecretMatch]:
+        """Scan text (the content of file_path) for potential secrets.
 
-            # Check each secret pattern
-            for pattern, secret_type, confidence in self.patterns:
-                for match in pattern.finditer(line):
-                    # Get the actual matched value
-                    matched_value = match.group(1) if match.lastindex else match.group(0)
-
-                    # Skip if match should be ignored
-                    if self._should_ignore_match(matched_value):
-                        continue
-
-                    matches.append(SecretMatch(
-                        secret_type=secret_type,
-                        file_path=str(path),
-                        line_number=line_num,
-                        line_content=line,
-                        match=matched_value,
-                        confidence=confidence,
-                    ))
+        Args:
+            content: Text to scan
+            file_path: Path reported in matches
+
+        Returns:
+            List of SecretMatch objects for detected secrets
+        """
+        matches: list[SecretMatch] = []
+
+        # Only lines holding a prefilter literal can match
+        hits = None if self._pattern_set.unfiltered else self._prefilter.hits(content)
+        if hits is None:
+            # Lowercasing changed the length (e.g. "\u0130"): check line by line
+            candidates = (
+                (line_num, line, self._prefilter.line_types(line))
+                for line_num, line in enumerate(content.split('\n'), 1)
+            )
+        else:
+            candidates = _lines_at(content, hits)
+
+        unfiltered = bool(self._pattern_set.unfiltered)
+        for line_num, line, types in candidates:
+            # No candidate pattern can match this line
+            if types or unfiltered:
+                self._scan_line(line, types, file_path, line_num, matches)
 
         return matches
 
+    def fingerprint(self) -> str:
+        """Hash of everything that decides a scan's findings besides the
+        file itself; SecretScanCache entries are only valid under it."""
+        config = [
+            SCAN_CACHE_VERSION,
+            [(pattern, t.value, confidence) for pattern, t, confidence in SECRET_PATTERNS],
+            IGNORE_PATTERNS,
+            self.allowlist.allowed_patterns,
+        ]
+        return hashlib.sha1(json.dumps(config).encode("utf-8")).hexdigest()
+
+    def _scan_source(self, path: Path, known_hash: Optional[str],
+                     digest: bool) -> Optional[tuple[list[SecretMatch], Optional[str], os.stat_result]]:
+        """Read and scan one file of a directory scan.
+
+        Args:
+            path: File to scan
+            known_hash: Content hash of the file's clean cache entry, if any;
+                the file is not rescanned when its content still has it
+            digest: Whether to hash the content
+
+        Returns:
+            (matches, content hash, stat), or None if the file is unreadable
+        """
+        try:
+            content, content_hash, st = _read_source(path, digest=digest)
+        except Exception:
+            return None
+        if known_hash is not None and content_hash == known_hash:
+            return [], content_hash, st
+        return self.scan_text(content, str(path)), content_hash, st
+
+    def _scan_line(self, line: str, types: set[SecretType], file_path: str,
+                   line_num: int, matches: list[SecretMatch]) -> None:
+        """Append the secrets found in one line to matches.
+
+        Args:
+            line: Line content
+            types: Secret types the prefilter found literals for
+            file_path: Path reported in matches
+            line_num: Line number reported in matches
+            matches: List to append to
+        """
+        ignored = None
+        for secret_type, confidence, matched_value in self._pattern_set.finditer(line, types):
+            # Skip lines matching ignore patterns (checked once, on the first match)
+            if ignored is None:
+                ignored = self._should_ignore_line(line)
+            if ignored:
+                return
+
+            # Skip if match should be ignored
+            if self._should_ignore_match(matched_value):
+                continue
+
+            matches.append(SecretMatch(
+                secret_type=secret_type,
+                file_path=file_path,
+                line_number=line_num,
+                line_content=line,
+                match=matched_value,
+                confidence=confidence,
+            ))
+
     def scan_diff(self, diff: str) -> list[SecretMatch]:
         """Scan a git diff for secrets in newly added lines.
 
@@ -355,20 +837,46 @@ class SecretScanner:
         Returns:
             List of SecretMatch objects for detected secrets
         """
-        matches = []
+        # No literal anywhere in the diff: nothing can match
+        if not self._pattern_set.unfiltered and self._prefilter.hits(diff) == []:
+            return []
+
+        return self.scan_diff_lines(diff.split('\n'))
+
+    def scan_diff_lines(self, lines: Iterable[str]) -> list[SecretMatch]:
+        """Scan git diff lines (without line endings) for secrets in newly
+        added lines, consuming them one at a time.
+
+        Files matching the allowlist are skipped up to the next file header.
+
+        Args:
+            lines: Lines of git diff output, e.g. streamed from a pipe
+
+        Returns:
+            List of SecretMatch objects for detected secrets
+        """
+        matches: list[SecretMatch] = []
         current_file = ""
+        skip_file = False
         line_num = 0
+        unfiltered = bool(self._pattern_set.unfiltered)
+        line_types = self._prefilter.line_types
 
-        for line in diff.split('\n'):
+        for line in lines:
             # Track current file
             if line.startswith('+++ b/'):
                 current_file = line[6:]
+                skip_file = self.allowlist.is_allowed_file(current_file)
+                continue
+
+            # Nothing in an allowlisted file matters until the next file
+            if skip_file:
                 continue
 
             # Track line numbers from hunk headers
             if line.startswith('@@'):
                 # Parse @@ -old,count +new,count @@
-                hunk_match = re.search(r'\+(\d+)', line)
+                hunk_match = _HUNK_NEW_START.search(line)
                 if hunk_match:
                     line_num = int(hunk_match.group(1)) - 1
                 continue
@@ -378,47 +886,68 @@ class SecretScanner:
                 line_num += 1
                 content = line[1:]  # Remove the + prefix
 
-                # Skip if file should be ignored
-                if self.allowlist.is_allowed_file(current_file):
-                    continue
-
-                # Skip lines matching ignore patterns
-                if self._should_ignore_line(content):
+                # Skip lines that cannot match
+                types = line_types(content)
+                if not types and not unfiltered:
                     continue
 
-                # Check each pattern
-                for pattern, secret_type, confidence in self.patterns:
-                    for match in pattern.finditer(content):
-                        matched_value = match.group(1) if match.lastindex else match.group(0)
-
-                        if self._should_ignore_match(matched_value):
-                            continue
-
-                        matches.append(SecretMatch(
-                            secret_type=secret_type,
-                            file_path=current_file,
-                            line_number=line_num,
-                            line_content=content,
-                            match=matched_value,
-                            confidence=confidence,
-                        ))
+                self._scan_line(content, types, current_file, line_num, matches)
             elif not line.startswith('-'):
                 # Context line (unchanged), increment line number
                 line_num += 1
 
         return matches
 
-    def scan_staged(self, repo_root: Optional[Path] = None) -> list[SecretMatch]:
+    def _scan_git_diff(self, args: list[str], cwd: Path) -> list[SecretMatch]:
+        """Run git diff and scan its output as it streams through a pipe.
+
+        Memory stays bounded by the longest diff line instead of the whole
+        diff.
+
+        Args:
+            args: git diff arguments (after "git diff")
+            cwd: Repository directory
+
+        Returns:
+            List of SecretMatch objects, or [] if git fails
+        """
+        try:
+            process = subprocess.Popen(
+                ['git', 'diff', *args],
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+            )
+        except OSError:
+            return []
+
+        with process:
+            lines = (line.rstrip('\n') for line in process.stdout)
+            matches = self.scan_diff_lines(lines)
+
+        if process.returncode != 0:
+            return []
+        return matches
+
+    def scan_staged(self, repo_root: Optional[Path] = None, stream: bool = False) -> list[SecretMatch]:
         """Scan all staged changes for secrets.
 
         Args:
             repo_root: Optional repository root path
+            stream: Scan git's output as it is produced instead of
+                capturing it whole first (for very large diffs)
 
         Returns:
             List of SecretMatch objects for detected secrets
         """
         cwd = repo_root or Path.cwd()
 
+        if stream:
+            return self._scan_git_diff(['--cached', '--unified=0'], cwd)
+
         # Get staged diff
         result = subprocess.run(
             ['git', 'diff', '--cached', '--unified=0'],
@@ -435,19 +964,25 @@ class SecretScanner:
     def scan_commit_range(
         self,
         base_ref: str = "HEAD",
-        repo_root: Optional[Path] = None
+        repo_root: Optional[Path] = None,
+        stream: bool = False,
     ) -> list[SecretMatch]:
         """Scan commits since a reference for secrets.
 
         Args:
             base_ref: Git reference to compare against
             repo_root: Optional repository root path
+            stream: Scan git's output as it is produced instead of
+                capturing it whole first (for very large diffs)
 
         Returns:
             List of SecretMatch objects for detected secrets
         """
         cwd = repo_root or Path.cwd()
 
+        if stream:
+            return self._scan_git_diff([base_ref, '--unified=0'], cwd)
+
         # Get diff since base_ref
         result = subprocess.run(
             ['git', 'diff', base_ref, '--unified=0'],
@@ -464,47 +999,102 @@ class SecretScanner:
     def scan_directory(
         self,
         directory: Path,
-        extensions: Optional[list[str]] = None
+        extensions: Optional[list[str]] = None,
+        jobs: Optional[int] = 1,
+        cache: Optional[SecretScanCache] = None,
     ) -> list[SecretMatch]:
         """Scan all files in a directory for secrets.
 
         Args:
             directory: Directory to scan
             extensions: Optional list of file extensions to scan
+            jobs: Worker processes (None or 1 for sequential, 0 for one per CPU)
+            cache: Optional cache of clean files; unchanged files recorded in
+                it are not read, and it is saved after the scan
 
         Returns:
             List of SecretMatch objects for detected secrets
         """
-        matches = []
-
-        # Default extensions to scan
         if extensions is None:
-            extensions = [
-                '.py', '.js', '.ts', '.jsx', '.tsx',
-                '.json', '.yaml', '.yml', '.toml',
-                '.env', '.conf', '.config', '.cfg',
-                '.sh', '.bash', '.zsh',
-                '.rb', '.go', '.rs', '.java',
-                '.php', '.cs', '.cpp', '.c', '.h',
-            ]
-
-        for path in directory.rglob('*'):
-            # Skip directories
-            if path.is_dir():
-                continue
+            extensions = DEFAULT_SCAN_EXTENSIONS
 
-            # Skip files without matching extensions
-            if extensions and path.suffix.lower() not in extensions:
-                continue
+        paths = [
+            path for path in iter_scan_files(directory, extensions)
+            if not self.allowlist.is_allowed_file(str(path))
+        ]
 
-            # Skip common non-code directories
-            if any(part.startswith('.') or part in ['node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build']
-                   for part in path.parts):
+        # Drop files the cache knows are clean and unchanged
+        checked_ns = time.time_ns()  # before any file is read
+        todo: list[tuple[Path, Optional[str]]] = []
+        if cache is None:
+            todo = [(path, None) for path in paths]
+        else:
+            cache.bind(self.fingerprint())
+            for path in paths:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                clean, known_hash = cache.lookup(os.path.abspath(path), st)
+                if not clean:
+                    todo.append((path, known_hash))
+
+        matches = []
+        digest = cache is not None
+        for (path, _), result in zip(todo, self._scan_sources(todo, jobs, digest)):
+            if result is None:
                 continue
+            file_matches, content_hash, st = result
+            if cache is not None:
+                key = os.path.abspath(path)
+                if file_matches:
+                    cache.forget(key)
+                else:
+                    cache.mark_clean(key, st, content_hash, checked_ns)
+            matches.extend(file_matches)
+
+        if cache is not None:
+            cache.save()
+        return matches
 
-            matches.extend(self.scan_file(path))
+    def _scan_sources(self, todo: list[tuple[Path, Optional[str]]], jobs: Optional[int],
+                      digest: bool) -> list:
+        """_scan_source over files, on a process pool when there are enough."""
+        workers = min(_resolve_jobs(jobs), len(todo) // MIN_FILES_PER_WORKER)
+        if workers > 1:
+            chunksize = max(1, len(todo) // (workers * 8))
+            items = [(path, known_hash, digest) for path, known_hash in todo]
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self.allowlist,)) as pool:
+                    return list(pool.map(_worker_scan, items, chunksize=chunksize))
+            except (OSError, NotImplementedError) as e:
+                # Process pools are unavailable on some restricted platforms
+                logger.warning(f"Parallel secret scan unavailable ({e}), scanning sequentially")
+        return [self._scan_source(path, known_hash, digest) for path, known_hash in todo]
 
-        return matches
+
+def _resolve_jobs(jobs: Optional[int]) -> int:
+    """Worker count for a jobs value: None or 1 sequential, <= 0 one per CPU."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+# Scanner of a pool worker process, built once by _init_worker
+_worker_scanner: Optional[SecretScanner] = None
+
+
+def _init_worker(allowlist: AllowlistConfig) -> None:
+    global _worker_scanner
+    _worker_scanner = SecretScanner(allowlist)
+
+
+def _worker_scan(item: tuple[Path, Optional[str], bool]):
+    path, known_hash, digest = item
+    return _worker_scanner._scan_source(path, known_hash, digest)
 
 
 def format_scan_results(matches: list[SecretMatch], verbose: bool = False) -> str:
@@ -14,7 +14,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-import yaml
+
+from .core import yamlio
+from .core.state_cache import StateSummary, parse_state, read_state
 
 logger = logging.getLogger(__name__)
 
@@ -87,11 +89,10 @@ class SessionManager:
         config_path = self.paircoder_dir / "config.yaml"
         if config_path.exists():
             try:
-                with open(config_path) as f:
-                    config = yaml.safe_load(f) or {}
+                config = yamlio.load_file(config_path, cache=True) or {}
                 session_config = config.get("session", {})
                 return session_config.get("timeout_minutes", self.DEFAULT_TIMEOUT_MINUTES)
-            except (yaml.YAMLError, IOError):
+            except (yamlio.YAMLError, IOError):
                 pass
         return self.DEFAULT_TIMEOUT_MINUTES
 
@@ -156,14 +157,20 @@ class SessionManager:
         self._save_session(session)
         self._log_session_start(session)
 
+        # Opt-in (history.auto_compact): archive cold history at most daily
+        from .core.history import maybe_compact
+        maybe_compact(self.paircoder_dir, now=start_time)
+
         return session
 
     def _log_session_start(self, session: SessionState) -> None:
         """Log session start to history."""
+        from .metrics.writer import append_locked
+
         try:
-            with open(self.sessions_log, "a", encoding="utf-8") as f:
-                timestamp = session.last_activity.isoformat()
-                f.write(f"{timestamp} session_start id={session.session_id}\n")
+            timestamp = session.last_activity.isoformat()
+            line = f"{timestamp} session_start id={session.session_id}\n"
+            append_locked(self.sessions_log, line.encode("utf-8"))
         except IOError as e:
             logger.warning(f"Failed to log session start: {e}")
 
@@ -177,65 +184,32 @@ class SessionManager:
         state_path = self.paircoder_dir / "context" / "state.md"
         context = SessionContext()
 
-        if not state_path.exists():
-            return context
-
         try:
-            content = state_path.read_text(encoding="utf-8")
-            context = self._parse_state_md(content)
-        except IOError as e:
+            summary = read_state(state_path)
+        except (IOError, ValueError) as e:
             logger.warning(f"Failed to read state.md: {e}")
+            return context
 
+        if summary is not None:
+            context = self._context_from_summary(summary)
         return context
 
     def _parse_state_md(self, content: str) -> SessionContext:
         """Parse state.md content to extract context."""
-        context = SessionContext()
-        lines = content.split("\n")
-
-        current_section = None
-        in_table = False
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Detect sections
-            if stripped.startswith("## "):
-                current_section = stripped[3:].lower()
-                in_table = False
-                continue
-
-            # Parse Active Plan section
-            if current_section == "active plan":
-                if stripped.startswith("**Plan:**"):
-                    context.active_plan = stripped.replace("**Plan:**", "").strip()
-                elif stripped.startswith("**Status:**"):
-                    context.plan_status = stripped.replace("**Status:**", "").strip()
-
-            # Parse task table
-            if current_section and "sprint" in current_section and "task" in current_section:
-                if "|" in stripped and "in_progress" in stripped.lower():
-                    # Parse task row
-                    parts = [p.strip() for p in stripped.split("|") if p.strip()]
-                    if len(parts) >= 2:
-                        context.current_task_id = parts[0] if parts[0] != "ID" else None
-                        context.current_task_title = parts[1] if len(parts) > 1 and parts[1] != "Title" else None
-
-            # Parse Progress line
-            if stripped.startswith("**Progress:**"):
-                context.progress = stripped.replace("**Progress:**", "").strip()
-
-            # Parse What Was Just Done
-            if current_section == "what was just done":
-                if stripped.startswith("- ") and not context.last_done:
-                    context.last_done = stripped[2:]
-
-            # Parse What's Next
-            if current_section == "what's next":
-                if (stripped.startswith("1. ") or stripped.startswith("- ")) and not context.whats_next:
-                    context.whats_next = stripped.lstrip("1.- ")
-
-        return context
+        return self._context_from_summary(parse_state(content))
+
+    @staticmethod
+    def _context_from_summary(summary: StateSummary) -> SessionContext:
+        title = summary.current_task_title
+        return SessionContext(
+            active_plan=summary.active_plan,
+            plan_status=summary.plan_status,
+            current_task_id=summary.current_task_id,
+            current_task_title=title if title != "Title" else None,
+            progress=summary.progress,
+            last_done=summary.last_done,
+            whats_next=summary.next_step,
+        )
 
     def format_context_output(self, context: SessionContext) -> str:
         """
@@ -38,6 +38,13 @@ class HistoryParser:
         """
         self.history_dir = history_dir
 
+    def _log_lines(self, name: str):
+        """Lines of a history log, including segments archived by
+        `history compact`."""
+        from ..core.history import HistoryArchive
+
+        return HistoryArchive(self.history_dir).iter_lines(self.history_dir / name)
+
     def get_sessions(self) -> List[Dict[str, Any]]:
         """Get list of sessions from session log.
 
@@ -47,14 +54,9 @@ class HistoryParser:
         if not self.history_dir or not self.history_dir.exists():
             return []
 
-        sessions_log = self.history_dir / "sessions.log"
-        if not sessions_log.exists():
-            return []
-
         sessions = []
         try:
-            content = sessions_log.read_text(encoding="utf-8")
-            for line in content.strip().split("\n"):
+            for line in self._log_lines("sessions.log"):
                 if not line:
                     continue
                 # Parse: 2025-12-23T10:00:00 session_start id=abc123
@@ -78,14 +80,9 @@ class HistoryParser:
         if not self.history_dir or not self.history_dir.exists():
             return []
 
-        changes_log = self.history_dir / "changes.log"
-        if not changes_log.exists():
-            return []
-
         changes = []
         try:
-            content = changes_log.read_text(encoding="utf-8")
-            for line in content.strip().split("\n"):
+            for line in self._log_lines("changes.log"):
                 if not line:
                     continue
                 # Parse timestamp
@@ -0,0 +1,196 @@
+"""CLI startup profiling and the cold-start benchmark.
+
+Hooks and agents run `bpsai-pair` many times per task, so most of a short
+command's wall time is Python importing modules. cli.py registers command
+groups lazily; this module keeps an eye on what startup still costs.
+
+`bpsai-pair --profile-imports <command ...>` re-runs the command under
+``python -X importtime`` and prints, on stderr, the total import time and
+the packages that dominated it. The command's own output is unchanged.
+
+measure_startup() is the cold-start benchmark (benchmarks/bench_cli_startup.py):
+it times importing the CLI in fresh interpreters and compares the median
+with STARTUP_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Target for importing bpsai_pair.cli in a fresh interpreter
+STARTUP_BUDGET_MS = 150.0
+
+# Packages no command should import unless it actually uses them
+HEAVY_MODULES = (
+    "requests",
+    "trello",
+    "tiktoken",
+    "docker",
+    "bpsai_pair.trello.commands",
+    "bpsai_pair.github.commands",
+    "bpsai_pair.planning.commands",
+    "bpsai_pair.orchestration",
+)
+
+_IMPORTTIME_PREFIX = "import time:"
+
+# Times the CLI import from inside a fresh interpreter
+_TIMED_IMPORT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import bpsai_pair.cli\n"
+    "print((time.perf_counter() - start) * 1000)\n"
+    "print(' '.join(sorted(sys.modules)))\n"
+)
+
+
+@dataclass
+class ImportTiming:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class StartupBenchmark:
+    """Result of measure_startup()."""
+
+    runs_ms: List[float]
+    budget_ms: float
+    modules: List[str] = field(default_factory=list)
+
+    @property
+    def median_ms(self) -> float:
+        ordered = sorted(self.runs_ms)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    @property
+    def within_budget(self) -> bool:
+        return self.median_ms <= self.budget_ms
+
+    def heavy_imports(self) -> List[str]:
+        """HEAVY_MODULES that importing the CLI pulled in."""
+        return [name for name in HEAVY_MODULES if name in self.modules]
+
+
+def parse_importtime(stderr: str) -> Tuple[List[ImportTiming], List[str]]:
+    """
+    Split stderr of a ``python -X importtime`` run.
+
+    Args:
+        stderr: Captured stderr
+
+    Returns:
+        (timings, other stderr lines)
+    """
+    timings: List[ImportTiming] = []
+    other: List[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            other.append(line)
+            continue
+        parts = line[len(_IMPORTTIME_PREFIX):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the column header
+        timings.append(ImportTiming(
+            module=parts[2].strip(),
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+        ))
+    return timings, other
+
+
+def _group(module: str) -> str:
+    # Our own modules individually, third-party ones by distribution
+    if module.startswith("bpsai_pair."):
+        return module
+    return module.split(".", 1)[0]
+
+
+def format_report(timings: Sequence[ImportTiming], top: int = 15) -> str:
+    """
+    Summarize import timings: total, then the costliest packages.
+
+    Args:
+        timings: Parsed ``-X importtime`` lines
+        top: Number of packages to list
+
+    Returns:
+        Multi-line report
+    """
+    totals: Dict[str, int] = {}
+    for timing in timings:
+        key = _group(timing.module)
+        totals[key] = totals.get(key, 0) + timing.self_us
+    total_ms = sum(totals.values()) / 1000
+
+    lines = [f"Imports: {len(timings)} modules, {total_ms:.1f} ms"]
+    for name, us in sorted(totals.items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"  {us / 1000:8.1f} ms  {name}")
+    heavy = [name for name in HEAVY_MODULES if any(t.module == name for t in timings)]
+    if heavy:
+        lines.append(f"Heavy modules imported: {', '.join(heavy)}")
+    return "\n".join(lines)
+
+
+def profile_command(argv: Sequence[str], top: int = 15) -> int:
+    """
+    Run a CLI command under ``-X importtime`` and report its imports.
+
+    Args:
+        argv: Command arguments (without --profile-imports)
+        top: Number of packages to list
+
+    Returns:
+        The command's exit code
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "bpsai_pair", *argv],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    timings, other = parse_importtime(result.stderr)
+    for line in other:
+        print(line, file=sys.stderr)
+    print(format_report(timings, top=top), file=sys.stderr)
+    return result.returncode
+
+
+def measure_startup(runs: int = 5, budget_ms: Optional[float] = None) -> StartupBenchmark:
+    """
+    Time ``import bpsai_pair.cli`` in fresh interpreters.
+
+    Args:
+        runs: Number of interpreters to start
+        budget_ms: Target median (defaults to STARTUP_BUDGET_MS)
+
+    Returns:
+        StartupBenchmark with per-run times and the modules imported
+
+    Raises:
+        subprocess.CalledProcessError: If the import fails
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    times: List[float] = []
+    modules: List[str] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _TIMED_IMPORT],
+            capture_output=True, text=True, check=True, env=env,
+        )
+        elapsed, loaded = result.stdout.splitlines()[:2]
+        times.append(float(elapsed))
+        modules = loaded.split()
+    return StartupBenchmark(
+        runs_ms=times,
+        budget_ms=STARTUP_BUDGET_MS if budget_ms is None else budget_ms,
+        modules=modules,
+    )
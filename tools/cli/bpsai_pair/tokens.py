@@ -2,12 +2,25 @@
 
 Provides accurate token counting using tiktoken for estimating
 Claude API context usage and preventing context compaction.
+
+Encodings are loaded once per process and shared. Multi-file counts go
+through count_files_tokens, which tokenizes in a single batch and can
+reuse counts from an on-disk cache keyed by content hash
+(.paircoder/cache/token-counts.json).
 """
+import codecs
+import hashlib
+import json
+import logging
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 import tiktoken
 
+logger = logging.getLogger(__name__)
+
 
 # Model context limits (tokens)
 MODEL_LIMITS = {
@@ -39,6 +52,27 @@ TASK_TYPE_MULTIPLIERS = {
 # Default base context tokens (system prompt, instructions, etc.)
 DEFAULT_BASE_CONTEXT = 15000
 
+DEFAULT_ENCODING = "cl100k_base"
+
+# Files that are never tokenized
+BINARY_EXTENSIONS = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.bin',
+                     '.jpg', '.jpeg', '.png', '.gif', '.ico', '.pdf',
+                     '.zip', '.tar', '.gz', '.bz2', '.7z', '.rar'}
+
+# Files above this size are streamed in chunks instead of read whole
+STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+# A chunk with no newline/whitespace is carried over until it reaches this size
+STREAM_MAX_CARRY = 4 * STREAM_CHUNK_SIZE
+
+TOKEN_CACHE_VERSION = 1
+TOKEN_CACHE_FILENAME = "token-counts.json"
+# Oldest entries are dropped beyond this many cached counts
+TOKEN_CACHE_MAX_ENTRIES = 20000
+
+_encodings: Dict[str, tiktoken.Encoding] = {}
+_encodings_lock = threading.Lock()
+
 
 @dataclass
 class TokenEstimate:
@@ -49,6 +83,7 @@ class TokenEstimate:
     estimated_output: int
     total: int
     budget_percent: float
+    truncated: bool = False  # counting stopped at max_tokens; total is a lower bound
 
 
 @dataclass
@@ -62,9 +97,11 @@ class BudgetStatus:
     message: str
 
 
-def get_encoding(model: str = "cl100k_base") -> tiktoken.Encoding:
+def get_encoding(model: str = DEFAULT_ENCODING) -> tiktoken.Encoding:
     """Get tiktoken encoding for a model.
 
+    Encodings are built once per process and shared between callers.
+
     Args:
         model: Encoding name or model name. Defaults to cl100k_base
                which is compatible with Claude models.
@@ -72,12 +109,27 @@ def get_encoding(model: str = "cl100k_base") -> tiktoken.Encoding:
     Returns:
         tiktoken.Encoding instance
     """
-    return tiktoken.get_encoding(model)
+    encoding = _encodings.get(model)
+    if encoding is None:
+        with _encodings_lock:
+            encoding = _encodings.get(model)
+            if encoding is None:
+                encoding = tiktoken.get_encoding(model)
+                _encodings[model] = encoding
+    return encoding
 
 
-def count_tokens(text: str, model: str = "cl100k_base") -> int:
+def clear_encoding_cache() -> None:
+    """Forget all loaded encodings."""
+    with _encodings_lock:
+        _encodings.clear()
+
+
+def count_tokens(text: str, model: str = DEFAULT_ENCODING) -> int:
     """Count tokens in text using tiktoken.
 
+    Special-token markers (e.g. "<|endoftext|>") are counted as plain text.
+
     Args:
         text: Text to count tokens for
         model: Encoding name. Defaults to cl100k_base (Claude-compatible)
@@ -88,43 +140,365 @@ def count_tokens(text: str, model: str = "cl100k_base") -> int:
     if not text:
         return 0
     encoding = get_encoding(model)
-    return len(encoding.encode(text))
+    return len(encoding.encode_ordinary(text))
 
 
-def count_file_tokens(path: Path) -> int:
-    """Count tokens in a file.
+def count_tokens_many(
+    texts: Sequence[str],
+    model: str = DEFAULT_ENCODING,
+    num_threads: Optional[int] = None,
+) -> List[int]:
+    """Count tokens for many texts in one batch.
+
+    Args:
+        texts: Texts to count tokens for
+        model: Encoding name. Defaults to cl100k_base (Claude-compatible)
+        num_threads: Tokenizer threads (default: one per CPU, at most 8)
+
+    Returns:
+        Token counts in the same order as texts
+    """
+    counts = [0] * len(texts)
+    pending = [i for i, text in enumerate(texts) if text]
+    if not pending:
+        return counts
+    if num_threads is None:
+        num_threads = min(8, os.cpu_count() or 1)
+
+    encoding = get_encoding(model)
+    if len(pending) == 1:
+        counts[pending[0]] = len(encoding.encode_ordinary(texts[pending[0]]))
+        return counts
+
+    batch = encoding.encode_ordinary_batch(
+        [texts[i] for i in pending], num_threads=max(1, num_threads)
+    )
+    for i, tokens in zip(pending, batch):
+        counts[i] = len(tokens)
+    return counts
+
+
+class TokenCountCache:
+    """On-disk token counts keyed by encoding and content hash.
 
-    Handles various encodings and binary files gracefully.
+    Counts depend only on file content, so entries stay valid across
+    renames, checkouts and mtime changes. Call save() to persist.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the cache.
+
+        Args:
+            path: Cache file (usually .paircoder/cache/token-counts.json)
+        """
+        self.path = Path(path)
+        self._counts: Dict[str, int] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_paircoder_dir(cls, paircoder_dir: Path) -> "TokenCountCache":
+        """Cache stored under a project's .paircoder/cache directory."""
+        return cls(Path(paircoder_dir) / "cache" / TOKEN_CACHE_FILENAME)
+
+    @staticmethod
+    def key(content: bytes, model: str = DEFAULT_ENCODING) -> str:
+        """Cache key for raw file content."""
+        return f"{model}:{hashlib.sha256(content).hexdigest()}"
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load token count cache: {e}")
+            return
+        if isinstance(data, dict) and data.get("version") == TOKEN_CACHE_VERSION:
+            counts = data.get("counts", {})
+            if isinstance(counts, dict):
+                self._counts = counts
+
+    def get(self, key: str) -> Optional[int]:
+        """Cached count for a key, or None."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return self._counts.get(key)
+
+    def put(self, key: str, count: int) -> None:
+        """Record a count (kept in memory until save())."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if self._counts.get(key) != count:
+                self._counts[key] = count
+                self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            if len(self._counts) > TOKEN_CACHE_MAX_ENTRIES:
+                keep = list(self._counts.items())[-TOKEN_CACHE_MAX_ENTRIES:]
+                self._counts = dict(keep)
+            data = {"version": TOKEN_CACHE_VERSION, "counts": self._counts}
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(json.dumps(data), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to save token count cache: {e}")
+                tmp_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return len(self._counts)
+
+
+def _is_binary(path: Path) -> bool:
+    return path.suffix.lower() in BINARY_EXTENSIONS
+
+
+def _read_token_source(path: Path) -> Optional[bytes]:
+    """Raw bytes of a tokenizable file, or None if it should count as 0."""
+    if _is_binary(path):
+        return None
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _decode(raw: bytes) -> str:
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        # Fall back to latin-1 for legacy files
+        return raw.decode('latin-1')
+
+
+def _hash_file(path: Path, model: str) -> str:
+    """Cache key for a file, hashed in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f"{model}:{digest.hexdigest()}"
+
+
+def _safe_split(text: str) -> int:
+    """Index to split streamed text at: after the last newline, else the
+    last space or tab. Returns 0 if there is no safe boundary."""
+    cut = text.rfind("\n") + 1
+    if cut == 0:
+        cut = max(text.rfind(" "), text.rfind("\t")) + 1
+    return cut
+
+
+def _stream_tokens(path: Path, encoding_name: str, codec: str, max_tokens: Optional[int]) -> Tuple[int, bool]:
+    encoding = get_encoding(encoding_name)
+    decoder = codecs.getincrementaldecoder(codec)()
+    total = 0
+    carry = ""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            final = not chunk
+            text = carry + decoder.decode(chunk, final=final)
+            if final:
+                head, carry = text, ""
+            else:
+                cut = _safe_split(text)
+                if cut == 0 and len(text) < STREAM_MAX_CARRY:
+                    carry = text
+                    continue
+                cut = cut or len(text)
+                head, carry = text[:cut], text[cut:]
+            if head:
+                total += len(encoding.encode_ordinary(head))
+            if max_tokens is not None and total >= max_tokens and not final:
+                return total, False
+            if final:
+                return total, True
+
+
+def stream_file_tokens(
+    path: Path,
+    model: str = DEFAULT_ENCODING,
+    max_tokens: Optional[int] = None,
+) -> Tuple[int, bool]:
+    """Count tokens in a file without reading it into memory at once.
+
+    The file is read in STREAM_CHUNK_SIZE chunks, split after the last
+    newline (or whitespace) of each chunk and encoded piece by piece. The
+    total can differ from a whole-file encode by a few tokens where a split
+    lands inside a whitespace run.
 
     Args:
         path: Path to the file
+        model: Encoding name
+        max_tokens: Stop reading once at least this many tokens are counted
 
     Returns:
-        Number of tokens, or 0 if file can't be read
+        (token count, complete) - complete is False if counting stopped
+        early, in which case the count is a lower bound >= max_tokens
+
+    Raises:
+        OSError: If the file cannot be read
     """
-    if not path.exists():
-        return 0
+    try:
+        return _stream_tokens(path, model, 'utf-8', max_tokens)
+    except UnicodeDecodeError:
+        # Fall back to latin-1 for legacy files
+        return _stream_tokens(path, model, 'latin-1', max_tokens)
 
-    # Skip binary files by extension
-    binary_extensions = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.bin',
-                        '.jpg', '.jpeg', '.png', '.gif', '.ico', '.pdf',
-                        '.zip', '.tar', '.gz', '.bz2', '.7z', '.rar'}
-    if path.suffix.lower() in binary_extensions:
-        return 0
 
+def _count_large_file(
+    path: Path,
+    model: str,
+    cache: Optional[TokenCountCache],
+    max_tokens: Optional[int],
+) -> Tuple[int, bool]:
+    """(token count, complete) for a streamed file; see stream_file_tokens."""
     try:
-        # Try UTF-8 first
-        content = path.read_text(encoding='utf-8')
-    except UnicodeDecodeError:
+        key = _hash_file(path, model) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached, True
+        count, complete = stream_file_tokens(path, model, max_tokens)
+    except OSError:
+        return 0, True
+    if key is not None and complete:
+        cache.put(key, count)
+    return count, complete
+
+
+def count_files_tokens(
+    paths: Iterable[Path],
+    model: str = DEFAULT_ENCODING,
+    cache: Optional[TokenCountCache] = None,
+    num_threads: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> Dict[Path, int]:
+    """Count tokens for many files in one batch.
+
+    Missing, unreadable and binary files count as 0. When a cache is given,
+    files whose content was counted before are not tokenized again, and new
+    counts are saved back to it. Files larger than STREAM_THRESHOLD_BYTES
+    (STREAM_CHUNK_SIZE when max_tokens is set) are streamed one at a time
+    after the batch (see stream_file_tokens).
+
+    Args:
+        paths: Files to count
+        model: Encoding name
+        cache: Optional content-hash token count cache
+        num_threads: Tokenizer threads (see count_tokens_many)
+        max_tokens: Stop once the running total reaches this many tokens;
+            large files not yet streamed then count as 0, so the sum is a
+            lower bound
+
+    Returns:
+        Mapping of each path to its token count, in input order
+    """
+    return _count_files(paths, model, cache, num_threads, max_tokens)[0]
+
+
+def _count_files(
+    paths: Iterable[Path],
+    model: str,
+    cache: Optional[TokenCountCache],
+    num_threads: Optional[int],
+    max_tokens: Optional[int],
+) -> Tuple[Dict[Path, int], bool]:
+    """count_files_tokens, also reporting whether every file was counted
+    in full (False if max_tokens stopped counting early)."""
+    counts: Dict[Path, int] = {}
+    misses: Dict[str, List[Path]] = {}
+    texts: Dict[str, str] = {}
+    large: List[Path] = []
+    stream_above = STREAM_THRESHOLD_BYTES if max_tokens is None else STREAM_CHUNK_SIZE
+
+    for path in paths:
+        path = Path(path)
+        if path in counts:
+            continue
+        counts[path] = 0  # placeholder keeps input order
+        if _is_binary(path):
+            continue
         try:
-            # Fall back to latin-1 for legacy files
-            content = path.read_text(encoding='latin-1')
-        except Exception:
-            return 0
-    except Exception:
-        return 0
+            if path.stat().st_size > stream_above:
+                large.append(path)
+                continue
+        except OSError:
+            continue
+        raw = _read_token_source(path)
+        if not raw:
+            continue
+        key = TokenCountCache.key(raw, model)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            counts[path] = cached
+            continue
+        misses.setdefault(key, []).append(path)
+        texts.setdefault(key, _decode(raw))
+
+    if misses:
+        keys = list(misses)
+        results = count_tokens_many([texts[k] for k in keys], model, num_threads)
+        for key, count in zip(keys, results):
+            for path in misses[key]:
+                counts[path] = count
+            if cache is not None:
+                cache.put(key, count)
+
+    total = sum(counts.values())
+    complete = True
+    for path in large:
+        if max_tokens is not None and total >= max_tokens:
+            complete = False
+            break
+        remaining = None if max_tokens is None else max_tokens - total
+        counts[path], streamed = _count_large_file(path, model, cache, remaining)
+        complete = complete and streamed
+        total += counts[path]
+
+    if cache is not None:
+        cache.save()
+    return counts, complete
+
+
+def count_file_tokens(
+    path: Path,
+    model: str = DEFAULT_ENCODING,
+    cache: Optional[TokenCountCache] = None,
+    max_tokens: Optional[int] = None,
+) -> int:
+    """Count tokens in a file.
 
-    return count_tokens(content)
+    Handles various encodings and binary files gracefully. Large files are
+    streamed in chunks rather than read whole.
+
+    Args:
+        path: Path to the file
+        model: Encoding name
+        cache: Optional content-hash token count cache
+        max_tokens: Stop reading once at least this many tokens are counted
+
+    Returns:
+        Number of tokens (a lower bound >= max_tokens if counting stopped
+        early), or 0 if file can't be read
+    """
+    path = Path(path)
+    return count_files_tokens([path], model=model, cache=cache, max_tokens=max_tokens)[path]
 
 
 def estimate_task_tokens(
@@ -132,7 +506,9 @@ def estimate_task_tokens(
     files: list[Path],
     complexity: int = 10,
     task_type: str = "feature",
-    base_context: int = DEFAULT_BASE_CONTEXT
+    base_context: int = DEFAULT_BASE_CONTEXT,
+    cache: Optional[TokenCountCache] = None,
+    max_tokens: Optional[int] = None,
 ) -> TokenEstimate:
     """Estimate total tokens for a task.
 
@@ -142,29 +518,42 @@ def estimate_task_tokens(
         complexity: Task complexity score (1-100)
         task_type: Type of task (feature, bugfix, refactor, chore, docs)
         base_context: Base context tokens (system prompt, etc.)
+        cache: Optional content-hash token count cache
+        max_tokens: Stop counting files once the total reaches this many
+            tokens (the estimate is then marked truncated if any file was
+            not counted in full)
 
     Returns:
         TokenEstimate with breakdown
     """
     # Count task file tokens (estimate if not found)
-    task_file_tokens = 500  # Default estimate
-    task_paths = [
+    task_path = None
+    for candidate in (
         Path(f".paircoder/tasks/{task_id}.task.md"),
         Path(f".paircoder/tasks/TASK-{task_id}.task.md"),
-    ]
-    for task_path in task_paths:
-        if task_path.exists():
-            task_file_tokens = count_file_tokens(task_path)
+    ):
+        if candidate.exists():
+            task_path = candidate
             break
 
-    # Count source file tokens
-    source_tokens = sum(count_file_tokens(f) for f in files)
-
     # Estimate output tokens based on complexity and task type
     multiplier = TASK_TYPE_MULTIPLIERS.get(task_type, 1.0)
     # Scale output estimate: base 1000 tokens + complexity factor
     estimated_output = int((1000 + complexity * 50) * multiplier)
 
+    # Task file and source files are tokenized in one batch
+    source_paths = [Path(f) for f in files]
+    batch = list(source_paths)
+    if task_path is not None:
+        batch.append(task_path)
+    files_budget = None
+    if max_tokens is not None:
+        files_budget = max(0, max_tokens - base_context - estimated_output)
+    counts, complete = _count_files(batch, DEFAULT_ENCODING, cache, None, files_budget)
+
+    task_file_tokens = counts[task_path] if task_path is not None else 500  # Default estimate
+    source_tokens = sum(counts[f] for f in source_paths)
+
     # Calculate total
     total = base_context + task_file_tokens + source_tokens + estimated_output
 
@@ -177,7 +566,8 @@ def estimate_task_tokens(
         source_files=source_tokens,
         estimated_output=estimated_output,
         total=total,
-        budget_percent=budget_percent
+        budget_percent=budget_percent,
+        truncated=not complete,
     )
 
 
@@ -222,7 +612,11 @@ def get_budget_status(
     )
 
 
-def estimate_from_task_file(task_path: Path) -> Optional[TokenEstimate]:
+def estimate_from_task_file(
+    task_path: Path,
+    cache: Optional[TokenCountCache] = None,
+    max_tokens: Optional[int] = None,
+) -> Optional[TokenEstimate]:
     """Estimate tokens from a task file by parsing its contents.
 
     Extracts:
@@ -232,6 +626,8 @@ def estimate_from_task_file(task_path: Path) -> Optional[TokenEstimate]:
 
     Args:
         task_path: Path to the .task.md file
+        cache: Optional content-hash token count cache
+        max_tokens: Stop counting once the estimate reaches this many tokens
 
     Returns:
         TokenEstimate or None if file can't be parsed
@@ -287,5 +683,7 @@ def estimate_from_task_file(task_path: Path) -> Optional[TokenEstimate]:
         task_id=task_id,
         files=files,
         complexity=complexity,
-        task_type=task_type
+        task_type=task_type,
+        cache=cache,
+        max_tokens=max_tokens,
     )
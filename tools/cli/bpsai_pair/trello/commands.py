@@ -35,13 +35,12 @@ def _load_config() -> dict:
         from ..core.config import Config
         from ..core.ops import find_project_root
         from pathlib import Path
-        import yaml
+        from ..core import yamlio
 
         root = find_project_root()
         config_file = root / ".paircoder" / "config.yaml"
         if config_file.exists():
-            with open(config_file, encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+            return yamlio.load_file(config_file, cache=True) or {}
         return {}
     except Exception:
         return {}
@@ -52,15 +51,14 @@ def _save_config(config: dict) -> None:
     try:
         from ..core.ops import find_project_root
         from pathlib import Path
-        import yaml
+        from ..core import yamlio
 
         root = find_project_root()
         config_dir = root / ".paircoder"
         config_dir.mkdir(exist_ok=True)
         config_file = config_dir / "config.yaml"
 
-        with open(config_file, 'w', encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yamlio.dump_file(config, config_file, sort_keys=False, allow_unicode=True)
     except Exception as e:
         console.print(f"[yellow]Warning: Could not save config: {e}[/yellow]")
 
@@ -167,12 +167,12 @@ class ProgressReporter:
 
 def _load_config(paircoder_dir) -> dict:
     """Load configuration from config.yaml."""
-    import yaml
     from pathlib import Path
+    from ..core import yamlio
 
     config_path = Path(paircoder_dir) / "config.yaml"
     if config_path.exists():
-        return yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        return yamlio.load_file(config_path, cache=True) or {}
     return {}
 
 
@@ -35,12 +35,11 @@ def get_board_client() -> tuple[TrelloService, dict]:
     # Load config
     try:
         from pathlib import Path
+        from ..core import yamlio
         from ..core.ops import find_project_root
-        import yaml
         config_file = find_project_root() / ".paircoder" / "config.yaml"
         if config_file.exists():
-            with open(config_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+            config = yamlio.load_file(config_file, cache=True) or {}
         else:
             config = {}
     except Exception:
@@ -590,13 +589,12 @@ def task_done(
 
     # ENFORCEMENT: Block --no-strict when strict_ac_verification is enabled
     if not strict:
-        import yaml
         try:
+            from ..core import yamlio
             from ..core.ops import find_paircoder_dir
             config_path = find_paircoder_dir() / "config.yaml"
             if config_path.exists():
-                with open(config_path) as f:
-                    config = yaml.safe_load(f) or {}
+                config = yamlio.load_file(config_path, cache=True) or {}
                 strict_ac = config.get("enforcement", {}).get("strict_ac_verification", False)
                 if strict_ac:
                     console.print(
@@ -139,11 +139,10 @@ def register(
     if not board_id:
         try:
             paircoder_dir = find_paircoder_dir()
-            import yaml
+            from ..core import yamlio
             config_path = paircoder_dir / "config.yaml"
             if config_path.exists():
-                with open(config_path, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+                config = yamlio.load_file(config_path, cache=True)
                 board_id = config.get("trello", {}).get("board_id")
         except Exception:
             pass
@@ -527,3 +527,63 @@ class TestEdgeCases:
 
         # Path outside project shouldn't match
         assert manager.is_path_locked(Path("/etc/passwd")) is False
+
+
+class TestCompiledTiers:
+    """Tests for the compiled path tries and decision cache."""
+
+    def _manager(self, tmp_path, **config):
+        from bpsai_pair.security.containment import ContainmentManager
+        from bpsai_pair.core.config import ContainmentConfig
+
+        return ContainmentManager(ContainmentConfig(enabled=True, **config), tmp_path)
+
+    def test_directory_prefix_is_by_component(self, tmp_path):
+        """A locked directory does not cover siblings sharing its name prefix."""
+        (tmp_path / "protected").mkdir()
+        manager = self._manager(tmp_path, readonly_directories=["protected/"], blocked_files=[".env"])
+
+        assert manager.get_path_tier(Path("protected")) == "readonly"
+        assert manager.get_path_tier(Path("protected/a/b.md")) == "readonly"
+        assert manager.get_path_tier(Path("protected-other/b.md")) == "readwrite"
+        assert manager.get_path_tier(Path(".env")) == "blocked"
+        assert manager.get_path_tier(Path(".env/child")) == "readwrite"
+
+    def test_unanchored_double_star_pattern(self, tmp_path):
+        """Patterns without a literal prefix are still matched as globs."""
+        manager = self._manager(tmp_path, blocked_directories=["**/secrets/*"])
+
+        assert manager.is_path_blocked(Path("a/b/secrets/key.pem")) is True
+        assert manager.is_path_blocked(Path("a/b/public/key.pem")) is False
+
+    def test_checks_do_not_stat_protected_entries(self, tmp_path):
+        """Only the checked path is resolved; tier entries are never stat'ed."""
+        for i in range(50):
+            (tmp_path / f"file{i}.md").write_text("x")
+        manager = self._manager(
+            tmp_path,
+            readonly_files=[f"file{i}.md" for i in range(50)] + ["missing.md"],
+            readonly_directories=["missing-dir/"],
+        )
+        manager.activate()
+
+        with patch.object(Path, "exists", side_effect=AssertionError("stat in hot path")):
+            manager.check_read_allowed(Path("src/main.py"))
+            with pytest.raises(Exception):
+                manager.check_write_allowed(Path("missing-dir/new.md"))
+            with pytest.raises(Exception):
+                manager.check_write_allowed(Path("file7.md"))
+
+    def test_decisions_are_cached_by_resolved_path(self, tmp_path):
+        """Repeated checks reuse the decision, but symlinks are still followed."""
+        (tmp_path / ".claude").mkdir()
+        manager = self._manager(tmp_path, readonly_directories=[".claude/"])
+
+        assert manager.is_path_locked(Path("src/a.py")) is False
+        assert manager.is_path_locked(Path("src/../src/a.py")) is False
+        info = manager._tiers.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "link").symlink_to(tmp_path / ".claude")
+        assert manager.is_path_locked(Path("src/link/a.py")) is True
@@ -0,0 +1,111 @@
+"""Tests for the shared metrics analytics dataset."""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from bpsai_pair.metrics.accuracy import AccuracyAnalyzer
+from bpsai_pair.metrics.analytics import (
+    CompletionSeries,
+    MetricsDataset,
+    RecordTable,
+    group_stats,
+)
+from bpsai_pair.metrics.burndown import BurndownGenerator, SprintConfig
+from bpsai_pair.metrics.collector import MetricsCollector
+from bpsai_pair.metrics.timelog import TimeIndexedLog
+from bpsai_pair.metrics.velocity import VelocityTracker
+
+
+class TestColumns:
+    def test_group_stats(self):
+        groups = group_stats([10.0, -20.0, 30.0], ["a", "b", "a"])
+
+        assert list(groups) == ["a", "b"]
+        assert groups["a"].count == 2
+        assert groups["a"].mean == 20.0
+        assert groups["b"].mean_abs == 20.0
+        assert group_stats([1.0, -3.0])["all"].mean == -1.0
+
+    def test_record_table_defaults(self):
+        table = RecordTable.from_records(
+            [{"ratio": 2.0}, {"task_type": "bugfix"}],
+            {"ratio": 1.0, "task_type": "unknown"},
+        )
+
+        assert len(table) == 2
+        assert table.column("ratio") == [2.0, 1.0]
+        assert table.column("task_type") == ["unknown", "bugfix"]
+
+    def test_completion_series(self):
+        series = CompletionSeries.from_records([
+            {"completed_at": "2025-01-08T12:00:00", "complexity": 5, "sprint": "s2"},
+            {"completed_at": "2025-01-06T00:00:00", "complexity": 3, "sprint": "s1"},
+            {"completed_at": "2025-01-13T00:00:00", "complexity": 8, "sprint": ""},
+            {"completed_at": None, "complexity": 100, "sprint": "s1"},
+        ])
+
+        # Ranges are inclusive at both ends, like VelocityTracker's week query
+        assert series.points_between(datetime(2025, 1, 6), datetime(2025, 1, 13)) == 16
+        assert series.points_between(datetime(2025, 1, 7), datetime(2025, 1, 12)) == 5
+        assert series.sprint_totals == {"s2": 5, "s1": 3}
+        assert series.weeks_tracked == 2
+        assert series.daily_points("s2", datetime(2025, 1, 7, 15), 3) == [0, 5, 0]
+        assert series.daily_points("missing", datetime(2025, 1, 7), 2) == [0, 0]
+
+
+class TestMetricsDataset:
+    def test_load_reused_until_log_changes(self, tmp_path):
+        log = TimeIndexedLog(tmp_path / "velocity-completions.jsonl", "completed_at")
+        log.append({"completed_at": "2025-01-06T00:00:00", "complexity": 3, "sprint": "s1"})
+        dataset = MetricsDataset(tmp_path)
+
+        with patch.object(CompletionSeries, "from_records", wraps=CompletionSeries.from_records) as build:
+            first = dataset.load("velocity", log, CompletionSeries.from_records)
+            assert dataset.load("velocity", log, CompletionSeries.from_records) is first
+            assert build.call_count == 1
+
+        log.append({"completed_at": "2025-01-07T00:00:00", "complexity": 2, "sprint": "s1"})
+        assert dataset.load("velocity", log, CompletionSeries.from_records).sprint_totals == {"s1": 5}
+
+    def test_shared_per_directory(self, tmp_path):
+        assert MetricsDataset.shared(tmp_path) is MetricsDataset.shared(tmp_path / ".")
+        assert MetricsDataset.shared(tmp_path) is not MetricsDataset.shared(tmp_path / "other")
+
+
+class TestReportsShareOneLoad:
+    def test_velocity_and_burndown(self, tmp_path):
+        dataset = MetricsDataset(tmp_path)
+        tracker = VelocityTracker(tmp_path, dataset=dataset)
+        now = datetime.now()
+        for days_ago, points in ((0, 3), (1, 5), (9, 8)):
+            tracker.record_completion(f"T{days_ago}", points, "sprint-1",
+                                      completed_at=now - timedelta(days=days_ago))
+
+        start = now - timedelta(days=2)
+        with patch.object(TimeIndexedLog, "read", autospec=True,
+                          side_effect=TimeIndexedLog.read) as read:
+            stats = tracker.get_velocity_stats("sprint-1")
+            tracker.get_weekly_breakdown()
+            tracker.get_sprint_breakdown()
+            burndown = BurndownGenerator(tmp_path, dataset=dataset).generate(
+                SprintConfig("sprint-1", start, now, total_points=16)
+            )
+
+        assert read.call_count == 1
+        assert stats.points_this_sprint == 16
+        assert stats.sprints_tracked == 1
+        assert [p.completed for p in burndown.data_points] == [0, 5, 8]
+
+    def test_accuracy_report(self, tmp_path):
+        collector = MetricsCollector(tmp_path)
+        collector.record_task_completion("T1", estimated_hours=2.0, actual_hours=3.0)
+        collector.record_task_completion("T2", estimated_hours=4.0, actual_hours=4.2)
+        analyzer = AccuracyAnalyzer(tmp_path)
+
+        with patch.object(TimeIndexedLog, "read", autospec=True,
+                          side_effect=TimeIndexedLog.read) as read:
+            report = analyzer.generate_report()
+
+        assert read.call_count == 1
+        assert report["stats"]["total_tasks"] == 2
+        assert report["stats"]["avg_variance_percent"] == 27.5
+        assert report["by_complexity_band"][0]["band"] == "S"  # complexity defaults to 30
@@ -0,0 +1,134 @@
+"""Tests for the content-addressed blob store and archive writer."""
+import hashlib
+import os
+import tarfile
+from unittest.mock import patch
+
+from bpsai_pair.context.cache import ContextCache
+from bpsai_pair.core import blobs
+from bpsai_pair.core.blobs import BlobStore, write_targz
+from bpsai_pair.core.ops import ContextPacker
+from bpsai_pair.orchestration.handoff import HandoffManager
+
+
+class TestBlobStore:
+    def test_put_is_content_addressed(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+
+        digest = store.put(b"hello")
+        again = store.put(b"hello")
+
+        assert digest == again == hashlib.sha256(b"hello").hexdigest()
+        assert store.get(digest) == b"hello"
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # fan-out dir + blob
+
+    def test_corrupt_blob_discarded(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        digest = store.put(b"hello")
+        store.path_for(digest).write_bytes(b"tampered")
+
+        assert store.get(digest) is None
+        assert not store.has(digest)
+
+    def test_for_project_requires_paircoder_dir(self, tmp_path):
+        assert BlobStore.for_project(tmp_path) is None
+        (tmp_path / ".paircoder").mkdir()
+        assert BlobStore.for_project(tmp_path).root == tmp_path / ".paircoder" / "cache" / "blobs"
+
+    def test_prune_removes_least_recent(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        old = store.put(b"a" * 100)
+        new = store.put(b"b" * 100)
+        os.utime(store.path_for(old), (1, 1))
+
+        store.prune(max_bytes=150)
+
+        assert not store.has(old)
+        assert store.has(new)
+
+
+class TestWriteTargz:
+    def test_archive_round_trips(self, tmp_path):
+        src = tmp_path / "AGENTS.md"
+        src.write_text("agents " * 100)
+        src.chmod(0o640)
+        output = tmp_path / "out.tgz"
+
+        write_targz(output, [("meta.json", b"{}"), ("docs/AGENTS.md", src)],
+                    store=BlobStore(tmp_path / "blobs"))
+
+        with tarfile.open(output, "r:gz") as tar:
+            assert tar.getnames() == ["meta.json", "docs/AGENTS.md"]
+            assert tar.extractfile("meta.json").read() == b"{}"
+            assert tar.extractfile("docs/AGENTS.md").read() == src.read_bytes()
+            assert tar.getmember("docs/AGENTS.md").mode == 0o640
+
+    def test_repeat_archive_reuses_compressed_blob(self, tmp_path):
+        src = tmp_path / "state.md"
+        src.write_text("state " * 5000)
+        store = BlobStore(tmp_path / "blobs")
+        write_targz(tmp_path / "one.tgz", [("state.md", src)], store=store)
+
+        with patch.object(blobs, "_gzip", wraps=blobs._gzip) as mock_gzip:
+            write_targz(tmp_path / "two.tgz", [("state.md", src)], store=store)
+            compressed = [len(call.args[0]) for call in mock_gzip.call_args_list]
+
+        # Only the tar header and trailer are compressed again
+        assert all(size <= tarfile.RECORDSIZE for size in compressed)
+        with tarfile.open(tmp_path / "two.tgz", "r:gz") as tar:
+            assert tar.extractfile("state.md").read() == src.read_bytes()
+
+    def test_store_pruned_to_cap(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs", max_bytes=3000)
+        for i in range(5):
+            src = tmp_path / f"file{i}.md"
+            src.write_bytes(os.urandom(1000))
+            write_targz(tmp_path / f"out{i}.tgz", [(src.name, src)], store=store)
+
+        assert store.size() <= 3000
+        with tarfile.open(tmp_path / "out0.tgz", "r:gz") as tar:
+            assert tar.extractfile("file0.md").read() == (tmp_path / "file0.md").read_bytes()
+
+
+class TestWriteThrough:
+    def test_context_cache_dedups_identical_content(self, tmp_path):
+        cache = ContextCache(tmp_path / "cache")
+        for name in ("a.md", "b.md"):
+            f = tmp_path / name
+            f.write_text("same")
+            cache.set(f, "same")
+
+        assert cache.get(tmp_path / "a.md")[0] == "same"
+        assert len([p for p in cache.blobs.root.rglob("*") if p.is_file()]) == 1
+
+    def test_cache_clear_keeps_packer_blobs(self, tmp_path):
+        cache = ContextCache(tmp_path / "cache")
+        cached = tmp_path / "cached.md"
+        cached.write_text("cached")
+        cache.set(cached, "cached")
+        packed = tmp_path / "packed.md"
+        packed.write_text("packed")
+        write_targz(tmp_path / "pack.tgz", [("packed.md", packed)], store=cache.blobs)
+
+        assert cache.clear() == 1
+        assert not cache.blobs.has(hashlib.sha256(b"cached").hexdigest())
+        assert cache.blobs.has(hashlib.sha256(b"packed").hexdigest())
+
+    def test_packers_share_blobs(self, tmp_path):
+        (tmp_path / ".paircoder" / "context").mkdir(parents=True)
+        (tmp_path / ".paircoder" / "context" / "state.md").write_text("# State")
+        (tmp_path / "AGENTS.md").write_text("# Agents")
+
+        ContextPacker.pack(tmp_path, tmp_path / "pack.tgz", lite=True)
+        HandoffManager(tmp_path).pack(
+            "T1",
+            include_files=[tmp_path / "AGENTS.md"],
+            output_path=tmp_path / "handoff.tgz",
+        )
+
+        store = BlobStore.for_project(tmp_path)
+        assert store.has(hashlib.sha256(b"# Agents").hexdigest())
+        assert store.has(hashlib.sha256(b"# State").hexdigest())
+        with tarfile.open(tmp_path / "handoff.tgz", "r:gz") as tar:
+            assert "context/AGENTS.md" in tar.getnames()
+            assert "HANDOFF.md" in tar.getnames()
@@ -0,0 +1,105 @@
+"""Tests for parallel plan/task parsing."""
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.planning import bulk
+from bpsai_pair.planning.bulk import (
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    parse_files,
+    resolve_jobs,
+)
+from bpsai_pair.planning.parser import PlanParser, TaskParser, load_task_file
+
+
+def _write_tasks(tasks_dir: Path, count: int) -> list[Path]:
+    tasks_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for n in range(count):
+        path = tasks_dir / f"T{n:03d}.task.md"
+        path.write_text(
+            f"---\nid: T{n:03d}\ntitle: Task {n}\nplan: plan-2025-01-bulk\n"
+            f"status: pending\n---\n\n# Objective\n\nTask {n}\n",
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+class TestResolveJobs:
+    """Tests for resolve_jobs."""
+
+    def test_sequential_defaults(self):
+        assert resolve_jobs(None) == 1
+        assert resolve_jobs(1) == 1
+
+    def test_auto(self):
+        assert resolve_jobs(0) == (os.cpu_count() or 1)
+
+    def test_explicit(self):
+        assert resolve_jobs(4) == 4
+
+
+class TestParseFiles:
+    """Tests for parse_files."""
+
+    @pytest.mark.parametrize("executor", [EXECUTOR_THREAD, EXECUTOR_PROCESS])
+    def test_preserves_order(self, tmp_path, executor):
+        """Parallel results come back in input order."""
+        paths = _write_tasks(tmp_path / "tasks", 12)
+        with patch.object(bulk, "MIN_FILES_PER_WORKER", 2):
+            tasks = parse_files(load_task_file, paths, jobs=3, executor=executor)
+        assert [t.id for t in tasks] == [f"T{n:03d}" for n in range(12)]
+        assert "Task 5" in tasks[5].body
+
+    def test_small_batches_run_sequentially(self, tmp_path):
+        """Too few files for the worker count skips the pool."""
+        paths = _write_tasks(tmp_path / "tasks", 3)
+        with patch.object(bulk, "ThreadPoolExecutor") as mock_pool, \
+                patch.object(bulk, "ProcessPoolExecutor") as mock_proc:
+            tasks = parse_files(load_task_file, paths, jobs=8)
+            mock_pool.assert_not_called()
+            mock_proc.assert_not_called()
+        assert len(tasks) == 3
+
+    def test_falls_back_when_pool_unavailable(self, tmp_path):
+        """Pool start-up failures fall back to sequential parsing."""
+        paths = _write_tasks(tmp_path / "tasks", 6)
+        with patch.object(bulk, "MIN_FILES_PER_WORKER", 1), \
+                patch.object(bulk, "ProcessPoolExecutor", side_effect=OSError("no semaphores")):
+            tasks = parse_files(load_task_file, paths, jobs=2, executor=EXECUTOR_PROCESS)
+        assert [t.id for t in tasks] == [f"T{n:03d}" for n in range(6)]
+
+    def test_executor_follows_yaml_backend(self):
+        """Threads with libyaml, processes without."""
+        with patch.object(bulk, "has_libyaml", return_value=True):
+            assert bulk.default_executor() == EXECUTOR_THREAD
+        with patch.object(bulk, "has_libyaml", return_value=False):
+            assert bulk.default_executor() == EXECUTOR_PROCESS
+
+
+class TestParserJobs:
+    """Tests for jobs on TaskParser / PlanParser."""
+
+    def test_task_parser_parallel_matches_sequential(self, tmp_path):
+        tasks_dir = tmp_path / ".paircoder" / "tasks"
+        _write_tasks(tasks_dir, 10)
+        with patch.object(bulk, "MIN_FILES_PER_WORKER", 2):
+            parallel = TaskParser(tasks_dir, jobs=4).parse_all()
+        sequential = TaskParser(tasks_dir).parse_all()
+        assert [t.id for t in parallel] == [t.id for t in sequential]
+        assert [t.body for t in parallel] == [t.body for t in sequential]
+
+    def test_plan_parser_parallel(self, tmp_path):
+        plans_dir = tmp_path / "plans"
+        plans_dir.mkdir()
+        for n in range(6):
+            (plans_dir / f"plan-2025-01-p{n}.plan.yaml").write_text(
+                f"id: plan-2025-01-p{n}\ntitle: Plan {n}\n", encoding="utf-8"
+            )
+        with patch.object(bulk, "MIN_FILES_PER_WORKER", 1):
+            plans = PlanParser(plans_dir, jobs=3).parse_all()
+        assert [p.id for p in plans] == [f"plan-2025-01-p{n}" for n in range(6)]
@@ -384,11 +384,9 @@ class TestBurndownGenerator:
             # Remaining can be negative (or clamped to 0)
             assert day2.remaining <= 0
 
-    def test_get_completions_for_date(self):
+    def test_get_daily_points(self):
         """Test getting completions for a specific date."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            generator = BurndownGenerator(Path(tmpdir))
-
             from bpsai_pair.metrics.velocity import VelocityTracker
             tracker = VelocityTracker(Path(tmpdir))
 
@@ -399,12 +397,9 @@ class TestBurndownGenerator:
             # Record completion on different day
             tracker.record_completion("T3", 30, "sprint-17", datetime(2025, 12, 18, 10, 0))
 
-            completions = generator._get_completions_for_date(
-                "sprint-17",
-                datetime(2025, 12, 17),
-            )
+            points = tracker.get_daily_points("sprint-17", datetime(2025, 12, 17), 2)
 
-            assert completions == 35  # 20 + 15
+            assert points == [35, 30]  # 20 + 15, then 30
 
     def test_persistence(self):
         """Test that burndown uses persisted velocity data."""
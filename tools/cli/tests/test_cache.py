@@ -145,6 +145,83 @@ class TestContextCache:
         assert result is not None
         assert result[0] == "# Persistent"
 
+    def test_lru_evicts_by_entry_count(self, tmp_path: Path):
+        """Least recently used entries are evicted past max_entries."""
+        cache = ContextCache(tmp_path / "cache", max_entries=2)
+        files = []
+        for i in range(3):
+            f = tmp_path / f"file{i}.md"
+            f.write_text(f"Content {i}")
+            files.append(f)
+
+        cache.set(files[0], "Content 0")
+        cache.set(files[1], "Content 1")
+        assert cache.get(files[0]) is not None  # file1 is now least recent
+        cache.set(files[2], "Content 2")
+
+        assert cache.get(files[1]) is None
+        assert cache.get(files[0]) is not None
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+
+    def test_lru_evicts_by_size(self, tmp_path: Path):
+        """Total cached bytes stay under max_bytes."""
+        cache = ContextCache(tmp_path / "cache", max_bytes=25)
+        for i in range(3):
+            f = tmp_path / f"file{i}.md"
+            f.write_text("x" * 10)
+            cache.set(f, "x" * 10)
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["total_bytes"] == 20
+
+    def test_counters_persist(self, tmp_path: Path):
+        """Hit and miss counts survive across instances."""
+        cache_dir = tmp_path / "cache"
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test")
+
+        cache1 = ContextCache(cache_dir)
+        cache1.get(test_file)
+        cache1.set(test_file, "# Test")
+        cache1.get(test_file)
+        cache1.close()
+
+        stats = ContextCache(cache_dir).stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_batch_commits_on_exit(self, tmp_path: Path):
+        """Writes inside batch() are invisible to other instances until exit."""
+        cache_dir = tmp_path / "cache"
+        cache = ContextCache(cache_dir)
+        other = ContextCache(cache_dir)
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test")
+
+        with cache.batch():
+            cache.set(test_file, "# Test")
+            assert cache.get(test_file) is not None
+            assert other.get(test_file) is None
+
+        assert other.get(test_file) is not None
+
+    def test_legacy_index_removed(self, tmp_path: Path):
+        """v1 index.json and its content files are cleaned up."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "index.json").write_text(json.dumps({"abc123": {"path": "x"}}))
+        (cache_dir / "abc123.txt").write_text("old")
+        (cache_dir / "task-index.json").write_text("{}")
+
+        ContextCache(cache_dir)
+
+        assert not (cache_dir / "index.json").exists()
+        assert not (cache_dir / "abc123.txt").exists()
+        assert (cache_dir / "task-index.json").exists()
+
 
 class TestContextLoader:
     """Tests for ContextLoader class."""
@@ -250,3 +327,40 @@ class TestContextLoader:
 
         assert loader.hits == 0
         assert loader.misses == 0
+
+    def test_prefetch_matches_sequential(self, tmp_path: Path):
+        """Concurrent prefetch returns the same content as sequential loads."""
+        context_dir = tmp_path / ".paircoder" / "context"
+        context_dir.mkdir(parents=True)
+        (context_dir / "project.md").write_text("# Project")
+        (context_dir / "workflow.md").write_text("# Workflow")
+        (tmp_path / "AGENTS.md").write_text("# Agents")
+        (tmp_path / "CLAUDE.md").write_text("# Claude")
+
+        sequential = ContextLoader(tmp_path).load_all_context(prefetch=False)
+        loader = ContextLoader(tmp_path)
+        prefetched = loader.load_all_context(prefetch=True, max_workers=4)
+
+        assert prefetched == sequential
+        assert loader.hits == 4
+        assert loader.misses == 0
+
+    def test_per_file_stats(self, tmp_path: Path):
+        """get_stats reports latency and cache hit per file."""
+        context_dir = tmp_path / ".paircoder" / "context"
+        context_dir.mkdir(parents=True)
+        (context_dir / "project.md").write_text("# Project")
+        (tmp_path / "AGENTS.md").write_text("# Agents")
+
+        loader = ContextLoader(tmp_path)
+        loader.load_all_context()
+        loader.load(".paircoder/context/project.md")
+
+        files = loader.get_stats()["files"]
+        assert set(files) == {".paircoder/context/project.md", "AGENTS.md"}
+        assert files[".paircoder/context/project.md"]["cache_hit"] is True
+        assert files["AGENTS.md"]["cache_hit"] is False
+        assert all(f["latency_ms"] >= 0 for f in files.values())
+
+        loader.reset_stats()
+        assert loader.get_stats()["files"] == {}
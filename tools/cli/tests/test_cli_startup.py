@@ -0,0 +1,96 @@
+"""Tests for lazy command loading and the CLI cold-start budget."""
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from bpsai_pair import cli
+from bpsai_pair.startup import (
+    HEAVY_MODULES,
+    format_report,
+    measure_startup,
+    parse_importtime,
+)
+
+IMPORTTIME_STDERR = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       5000 | rich.console
+import time:      3000 |       3000 |   rich.text
+import time:       500 |        500 | requests
+some warning
+"""
+
+
+def _modules_after(args, cwd):
+    """Modules imported by running the CLI in a fresh interpreter."""
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from bpsai_pair.cli import app\n"
+        f"CliRunner().invoke(app, {list(args)!r})\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=cwd,
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyCommands:
+    def test_every_registered_command_loads(self):
+        for name in cli.LAZY_COMMANDS:
+            command = cli.load_command(name)
+            assert command.name == name
+            assert command.hidden == (name in cli.HIDDEN_COMMANDS)
+
+    def test_help_lists_commands(self):
+        result = CliRunner().invoke(cli.app, ["--help"])
+        assert result.exit_code == 0
+        for name in ("plan", "session", "status", "contained-auto", "scan-secrets"):
+            assert name in result.output
+        assert "claude666" not in result.output
+
+    def test_import_loads_no_command_modules(self):
+        modules = _modules_after(["--version"], cwd=None)
+        assert "bpsai_pair.commands.core" not in modules
+        assert "bpsai_pair.commands.session" not in modules
+        assert not modules & set(HEAVY_MODULES)
+
+    def test_status_and_session_skip_heavy_modules(self, tmp_path):
+        for args in (["status"], ["session", "check"]):
+            modules = _modules_after(args, cwd=tmp_path)
+            assert not modules & set(HEAVY_MODULES), args
+
+
+class TestProfileImports:
+    def test_parse_importtime(self):
+        timings, other = parse_importtime(IMPORTTIME_STDERR)
+        assert [t.module for t in timings] == ["_io", "rich.console", "rich.text", "requests"]
+        assert timings[1].cumulative_us == 5000
+        assert other == ["some warning"]
+
+    def test_report_groups_packages(self):
+        report = format_report(parse_importtime(IMPORTTIME_STDERR)[0])
+        lines = report.splitlines()
+        assert lines[0] == "Imports: 4 modules, 5.6 ms"
+        assert lines[1].split() == ["5.0", "ms", "rich"]
+        assert lines[-1] == "Heavy modules imported: requests"
+
+    def test_flag_reports_on_stderr(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "bpsai_pair", "--profile-imports", "--version"],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 0
+        assert "version" in result.stdout
+        assert "Imports:" not in result.stdout
+        assert "Imports:" in result.stderr
+        assert "import time:" not in result.stderr
+
+
+def test_cold_start_within_budget():
+    benchmark = measure_startup(runs=3)
+    assert benchmark.heavy_imports() == []
+    assert benchmark.within_budget, (
+        f"import bpsai_pair.cli took {benchmark.median_ms:.0f} ms "
+        f"(budget {benchmark.budget_ms:.0f} ms)"
+    )
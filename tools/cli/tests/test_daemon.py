@@ -0,0 +1,139 @@
+"""Tests for the command daemon and its client."""
+import subprocess
+import tempfile
+import threading
+
+import pytest
+
+from bpsai_pair.daemon import client
+from bpsai_pair.daemon.server import DaemonError, DaemonServer
+
+pytestmark = pytest.mark.skipif(not client.SUPPORTED, reason="needs Unix domain sockets")
+
+STATE_MD = "# Current State\n\n## What's Next\n\n1. Ship the daemon\n"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    context = tmp_path / ".paircoder" / "context"
+    context.mkdir(parents=True)
+    (context / "state.md").write_text(STATE_MD, encoding="utf-8")
+    # Socket paths must stay short
+    monkeypatch.setenv("XDG_RUNTIME_DIR", tempfile.mkdtemp(prefix="bp"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(project):
+    server = DaemonServer(project, idle_timeout=30)
+    server.bind()
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    client.request(project, {"op": "stop"})
+    thread.join(timeout=5)
+
+
+class TestClient:
+    @pytest.mark.parametrize("argv, served", [
+        (["session", "check", "--quiet"], True),
+        (["compaction", "snapshot", "save"], True),
+        (["task", "update", "T1", "--status", "done"], True),
+        (["status"], True),
+        (["task", "list"], False),
+        (["compaction", "snapshot", "list"], False),
+        (["--version"], False),
+        ([], False),
+    ])
+    def test_is_served(self, argv, served):
+        assert client.is_served(argv) is served
+
+    def test_no_daemon_falls_back(self, project):
+        assert client.forward(["session", "check"]) is None
+
+    def test_socket_path_is_short_and_per_project(self, project, tmp_path_factory):
+        other = tmp_path_factory.mktemp("other")
+        assert client.socket_path(project) != client.socket_path(other)
+        assert len(str(client.socket_path(project))) < 100
+
+    def test_no_daemon_skips_build_key(self, project, monkeypatch):
+        def fail():
+            raise AssertionError("build_key computed without a daemon")
+
+        monkeypatch.setattr(client, "build_key", fail)
+        assert client.forward(["session", "check"]) is None
+
+    def test_installed_version(self, tmp_path):
+        assert client._installed_version(tmp_path) == ""
+        (tmp_path / "bpsai_pair.egg-info").mkdir()
+        (tmp_path / "bpsai_pair.egg-info" / "PKG-INFO").write_text("Name: bpsai-pair\nVersion: 2.9.3\n")
+        assert client._installed_version(tmp_path) == "2.9.3"
+        (tmp_path / "bpsai_pair-3.0.0.dist-info").mkdir()
+        assert client._installed_version(tmp_path) == "3.0.0"
+
+    def test_source_fingerprint_tracks_any_module(self, tmp_path):
+        import os
+
+        (tmp_path / "pkg" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "cli.py").write_text("")
+        module = tmp_path / "pkg" / "module.py"
+        module.write_text("")
+        (tmp_path / "pkg" / "__pycache__" / "stale.py").write_text("")
+        before = client._source_fingerprint(tmp_path)
+        assert before[1] == 2
+
+        os.utime(module, ns=(before[0] + 10**9, before[0] + 10**9))
+        assert client._source_fingerprint(tmp_path) == (before[0] + 10**9, 2)
+
+
+class TestDaemon:
+    def test_forwards_command_output(self, daemon, capsys):
+        assert client.forward(["session", "check", "--force"]) == 0
+        out = capsys.readouterr().out
+        assert "Ship the daemon" in out
+        assert daemon.requests == 1
+
+    def test_exit_code_and_stderr(self, daemon, capsys):
+        assert client.forward(["status", "--no-such-option"]) == 2
+        assert "No such option" in capsys.readouterr().err
+
+    def test_runs_in_client_cwd_and_env(self, daemon, project, monkeypatch):
+        monkeypatch.setenv("BPSAI_DAEMON_TEST", "1")
+        subdir = project / "src"
+        subdir.mkdir()
+        monkeypatch.chdir(subdir)
+
+        seen = {}
+
+        def fake_app(args, prog_name):
+            import os
+            seen.update(cwd=os.getcwd(), env=os.environ.get("BPSAI_DAEMON_TEST"))
+
+        monkeypatch.setattr("bpsai_pair.cli.app", fake_app)
+        assert client.forward(["status"]) == 0
+        assert seen == {"cwd": str(subdir), "env": "1"}
+
+    def test_out_of_date_daemon_is_not_used(self, daemon, monkeypatch):
+        monkeypatch.setattr(client, "build_key", lambda: [0, 0])
+        assert client.forward(["session", "check"]) is None
+        assert daemon.requests == 0
+
+    def test_ping_and_second_daemon(self, daemon, project):
+        reply = client.request(project, {"op": "ping"})
+        assert reply["root"] == str(project.resolve())
+        with pytest.raises(DaemonError):
+            DaemonServer(project).bind()
+
+
+def test_daemon_commands_without_daemon(project):
+    from typer.testing import CliRunner
+    from bpsai_pair.cli import app
+
+    result = CliRunner().invoke(app, ["daemon", "status", "--json"])
+    assert result.exit_code == 0
+    assert '"running": false' in result.output
+
+    result = CliRunner().invoke(app, ["daemon", "stop"])
+    assert "No daemon running" in result.output
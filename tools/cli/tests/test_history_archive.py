@@ -0,0 +1,208 @@
+"""Tests for history log compaction and gzip archival."""
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from bpsai_pair.core.history import (
+    CompactionPolicy,
+    HistoryArchive,
+    line_time,
+    maybe_compact,
+)
+from bpsai_pair.metrics.collector import MetricsCollector
+from bpsai_pair.metrics.timelog import TimeIndexedLog
+from bpsai_pair.skills.suggestion import HistoryParser
+
+NOW = datetime(2025, 3, 15, 12, 0)
+
+
+def _write_completions(path, start, count, step=timedelta(days=1)):
+    log = TimeIndexedLog(path, "completed_at")
+    log.append_many(
+        {"task_id": f"T{i}", "completed_at": (start + step * i).isoformat()}
+        for i in range(count)
+    )
+    return log
+
+
+@pytest.fixture
+def history_dir(tmp_path):
+    path = tmp_path / ".paircoder" / "history"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestLineTime:
+    def test_json_and_text_lines(self):
+        assert line_time(b'{"timestamp": "2025-01-02T03:04:05Z"}\n') == datetime(2025, 1, 2, 3, 4, 5)
+        assert line_time(b'{"completed_at": "2025-01-02T00:00:00+00:00"}') == datetime(2025, 1, 2)
+        assert line_time(b"2025-01-02T10:00:00 session_start id=abc\n") == datetime(2025, 1, 2, 10)
+        assert line_time(b"not a timestamp") is None
+        assert line_time(b"{broken") is None
+
+
+class TestCompaction:
+    def test_age_prefix_is_archived(self, history_dir):
+        log = _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+
+        result = HistoryArchive(history_dir).compact(CompactionPolicy(max_age_days=30), now=NOW)
+
+        assert len(result.segments) == 1
+        segment = result.segments[0]
+        assert segment.file == "task-completions.0001.jsonl.gz"
+        assert segment.end < (NOW - timedelta(days=30)).isoformat()
+        live = [json.loads(line) for line in log.path.read_text().splitlines()]
+        assert segment.lines + len(live) == 60
+        # Records come back in order, archived ones first
+        assert [r["task_id"] for r in log.read()] == [f"T{i}" for i in range(60)]
+
+    def test_size_limit(self, history_dir):
+        log = _write_completions(history_dir / "task-completions.jsonl", NOW - timedelta(hours=200),
+                                 200, step=timedelta(hours=1))
+
+        HistoryArchive(history_dir).compact(CompactionPolicy(max_bytes=1000), now=NOW)
+
+        assert log.path.stat().st_size <= 1000
+        assert len(list(log.read())) == 200
+
+    def test_range_reads_skip_cold_segments(self, history_dir):
+        log = _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+        archive = HistoryArchive(history_dir)
+        archive.compact(CompactionPolicy(max_age_days=30), now=NOW)
+
+        with patch.object(HistoryArchive, "read_segment", side_effect=AssertionError):
+            recent = list(log.read(start=datetime(2025, 2, 25)))
+        assert recent
+        assert len(list(log.read(end=datetime(2025, 1, 5)))) == 5
+
+    def test_past_metrics_months_archived_whole(self, history_dir):
+        for month in ("01", "03"):
+            event = {
+                "timestamp": f"2025-{month}-10T10:00:00", "session_id": "s", "task_id": "T1",
+                "agent": "claude-code", "model": "m", "operation": "invoke",
+                "tokens": {"input": 10, "output": 5}, "cost_usd": 0.5, "success": True,
+            }
+            (history_dir / f"metrics-2025-{month}.jsonl").write_text(json.dumps(event) + "\n")
+        MetricsCollector(history_dir).aggregate()  # build the sidecars
+
+        result = HistoryArchive(history_dir).compact(CompactionPolicy(), now=NOW)
+
+        assert [s.log for s in result.segments] == ["metrics-2025-01.jsonl"]
+        assert result.segments[0].whole
+        assert not (history_dir / "metrics-2025-01.jsonl").exists()
+        assert (history_dir / "metrics-2025-03.jsonl").exists()
+
+        fresh = MetricsCollector(history_dir)
+        assert len(fresh.query_events()) == 2
+        assert len(fresh._scan_events()) == 2
+        assert fresh.rollup(datetime(2025, 1, 10), period="month")["cost_usd"] == 0.5
+        fresh.store.rebuild()
+        assert fresh.aggregate()["cost_usd"] == 1.0
+
+    def test_recreated_past_month_archived_again(self, history_dir):
+        log = history_dir / "metrics-2025-01.jsonl"
+        archive = HistoryArchive(history_dir)
+        for day in ("10", "20"):
+            event = {
+                "timestamp": f"2025-01-{day}T10:00:00", "session_id": "s", "task_id": "T1",
+                "agent": "claude-code", "model": "m", "operation": "invoke",
+                "tokens": {"input": 10, "output": 5}, "cost_usd": 0.5, "success": True,
+            }
+            log.write_text(json.dumps(event) + "\n")
+            archive.compact(CompactionPolicy(), now=NOW)
+
+        assert [s.file for s in archive.segments()] == [
+            "metrics-2025-01.0001.jsonl.gz",
+            "metrics-2025-01.0002.jsonl.gz",
+        ]
+        fresh = MetricsCollector(history_dir)
+        assert len(fresh.query_events()) == 2
+        assert fresh.aggregate()["cost_usd"] == 1.0
+
+    def test_dry_run_changes_nothing(self, history_dir):
+        log = _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+        before = log.path.read_bytes()
+
+        result = HistoryArchive(history_dir).compact(CompactionPolicy(), now=NOW, dry_run=True)
+
+        assert result.segments
+        assert log.path.read_bytes() == before
+        assert not (history_dir / "archive").exists()
+
+    def test_repeat_compaction_numbers_segments(self, history_dir):
+        log = _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+        archive = HistoryArchive(history_dir)
+        archive.compact(CompactionPolicy(max_age_days=30), now=NOW)
+        archive.compact(CompactionPolicy(max_age_days=10), now=NOW)
+
+        assert [s.file for s in archive.segments()] == [
+            "task-completions.0001.jsonl.gz",
+            "task-completions.0002.jsonl.gz",
+        ]
+        assert len(list(log.read())) == 60
+
+    def test_failed_truncate_rolls_back_segment(self, history_dir):
+        log = _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+        archive = HistoryArchive(history_dir)
+
+        with patch.object(HistoryArchive, "_truncate", side_effect=OSError("disk full")):
+            result = archive.compact(CompactionPolicy(max_age_days=30), now=NOW)
+
+        assert not result.segments
+        assert archive.segments() == []
+        assert not (archive.archive_dir / "task-completions.0001.jsonl.gz").exists()
+        assert len(list(log.read())) == 60
+
+    def test_other_history_files_left_alone(self, history_dir):
+        gaps = history_dir / "skill-gaps.jsonl"
+        gaps.write_text('{"timestamp": "2020-01-01T00:00:00"}\n')
+
+        assert not HistoryArchive(history_dir).compact(CompactionPolicy(), now=NOW).segments
+        assert gaps.exists()
+
+
+class TestReaders:
+    def test_history_parser_reads_archived_sessions(self, history_dir):
+        lines = [f"{(datetime(2025, 1, 1) + timedelta(days=i)).isoformat()} session_start id=s{i}"
+                 for i in range(60)]
+        (history_dir / "sessions.log").write_text("\n".join(lines) + "\n")
+        HistoryArchive(history_dir).compact(CompactionPolicy(max_age_days=30), now=NOW)
+
+        parser = HistoryParser(history_dir=history_dir)
+        assert [s["id"] for s in parser.get_sessions()] == [f"s{i}" for i in range(60)]
+
+
+class TestAutoCompact:
+    def _config(self, tmp_path, enabled):
+        (tmp_path / ".paircoder" / "config.yaml").write_text(
+            f"history:\n  auto_compact: {str(enabled).lower()}\n  max_age_days: 30\n"
+        )
+
+    def test_disabled_by_default(self, tmp_path, history_dir):
+        _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+        assert maybe_compact(tmp_path / ".paircoder", now=NOW) is None
+
+    def test_runs_at_most_daily(self, tmp_path, history_dir):
+        self._config(tmp_path, True)
+        _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+
+        assert maybe_compact(tmp_path / ".paircoder", now=NOW).segments
+        assert maybe_compact(tmp_path / ".paircoder", now=NOW + timedelta(hours=1)) is None
+        assert maybe_compact(tmp_path / ".paircoder", now=NOW + timedelta(days=2)) is not None
+
+
+class TestCompactCommand:
+    def test_compact_json(self, tmp_path, history_dir):
+        from bpsai_pair.commands.history import app
+
+        _write_completions(history_dir / "task-completions.jsonl", datetime(2025, 1, 1), 60)
+        with patch("bpsai_pair.commands.history.repo_root", return_value=tmp_path):
+            result = CliRunner().invoke(app, ["compact", "--max-age-days", "0", "--json"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["segments"][0]["lines"] == 60
+        assert not (history_dir / "task-completions.jsonl").read_bytes()
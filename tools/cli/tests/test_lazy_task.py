@@ -0,0 +1,122 @@
+"""Tests for frontmatter-only task loading."""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.planning.models import LazyTask, TaskStatus
+from bpsai_pair.planning.parser import (
+    TaskParser,
+    parse_frontmatter,
+    read_frontmatter,
+    read_task_body,
+)
+
+
+TASK_CONTENT = """---
+id: T1.1
+title: Lazy task
+plan: plan-2025-01-feature
+status: in_progress
+priority: P0
+---
+
+# Objective
+
+Do the thing.
+"""
+
+
+@pytest.fixture
+def task_file(tmp_path: Path) -> Path:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    path = tasks_dir / "T1.1.task.md"
+    path.write_text(TASK_CONTENT, encoding="utf-8")
+    return path
+
+
+class TestReadFrontmatter:
+    """Tests for read_frontmatter / read_task_body."""
+
+    def test_matches_parse_frontmatter(self, task_file):
+        """Streaming read agrees with the full-content parser."""
+        expected, body = parse_frontmatter(TASK_CONTENT)
+        assert read_frontmatter(task_file) == expected
+        assert read_task_body(task_file) == body
+
+    def test_stops_at_closing_delimiter(self, task_file):
+        """Content far past the closing --- is never read."""
+        with task_file.open("ab") as f:
+            f.write(b"x" * 100_000 + b"\n\xff\xfe invalid utf-8\n")
+
+        assert read_frontmatter(task_file)["id"] == "T1.1"
+
+    def test_no_frontmatter(self, tmp_path):
+        """Files without frontmatter yield an empty dict."""
+        path = tmp_path / "plain.md"
+        path.write_text("# Just markdown\n", encoding="utf-8")
+        assert read_frontmatter(path) == {}
+
+    def test_unterminated_frontmatter(self, tmp_path):
+        """A missing closing delimiter is not treated as frontmatter."""
+        path = tmp_path / "broken.md"
+        path.write_text("---\nid: T1\n", encoding="utf-8")
+        assert read_frontmatter(path) == {}
+
+    def test_invalid_yaml(self, tmp_path):
+        """Invalid YAML yields an empty dict."""
+        path = tmp_path / "bad.md"
+        path.write_text("---\nid: [unclosed\n---\nbody\n", encoding="utf-8")
+        assert read_frontmatter(path) == {}
+
+
+class TestLazyTask:
+    """Tests for lazy TaskParser mode."""
+
+    def test_lazy_parse_defers_body(self, task_file):
+        """Lazy parse reads metadata now and the body on first access."""
+        parser = TaskParser(task_file.parent)
+        task = parser.parse(task_file, lazy=True)
+
+        assert isinstance(task, LazyTask)
+        assert task.status == TaskStatus.IN_PROGRESS
+        assert task.priority == "P0"
+        assert not task.body_loaded
+
+        with patch("bpsai_pair.planning.parser.read_task_body",
+                   return_value="# Objective") as mock_body:
+            assert task.body == "# Objective"
+            assert task.body == "# Objective"
+            mock_body.assert_called_once_with(task_file)
+        assert task.body_loaded
+
+    def test_lazy_body_matches_eager(self, task_file):
+        """Materialized body equals the eagerly parsed body."""
+        parser = TaskParser(task_file.parent)
+        assert parser.parse(task_file, lazy=True).body == parser.parse(task_file).body
+
+    def test_body_assignment(self, task_file):
+        """Assigning body replaces the deferred value."""
+        task = TaskParser(task_file.parent).parse(task_file, lazy=True)
+        task.body = "new body"
+        assert task.body_loaded
+        assert task.body == "new body"
+
+    def test_save_materializes_body(self, task_file):
+        """Saving a lazy task keeps its original body."""
+        parser = TaskParser(task_file.parent)
+        task = parser.parse(task_file, lazy=True)
+        task.status = TaskStatus.DONE
+        parser.save(task)
+
+        reloaded = parser.parse(task_file)
+        assert reloaded.status == TaskStatus.DONE
+        assert "Do the thing." in reloaded.body
+
+    def test_parse_all_lazy(self, task_file):
+        """parse_all(lazy=True) returns lazy tasks."""
+        tasks = TaskParser(task_file.parent).parse_all(lazy=True)
+        assert len(tasks) == 1
+        assert isinstance(tasks[0], LazyTask)
+        assert not tasks[0].body_loaded
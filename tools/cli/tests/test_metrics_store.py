@@ -0,0 +1,301 @@
+"""Tests for the columnar metrics rollup store."""
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.metrics.collector import MetricsCollector
+from bpsai_pair.metrics.reports import MetricsReporter
+from bpsai_pair.metrics.store import MetricsStore, MonthStore, aggregate_events
+
+
+def _event(ts: str, task_id="T1", session_id="s1", agent="claude-code",
+           model="sonnet", cost=1.0, success=True) -> dict:
+    return {
+        "timestamp": ts,
+        "session_id": session_id,
+        "task_id": task_id,
+        "agent": agent,
+        "model": model,
+        "operation": "invoke",
+        "tokens": {"input": 100, "output": 50, "total": 150},
+        "cost_usd": cost,
+        "duration_ms": 1000,
+        "success": success,
+        "error": None,
+    }
+
+
+def _write(log: Path, *events: dict) -> None:
+    with open(log, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> Path:
+    history = tmp_path / "history"
+    history.mkdir()
+    _write(
+        history / "metrics-2025-01.jsonl",
+        _event("2025-01-05T10:00:00", task_id="T1"),
+        _event("2025-01-05T12:00:00", task_id="T2", agent="codex-cli", success=False),
+        _event("2025-01-20T09:00:00Z", task_id=None, session_id="s2"),
+    )
+    _write(
+        history / "metrics-2025-02.jsonl",
+        _event("2025-02-01T08:00:00", task_id="T1", model="opus", cost=2.5),
+    )
+    return history
+
+
+class TestMetricsStore:
+    def test_sidecar_per_month(self, history):
+        store = MetricsStore(history)
+        assert len(store.events()) == 4
+        assert (history / "metrics-2025-01.db").exists()
+        assert (history / "metrics-2025-02.db").exists()
+
+    def test_time_range_query(self, history):
+        store = MetricsStore(history)
+        events = store.events(datetime(2025, 1, 5), datetime(2025, 1, 5, 23, 59, 59))
+        assert [e.task_id for e in events] == ["T1", "T2"]
+
+        events = store.events(start=datetime(2025, 1, 10))
+        assert [e.timestamp for e in events] == ["2025-01-20T09:00:00Z", "2025-02-01T08:00:00"]
+
+    def test_task_and_session_queries(self, history):
+        store = MetricsStore(history)
+        assert len(store.events(task_id="T1")) == 2
+        assert [e.task_id for e in store.events(session_id="s2")] == [None]
+
+    def test_aggregate_matches_python(self, history):
+        store = MetricsStore(history)
+        events = store.events()
+        for group_by in (None, "agent", "model", "task_id", "session"):
+            assert store.aggregate(group_by=group_by) == aggregate_events(events, group_by)
+
+        by_task = store.aggregate(group_by="task")
+        assert by_task["T1"]["cost_usd"] == 3.5
+        assert by_task["unknown"]["events"] == 1
+        assert store.aggregate()["failed"] == 1
+
+    def test_unknown_dimension(self, history):
+        with pytest.raises(ValueError):
+            MetricsStore(history).aggregate(group_by="colour")
+
+    def test_incremental_sync_reads_tail(self, history):
+        log = history / "metrics-2025-01.jsonl"
+        store = MetricsStore(history)
+        assert store.sync(log) == 3
+        assert store.sync(log) == 0
+
+        _write(log, _event("2025-01-21T09:00:00"))
+        assert store.sync(log) == 1
+        assert len(store.events(task_id="T1")) == 3
+
+    def test_partial_line_left_for_next_sync(self, history):
+        log = history / "metrics-2025-01.jsonl"
+        store = MetricsStore(history)
+        line = json.dumps(_event("2025-01-22T09:00:00", task_id="T9"))
+        with open(log, "a") as f:
+            f.write(line[:20])
+        assert store.events(task_id="T9") == []
+
+        with open(log, "a") as f:
+            f.write(line[20:] + "\n")
+        assert len(store.events(task_id="T9")) == 1
+
+    def test_rewritten_log_is_reingested(self, history):
+        log = history / "metrics-2025-01.jsonl"
+        store = MetricsStore(history)
+        store.events()
+
+        log.write_text(json.dumps(_event("2025-01-30T09:00:00", task_id="T7")) + "\n")
+        assert [e.task_id for e in store.events(start=datetime(2025, 1, 1), end=datetime(2025, 1, 31))] == ["T7"]
+
+    def test_malformed_lines_skipped(self, history):
+        log = history / "metrics-2025-01.jsonl"
+        with open(log, "a") as f:
+            f.write("{not json\n")
+        assert len(MetricsStore(history).events()) == 4
+
+    def test_rebuild(self, history):
+        store = MetricsStore(history)
+        store.events()
+        assert store.rebuild() == 4
+
+
+class TestCollectorIntegration:
+    def test_record_keeps_sidecar_current(self, tmp_path):
+        collector = MetricsCollector(tmp_path)
+        collector.record_invocation(
+            agent="claude-code", model="test",
+            input_tokens=100, output_tokens=50, duration_ms=10, task_id="T1",
+        )
+
+        db = MonthStore(collector._current_log)
+        conn = db.connect()
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+    def test_reporter_uses_store(self, history):
+        reporter = MetricsReporter(MetricsCollector(history))
+
+        task = reporter.get_task_metrics("T1")
+        assert task["events"] == 2
+        assert set(task["by_agent"]) == {"claude-code"}
+
+        breakdown = reporter.get_breakdown("model")
+        assert breakdown["opus"]["cost_usd"] == 2.5
+        assert reporter.get_session_metrics("s2")["events"] == 1
+
+
+class TestRollups:
+    def test_day_and_month_counters(self, history):
+        store = MetricsStore(history)
+
+        day = store.rollup(datetime(2025, 1, 5, 18, 0), "day")
+        assert day["events"] == 2
+        assert day["failed"] == 1
+        assert store.rollup(datetime(2025, 1, 6), "day") == store.rollup(datetime(2024, 6, 1), "day")
+
+        month = store.rollup(datetime(2025, 1, 31), "month")
+        assert month == store.aggregate(datetime(2025, 1, 1), datetime(2025, 1, 31, 23, 59, 59))
+
+    def test_grouped_counters(self, history):
+        store = MetricsStore(history)
+        by_agent = store.rollup(datetime(2025, 1, 5), "day", group_by="agent")
+        assert set(by_agent) == {"claude-code", "codex-cli"}
+        assert store.rollup(datetime(2025, 2, 1), "month", group_by="model")["opus"]["cost_usd"] == 2.5
+
+        with pytest.raises(ValueError):
+            store.rollup(datetime(2025, 2, 1), "month", group_by="task")
+
+    def test_counters_follow_appends_and_rewrites(self, history):
+        log = history / "metrics-2025-01.jsonl"
+        store = MetricsStore(history)
+        assert store.rollup(datetime(2025, 1, 5), "day")["cost_usd"] == 2.0
+
+        _write(log, _event("2025-01-05T20:00:00", cost=0.5))
+        assert store.rollup(datetime(2025, 1, 5), "day")["cost_usd"] == 2.5
+
+        log.write_text(json.dumps(_event("2025-01-05T09:00:00", cost=0.25)) + "\n")
+        assert store.rollup(datetime(2025, 1, 5), "day")["cost_usd"] == 0.25
+        assert store.rollup(datetime(2025, 1, 1), "month")["events"] == 1
+
+    def test_rebuild_recomputes_counters(self, history):
+        store = MetricsStore(history)
+        before = store.rollup(datetime(2025, 1, 1), "month")
+        conn = MonthStore(history / "metrics-2025-01.jsonl").connect()
+        conn.execute("UPDATE rollups SET cost_usd = 999")
+        conn.close()
+
+        MetricsCollector(history).rebuild_counters()
+        assert store.rollup(datetime(2025, 1, 1), "month") == before
+
+
+class TestBudgetCounters:
+    def test_check_budget_reads_counters(self, tmp_path):
+        from bpsai_pair.metrics.budget import BudgetConfig, BudgetEnforcer
+
+        collector = MetricsCollector(tmp_path)
+        now = datetime.now()
+        _write(
+            collector._get_current_log_path(),
+            _event(now.isoformat(), cost=3.0),
+            _event(datetime(now.year, now.month, 1).isoformat(), cost=4.0),
+        )
+        enforcer = BudgetEnforcer(collector, BudgetConfig(daily_limit_usd=10.0, monthly_limit_usd=20.0))
+
+        with patch.object(collector, "query_events") as query_events:
+            status = enforcer.check_budget()
+        query_events.assert_not_called()
+
+        assert status.monthly_spent == 7.0
+        assert status.daily_spent in (3.0, 7.0)  # 7.0 on the first of the month
+        assert enforcer.can_proceed(15.0)[0] is False
+
+    def test_monthly_totals_fall_back_to_logs(self, tmp_path):
+        collector = MetricsCollector(tmp_path)
+        _write(collector._get_current_log_path(), _event(datetime.now().isoformat(), cost=1.5))
+
+        with patch.object(MetricsStore, "rollup", side_effect=sqlite3.OperationalError("locked")):
+            assert collector.get_monthly_totals()["cost_usd"] == 1.5
+            assert collector.get_daily_totals()["cost_usd"] == 1.5
+
+
+class TestExport:
+    def test_rows_project_columns_and_skip_months(self, history):
+        store = MetricsStore(history)
+        rows = list(store.rows(["task_id", "cost_usd"], start=datetime(2025, 2, 1)))
+        assert rows == [("T1", 2.5)]
+        assert not (history / "metrics-2025-01.db").exists()
+
+    def test_unknown_column(self, history):
+        with pytest.raises(ValueError, match="nope"):
+            list(MetricsStore(history).rows(["timestamp", "nope"]))
+
+    def test_write_csv_streams_rows(self, history):
+        import csv
+        import io
+
+        reporter = MetricsReporter(MetricsCollector(history))
+        out = io.StringIO()
+        count = reporter.write_csv(out, end_date=datetime(2025, 1, 31),
+                                   columns=["task_id", "total_tokens", "success"])
+
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        assert count == 3
+        assert rows[0] == ["task_id", "total_tokens", "success"]
+        assert rows[1:] == [["T1", "150", "True"], ["T2", "150", "False"], ["", "150", "True"]]
+
+    def test_export_csv_matches_event_fields(self, history):
+        content = MetricsReporter(MetricsCollector(history)).export_csv()
+        header, first = content.splitlines()[:2]
+        assert header.startswith("timestamp,session_id,task_id,agent,model")
+        assert first == "2025-01-05T10:00:00,s1,T1,claude-code,sonnet,invoke,100,50,150,1.0,1000,True,"
+
+    def test_write_npz(self, history, tmp_path):
+        import struct
+        import zipfile
+
+        path = tmp_path / "metrics.npz"
+        count = MetricsReporter(MetricsCollector(history)).write_npz(
+            path, columns=["model", "cost_usd"]
+        )
+
+        assert count == 4
+        with zipfile.ZipFile(path) as archive:
+            assert archive.namelist() == ["model.npy", "cost_usd.npy"]
+            data = archive.read("cost_usd.npy")
+            header_len = struct.unpack("<H", data[8:10])[0]
+            assert b"'descr': '<f8'" in data[10:10 + header_len]
+            assert struct.unpack("<4d", data[10 + header_len:]) == (1.0, 1.0, 1.0, 2.5)
+            models = archive.read("model.npy")
+            header_len = struct.unpack("<H", models[8:10])[0]
+            assert (10 + header_len) % 64 == 0
+            body = models[10 + header_len:].decode("utf-32-le")
+            assert [body[i:i + 6].rstrip("\0") for i in range(0, len(body), 6)] == [
+                "sonnet", "sonnet", "sonnet", "opus"
+            ]
+
+    def test_write_npz_timestamps(self, history, tmp_path):
+        import struct
+        import zipfile
+        from datetime import datetime
+
+        path = tmp_path / "metrics.npz"
+        MetricsReporter(MetricsCollector(history)).write_npz(path, columns=["timestamp"])
+
+        with zipfile.ZipFile(path) as archive:
+            data = archive.read("timestamp.npy")
+        header_len = struct.unpack("<H", data[8:10])[0]
+        assert b"'descr': '<M8[us]'" in data[10:10 + header_len]
+        first = struct.unpack_from("<q", data, 10 + header_len)[0]
+        assert first == (datetime(2025, 1, 5, 10) - datetime(1970, 1, 1)).total_seconds() * 1_000_000
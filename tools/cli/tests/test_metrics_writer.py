@@ -0,0 +1,159 @@
+"""Tests for the buffered metrics writer."""
+import gc
+import json
+import threading
+import time
+import weakref
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.metrics import writer as writer_module
+from bpsai_pair.metrics.collector import MetricsCollector
+from bpsai_pair.metrics.velocity import VelocityTracker
+from bpsai_pair.metrics.writer import (
+    MetricsWriter,
+    WriterPolicy,
+    append_locked,
+    shared_writer,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_shared_writer(monkeypatch):
+    monkeypatch.setattr(writer_module, "_shared", None)
+    yield
+    if writer_module._shared is not None:
+        writer_module._shared.close()
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()] if path.exists() else []
+
+
+class TestMetricsWriter:
+    def test_buffers_until_max_records(self, tmp_path):
+        log = tmp_path / "events.jsonl"
+        writer = MetricsWriter(WriterPolicy(max_records=3, max_delay=60))
+
+        writer.append(log, [{"n": 1}])
+        writer.append(log, [{"n": 2}])
+        assert not log.exists()
+        assert writer.pending(log) > 0
+
+        writer.append(log, [{"n": 3}])
+        assert [r["n"] for r in _lines(log)] == [1, 2, 3]
+        assert writer.pending() == 0
+        writer.close()
+
+    def test_flushes_after_delay(self, tmp_path):
+        log = tmp_path / "events.jsonl"
+        writer = MetricsWriter(WriterPolicy(max_delay=0.05))
+
+        writer.append(log, [{"n": 1}])
+        deadline = time.time() + 2
+        while not log.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        assert _lines(log) == [{"n": 1}]
+        writer.close()
+
+    def test_close_flushes(self, tmp_path):
+        log = tmp_path / "events.jsonl"
+        writer = MetricsWriter(WriterPolicy(max_delay=60))
+        writer.append(log, [{"n": 1}])
+        writer.close()
+        assert _lines(log) == [{"n": 1}]
+
+    @pytest.mark.parametrize("policy, fsyncs", [
+        (WriterPolicy(fsync="none", max_records=2), 0),
+        (WriterPolicy(fsync="on-flush", max_records=2), 1),
+        (WriterPolicy(fsync="always", max_records=2), 2),
+    ])
+    def test_fsync_policy(self, tmp_path, policy, fsyncs):
+        writer = MetricsWriter(policy)
+        with patch("bpsai_pair.metrics.writer.os.fsync") as fsync:
+            writer.append(tmp_path / "events.jsonl", [{"n": 1}])
+            writer.append(tmp_path / "events.jsonl", [{"n": 2}])
+        assert fsync.call_count == fsyncs
+        writer.close()
+
+    def test_failed_flush_keeps_records(self, tmp_path):
+        log = tmp_path / "missing" / "events.jsonl"
+        writer = MetricsWriter(WriterPolicy(max_delay=60))
+        writer.append(log, [{"n": 1}])
+
+        writer.flush()
+        assert writer.pending(log) > 0
+
+        log.parent.mkdir()
+        writer.flush()
+        assert _lines(log) == [{"n": 1}]
+        writer.close()
+
+    def test_failed_timer_flush_is_retried(self, tmp_path):
+        log = tmp_path / "missing" / "events.jsonl"
+        writer = MetricsWriter(WriterPolicy(max_delay=0.05))
+        with patch.object(writer_module, "append_locked", wraps=append_locked) as mock_append:
+            writer.append(log, [{"n": 1}])
+            deadline = time.time() + 2
+            while not mock_append.called and time.time() < deadline:
+                time.sleep(0.01)
+            assert writer.pending(log) > 0
+
+            log.parent.mkdir()
+            while not log.exists() and time.time() < deadline + 2:
+                time.sleep(0.01)
+        assert _lines(log) == [{"n": 1}]
+        writer.close()
+
+    def test_unreferenced_writer_is_collected(self):
+        ref = weakref.ref(MetricsWriter())
+        gc.collect()
+        assert ref() is None
+
+    def test_concurrent_appends_do_not_interleave(self, tmp_path):
+        log = tmp_path / "events.jsonl"
+        payload = "x" * 10000
+
+        def worker(n):
+            for i in range(20):
+                append_locked(log, (json.dumps({"n": n, "i": i, "p": payload}) + "\n").encode())
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(_lines(log)) == 80
+
+    def test_policy_from_config(self):
+        policy = WriterPolicy.from_config(
+            {"metrics": {"writer": {"buffered": False, "max_records": 10, "fsync": "always"}}}
+        )
+        assert (policy.buffered, policy.max_records, policy.fsync) == (False, 10, "always")
+        assert WriterPolicy.from_config({"metrics": {"writer": {"fsync": "sometimes"}}}).fsync == "on-flush"
+
+
+class TestRecorders:
+    def test_collector_queries_see_buffered_events(self, tmp_path):
+        writer = shared_writer(WriterPolicy(max_delay=60))
+        collector = MetricsCollector(tmp_path, writer=writer)
+        collector.record_invocation("claude-code", "default", 100, 50, 10)
+
+        assert not list(tmp_path.glob("metrics-*.jsonl"))
+        assert collector.get_daily_totals(datetime.now())["events"] == 1
+
+    def test_velocity_reads_see_buffered_completions(self, tmp_path):
+        writer = shared_writer(WriterPolicy(max_delay=60))
+        tracker = VelocityTracker(tmp_path, writer=writer)
+        tracker.record_completion("T1", complexity=5, sprint="S1")
+
+        assert VelocityTracker(tmp_path).get_points_for_sprint("S1") == 5
+
+    def test_hooks_share_one_writer(self, tmp_path):
+        from bpsai_pair.core.hooks import HookRunner
+
+        runner = HookRunner({"metrics": {"writer": {"max_records": 100}}}, tmp_path)
+        assert runner._metrics_writer() is runner._metrics_writer()
+        assert runner._metrics_writer().policy.max_records == 100
@@ -0,0 +1,116 @@
+"""Tests for the persistent plan index."""
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.planning.parser import PlanParser
+from bpsai_pair.planning.plan_index import PlanIndex, plan_slug
+
+
+def _write_plan(plans_dir: Path, filename: str, plan_id: str, aged: bool = True) -> Path:
+    path = plans_dir / f"{filename}.plan.yaml"
+    path.write_text(f"id: {plan_id}\ntitle: {plan_id}\n", encoding="utf-8")
+    if aged:
+        _age(path)
+    return path
+
+
+def _age(path: Path) -> None:
+    """Backdate past the racy window, so the index trusts the stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**10))
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def plans_dir(tmp_path: Path) -> Path:
+    plans_dir = tmp_path / ".paircoder" / "plans"
+    plans_dir.mkdir(parents=True)
+    _write_plan(plans_dir, "plan-2025-01-alpha", "plan-2025-01-alpha")
+    _write_plan(plans_dir, "beta-renamed", "plan-2025-02-beta")
+    _write_plan(plans_dir, "plan-2025-03-gamma-feature", "plan-2025-03-gamma-feature")
+    _age(plans_dir)
+    return plans_dir
+
+
+class TestPlanIndex:
+    """Tests for PlanIndex."""
+
+    def test_plan_slug(self):
+        assert plan_slug("plan-2025-01-my-feature") == "my-feature"
+        assert plan_slug("short") == "short"
+
+    def test_persists_index(self, plans_dir):
+        PlanIndex(plans_dir).refresh()
+        data = json.loads((plans_dir.parent / "cache" / "plan-index.json").read_text())
+        assert data["files"]["beta-renamed.plan.yaml"]["id"] == "plan-2025-02-beta"
+
+    def test_resolve_exact_filename(self, plans_dir):
+        assert PlanIndex(plans_dir).resolve("plan-2025-01-alpha") == plans_dir / "plan-2025-01-alpha.plan.yaml"
+
+    def test_resolve_by_id_when_filename_differs(self, plans_dir):
+        assert PlanIndex(plans_dir).resolve("plan-2025-02-beta") == plans_dir / "beta-renamed.plan.yaml"
+
+    def test_resolve_by_slug(self, plans_dir):
+        assert PlanIndex(plans_dir).resolve("beta") == plans_dir / "beta-renamed.plan.yaml"
+
+    def test_resolve_partial(self, plans_dir):
+        assert PlanIndex(plans_dir).resolve("gamma") == plans_dir / "plan-2025-03-gamma-feature.plan.yaml"
+
+    def test_resolve_missing(self, plans_dir):
+        assert PlanIndex(plans_dir).resolve("nope") is None
+
+    def test_warm_lookup_parses_nothing(self, plans_dir):
+        PlanIndex(plans_dir).refresh()
+        with patch("bpsai_pair.core.yamlio.load_file") as mock_load:
+            assert PlanIndex(plans_dir).resolve("plan-2025-02-beta") is not None
+            mock_load.assert_not_called()
+
+    def test_recently_written_plan_is_reread(self, plans_dir):
+        """A stat match is not trusted for a plan indexed right after a write."""
+        path = _write_plan(plans_dir, "epsilon", "plan-2025-05-eps1", aged=False)
+        st = path.stat()
+        PlanIndex(plans_dir).refresh()
+
+        # Same size and mtime, new ID
+        _write_plan(plans_dir, "epsilon", "plan-2025-05-eps2", aged=False)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert path.stat().st_size == st.st_size
+
+        assert PlanIndex(plans_dir).resolve("plan-2025-05-eps2") == path
+
+    def test_new_plan_picked_up(self, plans_dir):
+        PlanIndex(plans_dir).refresh()
+        _write_plan(plans_dir, "delta-file", "plan-2025-04-delta")
+        _bump_mtime(plans_dir)
+        assert PlanIndex(plans_dir).resolve("plan-2025-04-delta") == plans_dir / "delta-file.plan.yaml"
+
+    def test_in_place_id_change_detected(self, plans_dir):
+        index = PlanIndex(plans_dir).refresh()
+        path = _write_plan(plans_dir, "beta-renamed", "plan-2025-02-betaprime")
+        _bump_mtime(path)
+
+        assert index.resolve("plan-2025-02-betaprime") == path
+
+
+class TestPlanParserLookup:
+    """Tests for PlanParser.get_plan_by_id via the index."""
+
+    def test_parses_only_matching_plan(self, plans_dir):
+        parser = PlanParser(plans_dir)
+        parser.index.refresh()
+
+        with patch.object(PlanParser, "parse", wraps=parser.parse) as mock_parse:
+            plan = parser.get_plan_by_id("plan-2025-02-beta")
+            assert mock_parse.call_count == 1
+        assert plan.id == "plan-2025-02-beta"
+
+    def test_not_found(self, plans_dir):
+        assert PlanParser(plans_dir).get_plan_by_id("missing") is None
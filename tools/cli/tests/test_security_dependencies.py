@@ -723,3 +723,214 @@ class TestCountPackages:
         count = scanner._count_npm_packages(pkg_file)
 
         assert count == 3
+
+
+# Stand-ins for pip-audit and npm: log each call and report a fixed advisory
+PIP_AUDIT_STUB = '''
+import json, sys
+log, args = sys.argv[1], sys.argv[2:]
+if args == ["--version"]:
+    sys.exit(0)
+text = open(args[args.index("-r") + 1]).read().replace("\\\\\\n", " ")
+reqs = [line.split()[0] for line in text.splitlines() if line.strip() and line[0] not in "#-"]
+with open(log, "a") as f:
+    f.write(json.dumps({"args": args, "requirements": reqs}) + "\\n")
+deps = []
+for req in reqs:
+    name, version = req.split("==")
+    vulns = [{"id": "CVE-2099-0001", "fix_versions": ["9.9"]}] if name == "requests" else []
+    deps.append({"name": name, "version": version, "vulns": vulns})
+print(json.dumps({"dependencies": deps}))
+'''
+
+NPM_STUB = '''
+import json, sys
+log, args = sys.argv[1], sys.argv[2:]
+if args == ["--version"]:
+    sys.exit(0)
+with open(log, "a") as f:
+    f.write(json.dumps({"args": args}) + "\\n")
+print(json.dumps({"vulnerabilities": {"lodash": {
+    "severity": "high", "range": "<4.17.21",
+    "via": [{"title": "Prototype Pollution", "url": "https://github.com/advisories/GHSA-aaaa"}],
+}}}))
+'''
+
+
+def _stub(tmp_path, name, source):
+    import sys
+    script = tmp_path / f"{name}.py"
+    script.write_text(source)
+    log = tmp_path / f"{name}.log"
+    return [sys.executable, str(script), str(log)], log
+
+
+def _calls(log):
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+class TestPackageCache:
+    """Tests for per-package caching with stub audit tools."""
+
+    def test_only_changed_package_is_reaudited(self, tmp_path):
+        """Changing one requirement of a lock file audits only that package."""
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        command, log = _stub(tmp_path, "pip-audit", PIP_AUDIT_STUB)
+        scanner = DependencyScanner(cache_dir=tmp_path / "cache", pip_audit_command=command)
+        header = "# This file is autogenerated by pip-compile with Python 3.11\n"
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text(header + "Flask==2.0.0\nrequests==2.25.0  # http\n")
+
+        vulns, errors = scanner.scan_python(req_file)
+        assert errors == []
+        assert [(v.package, v.version) for v in vulns] == [("requests", "2.25.0")]
+        assert _calls(log)[0]["requirements"] == ["flask==2.0.0", "requests==2.25.0"]
+        assert "--no-deps" in _calls(log)[0]["args"]
+
+        req_file.write_text(header + "Flask==2.0.0\nrequests==2.31.0\n")
+        vulns, errors = scanner.scan_python(req_file)
+        assert _calls(log)[1]["requirements"] == ["requests==2.31.0"]
+        assert [(v.package, v.version) for v in vulns] == [("requests", "2.31.0")]
+
+        # Another file of cached packages needs no audit at all
+        other = tmp_path / "requirements-dev.txt"
+        other.write_text("flask==2.0.0 \\\n    --hash=sha256:abc\n")
+        assert scanner.scan_python(other) == ([], [])
+        assert len(_calls(log)) == 2
+
+    def test_pinned_file_is_resolved_unless_locked(self, tmp_path):
+        """Pins alone may omit dependencies, so pip-audit resolves them."""
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        command, log = _stub(tmp_path, "pip-audit", PIP_AUDIT_STUB)
+        scanner = DependencyScanner(cache_dir=tmp_path / "cache", pip_audit_command=command)
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text("Flask==2.0.0\nrequests==2.25.0\n")
+
+        vulns, errors = scanner.scan_python(req_file)
+        assert errors == []
+        assert [(v.package, v.version) for v in vulns] == [("requests", "2.25.0")]
+        assert str(req_file) in _calls(log)[0]["args"]
+        assert "--no-deps" not in _calls(log)[0]["args"]
+
+        # The resolved packages fill the per-package cache for lock files
+        lock = tmp_path / "requirements.lock"
+        lock.write_text("flask==2.0.0 --hash=sha256:abc\nrequests==2.25.0 --hash=sha256:def\n")
+        vulns, errors = scanner.scan_python(lock)
+        assert [(v.package, v.version) for v in vulns] == [("requests", "2.25.0")]
+        assert len(_calls(log)) == 1
+
+        # Unless told the pinned files are complete
+        locked = DependencyScanner(cache_dir=tmp_path / "cache2", pip_audit_command=command, assume_locked=True)
+        locked.scan_python(req_file)
+        assert "--no-deps" in _calls(log)[1]["args"]
+
+    def test_locked_requirements(self):
+        """Lock files are recognized by hashes or a pip-compile header."""
+        from bpsai_pair.security.dependencies import _locked_requirements
+
+        hashed = "Flask[async]==2.0.0 \\\n    --hash=sha256:aaa \\\n    --hash=sha256:bbb\n"
+        assert _locked_requirements(hashed) == [("flask", "2.0.0")]
+        assert _locked_requirements("flask==2.0.0\n") == []
+        assert _locked_requirements("flask==2.0.0\n", assume_locked=True) == [("flask", "2.0.0")]
+        assert _locked_requirements("# autogenerated by pip-compile\nflask>=2.0\n") == []
+        assert _locked_requirements(hashed + "requests==2.25.0\n") == []
+
+    def test_unpinned_file_is_audited_whole(self, tmp_path):
+        """Files that are not fully pinned go to pip-audit as they are."""
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        command, log = _stub(tmp_path, "pip-audit", PIP_AUDIT_STUB)
+        scanner = DependencyScanner(cache_dir=tmp_path / "cache", pip_audit_command=command)
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text("requests==2.25.0\n-r base.txt\n")
+        (tmp_path / "base.txt").write_text("")
+
+        scanner.scan_python(req_file)
+
+        assert str(req_file) in _calls(log)[0]["args"]
+        assert "--no-deps" not in _calls(log)[0]["args"]
+
+    def test_file_is_hashed_once(self, tmp_path):
+        """A cache miss reads and hashes the file once for lookup and save."""
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        command, _ = _stub(tmp_path, "pip-audit", PIP_AUDIT_STUB)
+        scanner = DependencyScanner(cache_dir=tmp_path / "cache", pip_audit_command=command)
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text("requests==2.25.0\n")
+
+        with patch.object(DependencyScanner, "_get_cache_key", wraps=scanner._get_cache_key) as mock_key:
+            scanner.scan_python(req_file)
+        assert mock_key.call_count == 1
+
+    def test_npm_results_are_cached_per_lock(self, tmp_path):
+        """npm is audited again when package-lock.json changes."""
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        command, log = _stub(tmp_path, "npm", NPM_STUB)
+        scanner = DependencyScanner(cache_dir=tmp_path / "cache", npm_command=command)
+        project = tmp_path / "web"
+        (project / "node_modules").mkdir(parents=True)
+        pkg_file = project / "package.json"
+        pkg_file.write_text('{"dependencies": {"lodash": "^4.17.0"}}')
+        (project / "package-lock.json").write_text(json.dumps({"lockfileVersion": 3, "packages": {
+            "": {"name": "web"},
+            "node_modules/lodash": {"version": "4.17.0"},
+            "node_modules/a/node_modules/lodash": {"version": "4.17.1"},
+        }}))
+
+        first, _ = scanner.scan_npm(pkg_file)
+        second, errors = scanner.scan_npm(pkg_file)
+        assert len(_calls(log)) == 1
+        assert errors == []
+        assert [v.to_dict() for v in second] == [v.to_dict() for v in first]
+
+        # Findings are per name and range, so new versions are re-audited
+        (project / "package-lock.json").write_text(json.dumps({"lockfileVersion": 3, "packages": {
+            "": {"name": "web"},
+            "node_modules/lodash": {"version": "4.17.21"},
+        }}))
+        scanner.scan_npm(pkg_file)
+        assert len(_calls(log)) == 2
+
+
+class TestScanScheduler:
+    """Tests for concurrent audits in scan_all."""
+
+    def test_audits_run_concurrently(self, tmp_path):
+        """Python and npm audits of one project overlap."""
+        import threading
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        (tmp_path / "requirements.txt").write_text("flask==2.0.0\n")
+        (tmp_path / "package.json").write_text('{"dependencies": {}}')
+        barrier = threading.Barrier(2, timeout=5)
+
+        def audit(self, path, use_cache=True):
+            barrier.wait()
+            return [], [f"scanned {path.name}"]
+
+        with patch.object(DependencyScanner, "scan_python", audit), \
+                patch.object(DependencyScanner, "scan_npm", audit):
+            report = DependencyScanner(max_workers=2).scan_all(tmp_path)
+
+        assert report.errors == ["scanned requirements.txt", "scanned package.json"]
+
+    def test_stub_tools_end_to_end(self, tmp_path):
+        """scan_all drives configured tools and caches across runs."""
+        from bpsai_pair.security.dependencies import DependencyScanner
+
+        pip_command, pip_log = _stub(tmp_path, "pip-audit", PIP_AUDIT_STUB)
+        (tmp_path / "requirements.txt").write_text("requests==2.25.0\n")
+
+        scanner = DependencyScanner(cache_dir=tmp_path / "cache", pip_audit_command=pip_command)
+        first = scanner.scan_all(tmp_path)
+        second = DependencyScanner(cache_dir=tmp_path / "cache", pip_audit_command=pip_command).scan_all(tmp_path)
+
+        assert [v.cve_id for v in first.vulnerabilities] == ["CVE-2099-0001"]
+        assert [v.to_dict() for v in second.vulnerabilities] == [v.to_dict() for v in first.vulnerabilities]
+        assert len(_calls(pip_log)) == 1
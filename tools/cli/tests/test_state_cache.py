@@ -0,0 +1,145 @@
+"""Tests for the shared state.md cache."""
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.compaction import CompactionManager
+from bpsai_pair.core import state_cache
+from bpsai_pair.core.state_cache import parse_state, read_state
+from bpsai_pair.planning.state import ProjectState, StateManager
+from bpsai_pair.session import SessionManager
+
+STATE_MD = """# Current State
+
+> Last updated: 2025-01-15
+
+## Active Plan
+
+**Plan:** `plan-2025-01-cache`
+**Status:** in_progress
+**Current Sprint:** sprint-7
+
+## Current Sprint Tasks
+
+| ID | Title | Status |
+|----|-------|--------|
+| T7.1 | Add state cache | in_progress |
+
+**Progress:** 1/3 tasks
+
+## What Was Just Done
+
+- Wrote the parser
+- Added tests
+
+## What's Next
+
+1. Wire up consumers
+2. Ship it
+
+## Blockers
+
+None
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_memo(monkeypatch):
+    monkeypatch.setattr(state_cache, "_memo", {})
+
+
+@pytest.fixture
+def paircoder_dir(tmp_path):
+    context = tmp_path / ".paircoder" / "context"
+    context.mkdir(parents=True)
+    (context / "state.md").write_text(STATE_MD, encoding="utf-8")
+    return tmp_path / ".paircoder"
+
+
+def _age(path, seconds=10):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+class TestParseState:
+    def test_fields(self):
+        summary = parse_state(STATE_MD)
+        assert summary.last_updated == "2025-01-15"
+        assert summary.plan_id == "plan-2025-01-cache"
+        assert summary.sprint_id == "sprint-7"
+        assert summary.what_was_done == ["Wrote the parser", "Added tests"]
+        assert summary.whats_next == ["Wire up consumers", "Ship it"]
+        assert summary.blockers == []
+        assert summary.active_plan == "`plan-2025-01-cache`"
+        assert summary.plan_status == "in_progress"
+        assert (summary.current_task_id, summary.current_task_title) == ("T7.1", "Add state cache")
+        assert summary.progress == "1/3 tasks"
+        assert summary.last_done == "Wrote the parser"
+        assert summary.next_step == "Wire up consumers"
+
+    def test_consumers_agree(self, paircoder_dir):
+        state = StateManager(paircoder_dir).state
+        assert state.active_plan_id == "plan-2025-01-cache"
+        assert state.active_sprint_id == "sprint-7"
+        assert state.last_updated.day == 15
+        assert ProjectState.from_state_md(STATE_MD).whats_next == state.whats_next
+
+        context = SessionManager(paircoder_dir).get_context()
+        assert context.current_task_id == "T7.1"
+        assert context.whats_next == "Wire up consumers"
+
+        snapshot = CompactionManager(paircoder_dir)._create_snapshot_from_state(None, "auto")
+        assert snapshot.current_task_title == "Add state cache"
+        assert snapshot.progress == "1/3 tasks"
+
+
+class TestReadState:
+    def test_missing(self, tmp_path):
+        assert read_state(tmp_path / "context" / "state.md") is None
+
+    def test_parses_once_per_process(self, paircoder_dir):
+        state_path = paircoder_dir / "context" / "state.md"
+        with patch("bpsai_pair.core.state_cache.parse_state", wraps=parse_state) as parse:
+            StateManager(paircoder_dir).load_state()
+            SessionManager(paircoder_dir).get_context()
+            CompactionManager(paircoder_dir)._create_snapshot_from_state(None, "manual")
+            read_state(state_path)
+        assert parse.call_count == 1
+
+    def test_persisted_cache_skips_parse(self, paircoder_dir):
+        state_path = paircoder_dir / "context" / "state.md"
+        _age(state_path)
+        read_state(state_path)
+        assert (paircoder_dir / "cache" / "state-summary.json").exists()
+
+        state_cache._memo.clear()  # a new process
+        with patch("bpsai_pair.core.state_cache.parse_state") as parse, \
+                patch.object(type(state_path), "read_bytes") as read_bytes:
+            assert read_state(state_path).sprint_id == "sprint-7"
+        parse.assert_not_called()
+        read_bytes.assert_not_called()
+
+    def test_recent_write_checks_hash(self, paircoder_dir):
+        state_path = paircoder_dir / "context" / "state.md"
+        read_state(state_path)
+
+        # Same size, same mtime: only the hash can tell
+        st = state_path.stat()
+        state_path.write_text(STATE_MD.replace("sprint-7", "sprint-8"), encoding="utf-8")
+        os.utime(state_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert read_state(state_path).sprint_id == "sprint-8"
+
+    def test_edit_invalidates(self, paircoder_dir):
+        state_path = paircoder_dir / "context" / "state.md"
+        _age(state_path)
+        read_state(state_path)
+
+        state_path.write_text(STATE_MD + "\n## Blockers\n\n- Waiting on review\n", encoding="utf-8")
+        state_cache._memo.clear()
+        assert read_state(state_path).sprint_id == "sprint-7"
+        data = json.loads((paircoder_dir / "cache" / "state-summary.json").read_text())
+        assert data["size"] == state_path.stat().st_size
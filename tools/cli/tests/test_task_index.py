@@ -0,0 +1,232 @@
+"""Tests for the persistent task index."""
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.planning.models import Task, TaskStatus
+from bpsai_pair.planning.parser import TaskParser
+from bpsai_pair.planning.state import StateManager
+from bpsai_pair.planning.task_index import TaskIndex
+
+
+def _write_task(tasks_dir: Path, task_id: str, plan: str = "plan-2025-01-feature",
+                status: str = "pending", priority: str = "P1", sprint: str = "sprint-1",
+                aged: bool = True) -> Path:
+    path = tasks_dir / f"{task_id}.task.md"
+    path.write_text(
+        "---\n"
+        f"id: {task_id}\n"
+        f"title: Task {task_id}\n"
+        f"plan: {plan}\n"
+        f"status: {status}\n"
+        f"priority: {priority}\n"
+        f"sprint: {sprint}\n"
+        "complexity: 30\n"
+        "depends_on: []\n"
+        "---\n\n"
+        f"# Objective\n\nBody of {task_id}\n",
+        encoding="utf-8",
+    )
+    if aged:
+        # Older than the racy window, so the index trusts its stat
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**10))
+    return path
+
+
+@pytest.fixture
+def paircoder_dir(tmp_path: Path) -> Path:
+    paircoder_dir = tmp_path / ".paircoder"
+    (paircoder_dir / "tasks").mkdir(parents=True)
+    return paircoder_dir
+
+
+class TestTaskIndex:
+    """Tests for TaskIndex."""
+
+    def test_builds_index_file(self, paircoder_dir):
+        """Refreshing writes the index under .paircoder/cache."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+
+        index = TaskIndex(tasks_dir).refresh()
+
+        index_path = paircoder_dir / "cache" / "task-index.json"
+        assert index_path.exists()
+        data = json.loads(index_path.read_text())
+        record = data["files"]["T1.1.task.md"]
+        assert record["task"]["id"] == "T1.1"
+        assert record["task"]["plan_id"] == "plan-2025-01-feature"
+        assert [e.id for e in index.entries()] == ["T1.1"]
+
+    def test_unchanged_files_are_not_reparsed(self, paircoder_dir):
+        """A second process reuses persisted entries for unchanged files."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+        _write_task(tasks_dir, "T1.2")
+        TaskIndex(tasks_dir).refresh()
+
+        with patch("bpsai_pair.planning.parser.read_frontmatter") as mock_parse:
+            index = TaskIndex(tasks_dir).refresh()
+            mock_parse.assert_not_called()
+        assert [e.id for e in index.entries()] == ["T1.1", "T1.2"]
+
+    def test_changed_file_is_reindexed(self, paircoder_dir):
+        """Only the modified file is parsed again."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+        path = _write_task(tasks_dir, "T1.2")
+        TaskIndex(tasks_dir).refresh()
+
+        _write_task(tasks_dir, "T1.2", status="done")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        from bpsai_pair.planning import parser
+        with patch("bpsai_pair.planning.parser.read_frontmatter",
+                   wraps=parser.read_frontmatter) as mock_parse:
+            index = TaskIndex(tasks_dir).refresh()
+            assert mock_parse.call_count == 1
+
+        assert index.find("T1.2").task_status == TaskStatus.DONE
+
+    def test_recently_written_file_is_reparsed(self, paircoder_dir):
+        """A stat match is not trusted for a file indexed right after a write."""
+        tasks_dir = paircoder_dir / "tasks"
+        path = _write_task(tasks_dir, "T1.1", aged=False)
+        st = path.stat()
+        TaskIndex(tasks_dir).refresh()
+
+        # Same size and mtime, new content
+        _write_task(tasks_dir, "T1.1", status="blocked", aged=False)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert path.stat().st_size == st.st_size
+
+        assert TaskIndex(tasks_dir).refresh().find("T1.1").task_status == TaskStatus.BLOCKED
+
+    def test_deleted_file_is_dropped(self, paircoder_dir):
+        """Entries for removed task files disappear."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+        path = _write_task(tasks_dir, "T1.2")
+        TaskIndex(tasks_dir).refresh()
+
+        path.unlink()
+        index = TaskIndex(tasks_dir).refresh()
+
+        assert index.find("T1.2") is None
+        assert [e.id for e in index.entries()] == ["T1.1"]
+
+    def test_corrupt_index_is_rebuilt(self, paircoder_dir):
+        """An unreadable index file is ignored and replaced."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+        index_path = paircoder_dir / "cache" / "task-index.json"
+        index_path.parent.mkdir()
+        index_path.write_text("{not json")
+
+        index = TaskIndex(tasks_dir).refresh()
+
+        assert index.find("T1.1") is not None
+        assert json.loads(index_path.read_text())["version"] == 2
+
+    def test_loaded_index_is_reused_in_process(self, paircoder_dir):
+        """The index file is re-read only after another process rewrites it."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+        TaskIndex(tasks_dir).refresh()
+
+        with patch("bpsai_pair.planning.task_index.json.loads") as mock_loads:
+            assert TaskIndex(tasks_dir).refresh().find("T1.1") is not None
+            mock_loads.assert_not_called()
+
+        index_path = paircoder_dir / "cache" / "task-index.json"
+        data = json.loads(index_path.read_text())
+        data["files"]["T1.1.task.md"]["task"]["title"] = "Renamed elsewhere"
+        index_path.write_text(json.dumps(data))
+        st = index_path.stat()
+        os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert TaskIndex(tasks_dir).refresh().find("T1.1").title == "Renamed elsewhere"
+
+    def test_query_filters(self, paircoder_dir):
+        """Query filters by plan, status and sprint."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1", status="done")
+        _write_task(tasks_dir, "T1.2", sprint="sprint-2")
+        _write_task(tasks_dir, "T2.1", plan="plan-2025-02-other")
+
+        index = TaskIndex(tasks_dir).refresh()
+
+        assert [e.id for e in index.query(plan_slug="feature")] == ["T1.1", "T1.2"]
+        assert [e.id for e in index.query(plan_id="plan-2025-02-other")] == ["T2.1"]
+        assert [e.id for e in index.query(status=TaskStatus.DONE)] == ["T1.1"]
+        assert [e.id for e in index.query(sprint="sprint-2")] == ["T1.2"]
+
+
+class TestTaskParserIndex:
+    """Tests for index-backed TaskParser queries."""
+
+    def test_list_tasks_by_plan_uses_index(self, paircoder_dir):
+        """Plan filtering does not parse task files."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1")
+        _write_task(tasks_dir, "T2.1", plan="plan-2025-02-other")
+        parser = TaskParser(tasks_dir)
+        parser.index  # warm
+
+        with patch.object(TaskParser, "parse") as mock_parse:
+            paths = parser.list_tasks("feature")
+            mock_parse.assert_not_called()
+        assert paths == [tasks_dir / "T1.1.task.md"]
+
+    def test_metadata_only_tasks(self, paircoder_dir):
+        """metadata_only builds tasks without reading bodies up front."""
+        tasks_dir = paircoder_dir / "tasks"
+        _write_task(tasks_dir, "T1.1", status="in_progress")
+
+        tasks = TaskParser(tasks_dir).get_tasks_for_plan("plan-2025-01-feature", metadata_only=True)
+
+        assert len(tasks) == 1
+        assert isinstance(tasks[0], Task)
+        assert tasks[0].status == TaskStatus.IN_PROGRESS
+        assert tasks[0].source_path == tasks_dir / "T1.1.task.md"
+        assert not tasks[0].body_loaded
+        assert "Body of T1.1" in tasks[0].body
+
+    def test_get_task_by_id_parses_single_file(self, paircoder_dir):
+        """Lookup by ID parses only the matching file."""
+        tasks_dir = paircoder_dir / "tasks"
+        for i in range(5):
+            _write_task(tasks_dir, f"T1.{i}")
+        parser = TaskParser(tasks_dir)
+
+        with patch.object(TaskParser, "parse", wraps=parser.parse) as mock_parse:
+            task = parser.get_task_by_id("T1.3")
+            assert mock_parse.call_count == 1
+        assert task.id == "T1.3"
+        assert "Body of T1.3" in task.body
+
+    def test_state_manager_next_task(self, paircoder_dir):
+        """StateManager picks the next task from the index."""
+        tasks_dir = paircoder_dir / "tasks"
+        (paircoder_dir / "context").mkdir()
+        (paircoder_dir / "context" / "state.md").write_text(
+            "**Plan:** `plan-2025-01-feature`\n"
+        )
+        (paircoder_dir / "plans").mkdir()
+        (paircoder_dir / "plans" / "plan-2025-01-feature.plan.yaml").write_text(
+            "id: plan-2025-01-feature\ntitle: Feature\n"
+        )
+        _write_task(tasks_dir, "T1.1", status="done", priority="P0")
+        _write_task(tasks_dir, "T1.2", priority="P2")
+        _write_task(tasks_dir, "T1.3", priority="P0")
+
+        manager = StateManager(paircoder_dir)
+        task = manager.get_next_task()
+
+        assert task.id == "T1.3"
+        assert manager.get_status_summary()["task_counts"]["pending"] == 2
@@ -0,0 +1,121 @@
+"""Tests for the time-indexed append-only JSONL log."""
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair.metrics.burndown import BurndownGenerator, SprintConfig
+from bpsai_pair.metrics.store import to_epoch
+from bpsai_pair.metrics.timelog import TimeIndexedLog
+from bpsai_pair.metrics.velocity import VelocityTracker
+
+
+def _records(start: datetime, count: int, step=timedelta(hours=1)):
+    return [
+        {"task_id": f"T{i}", "completed_at": (start + step * i).isoformat()}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = TimeIndexedLog(tmp_path / "events.jsonl", "completed_at", block_lines=10)
+    log.append_many(_records(datetime(2025, 1, 1), 100))
+    return log
+
+
+class TestTimeIndexedLog:
+    def test_read_all(self, log):
+        assert [r["task_id"] for r in log.read()] == [f"T{i}" for i in range(100)]
+
+    def test_range_reads_only_matching_blocks(self, log):
+        start = datetime(2025, 1, 2, 0, 0)  # T24
+        end = datetime(2025, 1, 2, 5, 0)  # T29
+
+        list(log.read())  # build the index
+        ranges = log._ranges(log._load_index(), to_epoch(start), to_epoch(end))
+        assert len(ranges) == 1
+        assert ranges[0][1] - ranges[0][0] < log.path.stat().st_size / 5
+
+        assert [r["task_id"] for r in log.read(start, end)] == [f"T{i}" for i in range(24, 30)]
+
+    def test_index_persisted(self, log):
+        list(log.read())
+        index = json.loads(log.index_path.read_text())
+        assert index["size"] == log.path.stat().st_size
+        assert len(index["blocks"]) == 10
+
+        fresh = TimeIndexedLog(log.path, "completed_at", block_lines=10)
+        with patch.object(TimeIndexedLog, "_extend") as extend:
+            assert len(list(fresh.read(start=datetime(2025, 1, 4)))) == 28
+        extend.assert_not_called()
+
+    def test_out_of_order_records(self, tmp_path):
+        log = TimeIndexedLog(tmp_path / "events.jsonl", "completed_at", block_lines=2)
+        log.append_many(_records(datetime(2025, 3, 1), 6))
+        log.append({"task_id": "late", "completed_at": "2025-01-15T09:00:00"})
+        log.append_many(_records(datetime(2025, 3, 2), 4))
+
+        found = [r["task_id"] for r in log.read(datetime(2025, 1, 1), datetime(2025, 1, 31))]
+        assert found == ["late"]
+
+    def test_appends_indexed_incrementally(self, log):
+        assert len(list(log.read(start=datetime(2025, 2, 1)))) == 0
+        log.append({"task_id": "new", "completed_at": "2025-02-03T00:00:00"})
+        assert [r["task_id"] for r in log.read(start=datetime(2025, 2, 1))] == ["new"]
+
+    def test_partial_line_skipped_until_complete(self, log):
+        list(log.read())
+        line = json.dumps({"task_id": "new", "completed_at": "2025-02-03T00:00:00"})
+        with open(log.path, "a") as f:
+            f.write(line[:15])
+        assert len(list(log.read())) == 100
+
+        with open(log.path, "a") as f:
+            f.write(line[15:] + "\n")
+        assert len(list(log.read())) == 101
+
+    def test_rewritten_log_reindexed(self, log):
+        list(log.read())
+        log.path.write_text(json.dumps({"task_id": "only", "completed_at": "2025-01-01T05:00:00"}) + "\n")
+        assert [r["task_id"] for r in log.read(start=datetime(2025, 1, 1))] == ["only"]
+
+    def test_malformed_and_undated_lines(self, tmp_path):
+        log = TimeIndexedLog(tmp_path / "events.jsonl", "completed_at")
+        log.path.write_text(
+            '{"task_id": "a", "completed_at": "2025-01-01T00:00:00"}\n'
+            "{broken\n"
+            '{"task_id": "b", "completed_at": null}\n'
+        )
+        assert [r["task_id"] for r in log.read()] == ["a", "b"]
+        assert [r["task_id"] for r in log.read(start=datetime(2024, 1, 1))] == ["a"]
+
+    def test_missing_log(self, tmp_path):
+        log = TimeIndexedLog(tmp_path / "missing.jsonl", "completed_at")
+        assert list(log.read()) == []
+        assert log.buckets(datetime(2025, 1, 1), timedelta(days=1), 3) == [[], [], []]
+
+    def test_buckets(self, log):
+        buckets = log.buckets(datetime(2025, 1, 2), timedelta(days=1), 3)
+        assert [len(b) for b in buckets] == [24, 24, 24]
+        assert buckets[0][0]["task_id"] == "T24"
+
+
+class TestBurndownSinglePass:
+    def test_generate_reads_log_once(self, tmp_path):
+        tracker = VelocityTracker(tmp_path)
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=4)
+        tracker.record_completion("T1", 5, "sprint-1", completed_at=start + timedelta(hours=3))
+        tracker.record_completion("T2", 3, "sprint-1", completed_at=start + timedelta(days=2))
+        tracker.record_completion("T3", 8, "other", completed_at=start + timedelta(days=2))
+
+        generator = BurndownGenerator(tmp_path)
+        config = SprintConfig("sprint-1", start, start + timedelta(days=9), total_points=10)
+        with patch.object(TimeIndexedLog, "_scan", wraps=generator._velocity_tracker._log._scan) as scan:
+            data = generator.generate(config)
+
+        assert scan.call_count == 1
+        assert len(data.data_points) == 5  # no future days
+        assert [p.completed for p in data.data_points] == [5, 5, 8, 8, 8]
+        assert data.data_points[-1].remaining == 2
@@ -0,0 +1,206 @@
+"""Tests for shared encodings, batch token counting and the token count cache."""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from bpsai_pair import tokens
+from bpsai_pair.tokens import (
+    TokenCountCache,
+    count_file_tokens,
+    count_files_tokens,
+    count_tokens_many,
+    estimate_task_tokens,
+    get_encoding,
+)
+
+
+class FakeEncoding:
+    """Whitespace tokenizer standing in for a tiktoken encoding."""
+
+    def __init__(self):
+        self.encoded = []
+        self.batches = []
+
+    def encode_ordinary(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_ordinary_batch(self, texts, num_threads=8):
+        self.batches.append((list(texts), num_threads))
+        return [t.split() for t in texts]
+
+
+@pytest.fixture
+def fake_encoding():
+    encoding = FakeEncoding()
+    tokens.clear_encoding_cache()
+    with patch.object(tokens.tiktoken, "get_encoding", return_value=encoding) as mock_get:
+        yield encoding, mock_get
+    tokens.clear_encoding_cache()
+
+
+class TestEncodingRegistry:
+    def test_encoding_loaded_once(self, fake_encoding):
+        encoding, mock_get = fake_encoding
+        assert get_encoding() is encoding
+        assert get_encoding() is encoding
+        assert mock_get.call_count == 1
+
+
+class TestCountTokensMany:
+    def test_batch_preserves_order_and_skips_empty(self, fake_encoding):
+        encoding, _ = fake_encoding
+        counts = count_tokens_many(["a b", "", "c d e"], num_threads=2)
+
+        assert counts == [2, 0, 3]
+        assert encoding.batches == [(["a b", "c d e"], 2)]
+
+    def test_empty_input(self, fake_encoding):
+        assert count_tokens_many([]) == []
+
+
+class TestCountFilesTokens:
+    def test_counts_files_in_one_batch(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("one two")
+        b.write_text("three four five")
+
+        counts = count_files_tokens([a, b, tmp_path / "missing.py", tmp_path / "x.png"])
+
+        assert list(counts.values()) == [2, 3, 0, 0]
+        assert len(encoding.batches) == 1
+
+    def test_cache_skips_unchanged_content(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        path = tmp_path / "a.py"
+        path.write_text("one two three")
+        cache_path = tmp_path / "cache" / "token-counts.json"
+
+        assert count_file_tokens(path, cache=TokenCountCache(cache_path)) == 3
+        assert json.loads(cache_path.read_text())["version"] == 1
+
+        encoding.encoded.clear()
+        # A fresh cache instance (new process) reuses the persisted count
+        assert count_file_tokens(path, cache=TokenCountCache(cache_path)) == 3
+        assert encoding.encoded == []
+
+        path.write_text("one two three four")
+        assert count_file_tokens(path, cache=TokenCountCache(cache_path)) == 4
+
+    def test_identical_content_tokenized_once(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text("same words here")
+        b.write_text("same words here")
+
+        counts = count_files_tokens([a, b], cache=TokenCountCache(tmp_path / "c.json"))
+
+        assert counts == {a: 3, b: 3}
+        assert encoding.encoded == ["same words here"]
+
+    def test_corrupt_cache_ignored(self, fake_encoding, tmp_path):
+        cache_path = tmp_path / "token-counts.json"
+        cache_path.write_text("{not json")
+        path = tmp_path / "a.py"
+        path.write_text("x y")
+
+        assert count_file_tokens(path, cache=TokenCountCache(cache_path)) == 2
+        assert json.loads(cache_path.read_text())["version"] == 1
+
+
+class TestEstimateBatch:
+    def test_estimate_counts_sources_in_batch(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("a " * 10)
+        b.write_text("b " * 20)
+
+        estimate = estimate_task_tokens("T-NONE", [a, b], base_context=0)
+
+        assert estimate.source_files == 30
+        assert estimate.task_file == 500
+        assert len(encoding.batches) == 1
+
+
+class TestStreamingCount:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(tokens, "STREAM_CHUNK_SIZE", 64)
+        monkeypatch.setattr(tokens, "STREAM_MAX_CARRY", 256)
+        monkeypatch.setattr(tokens, "STREAM_THRESHOLD_BYTES", 128)
+
+    def test_stream_matches_whole_file(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        path = tmp_path / "big.txt"
+        path.write_text("".join(f"line {i} has words\n" for i in range(100)))
+
+        count, complete = tokens.stream_file_tokens(path)
+
+        assert complete
+        assert count == 400
+        assert len(encoding.encoded) > 1
+        assert max(len(t) for t in encoding.encoded) <= 256
+
+    def test_large_files_are_streamed(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        path = tmp_path / "big.lock"
+        path.write_text("word " * 200)
+
+        assert count_file_tokens(path) == 200
+        assert encoding.batches == []
+
+    def test_max_tokens_stops_early(self, fake_encoding, tmp_path):
+        encoding, _ = fake_encoding
+        path = tmp_path / "big.txt"
+        path.write_text("word\n" * 1000)
+
+        count, complete = tokens.stream_file_tokens(path, max_tokens=50)
+
+        assert not complete
+        assert 50 <= count < 1000
+        assert count_file_tokens(path, max_tokens=50) == count
+
+    def test_partial_counts_not_cached(self, fake_encoding, tmp_path):
+        path = tmp_path / "big.txt"
+        path.write_text("word\n" * 1000)
+        cache = TokenCountCache(tmp_path / "c.json")
+
+        count_file_tokens(path, cache=cache, max_tokens=50)
+        assert len(cache) == 0
+
+        assert count_file_tokens(path, cache=cache) == 1000
+        assert len(cache) == 1
+
+    def test_latin1_fallback(self, fake_encoding, tmp_path):
+        path = tmp_path / "legacy.txt"
+        path.write_bytes(b"caf\xe9 au lait\n" * 20)
+
+        count, complete = tokens.stream_file_tokens(path)
+
+        assert complete
+        assert count == 60
+
+    def test_estimate_truncated(self, fake_encoding, tmp_path):
+        path = tmp_path / "big.txt"
+        path.write_text("word\n" * 10000)
+
+        estimate = estimate_task_tokens("T-NONE", [path], base_context=0, max_tokens=2000)
+
+        assert estimate.truncated
+        assert estimate.total >= 2000
+        assert estimate.source_files < 10000
+
+    def test_estimate_reaching_limit_not_truncated(self, fake_encoding, tmp_path):
+        path = tmp_path / "small.txt"
+        path.write_text("word " * 10)
+        full = estimate_task_tokens("T-NONE", [path], base_context=0)
+
+        estimate = estimate_task_tokens("T-NONE", [path], base_context=0, max_tokens=full.total)
+
+        assert estimate.total == full.total
+        assert not estimate.truncated
@@ -0,0 +1,116 @@
+"""Tests for the unified YAML I/O layer."""
+import os
+from enum import Enum
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from bpsai_pair.core import yamlio
+from bpsai_pair.planning.models import TaskStatus
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yamlio.invalidate()
+    yield
+    yamlio.invalidate()
+
+
+class TestLoadDump:
+    """Tests for load/dump."""
+
+    def test_round_trip(self):
+        data = {"id": "plan-1", "tasks": [{"id": "T1", "complexity": 30}], "ok": True}
+        assert yamlio.load(yamlio.dump(data)) == data
+
+    def test_uses_c_loader_when_available(self):
+        if yamlio.HAS_LIBYAML:
+            assert yamlio.SafeLoader is yaml.CSafeLoader
+        else:
+            assert yamlio.SafeLoader is yaml.SafeLoader
+
+    def test_rejects_python_tags(self):
+        with pytest.raises(yamlio.YAMLError):
+            yamlio.load("!!python/object/apply:os.system ['true']")
+
+    def test_dumps_enums_and_paths_as_plain_scalars(self):
+        class Color(Enum):
+            RED = "red"
+
+        text = yamlio.dump({"status": TaskStatus.DONE, "color": Color.RED, "path": Path("a/b")})
+        assert "!!python" not in text
+        assert yamlio.load(text) == {"status": "done", "color": "red", "path": "a/b"}
+
+    def test_block_style_by_default(self):
+        assert yamlio.dump({"items": [1, 2]}) == "items:\n- 1\n- 2\n"
+
+    def test_kwargs_pass_through(self):
+        text = yamlio.dump({"b": 1, "a": 2}, sort_keys=False)
+        assert text.index("b:") < text.index("a:")
+
+
+def _age(path: Path) -> None:
+    """Backdate past the racy window, so the cache trusts the stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**10))
+
+
+class TestFileCache:
+    """Tests for load_file/dump_file caching."""
+
+    def test_cached_load_skips_parse(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("version: '2'\n", encoding="utf-8")
+        _age(path)
+
+        assert yamlio.load_file(path, cache=True) == {"version": "2"}
+        with patch.object(yamlio, "load") as mock_load:
+            assert yamlio.load_file(path, cache=True) == {"version": "2"}
+            mock_load.assert_not_called()
+
+    def test_cache_invalidated_by_mtime(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("a: 1\n", encoding="utf-8")
+        yamlio.load_file(path, cache=True)
+
+        path.write_text("a: 2\n", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert yamlio.load_file(path, cache=True) == {"a": 2}
+
+    def test_recently_written_file_is_reread(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("a: 1\n", encoding="utf-8")
+        st = path.stat()
+        yamlio.load_file(path, cache=True)
+
+        # Same size and mtime, new content
+        path.write_text("a: 2\n", encoding="utf-8")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert yamlio.load_file(path, cache=True) == {"a": 2}
+
+    def test_cached_result_is_a_copy(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("nested:\n  key: value\n", encoding="utf-8")
+        _age(path)
+
+        first = yamlio.load_file(path, cache=True)
+        first["nested"]["key"] = "mutated"
+
+        assert yamlio.load_file(path, cache=True) == {"nested": {"key": "value"}}
+
+    def test_dump_file_invalidates(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        yamlio.dump_file({"a": 1}, path)
+        assert yamlio.load_file(path, cache=True) == {"a": 1}
+
+        yamlio.dump_file({"a": 2}, path)
+        assert yamlio.load_file(path, cache=True) == {"a": 2}
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            yamlio.load_file(tmp_path / "missing.yaml", cache=True)